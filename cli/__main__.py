@@ -1,8 +1,10 @@
 """Main CLI entry point for GOLIAT."""
 
 import argparse
+import importlib
 import os
 import sys
+from typing import Callable, NamedTuple, Optional, Union
 
 # Only run initial_setup for commands that need it
 # Commands like 'init', 'version', 'status' don't need full setup
@@ -16,6 +18,12 @@ def create_parser():
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Run the command with import timing and report the slowest module imports.",
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     subparsers.required = True
 
@@ -375,6 +383,55 @@ Examples:
         action="store_true",
         help="Print metrics to console in pretty format (single-file mode only).",
     )
+    stats_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel parser processes (directory mode only, default: CPU count).",
+    )
+    stats_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every log instead of reusing cached metrics (directory mode only).",
+    )
+    stats_parser.add_argument(
+        "--eta-history",
+        metavar="PATH",
+        default=None,
+        help="Add parsed phase timings to the ETA model history, e.g. data/eta_history.json (directory mode only).",
+    )
+
+    # perf command - fleet-wide performance report from the Parquet metadata store
+    perf_parser = subparsers.add_parser("perf", help="Throughput, regression and phase-time report from the performance store")
+    perf_parser.add_argument(
+        "store", nargs="?", default=None, help="Performance store directory (default: from --config, else data/perf_store in the project)."
+    )
+    perf_parser.add_argument("--config", default=None, help="Study config whose execution_control.perf_store_dir names the store.")
+    perf_parser.add_argument("--since", default=None, help="Only simulations since a date or lookback, e.g. 2026-09-01 or 30d.")
+    perf_parser.add_argument("--machine", action="append", default=None, help="Only this machine (repeatable).")
+    perf_parser.add_argument("--gpu", action="append", default=None, help="Only this GPU model (repeatable).")
+    perf_parser.add_argument("--study-type", choices=["near_field", "far_field"], default=None)
+    perf_parser.add_argument("--group-by", default=None, help="Comma-separated grouping columns (default: machine,gpu_model).")
+    perf_parser.add_argument(
+        "--import-results", metavar="DIR", default=None, help="First append every simulation_metadata.json under DIR to the store."
+    )
+    perf_parser.add_argument("--as-machine", default=None, help="Machine name for --import-results (default: this host).")
+    perf_parser.add_argument("--compact", action="store_true", help="Merge the per-simulation files of each partition first.")
+    perf_parser.add_argument("-o", "--output", default=None, help="Also write the report tables as CSV files to this directory.")
+
+    # bench command - hot-path benchmarks on a synthetic phantom, no Sim4Life needed
+    bench_parser = subparsers.add_parser("bench", help="Benchmark the extraction hot paths on a synthetic phantom")
+    bench_parser.add_argument("--grid", type=int, nargs=3, metavar=("NX", "NY", "NZ"), default=None, help="Grid size in nodes.")
+    bench_parser.add_argument("--directions", type=int, default=None, help="Incident directions (one _Output.h5 each).")
+    bench_parser.add_argument("--spacing-mm", type=float, default=None, help="Voxel size in mm.")
+    bench_parser.add_argument("--cases", default=None, help="Comma-separated cases to run (default: all).")
+    bench_parser.add_argument("--repeat", type=int, default=None, help="Timed runs per case.")
+    bench_parser.add_argument("--air-points", type=int, default=None, help="Air focus points for the hotspot cases.")
+    bench_parser.add_argument("--work-dir", default=None, help="Where the phantom is generated and reused (default: data/bench).")
+    bench_parser.add_argument("--baseline", default=None, help="Baseline file (default: data/bench_baseline.json).")
+    bench_parser.add_argument("--save-baseline", action="store_true", help="Store this run's results as the baseline.")
+    bench_parser.add_argument("-o", "--output", default=None, help="Also write this run's results to a JSON file.")
+    bench_parser.add_argument("--list", action="store_true", help="List the cases and exit.")
 
     return parser
 
@@ -410,306 +467,348 @@ def _print_ascii_art():
         print("=" * min(terminal_width - 2, 60) + "\n")
 
 
-def main():
-    """Main entry point for GOLIAT CLI."""
-    _print_ascii_art()
-
-    parser = create_parser()
-    args = parser.parse_args()
+def _run_init(args):
+    """Run initial setup (install dependencies, check Python, prepare data)."""
+    from goliat.utils.setup import initial_setup
 
-    # Commands that don't need full setup
-    if args.command == "init":
-        # Run initial setup (install dependencies, check Python, prepare data)
-        from goliat.utils.setup import initial_setup
+    initial_setup()
+    print("\nGOLIAT initialization complete!")
+    print("  You can now run 'goliat study <config>' to start a simulation.")
 
-        initial_setup()
-        print("\nGOLIAT initialization complete!")
-        print("  You can now run 'goliat study <config>' to start a simulation.")
-        return
 
-    elif args.command == "version":
-        from cli.commands import show_version
+def _run_version(args):
+    """Print the installed GOLIAT version."""
+    from cli.commands import show_version
 
-        show_version()
-        return
+    show_version()
 
-    elif args.command == "status":
-        from cli.commands import show_status
-        from cli.utils import get_base_dir
 
-        base_dir = get_base_dir()
-        show_status(base_dir=base_dir)
-        return
+def _run_status(args):
+    """Show setup status and environment information."""
+    from cli.commands import show_status
+    from cli.utils import get_base_dir
 
-    elif args.command == "validate":
-        from cli.commands import validate_config
+    show_status(base_dir=get_base_dir())
 
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        # Validate doesn't need full setup, but it needs the package
-        try:
-            validate_config(args.config, base_dir=base_dir)
-        except ImportError:
-            print("Error: GOLIAT package not installed. Run 'goliat study' to install.")
-        return
 
-    elif args.command == "config":
-        from cli.commands import config_set_version, config_show
-        from cli.utils import get_base_dir
-
-        base_dir = get_base_dir()
-
-        if args.config_command == "show":
-            config_show(base_dir=base_dir)
-        elif args.config_command == "set-version":
-            config_set_version(base_dir=base_dir)
-        else:
-            # No subcommand given, show help
-            print("Usage: goliat config <command>")
-            print("\nAvailable commands:")
-            print("  show         Show current configuration and preferences")
-            print("  set-version  Change the Sim4Life version")
-        return
+def _run_validate(args):
+    """Validate a config file without running the full setup."""
+    from cli.commands import validate_config
 
-    elif args.command == "ask":
-        from cli.run_ai import main_ask
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-ask"]
-        if args.question:
-            sys.argv.append(args.question)
-        if hasattr(args, "debug") and args.debug:
-            sys.argv.extend(["--debug", args.debug])
-        if hasattr(args, "logs") and args.logs:
-            sys.argv.extend(["--logs", args.logs])
-        if hasattr(args, "config") and args.config:
-            sys.argv.extend(["--config", args.config])
-        if hasattr(args, "backend"):
-            sys.argv.extend(["--backend", args.backend])
-        if hasattr(args, "reindex") and args.reindex:
-            sys.argv.append("--reindex")
-        try:
-            main_ask()
-        finally:
-            sys.argv = original_argv
-        return
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    # Validate doesn't need full setup, but it needs the package
+    try:
+        validate_config(args.config, base_dir=base_dir)
+    except ImportError:
+        print("Error: GOLIAT package not installed. Run 'goliat study' to install.")
 
-    elif args.command == "chat":
-        from cli.run_ai import main_chat
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-chat"]
-        if hasattr(args, "backend"):
-            sys.argv.extend(["--backend", args.backend])
-        try:
-            main_chat()
-        finally:
-            sys.argv = original_argv
-        return
 
-    elif args.command == "debug":
-        from cli.run_ai import main_debug
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-debug"]
-        if hasattr(args, "error") and args.error:
-            sys.argv.append(args.error)
-        if hasattr(args, "question") and args.question:
-            sys.argv.extend(["--question", args.question])
-        if hasattr(args, "logs") and args.logs:
-            sys.argv.extend(["--logs", args.logs])
-        if hasattr(args, "log_count") and args.log_count:
-            sys.argv.extend(["--log-count", str(args.log_count)])
-        if hasattr(args, "config") and args.config:
-            sys.argv.extend(["--config", args.config])
-        if hasattr(args, "no_shell_context") and args.no_shell_context:
-            sys.argv.append("--no-shell-context")
-        if hasattr(args, "no_browser") and args.no_browser:
-            sys.argv.append("--no-browser")
-        if hasattr(args, "simple") and args.simple:
-            sys.argv.append("--simple")
-        if hasattr(args, "complex") and args.complex:
-            sys.argv.append("--complex")
-        if hasattr(args, "auto") and args.auto:
-            sys.argv.append("--auto")
-        try:
-            main_debug()
-        finally:
-            sys.argv = original_argv
-        return
+def _run_config(args):
+    """Show or change user preferences."""
+    from cli.commands import config_set_version, config_show
+    from cli.utils import get_base_dir
 
-    elif args.command == "recommend":
-        from cli.run_ai import main_recommend
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-recommend", args.log_file]
-        if hasattr(args, "quiet") and args.quiet:
-            sys.argv.append("--quiet")
-        if hasattr(args, "backend"):
-            sys.argv.extend(["--backend", args.backend])
-        try:
-            main_recommend()
-        finally:
-            sys.argv = original_argv
-        return
+    base_dir = get_base_dir()
 
+    if args.config_command == "show":
+        config_show(base_dir=base_dir)
+    elif args.config_command == "set-version":
+        config_set_version(base_dir=base_dir)
+    else:
+        # No subcommand given, show help
+        print("Usage: goliat config <command>")
+        print("\nAvailable commands:")
+        print("  show         Show current configuration and preferences")
+        print("  set-version  Change the Sim4Life version")
+
+
+def _ask_argv(args):
+    """Arguments forwarded to cli.run_ai.main_ask."""
+    argv = ["goliat-ask"]
+    if args.question:
+        argv.append(args.question)
+    if args.debug:
+        argv.extend(["--debug", args.debug])
+    if args.logs:
+        argv.extend(["--logs", args.logs])
+    if args.config:
+        argv.extend(["--config", args.config])
+    argv.extend(["--backend", args.backend])
+    if args.reindex:
+        argv.append("--reindex")
+    return argv
+
+
+def _chat_argv(args):
+    """Arguments forwarded to cli.run_ai.main_chat."""
+    return ["goliat-chat", "--backend", args.backend]
+
+
+def _debug_argv(args):
+    """Arguments forwarded to cli.run_ai.main_debug."""
+    argv = ["goliat-debug"]
+    if args.error:
+        argv.append(args.error)
+    if args.question:
+        argv.extend(["--question", args.question])
+    if args.logs:
+        argv.extend(["--logs", args.logs])
+    if args.log_count:
+        argv.extend(["--log-count", str(args.log_count)])
+    if args.config:
+        argv.extend(["--config", args.config])
+    for flag in ("no_shell_context", "no_browser", "simple", "complex", "auto"):
+        if getattr(args, flag):
+            argv.append("--" + flag.replace("_", "-"))
+    return argv
+
+
+def _recommend_argv(args):
+    """Arguments forwarded to cli.run_ai.main_recommend."""
+    argv = ["goliat-recommend", args.log_file]
+    if args.quiet:
+        argv.append("--quiet")
+    argv.extend(["--backend", args.backend])
+    return argv
+
+
+def _study_argv(args):
+    """Arguments forwarded to cli.run_study.main."""
+    # The study module parses its own args: drop 'goliat study' and keep the config and flags
+    argv = ["goliat-study"]
+    if args.config:
+        argv.append(args.config)
+    if args.title:
+        argv.extend(["--title", args.title])
+    if args.pid:
+        argv.extend(["--pid", args.pid])
+    if args.no_cache:
+        argv.append("--no-cache")
+    if args.auto_close:
+        argv.append("--auto-close")
+    if args.persistent:
+        argv.append("--persistent")
+    if args.max_retries != 3:  # Only pass if not default
+        argv.extend(["--max-retries", str(args.max_retries)])
+    if args.persistent_child:
+        argv.append("--_persistent-child")
+    return argv
+
+
+def _analyze_argv(args):
+    """Arguments forwarded to cli.run_analysis.main."""
+    argv = ["goliat-analyze"]
+    if args.config:
+        argv.append(args.config)
+    argv.extend(["--format", args.format])
+    if args.analysis:
+        argv.extend(["--analysis", args.analysis])
+    if args.generate_paper:
+        argv.append("--generate-paper")
+    if args.no_gui:
+        argv.append("--no-gui")
+    return argv
+
+
+def _is_single_log(args) -> bool:
+    """Whether `goliat stats` was given a single verbose.log instead of a directory."""
+    return os.path.isfile(args.path) and args.path.endswith(".log")
+
+
+def _stats_argv(args):
+    """Arguments forwarded to the single-file or directory stats entry point."""
+    argv = ["goliat-stats", args.path]
+    if args.output:
+        argv.extend(["-o", args.output])
+    if _is_single_log(args):
+        if args.pretty:
+            argv.append("--pretty")
+        return argv
+    if args.json:
+        argv.append("--json")
+    if args.workers:
+        argv.extend(["--workers", str(args.workers)])
+    if args.no_cache:
+        argv.append("--no-cache")
+    if args.eta_history:
+        argv.extend(["--eta-history", args.eta_history])
+    return argv
+
+
+def _stats_target(args) -> str:
+    """Entry point for `goliat stats`."""
+    # Single-file mode parses one verbose.log; directory mode scans results and plots
+    if _is_single_log(args):
+        return "goliat.analysis.parse_verbose_log:main"
+    return "goliat.analysis.analyze_simulation_stats:main"
+
+
+def _perf_argv(args):
+    """Arguments forwarded to goliat.analysis.perf_report.main."""
+    from cli.utils import get_base_dir
+
+    argv = ["goliat-perf"]
+    if args.store:
+        argv.append(args.store)
+    argv.extend(["--base-dir", get_base_dir()])
+    if args.config:
+        argv.extend(["--config", args.config])
+    for value in args.machine or []:
+        argv.extend(["--machine", value])
+    for value in args.gpu or []:
+        argv.extend(["--gpu", value])
+    for option in ("since", "study_type", "group_by", "import_results", "as_machine", "output"):
+        if getattr(args, option):
+            argv.extend(["--" + option.replace("_", "-"), getattr(args, option)])
+    if args.compact:
+        argv.append("--compact")
+    return argv
+
+
+def _bench_argv(args):
+    """Arguments forwarded to goliat.bench.runner.main."""
+    argv = ["goliat-bench"]
+    if args.grid:
+        argv.extend(["--grid", *(str(n) for n in args.grid)])
+    for option in ("directions", "spacing_mm", "cases", "repeat", "air_points", "work_dir", "baseline", "output"):
+        if getattr(args, option) is not None:
+            argv.extend(["--" + option.replace("_", "-"), str(getattr(args, option))])
+    for flag in ("save_baseline", "list"):
+        if getattr(args, flag):
+            argv.append("--" + flag.replace("_", "-"))
+    return argv
+
+
+def _parallel_argv(args):
+    """Arguments forwarded to cli.run_parallel_studies.main."""
+    argv = ["goliat-parallel"]
+    if args.config:
+        argv.append(args.config)
+    if args.num_splits != 4:  # Only add if not default
+        argv.extend(["--num-splits", str(args.num_splits)])
+    if args.skip_split:
+        argv.append("--skip-split")
+    if args.no_cache:
+        argv.append("--no-cache")
+    return argv
+
+
+def _super_study_argv(args):
+    """Arguments forwarded to cli.run_super_study.main."""
+    argv = ["goliat-super-study", args.config, "--name", args.name]
+    if args.description:
+        argv.extend(["--description", args.description])
+    if args.num_splits is not None:
+        argv.extend(["--num-splits", str(args.num_splits)])
+    if args.split_by:
+        argv.extend(["--split-by", args.split_by])
+    if args.frequency_groups:
+        argv.extend(["--frequency-groups", args.frequency_groups])
+    if args.server_url:
+        argv.extend(["--server-url", args.server_url])
+    return argv
+
+
+def _worker_argv(args):
+    """Arguments forwarded to cli.run_worker.main."""
+    argv = ["goliat-worker", args.assignment_indices, args.super_study_name]
+    if args.title:
+        argv.extend(["--title", args.title])
+    if args.no_cache:
+        argv.append("--no-cache")
+    if args.reupload_results:
+        argv.append("--reupload-results")
+    if args.server_url:
+        argv.extend(["--server-url", args.server_url])
+    if args.auto_close:
+        argv.append("--auto-close")
+    if args.max_retries != 3:  # Only pass if not default
+        argv.extend(["--max-retries", str(args.max_retries)])
+    return argv
+
+
+class Command(NamedTuple):
+    """How a subcommand is dispatched.
+
+    Either `handler` runs in-process with the parsed args, or `target`
+    ("module:function", or a callable returning one) is imported only when
+    the command runs and called with `sys.argv` rebuilt by `argv`.
+    """
+
+    handler: Optional[Callable] = None
+    target: Union[str, Callable, None] = None
+    argv: Optional[Callable] = None
+    needs_setup: bool = False
+
+
+COMMANDS = {
+    # Commands that don't need full setup
+    "init": Command(handler=_run_init),
+    "version": Command(handler=_run_version),
+    "status": Command(handler=_run_status),
+    "validate": Command(handler=_run_validate),
+    "config": Command(handler=_run_config),
+    "ask": Command(target="cli.run_ai:main_ask", argv=_ask_argv),
+    "chat": Command(target="cli.run_ai:main_chat", argv=_chat_argv),
+    "debug": Command(target="cli.run_ai:main_debug", argv=_debug_argv),
+    "recommend": Command(target="cli.run_ai:main_recommend", argv=_recommend_argv),
+    "bench": Command(target="goliat.bench.runner:main", argv=_bench_argv),
     # Commands that need full setup
-    from goliat.utils.setup import initial_setup
+    "study": Command(target="cli.run_study:main", argv=_study_argv, needs_setup=True),
+    "analyze": Command(target="cli.run_analysis:main", argv=_analyze_argv, needs_setup=True),
+    "stats": Command(target=_stats_target, argv=_stats_argv, needs_setup=True),
+    "perf": Command(target="goliat.analysis.perf_report:main", argv=_perf_argv, needs_setup=True),
+    "parallel": Command(target="cli.run_parallel_studies:main", argv=_parallel_argv, needs_setup=True),
+    "free-space": Command(target="cli.run_free_space_study:main", argv=lambda args: ["goliat-free-space"], needs_setup=True),
+    "super_study": Command(target="cli.run_super_study:main", argv=_super_study_argv, needs_setup=True),
+    "worker": Command(target="cli.run_worker:main", argv=_worker_argv, needs_setup=True),
+}
+"""Subcommand registry; nothing beyond argparse is imported until a command is dispatched."""
+
+COMMANDS["freespace"] = COMMANDS["free-space"]
+
+
+def _run_forwarded(command: Command, args):
+    """Imports a command's entry point and runs it with a rebuilt sys.argv."""
+    target = command.target(args) if callable(command.target) else command.target
+    module_name, func_name = target.split(":")
+    entry_point = getattr(importlib.import_module(module_name), func_name)
+
+    original_argv = sys.argv[:]
+    sys.argv = command.argv(args)
+    try:
+        entry_point()
+    finally:
+        sys.argv = original_argv
 
-    initial_setup()
 
-    if args.command == "study":
-        from cli.run_study import main as study_main
-
-        # Reconstruct sys.argv for the study module (it expects to parse its own args)
-        # Remove 'goliat study' and keep just the config and flags
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-study"]  # Fake program name for compatibility
-        if args.config:
-            sys.argv.append(args.config)
-        if args.title:
-            sys.argv.extend(["--title", args.title])
-        if args.pid:
-            sys.argv.extend(["--pid", args.pid])
-        if args.no_cache:
-            sys.argv.append("--no-cache")
-        if args.auto_close:
-            sys.argv.append("--auto-close")
-        if hasattr(args, "persistent") and args.persistent:
-            sys.argv.append("--persistent")
-        if hasattr(args, "max_retries") and args.max_retries != 3:  # Only pass if not default
-            sys.argv.extend(["--max-retries", str(args.max_retries)])
-        if hasattr(args, "persistent_child") and args.persistent_child:
-            sys.argv.append("--_persistent-child")
-        try:
-            study_main()
-        finally:
-            sys.argv = original_argv
-
-    elif args.command == "analyze":
-        from cli.run_analysis import main as analyze_main
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-analyze"]
-        if args.config:
-            sys.argv.append(args.config)
-        if hasattr(args, "format"):
-            sys.argv.extend(["--format", args.format])
-        if hasattr(args, "analysis") and args.analysis:
-            sys.argv.extend(["--analysis", args.analysis])
-        if hasattr(args, "generate_paper") and args.generate_paper:
-            sys.argv.append("--generate-paper")
-        if hasattr(args, "no_gui") and args.no_gui:
-            sys.argv.append("--no-gui")
-        try:
-            analyze_main()
-        finally:
-            sys.argv = original_argv
-
-    elif args.command == "stats":
-        # Determine if path is a single file or directory
-        if os.path.isfile(args.path) and args.path.endswith(".log"):
-            # Single-file mode: parse a single verbose.log file
-            from goliat.analysis.parse_verbose_log import main as parse_log_main
-
-            original_argv = sys.argv[:]
-            sys.argv = ["goliat-stats", args.path]
-            if args.output:
-                sys.argv.extend(["-o", args.output])
-            if args.pretty:
-                sys.argv.append("--pretty")
-            try:
-                parse_log_main()
-            finally:
-                sys.argv = original_argv
-        else:
-            # Directory mode: scan results directory and generate visualizations
-            from goliat.analysis.analyze_simulation_stats import main as stats_main
-
-            original_argv = sys.argv[:]
-            sys.argv = ["goliat-stats", args.path]
-            if args.output:
-                sys.argv.extend(["-o", args.output])
-            if args.json:
-                sys.argv.append("--json")
-            try:
-                stats_main()
-            finally:
-                sys.argv = original_argv
-
-    elif args.command == "parallel":
-        from cli.run_parallel_studies import main as parallel_main
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-parallel"]
-        if args.config:
-            sys.argv.append(args.config)
-        if args.num_splits != 4:  # Only add if not default
-            sys.argv.extend(["--num-splits", str(args.num_splits)])
-        if args.skip_split:
-            sys.argv.append("--skip-split")
-        if args.no_cache:
-            sys.argv.append("--no-cache")
-        try:
-            parallel_main()
-        finally:
-            sys.argv = original_argv
-
-    elif args.command in ("free-space", "freespace"):
-        from cli.run_free_space_study import main as free_space_main
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-free-space"]
-        try:
-            free_space_main()
-        finally:
-            sys.argv = original_argv
-
-    elif args.command == "super_study":
-        from cli.run_super_study import main as super_study_main
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-super-study", args.config, "--name", args.name]
-        if args.description:
-            sys.argv.extend(["--description", args.description])
-        if args.num_splits is not None:
-            sys.argv.extend(["--num-splits", str(args.num_splits)])
-        if hasattr(args, "split_by") and args.split_by:
-            sys.argv.extend(["--split-by", args.split_by])
-        if hasattr(args, "frequency_groups") and args.frequency_groups:
-            sys.argv.extend(["--frequency-groups", args.frequency_groups])
-        if args.server_url:
-            sys.argv.extend(["--server-url", args.server_url])
-        try:
-            super_study_main()
-        finally:
-            sys.argv = original_argv
-
-    elif args.command == "worker":
-        from cli.run_worker import main as worker_main
-
-        original_argv = sys.argv[:]
-        sys.argv = ["goliat-worker", args.assignment_indices, args.super_study_name]
-        if args.title:
-            sys.argv.extend(["--title", args.title])
-        if args.no_cache:
-            sys.argv.append("--no-cache")
-        if args.reupload_results:
-            sys.argv.append("--reupload-results")
-        if args.server_url:
-            sys.argv.extend(["--server-url", args.server_url])
-        if args.auto_close:
-            sys.argv.append("--auto-close")
-        if hasattr(args, "max_retries") and args.max_retries != 3:  # Only pass if not default
-            sys.argv.extend(["--max-retries", str(args.max_retries)])
-        try:
-            worker_main()
-        finally:
-            sys.argv = original_argv
+def main():
+    """Main entry point for GOLIAT CLI."""
+    if "--profile-startup" in sys.argv[1:]:
+        from cli.startup_profile import profile_startup
 
-    else:
+        sys.exit(profile_startup([arg for arg in sys.argv[1:] if arg != "--profile-startup"]))
+
+    _print_ascii_art()
+
+    parser = create_parser()
+    args = parser.parse_args()
+
+    command = COMMANDS.get(args.command)
+    if command is None:
         parser.print_help()
         sys.exit(1)
 
+    if command.needs_setup:
+        from goliat.utils.setup import initial_setup
+
+        initial_setup()
+
+    if command.handler is not None:
+        command.handler(args)
+    else:
+        _run_forwarded(command, args)
+
 
 if __name__ == "__main__":
     main()
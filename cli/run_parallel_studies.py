@@ -6,13 +6,13 @@ import os
 import shutil
 import subprocess
 import sys
-from copy import deepcopy
 
 import colorama
 
 # Base directory for config files
 from cli.utils import get_base_dir
 from goliat.colors import init_colorama
+from goliat.config.compiled import derive_config
 
 base_dir = get_base_dir()
 
@@ -172,23 +172,25 @@ def split_config(config_path, num_splits, logger):
 
     # Create config files
     for i, (phantoms, items_subset) in enumerate(config_splits):
-        new_config = deepcopy(config)
+        # Each split only replaces top-level keys, so the rest of the config is shared instead of deep-copied
+        overrides = {}
 
         # Update phantoms
         if is_near_field_dict:
             # Near-field dict format: keep only selected phantoms
             original_phantoms_dict = config.get("phantoms", {})
-            new_config["phantoms"] = {p: original_phantoms_dict[p] for p in phantoms}
+            overrides["phantoms"] = {p: original_phantoms_dict[p] for p in phantoms}
         else:
             # Far-field list format
-            new_config["phantoms"] = phantoms
+            overrides["phantoms"] = phantoms
 
         # Update frequencies or antennas
         if study_type == "near_field":
             original_antenna_config = config.get("antenna_config", {})
-            new_config["antenna_config"] = {key: original_antenna_config[key] for key in items_subset}
+            overrides["antenna_config"] = {key: original_antenna_config[key] for key in items_subset}
         else:
-            new_config["frequencies_mhz"] = items_subset
+            overrides["frequencies_mhz"] = items_subset
+        new_config = derive_config(config, overrides)
 
         new_config_path = os.path.join(output_dir, f"{config_filename}_{i}.json")
         with open(new_config_path, "w") as f:
@@ -311,6 +311,7 @@ def study_process_wrapper(queue, stop_event, config_filename, process_id, no_cac
             profiling_config=profiling_config_data,
             study_type=study_type,
             config_path=config.profiling_config_path,
+            eta_history_path=config.eta_history_path,
         )
 
         # The study will use the QueueGUI to send updates back to the main process.
@@ -601,6 +602,7 @@ def main():
                 profiling_config=profiling_config_data,
                 study_type=study_type,
                 config_path=config.profiling_config_path,
+                eta_history_path=config.eta_history_path,
             )
 
             console_logger = ConsoleLogger(progress_logger, verbose_logger)
@@ -5,11 +5,11 @@ import json
 import logging
 import os
 import sys
-from copy import deepcopy
 
 import colorama
 
 from goliat.colors import init_colorama
+from goliat.config.compiled import derive_config
 
 try:
     import requests
@@ -121,12 +121,11 @@ def split_config_by_dimension(config_path, split_by, logger):
     if split_by == "phantom":
         # One assignment per phantom
         for phantom in phantom_list:
-            assignment_config = deepcopy(base_config)
             if is_near_field_dict:
                 original_phantoms_dict = base_config.get("phantoms", {})
-                assignment_config["phantoms"] = {phantom: original_phantoms_dict[phantom]}
+                assignment_config = derive_config(base_config, {"phantoms": {phantom: original_phantoms_dict[phantom]}})
             else:
-                assignment_config["phantoms"] = [phantom]
+                assignment_config = derive_config(base_config, {"phantoms": [phantom]})
 
             assignment_configs.append({"config": assignment_config, "phantoms": [phantom], "items": [phantom], "items_name": "phantom"})
 
@@ -141,8 +140,7 @@ def split_config_by_dimension(config_path, split_by, logger):
             sys.exit(1)
 
         for freq in frequencies:
-            assignment_config = deepcopy(base_config)
-            assignment_config["frequencies_mhz"] = [freq]
+            assignment_config = derive_config(base_config, {"frequencies_mhz": [freq]})
 
             assignment_configs.append({"config": assignment_config, "phantoms": phantom_list, "items": [freq], "items_name": "frequency"})
 
@@ -165,9 +163,8 @@ def split_config_by_dimension(config_path, split_by, logger):
             sys.exit(1)
 
         for direction in directions:
-            assignment_config = deepcopy(base_config)
-            # Update the incident_directions in the nested structure
-            assignment_config["far_field_setup"][far_field_type]["incident_directions"] = [direction]
+            # Update the incident_directions in the nested structure; sibling subtrees stay shared with base_config
+            assignment_config = derive_config(base_config, {("far_field_setup", far_field_type, "incident_directions"): [direction]})
 
             assignment_configs.append(
                 {"config": assignment_config, "phantoms": phantom_list, "items": [direction], "items_name": "direction"}
@@ -192,9 +189,8 @@ def split_config_by_dimension(config_path, split_by, logger):
             sys.exit(1)
 
         for polarization in polarizations:
-            assignment_config = deepcopy(base_config)
-            # Update the polarizations in the nested structure
-            assignment_config["far_field_setup"][far_field_type]["polarizations"] = [polarization]
+            # Update the polarizations in the nested structure; sibling subtrees stay shared with base_config
+            assignment_config = derive_config(base_config, {("far_field_setup", far_field_type, "polarizations"): [polarization]})
 
             assignment_configs.append(
                 {"config": assignment_config, "phantoms": phantom_list, "items": [polarization], "items_name": "polarization"}
@@ -229,13 +225,15 @@ def split_config_by_dimension(config_path, split_by, logger):
         # Create cartesian product: frequency × polarization
         for freq in frequencies:
             for polarization in polarizations:
-                assignment_config = deepcopy(base_config)
-                assignment_config["frequencies_mhz"] = [freq]
-                assignment_config["far_field_setup"][far_field_type]["polarizations"] = [polarization]
+                overrides = {
+                    "frequencies_mhz": [freq],
+                    ("far_field_setup", far_field_type, "polarizations"): [polarization],
+                }
 
                 # Filter gridding_per_frequency
                 if gridding_per_freq and str(freq) in gridding_per_freq:
-                    assignment_config["gridding_parameters"]["global_gridding_per_frequency"] = {str(freq): gridding_per_freq[str(freq)]}
+                    overrides[("gridding_parameters", "global_gridding_per_frequency")] = {str(freq): gridding_per_freq[str(freq)]}
+                assignment_config = derive_config(base_config, overrides)
 
                 assignment_configs.append(
                     {
@@ -267,8 +265,7 @@ def split_config_by_dimension(config_path, split_by, logger):
             orientations = scenario_details.get("orientations", {})
             if not orientations:
                 # No orientations defined — treat the whole scenario as one assignment
-                assignment_config = deepcopy(base_config)
-                assignment_config["placement_scenarios"] = {scenario_name: scenario_details}
+                assignment_config = derive_config(base_config, {"placement_scenarios": {scenario_name: scenario_details}})
                 assignment_configs.append(
                     {
                         "config": assignment_config,
@@ -279,11 +276,9 @@ def split_config_by_dimension(config_path, split_by, logger):
                 )
             else:
                 for orient_name, orient_value in orientations.items():
-                    assignment_config = deepcopy(base_config)
                     # Keep only this scenario, with only this orientation
-                    reduced_scenario = deepcopy(scenario_details)
-                    reduced_scenario["orientations"] = {orient_name: orient_value}
-                    assignment_config["placement_scenarios"] = {scenario_name: reduced_scenario}
+                    reduced_scenario = {**scenario_details, "orientations": {orient_name: orient_value}}
+                    assignment_config = derive_config(base_config, {"placement_scenarios": {scenario_name: reduced_scenario}})
                     assignment_configs.append(
                         {
                             "config": assignment_config,
@@ -365,14 +360,14 @@ def split_config_custom_frequency_groups(config_path, frequency_groups_str, logg
 
     assignment_configs = []
     for i, freq_group in enumerate(frequency_groups):
-        assignment_config = deepcopy(base_config)
-        assignment_config["frequencies_mhz"] = freq_group
+        overrides = {"frequencies_mhz": freq_group}
 
         # Filter gridding_per_frequency to only include relevant frequencies
         if gridding_per_freq:
             filtered_gridding = {str(f): gridding_per_freq.get(str(f)) for f in freq_group if str(f) in gridding_per_freq}
             if filtered_gridding:
-                assignment_config["gridding_parameters"]["global_gridding_per_frequency"] = filtered_gridding
+                overrides[("gridding_parameters", "global_gridding_per_frequency")] = filtered_gridding
+        assignment_config = derive_config(base_config, overrides)
 
         assignment_configs.append({"config": assignment_config, "phantoms": phantom_list, "items": freq_group, "items_name": "frequencies"})
 
@@ -457,23 +452,24 @@ def split_config(config_path, num_splits, logger):
     assignment_configs = []
     for i, phantom_group in enumerate(phantom_groups):
         for j, item_group in enumerate(item_groups):
-            assignment_config = deepcopy(base_config)
+            overrides = {}
 
             # Update phantoms
             if is_near_field_dict:
                 # Near-field dict format: keep only selected phantoms
                 original_phantoms_dict = base_config.get("phantoms", {})
-                assignment_config["phantoms"] = {p: original_phantoms_dict[p] for p in phantom_group}
+                overrides["phantoms"] = {p: original_phantoms_dict[p] for p in phantom_group}
             else:
                 # Far-field list format
-                assignment_config["phantoms"] = phantom_group
+                overrides["phantoms"] = phantom_group
 
             # Update frequencies or antennas
             if study_type == "near_field":
                 original_antenna_config = base_config.get("antenna_config", {})
-                assignment_config["antenna_config"] = {key: original_antenna_config[key] for key in item_group}
+                overrides["antenna_config"] = {key: original_antenna_config[key] for key in item_group}
             else:
-                assignment_config["frequencies_mhz"] = item_group
+                overrides["frequencies_mhz"] = item_group
+            assignment_config = derive_config(base_config, overrides)
 
             assignment_configs.append(
                 {"config": assignment_config, "phantoms": phantom_group, "items": item_group, "items_name": items_name}
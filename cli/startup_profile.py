@@ -0,0 +1,96 @@
+"""Import-time profiling for `goliat --profile-startup`."""
+
+import re
+import subprocess
+import sys
+import time
+from typing import NamedTuple
+
+STARTUP_REPORT_TOP = 25
+"""Number of modules listed in the startup report."""
+
+STARTUP_IMPORT_BUDGET_S = 1.0
+"""Import-time budget for light commands (version, status, validate); guarded by tests/test_cli_startup.py."""
+
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib", "scipy", "h5py", "PySide6")
+"""Packages that light commands must not import."""
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+class ImportRecord(NamedTuple):
+    """One line of `python -X importtime` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(line: str):
+    """Parses an `-X importtime` stderr line; None for any other line (including the header)."""
+    match = _IMPORTTIME_LINE.match(line)
+    if not match:
+        return None
+    self_us, cumulative_us, indent, module = match.groups()
+    return ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2)
+
+
+def format_report(records: list[ImportRecord], wall_seconds: float, top: int = STARTUP_REPORT_TOP) -> str:
+    """Builds the startup report: total import time and the slowest modules.
+
+    Args:
+        records: Parsed import records.
+        wall_seconds: Wall time of the whole command.
+        top: Number of modules to list.
+
+    Returns:
+        Report text.
+    """
+    total_us = sum(r.self_us for r in records)
+    heavy = sorted({r.module.split(".")[0] for r in records} & set(HEAVY_MODULES))
+    lines = [
+        "",
+        "=" * 72,
+        f"Startup profile: {len(records)} modules imported in {total_us / 1e6:.3f}s (command wall time {wall_seconds:.3f}s)",
+        f"Heavy packages loaded: {', '.join(heavy) if heavy else 'none'}",
+        "=" * 72,
+        f"{'cumulative':>12} {'self':>10}  module",
+    ]
+    # Top-level imports show which import statement is expensive, nested ones why
+    for r in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        lines.append(f"{r.cumulative_us / 1000:>10.1f}ms {r.self_us / 1000:>8.1f}ms  {'  ' * r.depth}{r.module}")
+    return "\n".join(lines)
+
+
+def profile_startup(cli_args: list[str]) -> int:
+    """Runs a goliat command under `python -X importtime` and reports per-module import times.
+
+    The command runs in a child interpreter so the timings cover a cold
+    start. Its stdout and stdin are passed through; stderr lines that are
+    not import timings are forwarded.
+
+    Args:
+        cli_args: Command line without the program name and `--profile-startup`.
+
+    Returns:
+        Exit code of the command.
+    """
+    code = "import sys; from cli.__main__ import main; sys.argv[0] = 'goliat'; main()"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", code, *cli_args],
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    records = []
+    for line in process.stderr:  # type: ignore[union-attr]
+        record = parse_importtime(line)
+        if record is not None:
+            records.append(record)
+        elif not line.startswith("import time:"):
+            sys.stderr.write(line)
+    returncode = process.wait()
+    print(format_report(records, time.perf_counter() - start), file=sys.stderr)
+    return returncode
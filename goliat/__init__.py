@@ -1,17 +1,27 @@
-from importlib import metadata
+def _read_version() -> str:
+    """Installed package version, or the one in pyproject.toml for source checkouts."""
+    from importlib import metadata
 
-try:
-    __version__ = metadata.version("goliat")
-except metadata.PackageNotFoundError:
-    # Fallback: read from pyproject.toml directly
-    from pathlib import Path
+    try:
+        return metadata.version("goliat")
+    except metadata.PackageNotFoundError:
+        # Fallback: read from pyproject.toml directly
+        from pathlib import Path
 
-    import tomllib
+        import tomllib
 
-    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        with open(pyproject_path, "rb") as f:
-            pyproject = tomllib.load(f)
-            __version__ = pyproject.get("project", {}).get("version", "unknown")
-    else:
-        __version__ = "unknown"
+        pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
+        if pyproject_path.exists():
+            with open(pyproject_path, "rb") as f:
+                pyproject = tomllib.load(f)
+                return pyproject.get("project", {}).get("version", "unknown")
+        return "unknown"
+
+
+def __getattr__(name: str):
+    """Resolves `__version__` on first access; importlib.metadata is slow to import."""
+    if name == "__version__":
+        global __version__
+        __version__ = _read_version()
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,65 +9,180 @@ IMPROVEMENTS:
 - Robust text placement to avoid overlap.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import os
 import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
-import matplotlib.gridspec as gridspec
-import matplotlib.pyplot as plt
 import numpy as np
 
 from goliat.analysis.parse_verbose_log import parse_verbose_log
+from goliat.analysis.solver_throughput_report import build_throughput_report, log_throughput_report
+from goliat.eta_model import import_log_history
+from goliat.results import get_catalog
 
+VERBOSE_LOG_CACHE_NAME = ".verbose_log_metrics_cache.json"
+"""File name of the parsed-metrics cache written into the scanned results directory."""
 
-def find_all_verbose_logs(results_dir: str | Path) -> list[Path]:
-    """Find all verbose.log files in the results directory."""
-    results_dir = Path(results_dir)
-    return list(results_dir.rglob("verbose.log"))
-
-
-def parse_all_logs(log_files: list[Path], verbose: bool = True) -> list[dict]:
-    """Parse all verbose.log files and return list of metrics."""
-    all_metrics = []
-
-    for i, log_file in enumerate(log_files):
-        # STRICT FILTER: Only Near Field
-        if "near_field" not in log_file.parts:
-            continue
+_LOG_CACHE_FORMAT = 1
+_MIN_LOGS_FOR_POOL = 8
 
-        if verbose and i % 50 == 0:
-            logging.getLogger("progress").info(f"  Parsing: {i + 1}/{len(log_files)}...", extra={"log_type": "verbose"})
 
+def find_all_verbose_logs(results_dir: str | Path) -> list[Path]:
+    """Find all verbose.log files in the results directory, via an incremental scan of its results catalog."""
+    catalog = get_catalog(str(results_dir))
+    catalog.refresh()
+    return [Path(info.path) for info in catalog.find("verbose.log")]
+
+
+def _log_fingerprint(log_file: Path) -> tuple[int, int]:
+    """(size, mtime_ns) of a log file, used to detect changed logs."""
+    st = log_file.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+@functools.lru_cache(maxsize=None)
+def _log_cache_version() -> str:
+    """Cache format plus a hash of the parser's source, so any change to the parser invalidates cached metrics."""
+    from goliat.analysis import parse_verbose_log as parser_module
+
+    source = Path(parser_module.__file__).read_bytes()
+    return f"{_LOG_CACHE_FORMAT}-{hashlib.sha1(source).hexdigest()[:12]}"
+
+
+def _parse_log_safe(log_file: str) -> dict | None:
+    """Parse one log, returning None on failure (top-level for ProcessPoolExecutor)."""
+    try:
+        return parse_verbose_log(log_file)
+    except Exception:
+        return None
+
+
+def load_log_cache(cache_path: str | Path) -> dict:
+    """Load the parsed-metrics cache, returning an empty cache if missing or outdated."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get("version") != _log_cache_version():
+        return {}
+    return cache.get("entries", {})
+
+
+def save_log_cache(cache_path: str | Path, entries: dict) -> None:
+    """Atomically write the parsed-metrics cache."""
+    cache_path = Path(cache_path)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": _log_cache_version(), "entries": entries}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.getLogger("verbose").warning(f"Could not write log cache {cache_path}: {e}")
+
+
+def _category_from_path(log_file: Path) -> dict:
+    """Derive study type, phantom, frequency and placement from a log path."""
+    parts = log_file.parts
+    category = {"study_type": "near_field", "phantom": "unknown", "frequency": "unknown", "placement": "unknown"}
+
+    try:
+        # Assuming structure: .../near_field/phantom/freq/placement/verbose.log
+        nf_index = parts.index("near_field")
+        if nf_index + 3 < len(parts):
+            category["phantom"] = parts[nf_index + 1]
+            category["frequency"] = parts[nf_index + 2]
+            category["placement"] = parts[nf_index + 3]
+    except ValueError:
+        pass
+    return category
+
+
+def parse_all_logs(
+    log_files: list[Path],
+    verbose: bool = True,
+    cache_path: str | Path | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Parse all verbose.log files and return list of metrics.
+
+    Logs whose size and mtime match an entry in the cache are not parsed
+    again; the remaining logs are parsed in a process pool.
+
+    Args:
+        log_files: Candidate log files. Only near-field logs are used.
+        verbose: Whether to log progress.
+        cache_path: JSON cache of parsed metrics keyed by log path. No caching if None.
+        max_workers: Process pool size. Defaults to the CPU count; 1 parses serially.
+
+    Returns:
+        One metrics dict per successfully parsed log, in input order.
+    """
+    progress_logger = logging.getLogger("progress")
+
+    # STRICT FILTER: Only Near Field
+    nf_logs = [log_file for log_file in log_files if "near_field" in log_file.parts]
+
+    cache = load_log_cache(cache_path) if cache_path else {}
+    results: dict[str, dict | None] = {}
+    fingerprints: dict[str, tuple[int, int]] = {}
+    to_parse: list[str] = []
+    for log_file in nf_logs:
+        key = str(log_file.resolve())
         try:
-            metrics = parse_verbose_log(log_file)
-
-            # Robust category extraction
-            parts = log_file.parts
-            category = {"study_type": "near_field", "phantom": "unknown", "frequency": "unknown", "placement": "unknown"}
-
-            try:
-                # Assuming structure: .../near_field/phantom/freq/placement/verbose.log
-                nf_index = parts.index("near_field")
-                if nf_index + 3 < len(parts):
-                    category["phantom"] = parts[nf_index + 1]
-                    category["frequency"] = parts[nf_index + 2]
-                    category["placement"] = parts[nf_index + 3]
-            except ValueError:
-                pass
-
-            metrics["category"] = category
-            all_metrics.append(metrics)
+            fingerprints[key] = _log_fingerprint(log_file)
+        except OSError:
+            continue
+        entry = cache.get(key)
+        if entry and (entry["size"], entry["mtime_ns"]) == fingerprints[key]:
+            results[key] = entry["metrics"]
+        else:
+            to_parse.append(key)
+
+    if verbose and cache_path:
+        progress_logger.info(f"  {len(results)} logs cached, {len(to_parse)} to parse.", extra={"log_type": "verbose"})
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(to_parse) >= _MIN_LOGS_FOR_POOL:
+        with ProcessPoolExecutor(max_workers=min(workers, len(to_parse))) as executor:
+            futures = {executor.submit(_parse_log_safe, key): key for key in to_parse}
+            for i, future in enumerate(as_completed(futures)):
+                results[futures[future]] = future.result()
+                if verbose and i % 50 == 0:
+                    progress_logger.info(f"  Parsing: {i + 1}/{len(to_parse)}...", extra={"log_type": "verbose"})
+    else:
+        for i, key in enumerate(to_parse):
+            if verbose and i % 50 == 0:
+                progress_logger.info(f"  Parsing: {i + 1}/{len(to_parse)}...", extra={"log_type": "verbose"})
+            results[key] = _parse_log_safe(key)
+
+    if cache_path and to_parse:
+        for key in to_parse:
+            # Failed parses are retried next time, e.g. a log that was still locked or being written
+            if results[key] is None:
+                cache.pop(key, None)
+                continue
+            size, mtime_ns = fingerprints[key]
+            cache[key] = {"size": size, "mtime_ns": mtime_ns, "metrics": results[key]}
+        save_log_cache(cache_path, cache)
 
-        except Exception:
-            if verbose:
-                # print(f"  Error parsing {log_file}: {e}")
-                pass
+    all_metrics = []
+    for log_file in nf_logs:
+        metrics = results.get(str(log_file.resolve()))
+        if metrics is None:
+            continue
+        metrics["category"] = _category_from_path(log_file)
+        all_metrics.append(metrics)
 
     if verbose:
-        logging.getLogger("progress").info(f"  Parsed {len(all_metrics)} Near-Field log files.", extra={"log_type": "progress"})
+        progress_logger.info(f"  Parsed {len(all_metrics)} Near-Field log files.", extra={"log_type": "progress"})
 
     return all_metrics
 
@@ -189,6 +304,8 @@ def format_large_number(n: float, precision: int = 1) -> str:
 
 def set_custom_style():
     """Set a professional, high-contrast engineering dark style."""
+    import matplotlib.pyplot as plt
+
     plt.style.use("seaborn-v0_8-darkgrid")
 
     # Colors suitable for "Engineering/Simulation" look (Deep Blues, Bright Cyans, Warm Accents)
@@ -231,6 +348,10 @@ def set_custom_style():
 
 def create_visualizations(stats: dict, output_dir: str | Path):
     """Create all visualizations with rigorous layout checks."""
+    # Deferred so log parsing (and its worker processes) never pays for matplotlib
+    import matplotlib.gridspec as gridspec
+    import matplotlib.pyplot as plt
+
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -541,15 +662,28 @@ def main():
     parser.add_argument("results_dir", nargs="?", default="results")
     parser.add_argument("-o", "--output", default="paper/simulation_stats")
     parser.add_argument("--json", action="store_true")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel parser processes (default: CPU count).")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every log instead of reusing cached metrics.")
+    parser.add_argument(
+        "--eta-history",
+        metavar="PATH",
+        default=None,
+        help="Add the parsed phase timings to this ETA history file (e.g. data/eta_history.json).",
+    )
     args = parser.parse_args()
 
     log_files = find_all_verbose_logs(args.results_dir)
-    all_metrics = parse_all_logs(log_files)
+    cache_path = None if args.no_cache else Path(args.results_dir) / VERBOSE_LOG_CACHE_NAME
+    all_metrics = parse_all_logs(log_files, cache_path=cache_path, max_workers=args.workers)
 
     if not all_metrics:
         logging.getLogger("progress").warning("  No Near-Field logs found.", extra={"log_type": "warning"})
         return
 
+    if args.eta_history:
+        added = import_log_history(args.eta_history, "near_field", all_metrics)
+        logging.getLogger("progress").info(f"  Added {added} phase timings to {args.eta_history}", extra={"log_type": "info"})
+
     stats = compute_aggregate_stats(all_metrics)
 
     logging.getLogger("progress").info(f"  Total Simulations: {stats['total_simulations']}", extra={"log_type": "info"})
@@ -557,6 +691,10 @@ def main():
         f"  Total Cell-Iterations: {format_large_number(stats['total_cell_iterations'])}", extra={"log_type": "info"}
     )
 
+    throughput_rows = build_throughput_report(args.results_dir)
+    if throughput_rows:
+        log_throughput_report(throughput_rows)
+
     create_visualizations(stats, args.output)
 
     if args.json:
@@ -573,6 +711,10 @@ def main():
         with open(json_path, "w") as f:
             json.dump(json_stats, f, indent=2)
 
+        if throughput_rows:
+            with open(Path(args.output) / "nf_solver_throughput.json", "w") as f:
+                json.dump(throughput_rows, f, indent=2)
+
     logging.getLogger("progress").info(f"  Saved visualizations to: {args.output}/", extra={"log_type": "success"})
 
 
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 
 import pandas as pd
 
+from ..extraction.tissue_grouping import TissueTaxonomy
+from ..results import get_catalog
 from .plotter import Plotter
 
 if TYPE_CHECKING:
@@ -40,6 +42,24 @@ class Analyzer:
         # Will be populated from pickle files - contains actual tissue names from extraction
         # This is the authoritative source, computed during extraction using material_name_mapping.json
         self.tissue_group_composition = {}
+        self._tissue_taxonomy: tuple[dict, TissueTaxonomy] | None = None
+        self._catalog = None
+
+    @property
+    def tissue_taxonomy(self) -> TissueTaxonomy:
+        """Compiled membership index of `tissue_group_composition`.
+
+        Built once per phantom and rebuilt only if the composition changes;
+        strategies use it to aggregate organ-level results by tissue group.
+        """
+        signature = self._composition_signature()
+        if self._tissue_taxonomy is None or self._tissue_taxonomy[0] != signature:
+            groups = {group_name: sorted(tissues) for group_name, tissues in signature.items()}
+            self._tissue_taxonomy = (signature, TissueTaxonomy.from_groups(groups))
+        return self._tissue_taxonomy[1]
+
+    def _composition_signature(self) -> dict[str, frozenset]:
+        return {group_name: frozenset(tissues) for group_name, tissues in self.tissue_group_composition.items()}
 
     def run_analysis(self):
         """Runs complete analysis pipeline using the selected strategy.
@@ -84,6 +104,19 @@ class Analyzer:
 
         logging.getLogger("progress").info("--- Analysis Finished ---", extra={"log_type": "success"})
 
+    def _result_files(self, results_dir: str) -> set[str]:
+        """Returns the names of the files in a simulation directory.
+
+        The results catalog is refreshed once per analyzer for this phantom's
+        subtree, so each simulation costs an index lookup instead of several
+        `exists` calls on a possibly remote results share.
+        """
+        if self._catalog is None:
+            self._catalog = get_catalog(os.path.join(self.base_dir, "results"))
+            self._catalog.refresh(under=self.results_base_dir)
+        entry = self._catalog.simulation(results_dir)
+        return set(entry.files) if entry else set()
+
     def _process_single_result(self, frequency_mhz: int, scenario_name: str, pos_name: str, orient_name: str):
         """Processes one simulation result file.
 
@@ -113,14 +146,16 @@ class Analyzer:
         sapd_json_path = os.path.join(results_dir, "sapd_results.json")
 
         # Check if files exist - skip silently if missing (partial results)
-        if not os.path.exists(json_path):
+        result_files = self._result_files(results_dir)
+        if "sar_results.json" not in result_files:
             logging.getLogger("progress").debug(
                 f"  - Skipping (no JSON): {frequency_mhz}MHz, {detailed_placement_name}",
                 extra={"log_type": "debug"},
             )
             return
 
-        if not os.path.exists(pickle_path):
+        has_pickle = "sar_stats_all_tissues.pkl" in result_files
+        if not has_pickle:
             logging.getLogger("progress").warning(
                 f"  - Warning: PKL file missing for {frequency_mhz}MHz, {detailed_placement_name}",
                 extra={"log_type": "warning"},
@@ -139,12 +174,12 @@ class Analyzer:
 
             # Load SAPD JSON if it exists (optional, only present when sapd=true)
             sapd_results = None
-            if os.path.exists(sapd_json_path):
+            if "sapd_results.json" in result_files:
                 with open(sapd_json_path, "r") as f:
                     sapd_results = json.load(f)
 
             # Load PKL if available
-            if os.path.exists(pickle_path):
+            if has_pickle:
                 try:
                     with open(pickle_path, "rb") as f:
                         pickle_data = pickle.load(f)
@@ -291,6 +326,9 @@ class Analyzer:
             # Restore tissue_group_composition from cache
             if "tissue_group_composition" in cached_data:
                 self.tissue_group_composition = cached_data["tissue_group_composition"]
+                if "tissue_taxonomy" in cached_data:
+                    signature = self._composition_signature()
+                    self._tissue_taxonomy = (signature, TissueTaxonomy.from_dict(cached_data["tissue_taxonomy"]))
 
             if results_df is not None:
                 logging.getLogger("progress").info(
@@ -318,6 +356,7 @@ class Analyzer:
             "summary_results": results_df,
             "organ_results": organ_results_df,
             "tissue_group_composition": self.tissue_group_composition,
+            "tissue_taxonomy": self.tissue_taxonomy.to_dict(),
         }
         with open(output_pickle_path, "wb") as f:
             pickle.dump(cached_data, f)
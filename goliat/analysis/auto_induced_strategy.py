@@ -34,6 +34,8 @@ from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 from scipy import stats
 from scipy.optimize import curve_fit
 
+from goliat.results import get_catalog
+
 # Suppress matplotlib thread warning
 warnings.filterwarnings("ignore", message=".*Starting a Matplotlib GUI outside of the main thread.*")
 
@@ -195,6 +197,7 @@ class AutoInducedAnalyzer:
     def load_data(self) -> None:
         """Load all auto-induced results data."""
         self.logger.info("Loading auto-induced data...")
+        get_catalog(str(self.results_dir)).refresh()
 
         # Load proxy scores
         self._load_proxy_scores()
@@ -207,30 +210,26 @@ class AutoInducedAnalyzer:
 
         self.logger.info(f"Loaded {len(self.proxy_df):,} proxy scores, {len(self.candidate_df)} candidates")
 
+    def _iter_auto_induced_files(self, filename: str):
+        """Yields (freq_ghz, phantom, path) for each `<N>GHz/<phantom>/auto_induced/<filename>` in the results catalog."""
+        for info in get_catalog(str(self.results_dir)).find(filename):
+            parts = info.relpath.split("/")
+            if len(parts) == 4 and parts[0].endswith("GHz") and parts[0][:-3].isdigit() and parts[2] == "auto_induced":
+                yield int(parts[0][:-3]), parts[1], Path(info.path)
+
     def _load_proxy_scores(self) -> None:
         """Load all proxy scores from all frequency/phantom combinations."""
         all_scores = []
 
-        for freq_folder in sorted(self.results_dir.iterdir()):
-            if not freq_folder.is_dir() or not freq_folder.name.endswith("GHz"):
-                continue
-
-            freq_ghz = int(freq_folder.name.replace("GHz", ""))
-
-            for phantom_folder in freq_folder.iterdir():
-                if not phantom_folder.is_dir():
-                    continue
-
-                proxy_csv = phantom_folder / "auto_induced" / "all_proxy_scores.csv"
-                if proxy_csv.exists():
-                    df = pd.read_csv(proxy_csv)
-                    df["freq_ghz"] = freq_ghz
-                    df["phantom"] = phantom_folder.name
-                    # Normalize proxy_score from E=1V/m to E=27.46V/m (1 W/m² incident)
-                    # proxy_score is |E|² in V²/m², so multiply by 754
-                    if "proxy_score" in df.columns:
-                        df["proxy_score"] = df["proxy_score"] * 754
-                    all_scores.append(df)
+        for freq_ghz, phantom, proxy_csv in self._iter_auto_induced_files("all_proxy_scores.csv"):
+            df = pd.read_csv(proxy_csv)
+            df["freq_ghz"] = freq_ghz
+            df["phantom"] = phantom
+            # Normalize proxy_score from E=1V/m to E=27.46V/m (1 W/m² incident)
+            # proxy_score is |E|² in V²/m², so multiply by 754
+            if "proxy_score" in df.columns:
+                df["proxy_score"] = df["proxy_score"] * 754
+            all_scores.append(df)
 
         if all_scores:
             self.proxy_df = pd.concat(all_scores, ignore_index=True)
@@ -239,31 +238,20 @@ class AutoInducedAnalyzer:
         """Load all candidate data with SAPD values."""
         all_candidates = []
 
-        for freq_folder in sorted(self.results_dir.iterdir()):
-            if not freq_folder.is_dir() or not freq_folder.name.endswith("GHz"):
-                continue
-
-            freq_ghz = int(freq_folder.name.replace("GHz", ""))
-
-            for phantom_folder in freq_folder.iterdir():
-                if not phantom_folder.is_dir():
-                    continue
-
-                # Load from proxy_sapd_correlation.csv (the correct file)
-                candidates_csv = phantom_folder / "auto_induced" / "proxy_sapd_correlation.csv"
-                if candidates_csv.exists():
-                    df = pd.read_csv(candidates_csv)
-                    df["freq_ghz"] = freq_ghz
-                    df["phantom"] = phantom_folder.name
-                    # Normalize all values from E=1V/m to 1 W/m² incident power density
-                    # Multiply by 754 to normalize E=1 V/m to 1 W/m² incident power density.
-                    if "sapd_w_m2" in df.columns:
-                        df["peak_sapd"] = df["sapd_w_m2"] * 754  # W/m² at 1 W/m² incident
-                    if "proxy_score" in df.columns:
-                        df["proxy_score"] = df["proxy_score"] * 754  # V²/m² at 1 W/m² incident
-                    if "distance_to_skin_mm" in df.columns:
-                        df["distance_to_skin"] = df["distance_to_skin_mm"]
-                    all_candidates.append(df)
+        # Load from proxy_sapd_correlation.csv (the correct file)
+        for freq_ghz, phantom, candidates_csv in self._iter_auto_induced_files("proxy_sapd_correlation.csv"):
+            df = pd.read_csv(candidates_csv)
+            df["freq_ghz"] = freq_ghz
+            df["phantom"] = phantom
+            # Normalize all values from E=1V/m to 1 W/m² incident power density
+            # Multiply by 754 to normalize E=1 V/m to 1 W/m² incident power density.
+            if "sapd_w_m2" in df.columns:
+                df["peak_sapd"] = df["sapd_w_m2"] * 754  # W/m² at 1 W/m² incident
+            if "proxy_score" in df.columns:
+                df["proxy_score"] = df["proxy_score"] * 754  # V²/m² at 1 W/m² incident
+            if "distance_to_skin_mm" in df.columns:
+                df["distance_to_skin"] = df["distance_to_skin_mm"]
+            all_candidates.append(df)
 
         if all_candidates:
             self.candidate_df = pd.concat(all_candidates, ignore_index=True)
@@ -139,6 +139,22 @@ class BaseAnalysisStrategy(ABC):
         """
         pass
 
+    def summarize_tissue_groups(self, analyzer: "Analyzer", all_organ_results_df: pd.DataFrame, columns: dict[str, str]) -> pd.DataFrame:
+        """Averages organ-level columns per tissue group and frequency for the heatmaps.
+
+        Args:
+            analyzer: Analyzer whose `tissue_taxonomy` defines the groups.
+            all_organ_results_df: DataFrame with organ-level details.
+            columns: Output column name -> organ-level column to average.
+
+        Returns:
+            DataFrame with 'frequency_mhz', 'group' (display name, e.g. 'Eyes') and the
+            output columns. Empty if no organ belongs to a group.
+        """
+        summary = analyzer.tissue_taxonomy.aggregate(all_organ_results_df, list(columns.values()), by=["frequency_mhz"])
+        summary["group"] = [group_name.replace("_group", "").capitalize() for group_name in summary["group"]]
+        return summary.rename(columns={source: name for name, source in columns.items()})
+
     @abstractmethod
     def generate_plots(
         self,
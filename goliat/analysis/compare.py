@@ -2,15 +2,28 @@
 
 This module provides functionality to compare SAR data between different
 institutions (UGent and CNR) and create publication-quality comparison plots.
+
+Each workbook is parsed once per content: its rows are cached as typed
+columns keyed by the workbook's hash. Figures are drawn on a process pool,
+and a figure whose data is unchanged since it was saved is not redrawn.
 """
 
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from goliat.constants import COMPARISON_CACHE_DIR, COMPARISON_MANIFEST_FILENAME, COMPARISON_PLOT_WORKERS
+
 # Try to use scienceplots style if available
 try:
     import scienceplots  # noqa: F401
@@ -62,6 +75,9 @@ SCENARIOS = ["fronteyes", "belly", "cheek"]
 INSTITUTION_COLORS = {"UGent": "black", "CNR": "red"}
 PHANTOM_MARKERS = {"Thelonious": "o", "Eartha": "s", "Duke": "^"}
 
+# Bumped whenever the layout of the columnar workbook cache changes
+_CACHE_FORMAT = 1
+
 
 def _apply_comparison_style():
     """Apply white background style to matplotlib.
@@ -88,64 +104,121 @@ def _apply_comparison_style():
     )
 
 
+def workbook_hash(path: str) -> str:
+    """Returns the SHA-256 of a workbook's contents, the key of its cached columnar copy."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _parse_workbook(path: str) -> pd.DataFrame:
+    """Reads every sheet of a partner workbook, tagging rows with the phantom and scenario of their sheet."""
+    frames = []
+    for sheet_name, df in pd.read_excel(path, sheet_name=None).items():
+        parts = sheet_name.split("_")
+        df["phantom"] = parts[0]
+        df["scenario"] = "_".join(parts[1:])
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _save_columnar(df: pd.DataFrame, path: str):
+    """Writes a frame as one typed array per column.
+
+    Numeric columns keep their dtype. Any other column is stored as
+    category codes (-1 for missing) plus the text of its categories.
+    """
+    arrays = {"columns": np.array([str(c) for c in df.columns], dtype=str)}
+    for i, column in enumerate(df.columns):
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values):
+            arrays[f"values_{i}"] = values.to_numpy()
+        else:
+            codes, categories = pd.factorize(values)
+            arrays[f"codes_{i}"] = codes.astype(np.int32)
+            arrays[f"categories_{i}"] = np.array([str(c) for c in categories], dtype=str)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _load_columnar(path: str) -> pd.DataFrame:
+    """Reads a frame written by `_save_columnar`."""
+    columns = {}
+    with np.load(path, allow_pickle=False) as data:
+        for i, column in enumerate(data["columns"]):
+            if f"values_{i}" in data.files:
+                columns[str(column)] = data[f"values_{i}"]
+            else:
+                codes = data[f"codes_{i}"]
+                # Appending NaN lets code -1 (missing) index it directly
+                labels = np.append(data[f"categories_{i}"].astype(object), np.nan)
+                columns[str(column)] = labels[codes]
+    return pd.DataFrame(columns)
+
+
+def read_partner_workbook(path: str, institution: str, cache_dir: Optional[str] = COMPARISON_CACHE_DIR) -> pd.DataFrame:
+    """Loads all sheets of a partner workbook, parsing the Excel file only once per content.
+
+    The parsed rows are stored in `cache_dir` as `<workbook hash>.npz`, so later
+    runs skip Excel entirely until the workbook changes. Text columns come
+    back as strings.
+
+    Args:
+        path: Path to the Excel workbook, one sheet per `<Phantom>_<scenario>`.
+        institution: Value of the added `institution` column.
+        cache_dir: Directory of the columnar cache, or None to always parse the workbook.
+
+    Returns:
+        The rows of all sheets with `phantom`, `scenario` and `institution` columns added.
+    """
+    cache_path = os.path.join(cache_dir, f"{workbook_hash(path)}.v{_CACHE_FORMAT}.npz") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        logging.getLogger("verbose").info(f"Using cached columns of {path}: {cache_path}", extra={"log_type": "verbose"})
+        df = _load_columnar(cache_path)
+    else:
+        df = _parse_workbook(path)
+        if cache_path:
+            _save_columnar(df, cache_path)
+    df["institution"] = institution
+    return df
+
+
 def load_comparison_data(
     ugent_file: str,
     cnr_file: str,
+    cache_dir: Optional[str] = COMPARISON_CACHE_DIR,
 ) -> pd.DataFrame:
     """Load all data from both Excel files.
 
     Args:
         ugent_file: Path to UGent Excel file
         cnr_file: Path to CNR Excel file
+        cache_dir: Directory of the columnar workbook cache, or None to parse the workbooks on every call
 
     Returns:
         Combined DataFrame with all data
     """
     all_data = []
 
-    # Load UGent data
-    if os.path.exists(ugent_file):
-        logging.getLogger("progress").info(
-            f"Loading UGent data from: {ugent_file}",
-            extra={"log_type": "info"},
-        )
-        xl_ugent = pd.ExcelFile(ugent_file)
-        for sheet_name in xl_ugent.sheet_names:
-            df = pd.read_excel(ugent_file, sheet_name=sheet_name)
-            parts = sheet_name.split("_")
-            phantom = parts[0]
-            scenario = "_".join(parts[1:])
-            df["phantom"] = phantom
-            df["institution"] = "UGent"
-            df["scenario"] = scenario
-            all_data.append(df)
-    else:
-        logging.getLogger("progress").warning(
-            f"UGent file not found: {ugent_file}",
-            extra={"log_type": "warning"},
-        )
-
-    # Load CNR data
-    if os.path.exists(cnr_file):
-        logging.getLogger("progress").info(
-            f"Loading CNR data from: {cnr_file}",
-            extra={"log_type": "info"},
-        )
-        xl_cnr = pd.ExcelFile(cnr_file)
-        for sheet_name in xl_cnr.sheet_names:
-            df = pd.read_excel(cnr_file, sheet_name=sheet_name)
-            parts = sheet_name.split("_")
-            phantom = parts[0]
-            scenario = "_".join(parts[1:])
-            df["phantom"] = phantom
-            df["institution"] = "CNR"
-            df["scenario"] = scenario
-            all_data.append(df)
-    else:
-        logging.getLogger("progress").warning(
-            f"CNR file not found: {cnr_file}",
-            extra={"log_type": "warning"},
-        )
+    for institution, path in (("UGent", ugent_file), ("CNR", cnr_file)):
+        if os.path.exists(path):
+            logging.getLogger("progress").info(
+                f"Loading {institution} data from: {path}",
+                extra={"log_type": "info"},
+            )
+            df = read_partner_workbook(path, institution, cache_dir)
+            if not df.empty:
+                all_data.append(df)
+        else:
+            logging.getLogger("progress").warning(
+                f"{institution} file not found: {path}",
+                extra={"log_type": "warning"},
+            )
 
     if not all_data:
         return pd.DataFrame()
@@ -154,22 +227,29 @@ def load_comparison_data(
     return combined_df
 
 
-def create_comparison_plots(
-    df: pd.DataFrame,
-    output_dir: Path,
-    plot_format: str = "pdf",
-):
-    """Create comparison plots for all metrics and scenarios.
+class ComparisonFigure(NamedTuple):
+    """One comparison figure.
 
-    Args:
-        df: Combined DataFrame with UGent and CNR data
-        output_dir: Directory to save plots
-        plot_format: Output format ('pdf' or 'png')
+    Attributes:
+        filename: File name of the figure in the output directory; its extension is the plot format.
+        metric: Metric column plotted against frequency.
+        scenario: Scenario of a single-scenario figure, or None for the summary across `SCENARIOS`.
     """
-    output_dir.mkdir(exist_ok=True, parents=True)
 
+    filename: str
+    metric: str
+    scenario: Optional[str] = None
+
+
+def _safe_metric(metric: str) -> str:
+    return metric.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
+
+
+def scenario_figures(df: pd.DataFrame, plot_format: str = "pdf") -> list[ComparisonFigure]:
+    """Lists the per-scenario figures that have data: one per scenario and metric."""
+    figures = []
     for scenario in SCENARIOS:
-        scenario_data = df[df["scenario"] == scenario].copy()
+        scenario_data = df[df["scenario"] == scenario]
 
         if scenario_data.empty:
             logging.getLogger("progress").info(
@@ -179,159 +259,268 @@ def create_comparison_plots(
             continue
 
         for metric in METRICS:
-            if metric not in scenario_data.columns:
-                continue
+            if metric in scenario_data.columns and scenario_data[metric].notna().any():
+                figures.append(ComparisonFigure(f"compare_{_safe_metric(metric)}_{scenario}.{plot_format}", metric, scenario))
+    return figures
+
+
+def summary_figures(df: pd.DataFrame, plot_format: str = "pdf") -> list[ComparisonFigure]:
+    """Lists the summary figures that have data: one per metric, with a panel per scenario."""
+    return [
+        ComparisonFigure(f"compare_summary_{_safe_metric(metric)}.{plot_format}", metric)
+        for metric in METRICS
+        if metric in df.columns and df[metric].notna().any()
+    ]
+
+
+def figure_data(df: pd.DataFrame, figure: ComparisonFigure) -> pd.DataFrame:
+    """Selects the rows and columns a figure is drawn from."""
+    rows = df[figure.metric].notna()
+    if figure.scenario is not None:
+        rows &= df["scenario"] == figure.scenario
+    return df.loc[rows, ["phantom", "institution", "scenario", "frequency_mhz", figure.metric]]
+
+
+def figure_fingerprint(data: pd.DataFrame, figure: ComparisonFigure) -> str:
+    """Returns a hash of a figure's data; an unchanged hash means the saved figure is still current."""
+    hasher = hashlib.sha1(repr(tuple(figure)).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def _plot_phantoms(ax, data: pd.DataFrame, metric: str, summary: bool):
+    """Draws mean ± std over frequency for each phantom in `data`."""
+    for phantom in sorted(data["phantom"].unique()):
+        phantom_data = data[data["phantom"] == phantom]
+        institution = phantom_data["institution"].iloc[0]
+
+        grouped = phantom_data.groupby("frequency_mhz")[metric].agg(["mean", "std"])
+
+        x = grouped.index.values
+        y_mean = grouped["mean"].values
+        y_std = grouped["std"].values
+
+        color = INSTITUTION_COLORS.get(institution, "gray")
+        marker = PHANTOM_MARKERS.get(phantom, "o")
+
+        if summary:
+            ax.errorbar(
+                x,
+                y_mean,
+                yerr=y_std,
+                marker=marker,
+                linestyle="-" if institution == "UGent" else "--",
+                label=f"{phantom}",
+                color=color,
+                markersize=3,
+                capsize=1,
+                capthick=0.5,
+                linewidth=1,
+            )
+        else:
+            ax.errorbar(
+                x,
+                y_mean,
+                yerr=y_std,
+                marker=marker,
+                linestyle="-",
+                label=f"{phantom} ({institution})",
+                color=color,
+                markersize=4,
+                capsize=2,
+                capthick=1,
+                linewidth=1.5,
+            )
+
+
+def draw_comparison_figure(data: pd.DataFrame, figure: ComparisonFigure, output_dir: Path):
+    """Draws one figure from its `figure_data` and saves it in `output_dir`."""
+    metric = figure.metric
+
+    if figure.scenario is not None:
+        fig, ax = plt.subplots(figsize=(3.5, 2.5))  # IEEE single-column
+        _plot_phantoms(ax, data, metric, summary=False)
+        ax.set_xlabel("Frequency (MHz)")
+        ax.set_ylabel(metric)
+        ax.legend(loc="best", fontsize=7)
+        ax.grid(True, alpha=0.3)
+        ax.set_ylim(bottom=0)
+    else:
+        # Create figure with 3 subplots (one per scenario)
+        fig, axes = plt.subplots(1, 3, figsize=(7, 2.5))
 
-            metric_data = scenario_data[scenario_data[metric].notna()].copy()
+        for idx, scenario in enumerate(SCENARIOS):
+            ax = axes[idx]
+            scenario_data = data[data["scenario"] == scenario]
 
-            if metric_data.empty:
+            if scenario_data.empty:
+                ax.text(0.5, 0.5, "No data", ha="center", va="center", transform=ax.transAxes)
+                ax.set_title(scenario.replace("_", " ").title())
                 continue
 
-            fig, ax = plt.subplots(figsize=(3.5, 2.5))  # IEEE single-column
+            _plot_phantoms(ax, scenario_data, metric, summary=True)
+            ax.set_xlabel("Frequency (MHz)")
+            if idx == 0:
+                ax.set_ylabel(metric.replace("_", " "))
+            ax.set_title(scenario.replace("_", " ").title())
+            ax.legend(loc="best", fontsize=6)
+            ax.grid(True, alpha=0.3)
+            ax.set_ylim(bottom=0)
 
-            phantoms = metric_data["phantom"].unique()
+    plt.tight_layout()
 
-            for phantom in sorted(phantoms):
-                phantom_data = metric_data[metric_data["phantom"] == phantom]
-                institution = phantom_data["institution"].iloc[0]
+    filepath = output_dir / figure.filename
+    if filepath.suffix == ".pdf":
+        fig.savefig(filepath, bbox_inches="tight", format="pdf")
+    else:
+        fig.savefig(filepath, dpi=300, bbox_inches="tight")
 
-                grouped = phantom_data.groupby("frequency_mhz")[metric].agg(["mean", "std"])
+    plt.close(fig)
 
-                x = grouped.index.values
-                y_mean = grouped["mean"].values
-                y_std = grouped["std"].values
 
-                label = f"{phantom} ({institution})"
-                color = INSTITUTION_COLORS.get(institution, "gray")
-                marker = PHANTOM_MARKERS.get(phantom, "o")
+_worker_df: Optional[pd.DataFrame] = None
 
-                ax.errorbar(
-                    x,
-                    y_mean,
-                    yerr=y_std,
-                    marker=marker,
-                    linestyle="-",
-                    label=label,
-                    color=color,
-                    markersize=4,
-                    capsize=2,
-                    capthick=1,
-                    linewidth=1.5,
-                )
 
-            ax.set_xlabel("Frequency (MHz)")
-            ax.set_ylabel(metric)
-            ax.legend(loc="best", fontsize=7)
-            ax.grid(True, alpha=0.3)
-            ax.set_ylim(bottom=0)
+def _init_plot_worker(data_path: str):
+    """Loads the comparison data once per worker process."""
+    global _worker_df
+    _worker_df = pd.read_pickle(data_path)
+    _apply_comparison_style()
 
-            plt.tight_layout()
 
-            safe_metric = metric.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
-            filename = f"compare_{safe_metric}_{scenario}.{plot_format}"
-            filepath = output_dir / filename
+def _draw_in_worker(figure: ComparisonFigure, output_dir: Path) -> ComparisonFigure:
+    draw_comparison_figure(figure_data(_worker_df, figure), figure, output_dir)
+    return figure
 
-            if plot_format == "pdf":
-                fig.savefig(filepath, bbox_inches="tight", format="pdf")
-            else:
-                fig.savefig(filepath, dpi=300, bbox_inches="tight")
 
-            plt.close(fig)
-            logging.getLogger("progress").info(
-                f"  - Generated comparison plot: {filename}",
-                extra={"log_type": "success"},
-            )
+def _read_manifest(path: Path) -> dict[str, str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 
-def create_summary_comparison_plots(
+def _write_manifest(path: Path, manifest: dict[str, str]):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def render_comparison_figures(
     df: pd.DataFrame,
+    figures: list[ComparisonFigure],
     output_dir: Path,
-    plot_format: str = "pdf",
-):
-    """Create summary comparison plots across all scenarios.
+    workers: int = COMPARISON_PLOT_WORKERS,
+    force: bool = False,
+) -> list[ComparisonFigure]:
+    """Draws the figures whose data changed since they were last saved.
+
+    The fingerprint of each saved figure's data is kept in
+    `COMPARISON_MANIFEST_FILENAME` in `output_dir`; figures whose file exists
+    and whose fingerprint is unchanged are skipped. The rest are drawn on a
+    pool of `workers` processes, each of which loads `df` once when it
+    starts and then receives only the figure to draw. The pool uses "spawn", so it is
+    safe to start from the GUI's analysis thread.
 
     Args:
-        df: Combined DataFrame with UGent and CNR data
-        output_dir: Directory to save plots
-        plot_format: Output format ('pdf' or 'png')
+        df: Combined DataFrame with UGent and CNR data.
+        figures: Figures to bring up to date, from `scenario_figures` and `summary_figures`.
+        output_dir: Directory to save plots.
+        workers: Drawing processes; 1 draws in this process.
+        force: Redraw every figure regardless of the manifest.
+
+    Returns:
+        The figures that were drawn.
     """
     output_dir.mkdir(exist_ok=True, parents=True)
+    manifest_path = output_dir / COMPARISON_MANIFEST_FILENAME
+    manifest = _read_manifest(manifest_path)
+
+    fingerprints = {figure: figure_fingerprint(figure_data(df, figure), figure) for figure in figures}
+    stale = [
+        figure
+        for figure in figures
+        if force or manifest.get(figure.filename) != fingerprints[figure] or not (output_dir / figure.filename).exists()
+    ]
+    if len(stale) < len(figures):
+        logging.getLogger("progress").info(
+            f"  - {len(figures) - len(stale)} comparison plots unchanged, skipped",
+            extra={"log_type": "info"},
+        )
 
-    for metric in METRICS:
-        if metric not in df.columns:
-            continue
-
-        metric_data = df[df[metric].notna()].copy()
-
-        if metric_data.empty:
-            continue
-
-        # Create figure with 3 subplots (one per scenario)
-        fig, axes = plt.subplots(1, 3, figsize=(7, 2.5))
-
-        for idx, scenario in enumerate(SCENARIOS):
-            ax = axes[idx]
-            scenario_data = metric_data[metric_data["scenario"] == scenario]
+    def finished(figure: ComparisonFigure):
+        manifest[figure.filename] = fingerprints[figure]
+        kind = "comparison plot" if figure.scenario is not None else "summary comparison plot"
+        logging.getLogger("progress").info(
+            f"  - Generated {kind}: {figure.filename}",
+            extra={"log_type": "success"},
+        )
 
-            if scenario_data.empty:
-                ax.text(0.5, 0.5, "No data", ha="center", va="center", transform=ax.transAxes)
-                ax.set_title(scenario.replace("_", " ").title())
-                continue
+    try:
+        if workers > 1 and len(stale) > 1:
+            # Workers read the data from a file: a large frame in `initargs` is written into each
+            # new process's pipe, which blocks forever if that process dies while starting
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                data_path = os.path.join(tmp_dir, "comparison.pkl")
+                df.to_pickle(data_path)
+                with ProcessPoolExecutor(
+                    max_workers=min(workers, len(stale)),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_plot_worker,
+                    initargs=(data_path,),
+                ) as pool:
+                    futures = [pool.submit(_draw_in_worker, figure, output_dir) for figure in stale]
+                    for future in as_completed(futures):
+                        finished(future.result())
+        else:
+            for figure in stale:
+                draw_comparison_figure(figure_data(df, figure), figure, output_dir)
+                finished(figure)
+    finally:
+        # Keep the fingerprints of what was drawn even if a later figure failed
+        if stale:
+            _write_manifest(manifest_path, manifest)
+    return stale
 
-            phantoms = scenario_data["phantom"].unique()
-            for phantom in sorted(phantoms):
-                phantom_data = scenario_data[scenario_data["phantom"] == phantom]
-                institution = phantom_data["institution"].iloc[0]
-
-                grouped = phantom_data.groupby("frequency_mhz")[metric].agg(["mean", "std"])
-
-                x = grouped.index.values
-                y_mean = grouped["mean"].values
-                y_std = grouped["std"].values
-
-                label = f"{phantom}"
-                color = INSTITUTION_COLORS.get(institution, "gray")
-                marker = PHANTOM_MARKERS.get(phantom, "o")
-                linestyle = "-" if institution == "UGent" else "--"
-
-                ax.errorbar(
-                    x,
-                    y_mean,
-                    yerr=y_std,
-                    marker=marker,
-                    linestyle=linestyle,
-                    label=label,
-                    color=color,
-                    markersize=3,
-                    capsize=1,
-                    capthick=0.5,
-                    linewidth=1,
-                )
 
-            ax.set_xlabel("Frequency (MHz)")
-            if idx == 0:
-                ax.set_ylabel(metric.replace("_", " "))
-            ax.set_title(scenario.replace("_", " ").title())
-            ax.legend(loc="best", fontsize=6)
-            ax.grid(True, alpha=0.3)
-            ax.set_ylim(bottom=0)
+def create_comparison_plots(
+    df: pd.DataFrame,
+    output_dir: Path,
+    plot_format: str = "pdf",
+    workers: int = COMPARISON_PLOT_WORKERS,
+    force: bool = False,
+):
+    """Create comparison plots for all metrics and scenarios.
 
-        plt.tight_layout()
+    Args:
+        df: Combined DataFrame with UGent and CNR data
+        output_dir: Directory to save plots
+        plot_format: Output format ('pdf' or 'png')
+        workers: Processes drawing figures in parallel
+        force: Redraw figures whose data is unchanged
+    """
+    render_comparison_figures(df, scenario_figures(df, plot_format), output_dir, workers, force)
 
-        safe_metric = metric.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
-        filename = f"compare_summary_{safe_metric}.{plot_format}"
-        filepath = output_dir / filename
 
-        if plot_format == "pdf":
-            fig.savefig(filepath, bbox_inches="tight", format="pdf")
-        else:
-            fig.savefig(filepath, dpi=300, bbox_inches="tight")
+def create_summary_comparison_plots(
+    df: pd.DataFrame,
+    output_dir: Path,
+    plot_format: str = "pdf",
+    workers: int = COMPARISON_PLOT_WORKERS,
+    force: bool = False,
+):
+    """Create summary comparison plots across all scenarios.
 
-        plt.close(fig)
-        logging.getLogger("progress").info(
-            f"  - Generated summary comparison plot: {filename}",
-            extra={"log_type": "success"},
-        )
+    Args:
+        df: Combined DataFrame with UGent and CNR data
+        output_dir: Directory to save plots
+        plot_format: Output format ('pdf' or 'png')
+        workers: Processes drawing figures in parallel
+        force: Redraw figures whose data is unchanged
+    """
+    render_comparison_figures(df, summary_figures(df, plot_format), output_dir, workers, force)
 
 
 def run_comparison(
@@ -339,6 +528,9 @@ def run_comparison(
     cnr_file: str,
     output_dir: str,
     plot_format: str = "pdf",
+    cache_dir: Optional[str] = COMPARISON_CACHE_DIR,
+    workers: int = COMPARISON_PLOT_WORKERS,
+    force: bool = False,
 ):
     """Run the full comparison analysis.
 
@@ -347,6 +539,9 @@ def run_comparison(
         cnr_file: Path to CNR Excel file
         output_dir: Directory to save comparison plots
         plot_format: Output format ('pdf' or 'png')
+        cache_dir: Directory of the columnar workbook cache, or None to parse the workbooks
+        workers: Processes drawing figures in parallel
+        force: Redraw figures whose data is unchanged
     """
     # Apply white background style (overrides any dark mode from other modules)
     _apply_comparison_style()
@@ -365,7 +560,7 @@ def run_comparison(
     )
 
     # Load data
-    df = load_comparison_data(ugent_file, cnr_file)
+    df = load_comparison_data(ugent_file, cnr_file, cache_dir)
 
     if df.empty:
         logging.getLogger("progress").error(
@@ -391,21 +586,13 @@ def run_comparison(
         extra={"log_type": "info"},
     )
 
-    output_path = Path(output_dir)
-
-    # Create individual comparison plots
+    # Individual and summary plots share one pool of drawing processes
     logging.getLogger("progress").info(
-        "\nCreating individual comparison plots...",
+        "\nCreating comparison plots...",
         extra={"log_type": "info"},
     )
-    create_comparison_plots(df, output_path, plot_format)
-
-    # Create summary plots
-    logging.getLogger("progress").info(
-        "\nCreating summary comparison plots...",
-        extra={"log_type": "info"},
-    )
-    create_summary_comparison_plots(df, output_path, plot_format)
+    figures = scenario_figures(df, plot_format) + summary_figures(df, plot_format)
+    render_comparison_figures(df, figures, Path(output_dir), workers, force)
 
     logging.getLogger("progress").info(
         f"\nAll comparison plots saved to: {output_dir}",
@@ -444,6 +631,22 @@ def main():
         default="pdf",
         help="Output format for plots",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=COMPARISON_PLOT_WORKERS,
+        help="Processes drawing plots in parallel",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse the Excel files instead of using their cached columns",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Redraw plots whose data is unchanged",
+    )
     args = parser.parse_args()
 
     # Setup basic logging if not in goliat context
@@ -456,6 +659,9 @@ def main():
         args.cnr_file,
         args.output,
         args.format,
+        cache_dir=None if args.no_cache else COMPARISON_CACHE_DIR,
+        workers=args.workers,
+        force=args.force,
     )
 
 
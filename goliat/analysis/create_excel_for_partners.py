@@ -2,81 +2,180 @@
 
 import json
 import logging
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Sequence
 
 import pandas as pd
 
+from goliat.constants import PARTNER_EXCEL_CHUNK_ROWS, PARTNER_EXCEL_WORKERS
 
-def _auto_size_columns(worksheet, df: pd.DataFrame):
-    """Auto-size column widths to fit content.
+SHEET_TYPES = ("fronteyes", "belly", "cheek")
+"""Sheets written per phantom, in workbook order."""
+
+PLACEMENT_PREFIXES = {"fronteyes": "front_of_eyes_", "belly": "by_belly_", "cheek": "by_cheek_tragus_"}
+"""Placement prefix selecting the rows of each sheet."""
+
+SOURCE_COLUMNS = ("placement", "frequency_mhz", "SAR_whole_body", "SAR_head", "SAR_trunk", "peak_sapd_W_m2")
+"""Results CSV columns the sheets are built from; all others are skipped while parsing."""
+
+GENERAL_NUMBER_WIDTH = 11
+"""Characters Excel's General format shows at most for a number."""
+
+
+def _column_widths(df: pd.DataFrame) -> list[int]:
+    """Column widths from per-column statistics instead of a scan of every cell.
+
+    Integer columns are sized by their minimum and maximum, other numbers by
+    the General format width, and text columns by their longest distinct value.
 
     Args:
-        worksheet: openpyxl worksheet object
-        df: DataFrame that was written to the worksheet
-    """
-    if df.empty:
-        return
+        df: Sheet data.
 
-    # Calculate max width for each column
-    for idx, column in enumerate(df.columns, start=1):
-        # Get max length in column (including header)
-        data_max = df[column].fillna("").astype(str).apply(len).max()
-        if pd.isna(data_max):
-            data_max = 0
-        max_length = max(int(data_max), len(str(column)))
-        # Add some padding and set minimum width
-        adjusted_width = min(max(max_length + 2, 10), 50)  # Min 10, max 50
-        worksheet.column_dimensions[worksheet.cell(1, idx).column_letter].width = adjusted_width
+    Returns:
+        One width per column, padded and clamped to 10-50 characters.
+    """
+    widths = []
+    for column in df.columns:
+        series = df[column].dropna()
+        if series.empty:
+            data_width = 0
+        elif pd.api.types.is_integer_dtype(series):
+            data_width = max(len(str(series.min())), len(str(series.max())))
+        elif pd.api.types.is_float_dtype(series):
+            data_width = GENERAL_NUMBER_WIDTH
+        else:
+            data_width = max(len(str(value)) for value in series.unique())
+        widths.append(min(max(max(data_width, len(str(column))) + 2, 10), 50))  # Min 10, max 50
+    return widths
 
 
 def _add_table_formatting(worksheet, df: pd.DataFrame, table_name: str):
     """Add Excel table formatting matching CNR's Excel format.
 
     Args:
-        worksheet: openpyxl worksheet object
+        worksheet: openpyxl worksheet object, possibly write-only
         df: DataFrame that was written to the worksheet
         table_name: Name for the table
     """
+    from openpyxl.utils import get_column_letter
     from openpyxl.worksheet.table import Table, TableStyleInfo
 
     if df.empty:
         return
 
-    # Calculate table range (A1 to last column + last row)
-    num_rows = len(df) + 1  # +1 for header
-    num_cols = len(df.columns)
-
-    # Convert column number to letter (1 -> A, 2 -> B, etc.)
-    def col_num_to_letter(n):
-        """Convert 1-based column index to Excel letter (1->A, 27->AA)."""
-        result = ""
-        while n > 0:
-            n -= 1
-            result = chr(65 + (n % 26)) + result
-            n //= 26
-        return result
-
-    start_cell = "A1"
-    end_col = col_num_to_letter(num_cols)
-    end_cell = f"{end_col}{num_rows}"
-    table_range = f"{start_cell}:{end_cell}"
-
-    # Create table
-    table = Table(displayName=table_name.replace(" ", "_"), ref=table_range)
-
-    # Add default Excel green table style
+    table = Table(displayName=table_name.replace(" ", "_"), ref=f"A1:{get_column_letter(len(df.columns))}{len(df) + 1}")
+    # Write-only sheets cannot be read back, so the column names come from the DataFrame
+    table._initialise_columns()
+    for table_column, name in zip(table.tableColumns, df.columns):
+        table_column.name = str(name)
+
     # TableStyleLight2 is the light green style, TableStyleMedium2 is medium green
-    style = TableStyleInfo(
+    table.tableStyleInfo = TableStyleInfo(
         name="TableStyleLight2",  # Light green table style (default Excel green)
         showFirstColumn=False,
         showLastColumn=False,
         showRowStripes=True,
         showColumnStripes=False,
     )
-    table.tableStyleInfo = style
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="In write-only mode you must add table columns manually")
+        worksheet.add_table(table)
+
+
+def write_sheet(workbook, sheet_name: str, df: pd.DataFrame):
+    """Streams a DataFrame into a new sheet of a write-only workbook.
+
+    Column widths are set up front, rows are appended one at a time (so only
+    the current row is held by openpyxl) and the rows are formatted as a table.
+
+    Args:
+        workbook: openpyxl Workbook opened with write_only=True.
+        sheet_name: Sheet title, at most 31 characters.
+        df: Sheet data from `create_sheet_data`.
+    """
+    from openpyxl.utils import get_column_letter
+
+    worksheet = workbook.create_sheet(sheet_name)
+    if df.empty:
+        return
+    for idx, width in enumerate(_column_widths(df), start=1):
+        worksheet.column_dimensions[get_column_letter(idx)].width = width
 
-    # Add table to worksheet
-    worksheet.add_table(table)
+    worksheet.append([str(column) for column in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        worksheet.append([None if pd.isna(value) else value for value in row])
+    _add_table_formatting(worksheet, df, sheet_name)
+
+
+def read_sheet_sources(csv_path: str | Path, chunk_rows: int = PARTNER_EXCEL_CHUNK_ROWS) -> pd.DataFrame:
+    """Reads the rows and columns of a results CSV that any sheet uses.
+
+    The CSV is parsed in chunks of `chunk_rows`, keeping only `SOURCE_COLUMNS`
+    and the placements of the partner sheets, so the full results table is
+    never in memory.
+
+    Args:
+        csv_path: Path to normalized_results_detailed.csv.
+        chunk_rows: Rows parsed at a time.
+
+    Returns:
+        DataFrame with the used columns of the matching rows.
+    """
+    prefixes = tuple(PLACEMENT_PREFIXES.values())
+    chunks = [
+        chunk[chunk["placement"].astype(str).str.startswith(prefixes)]
+        for chunk in pd.read_csv(csv_path, usecols=lambda column: column in SOURCE_COLUMNS, chunksize=chunk_rows)
+    ]
+    sources = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=["placement", "frequency_mhz"])
+    sources["placement"] = sources["placement"].astype("category")
+    return sources
+
+
+def write_partner_workbook(
+    output_path: str | Path,
+    phantom_csvs: Sequence[tuple[str, str | Path]],
+    power_mapping: dict[int, int],
+    sheet_prefix: Callable[[str], str] = lambda phantom_name: phantom_name.capitalize(),
+    workers: int = PARTNER_EXCEL_WORKERS,
+) -> dict[str, int]:
+    """Writes the partner sheets of several phantoms into one workbook.
+
+    Phantoms are read and sorted concurrently; their sheets are streamed into
+    a write-only workbook in the given phantom order as soon as each phantom
+    is ready.
+
+    Args:
+        output_path: Destination .xlsx file.
+        phantom_csvs: (phantom name, results CSV path) pairs, in sheet order.
+        power_mapping: Dictionary mapping frequency (MHz) to target power (mW).
+        sheet_prefix: Maps a phantom name to the prefix of its sheet names.
+        workers: Phantoms prepared at the same time.
+
+    Returns:
+        Rows written per sheet name.
+    """
+    from openpyxl import Workbook
+
+    def prepare(csv_path):
+        sources = read_sheet_sources(csv_path)
+        return [create_sheet_data(sources, sheet_type, power_mapping) for sheet_type in SHEET_TYPES]
+
+    workbook = Workbook(write_only=True)
+    rows: dict[str, int] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(phantom_csvs)))) as executor:
+        futures = [executor.submit(prepare, csv_path) for _, csv_path in phantom_csvs]
+        for (phantom_name, _), future in zip(phantom_csvs, futures):
+            sheets = future.result()
+            # Excel limits sheet names to 31 characters
+            for sheet_type, sheet in zip(SHEET_TYPES, sheets):
+                sheet_name = f"{sheet_prefix(phantom_name)}_{sheet_type}"[:31]
+                write_sheet(workbook, sheet_name, sheet)
+                rows[sheet_name] = len(sheet)
+            del sheets
+    workbook.save(output_path)
+    return rows
 
 
 def get_target_power_mapping(config_path: str) -> dict[int, int]:
@@ -157,7 +256,7 @@ def create_sheet_data(
         return pd.DataFrame()
 
     # Map placement names to match CNR's Excel format
-    filtered_df["placement"] = filtered_df["placement"].apply(lambda x: map_placement_name(x, sheet_type))
+    filtered_df["placement"] = filtered_df["placement"].astype(str).apply(lambda x: map_placement_name(x, sheet_type))
 
     # Create output DataFrame with column names matching CNR's Excel format
     result_df = pd.DataFrame()
@@ -203,32 +302,12 @@ def create_cnr_excel(
         config_path: Path to config JSON file with antenna_config
         output_path: Path where Excel file should be saved
     """
-    # Read CSV data
-    df = pd.read_csv(csv_path)
-
-    # Get power mapping from config
     power_mapping = get_target_power_mapping(config_path)
-
-    # Create data for each sheet
-    sheet_fronteyes = create_sheet_data(df, "fronteyes", power_mapping)
-    sheet_belly = create_sheet_data(df, "belly", power_mapping)
-    sheet_cheek = create_sheet_data(df, "cheek", power_mapping)
-
-    # Create Excel file with multiple sheets
-    sheet_name = f"{phantom_name.capitalize()}_fronteyes"
-    belly_name = f"{phantom_name.capitalize()}_belly"
-    cheek_name = f"{phantom_name.capitalize()}_cheek"
-
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        # Write sheets in order: fronteyes (sheet 1), belly (sheet 2), cheek (sheet 3)
-        sheet_fronteyes.to_excel(writer, sheet_name=sheet_name, index=False)
-        sheet_belly.to_excel(writer, sheet_name=belly_name, index=False)
-        sheet_cheek.to_excel(writer, sheet_name=cheek_name, index=False)
+    rows = write_partner_workbook(output_path, [(phantom_name, csv_path)], power_mapping)
 
     print(f"Created Excel file: {output_path}")
-    print(f"  - Sheet 1 ({sheet_name}): {len(sheet_fronteyes)} rows")
-    print(f"  - Sheet 2 ({belly_name}): {len(sheet_belly)} rows")
-    print(f"  - Sheet 3 ({cheek_name}): {len(sheet_cheek)} rows")
+    for i, (sheet_name, n_rows) in enumerate(rows.items(), start=1):
+        print(f"  - Sheet {i} ({sheet_name}): {n_rows} rows")
 
 
 def main(config_path: str | None = None):
@@ -272,61 +351,19 @@ def main(config_path: str | None = None):
     # Get power mapping from config
     power_mapping = get_target_power_mapping(str(config_path))
 
-    # Create Excel writer
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        for phantom_name in phantoms:
-            csv_path = results_dir / phantom_name / "normalized_results_detailed.csv"
-
-            if not csv_path.exists():
-                logging.getLogger("progress").warning(f"CSV file not found: {csv_path}", extra={"log_type": "warning"})
-                continue
-
-            logging.getLogger("progress").info(f"  Processing: {phantom_name.capitalize()}...", extra={"log_type": "progress"})
-
-            # Read CSV data
-            df = pd.read_csv(csv_path)
-
-            # Create data for each sheet
-            sheet_fronteyes = create_sheet_data(df, "fronteyes", power_mapping)
-            sheet_belly = create_sheet_data(df, "belly", power_mapping)
-            sheet_cheek = create_sheet_data(df, "cheek", power_mapping)
-
-            # Create sheet names (Excel limits sheet names to 31 characters)
-            # Strip frequency/resolution suffixes like _26ghz_coarse for clean tab names
-            clean_name = phantom_name.split("_")[0].capitalize()
-            sheet_name_fronteyes = f"{clean_name}_fronteyes"[:31]
-            sheet_name_belly = f"{clean_name}_belly"[:31]
-            sheet_name_cheek = f"{clean_name}_cheek"[:31]
-
-            # Write sheets
-            sheet_fronteyes.to_excel(writer, sheet_name=sheet_name_fronteyes, index=False)
-            sheet_belly.to_excel(writer, sheet_name=sheet_name_belly, index=False)
-            sheet_cheek.to_excel(writer, sheet_name=sheet_name_cheek, index=False)
-
-            # Add table formatting to each sheet
-            workbook = writer.book
-
-            # Format fronteyes sheet as table
-            if not sheet_fronteyes.empty:
-                ws_fronteyes = workbook[sheet_name_fronteyes]
-                _add_table_formatting(ws_fronteyes, sheet_fronteyes, sheet_name_fronteyes)
-                _auto_size_columns(ws_fronteyes, sheet_fronteyes)
-
-            # Format belly sheet as table
-            if not sheet_belly.empty:
-                ws_belly = workbook[sheet_name_belly]
-                _add_table_formatting(ws_belly, sheet_belly, sheet_name_belly)
-                _auto_size_columns(ws_belly, sheet_belly)
-
-            # Format cheek sheet as table
-            if not sheet_cheek.empty:
-                ws_cheek = workbook[sheet_name_cheek]
-                _add_table_formatting(ws_cheek, sheet_cheek, sheet_name_cheek)
-                _auto_size_columns(ws_cheek, sheet_cheek)
-
-            logging.getLogger("progress").info(f"    - {sheet_name_fronteyes}: {len(sheet_fronteyes)} rows", extra={"log_type": "verbose"})
-            logging.getLogger("progress").info(f"    - {sheet_name_belly}: {len(sheet_belly)} rows", extra={"log_type": "verbose"})
-            logging.getLogger("progress").info(f"    - {sheet_name_cheek}: {len(sheet_cheek)} rows", extra={"log_type": "verbose"})
+    phantom_csvs = []
+    for phantom_name in phantoms:
+        csv_path = results_dir / phantom_name / "normalized_results_detailed.csv"
+        if not csv_path.exists():
+            logging.getLogger("progress").warning(f"CSV file not found: {csv_path}", extra={"log_type": "warning"})
+            continue
+        logging.getLogger("progress").info(f"  Processing: {phantom_name.capitalize()}...", extra={"log_type": "progress"})
+        phantom_csvs.append((phantom_name, csv_path))
+
+    # Strip frequency/resolution suffixes like _26ghz_coarse for clean tab names
+    rows = write_partner_workbook(output_path, phantom_csvs, power_mapping, sheet_prefix=lambda name: name.split("_")[0].capitalize())
+    for sheet_name, n_rows in rows.items():
+        logging.getLogger("progress").info(f"    - {sheet_name}: {n_rows} rows", extra={"log_type": "verbose"})
 
     logging.getLogger("progress").info(f"  Created: {output_path.name}", extra={"log_type": "success"})
 
@@ -238,21 +238,14 @@ class FarFieldAnalysisStrategy(BaseAnalysisStrategy):
             )
             return results_df
 
-        tissue_groups = {group_name: list(tissues) for group_name, tissues in analyzer.tissue_group_composition.items()}
-
-        group_sar_data = []
-        for group_name, tissue_list in tissue_groups.items():
-            group_organs = all_organ_results_df[all_organ_results_df["tissue"].isin(tissue_list)]
-
-            if not group_organs.empty:
-                group_avg = group_organs.groupby(["placement", "frequency_mhz"])["mass_avg_sar_mw_kg"].mean().reset_index()
-                group_avg["group"] = group_name.replace("_group", "")
-                group_sar_data.append(group_avg)
+        combined_group_sar = analyzer.tissue_taxonomy.aggregate(
+            all_organ_results_df, ["mass_avg_sar_mw_kg"], by=["placement", "frequency_mhz"]
+        )
+        combined_group_sar["group"] = [group_name.replace("_group", "") for group_name in combined_group_sar["group"]]
 
         expected_sar_columns = ["SAR_brain", "SAR_skin", "SAR_genitals", "SAR_eyes"]
 
-        if group_sar_data:
-            combined_group_sar = pd.concat(group_sar_data, ignore_index=True)
+        if not combined_group_sar.empty:
             group_sar_pivot = combined_group_sar.pivot_table(
                 index=["placement", "frequency_mhz"], columns="group", values="mass_avg_sar_mw_kg", aggfunc="mean"
             ).reset_index()
@@ -403,27 +396,10 @@ class FarFieldAnalysisStrategy(BaseAnalysisStrategy):
 
         organ_pssar_df = all_organ_results_df.groupby(["tissue", "frequency_mhz"])["peak_sar_10g_mw_kg"].mean().reset_index()
 
-        group_summary_data = []
         if analyzer.tissue_group_composition:
-            tissue_groups = {group_name: list(tissues) for group_name, tissues in analyzer.tissue_group_composition.items()}
-
-            for group_name, tissues in tissue_groups.items():
-                if not tissues:
-                    continue
-                group_df = all_organ_results_df[all_organ_results_df["tissue"].isin(tissues)]
-                if not group_df.empty:
-                    summary = (
-                        group_df.groupby("frequency_mhz")
-                        .agg(
-                            avg_sar=("mass_avg_sar_mw_kg", "mean"),
-                            peak_sar_10g_mw_kg=("peak_sar_10g_mw_kg", "mean"),
-                        )
-                        .reset_index()
-                    )
-                    summary["group"] = group_name.replace("_group", "").capitalize()
-                    group_summary_data.append(summary)
-
-            group_summary_df = pd.concat(group_summary_data, ignore_index=True) if group_summary_data else pd.DataFrame()
+            group_summary_df = self.summarize_tissue_groups(
+                analyzer, all_organ_results_df, {"avg_sar": "mass_avg_sar_mw_kg", "peak_sar_10g_mw_kg": "peak_sar_10g_mw_kg"}
+            )
 
             if not group_summary_df.empty:
                 plotter_tissue_groups = {group_name: list(tissues) for group_name, tissues in analyzer.tissue_group_composition.items()}
@@ -367,28 +367,17 @@ class NearFieldAnalysisStrategy(BaseAnalysisStrategy):
             )
             return results_df
 
-        # Convert sets to lists for processing
-        tissue_groups = {group_name: list(tissues) for group_name, tissues in analyzer.tissue_group_composition.items()}
-
-        # Aggregate SAR by tissue groups for each placement
-        # Use exact tissue name matching from pickle files
-        group_sar_data = []
-        for group_name, tissue_list in tissue_groups.items():
-            group_organs = all_organ_results_df[all_organ_results_df["tissue"].isin(tissue_list)]
-
-            if not group_organs.empty:
-                # Group by placement and frequency, calculate mean SAR
-                group_avg = group_organs.groupby(["placement", "frequency_mhz"])["mass_avg_sar_mw_kg"].mean().reset_index()
-                group_avg["group"] = group_name.replace("_group", "")
-                group_sar_data.append(group_avg)
+        # Mean SAR of every group for each placement and frequency, in one pass over the organ table
+        # Uses exact tissue name matching from pickle files
+        combined_group_sar = analyzer.tissue_taxonomy.aggregate(
+            all_organ_results_df, ["mass_avg_sar_mw_kg"], by=["placement", "frequency_mhz"]
+        )
+        combined_group_sar["group"] = [group_name.replace("_group", "") for group_name in combined_group_sar["group"]]
 
         # Expected tissue group SAR columns that should always be present
         expected_sar_columns = ["SAR_brain", "SAR_skin", "SAR_genitals", "SAR_eyes"]
 
-        if group_sar_data:
-            # Combine all groups
-            combined_group_sar = pd.concat(group_sar_data, ignore_index=True)
-
+        if not combined_group_sar.empty:
             # Pivot to create columns for each group
             group_sar_pivot = combined_group_sar.pivot_table(
                 index=["placement", "frequency_mhz"], columns="group", values="mass_avg_sar_mw_kg", aggfunc="mean"
@@ -522,22 +511,7 @@ class NearFieldAnalysisStrategy(BaseAnalysisStrategy):
                 organ_sar_df = organ_sar_df.dropna(subset=["min_sar", "avg_sar", "max_sar"], how="all")
 
                 # Prepare group-level summary data
-                tissue_groups = {group_name: list(tissues) for group_name, tissues in analyzer.tissue_group_composition.items()}
-
-                group_summary_data = []
-                for group_name, tissues in tissue_groups.items():
-                    if not tissues:
-                        continue
-
-                    # Filter organs belonging to this group
-                    group_df = all_organ_results_df[all_organ_results_df["tissue"].isin(tissues)]
-
-                    if not group_df.empty:
-                        summary = group_df.groupby("frequency_mhz").agg(avg_sar=("mass_avg_sar_mw_kg", "mean")).reset_index()
-                        summary["group"] = group_name.replace("_group", "").capitalize()
-                        group_summary_data.append(summary)
-
-                group_summary_df = pd.concat(group_summary_data, ignore_index=True) if group_summary_data else pd.DataFrame()
+                group_summary_df = self.summarize_tissue_groups(analyzer, all_organ_results_df, {"avg_sar": "mass_avg_sar_mw_kg"})
 
                 if not organ_sar_df.empty and not group_summary_df.empty:
                     # Use tissue_group_composition for plotter (convert sets to lists)
@@ -563,20 +537,8 @@ class NearFieldAnalysisStrategy(BaseAnalysisStrategy):
                         )
                         organ_pssar_df = plotter._filter_all_regions(organ_pssar_df, tissue_column="tissue")
 
-                        group_pssar_summary_data = []
-                        for group_name, tissues in tissue_groups.items():
-                            if not tissues:
-                                continue
-                            group_df = all_organ_results_df[all_organ_results_df["tissue"].isin(tissues)]
-                            if not group_df.empty:
-                                summary = (
-                                    group_df.groupby("frequency_mhz").agg(peak_sar_10g_mw_kg=("peak_sar_10g_mw_kg", "mean")).reset_index()
-                                )
-                                summary["group"] = group_name.replace("_group", "").capitalize()
-                                group_pssar_summary_data.append(summary)
-
-                        group_pssar_summary_df = (
-                            pd.concat(group_pssar_summary_data, ignore_index=True) if group_pssar_summary_data else pd.DataFrame()
+                        group_pssar_summary_df = self.summarize_tissue_groups(
+                            analyzer, all_organ_results_df, {"peak_sar_10g_mw_kg": "peak_sar_10g_mw_kg"}
                         )
 
                         if not organ_pssar_df.empty and not group_pssar_summary_df.empty:
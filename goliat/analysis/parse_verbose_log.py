@@ -10,13 +10,32 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+PML_SIDES = ["X-", "X+", "Y-", "Y+", "Z-", "Z+"]
+_DONE_IN_PATTERN = re.compile(r"done in ([\d.]+)s")
+
+# Phrases whose mere presence anywhere in the log is recorded
+_FLAG_PHRASES = (
+    "path sensor",
+    "field sensor",
+    "point sensor",
+    "Using DFT to convert to frequency domain",
+    "Using Harmonic source",
+    "Using Gaussian source",
+    "FDTD simulation finished successfully",
+    "iSolve ended successfully",
+)
 
 
 def parse_verbose_log(log_path: str | Path) -> dict[str, Any]:
     """
     Parse a verbose.log file and extract all simulation metrics.
 
+    The log is read line by line in a single pass, so memory use does not
+    grow with the log size. Every metric pattern is line-local; patterns that
+    only need their first occurrence are dropped once they have matched.
+
     Args:
         log_path: Path to the verbose.log file
 
@@ -28,523 +47,412 @@ def parse_verbose_log(log_path: str | Path) -> dict[str, Any]:
     if not log_path.exists():
         raise FileNotFoundError(f"Log file not found: {log_path}")
 
-    content = log_path.read_text(encoding="utf-8", errors="replace")
-
-    metrics = {
-        "metadata": _extract_metadata(content, log_path),
-        "phantom": _extract_phantom_info(content),
-        "grid": _extract_grid_info(content),
-        "boundaries": _extract_boundary_info(content),
-        "materials": _extract_materials_info(content),
-        "solver": _extract_solver_info(content),
-        "timing": _extract_timing_info(content),
-        "hardware": _extract_hardware_info(content),
-        "simulation": _extract_simulation_info(content),
-        "edges": _extract_edge_statistics(content),
-        "sensors": _extract_sensor_info(content),
-        "sources": _extract_source_info(content),
-        "results": _extract_results_info(content),
-        "_content": content,  # Store for speed extraction in _compute_summary
-    }
-
-    # Add computed summary statistics
-    metrics["summary"] = _compute_summary(metrics)
-
-    # Remove _content to save memory (it's huge)
-    del metrics["_content"]
+    parser = _VerboseLogParser(log_path)
+    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            parser.feed(line)
+    return parser.finish()
 
-    return metrics
 
-
-def _extract_metadata(content: str, log_path: Path) -> dict[str, Any]:
-    """Extract metadata about the simulation run."""
-    metadata = {
-        "log_file": str(log_path),
-        "parse_timestamp": datetime.now().isoformat(),
+def _range_info(match: re.Match) -> dict[str, float]:
+    """Build an axis range dict from an 'X: Range [...]' match."""
+    info = {
+        "min_m": float(match.group(1)),
+        "max_m": float(match.group(2)),
+        "min_step_m": float(match.group(3)),
+        "max_step_m": float(match.group(4)),
     }
+    info["extent_mm"] = (info["max_m"] - info["min_m"]) * 1000
+    return info
 
-    # Extract simulation name
-    match = re.search(r"Simulation '([^']+)' started on (.+)", content)
-    if match:
-        metadata["simulation_name"] = match.group(1)
-        metadata["start_time"] = match.group(2).strip()
-
-    # Extract end time
-    match = re.search(r"Simulation '([^']+)' has ended successfully on (.+?) and took", content)
-    if match:
-        metadata["end_time"] = match.group(2).strip()
-
-    # Extract phantom and frequency from path
-    parts = log_path.parts
-    for i, part in enumerate(parts):
-        if part == "near_field" and i + 3 < len(parts):
-            metadata["phantom_name"] = parts[i + 1]
-            metadata["frequency_folder"] = parts[i + 2]
-            metadata["placement"] = parts[i + 3]
-            break
-
-    # Extract project path
-    match = re.search(r"Saving project to ([^\s]+\.smash)", content)
-    if match:
-        metadata["project_path"] = match.group(1)
-
-    return metadata
-
-
-def _extract_phantom_info(content: str) -> dict[str, Any]:
-    """Extract phantom-related information."""
-    phantom = {}
-
-    # Extract phantom file path
-    match = re.search(r"Importing from '([^']+)'", content)
-    if match:
-        phantom["file_path"] = match.group(1)
-        phantom["file_name"] = Path(match.group(1)).name
-
-    # Extract import time
-    match = re.search(r"Phantom imported successfully.*?done in ([\d.]+)s", content, re.DOTALL)
-    if match:
-        phantom["import_time_s"] = float(match.group(1))
-
-    return phantom
-
-
-def _extract_grid_info(content: str) -> dict[str, Any]:
-    """Extract grid information."""
-    grid = {}
-
-    # Number of cells
-    match = re.search(r"Number of cells: (\d+)x(\d+)x(\d+) = (\d+) cells = ([\d.]+) MCells", content)
-    if match:
-        grid["dimensions"] = {
-            "x": int(match.group(1)),
-            "y": int(match.group(2)),
-            "z": int(match.group(3)),
-        }
-        grid["total_cells"] = int(match.group(4))
-        grid["total_mcells"] = float(match.group(5))
-
-    # Number of cells with PML
-    match = re.search(r"Number of cells including PML: (\d+)x(\d+)x(\d+) = (\d+) cells = ([\d.]+) MCells", content)
-    if match:
-        grid["dimensions_with_pml"] = {
-            "x": int(match.group(1)),
-            "y": int(match.group(2)),
-            "z": int(match.group(3)),
-        }
-        grid["total_cells_with_pml"] = int(match.group(4))
-        grid["total_mcells_with_pml"] = float(match.group(5))
-
-    # X range
-    match = re.search(r"X: Range \[([-\d.]+) \.\.\. ([-\d.]+)\] with minimal ([-\d.e+]+) and maximal step ([-\d.e+]+)", content)
-    if match:
-        grid["x_range"] = {
-            "min_m": float(match.group(1)),
-            "max_m": float(match.group(2)),
-            "min_step_m": float(match.group(3)),
-            "max_step_m": float(match.group(4)),
-        }
-        grid["x_range"]["extent_mm"] = (grid["x_range"]["max_m"] - grid["x_range"]["min_m"]) * 1000
-
-    # Y range
-    match = re.search(r"Y: Range \[([-\d.]+) \.\.\. ([-\d.]+)\] with minimal ([-\d.e+]+) and maximal step ([-\d.e+]+)", content)
-    if match:
-        grid["y_range"] = {
-            "min_m": float(match.group(1)),
-            "max_m": float(match.group(2)),
-            "min_step_m": float(match.group(3)),
-            "max_step_m": float(match.group(4)),
-        }
-        grid["y_range"]["extent_mm"] = (grid["y_range"]["max_m"] - grid["y_range"]["min_m"]) * 1000
-
-    # Z range
-    match = re.search(r"Z: Range \[([-\d.]+) \.\.\. ([-\d.]+)\] with minimal ([-\d.e+]+) and maximal step ([-\d.e+]+)", content)
-    if match:
-        grid["z_range"] = {
-            "min_m": float(match.group(1)),
-            "max_m": float(match.group(2)),
-            "min_step_m": float(match.group(3)),
-            "max_step_m": float(match.group(4)),
-        }
-        grid["z_range"]["extent_mm"] = (grid["z_range"]["max_m"] - grid["z_range"]["min_m"]) * 1000
 
-    # Grid resolution setting
-    match = re.search(r"Global and added manual grid set with frequency-specific \((\d+)MHz\) resolution: ([\d.]+) mm", content)
-    if match:
-        grid["frequency_mhz"] = int(match.group(1))
-        grid["resolution_mm"] = float(match.group(2))
+def _hms_to_seconds(hours: str, minutes: str, seconds: str) -> int:
+    """Convert an h:m:s triple of strings to seconds."""
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
-    return grid
 
+class _VerboseLogParser:
+    """Single-pass, line-oriented state machine behind `parse_verbose_log`.
 
-def _extract_boundary_info(content: str) -> dict[str, Any]:
-    """Extract boundary condition information."""
-    boundaries = {}
-
-    # Extract PML layers for each side
-    sides = ["X-", "X+", "Y-", "Y+", "Z-", "Z+"]
-    boundaries["pml_layers"] = {}
-
-    for side in sides:
-        match = re.search(rf"Side {re.escape(side)}: ABC \(UPML, (\d+) layers\)", content)
-        if match:
-            boundaries["pml_layers"][side] = int(match.group(1))
-
-    # Global boundary type
-    match = re.search(r"Setting global boundary conditions to: (\w+)", content)
-    if match:
-        boundaries["type"] = match.group(1)
-
-    # PML strength
-    match = re.search(r"Setting PML strength to: (\w+)", content)
-    if match:
-        boundaries["pml_strength"] = match.group(1)
-
-    return boundaries
-
-
-def _extract_materials_info(content: str) -> dict[str, Any]:
-    """Extract materials information."""
-    materials = {}
-
-    # Total number of materials
-    match = re.search(r"Materials \((\d+)\):", content)
-    if match:
-        materials["total_count"] = int(match.group(1))
-
-    # Count material types
-    dielectric_count = len(re.findall(r": dielectric \(eps_r=", content))
-    lossy_metal_count = len(re.findall(r": lossy metal \(eps_r=", content))
-
-    materials["dielectric_count"] = dielectric_count
-    materials["lossy_metal_count"] = lossy_metal_count
-
-    # Extract tissue names (from Eartha phantom)
-    tissue_pattern = re.findall(r"(\w+(?:_\w+)*)\s+\(Eartha\): (\w+)", content)
-    materials["tissues"] = [{"name": t[0], "type": t[1]} for t in tissue_pattern]
-    materials["tissue_count"] = len(materials["tissues"])
-
-    # Extract antenna materials
-    antenna_pattern = re.findall(r"([\w:]+)\s+\(Antenna[^)]+\): (\w+)", content)
-    materials["antenna_components"] = [{"name": a[0], "type": a[1]} for a in antenna_pattern]
-
-    return materials
-
-
-def _extract_solver_info(content: str) -> dict[str, Any]:
-    """Extract solver configuration information."""
-    solver = {}
-
-    # Solver type
-    match = re.search(r"Solver type: (\w+), (\w+), (\w+)", content)
-    if match:
-        solver["type"] = match.group(1)
-        solver["precision"] = match.group(2)
-        solver["accelerator"] = match.group(3)
-
-    # Solver kernel
-    match = re.search(r"Solver kernel set to: ([^\[]+)", content)
-    if match:
-        solver["kernel"] = match.group(1).strip()
-
-    # Acceleware version
-    match = re.search(r"Used Acceleware library is '([^']+)'", content)
-    if match:
-        solver["acceleware_version"] = match.group(1)
-
-    # iSolve version
-    match = re.search(r"iSolve X, Version ([\d.]+) \((\d+)\)", content)
-    if match:
-        solver["isolve_version"] = match.group(1)
-        solver["isolve_build"] = int(match.group(2))
-
-    # Floating point precision
-    match = re.search(r"Floating Point Arithmetic: (\w+) \((\d+) Bytes\)", content)
-    if match:
-        solver["float_type"] = match.group(1)
-        solver["float_bytes"] = int(match.group(2))
-
-    # Time step
-    match = re.search(r"Simulation Time Step:\s+([\d.e+-]+) sec", content)
-    if match:
-        solver["time_step_s"] = float(match.group(1))
-
-    # Number of iterations
-    match = re.search(r"Simulation Iterations:\s+(\d+)", content)
-    if match:
-        solver["iterations"] = int(match.group(1))
-
-    # Max simulated time
-    match = re.search(r"Max Simulated Time:\s+([\d.e+-]+) sec", content)
-    if match:
-        solver["max_simulated_time_s"] = float(match.group(1))
-
-    # Simulation time in periods
-    match = re.search(r"Simulation time set to ([\d.]+) periods", content)
-    if match:
-        solver["simulation_periods"] = float(match.group(1))
-
-    return solver
-
-
-def _extract_timing_info(content: str) -> dict[str, Any]:
-    """Extract timing information."""
-    timing = {}
-
-    # Total simulation wall clock time
-    match = re.search(r"took (\d+):(\d+):(\d+) wall clock time", content)
-    if match:
-        hours = int(match.group(1))
-        minutes = int(match.group(2))
-        seconds = int(match.group(3))
-        timing["total_wall_clock_s"] = hours * 3600 + minutes * 60 + seconds
-        timing["total_wall_clock_formatted"] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-    # Subtask timings
-    subtask_pattern = re.findall(r"Subtask '(\w+)' done in ([\d.]+)s", content)
-    timing["subtasks"] = {task: float(time) for task, time in subtask_pattern}
-
-    # Phase timings
-    phase_pattern = re.findall(r"--- Finished: (\w+) \(took ([\d.]+)s\)", content)
-    timing["phases"] = {phase: float(time) for phase, time in phase_pattern}
-
-    # Elapsed times for specific operations
-    elapsed_pattern = re.findall(r"Elapsed time for '([^']+)' was (\d+):(\d+):(\d+)", content)
-    timing["operations"] = {}
-    for op, h, m, s in elapsed_pattern:
-        total_s = int(h) * 3600 + int(m) * 60 + int(s)
-        timing["operations"][op] = total_s
-
-    return timing
-
-
-def _extract_hardware_info(content: str) -> dict[str, Any]:
-    """Extract hardware information."""
-    hardware = {}
-
-    # OS
-    match = re.search(r"Host OS: (.+)", content)
-    if match:
-        hardware["os"] = match.group(1).strip()
-
-    # CPU
-    match = re.search(r"Host CPU: (.+)", content)
-    if match:
-        hardware["cpu"] = match.group(1).strip()
-
-    # System RAM
-    match = re.search(r"Installed system RAM visible to this process:\s+([\d.]+) GB", content)
-    if match:
-        hardware["system_ram_gb"] = float(match.group(1))
-
-    match = re.search(r"Host memory: (\d+) MB", content)
-    if match:
-        hardware["host_memory_mb"] = int(match.group(1))
-
-    # GPU
-    match = re.search(r"(NVIDIA [^,]+) \(device ID = (\d+)\), compute capability ([\d.]+), total memory (\d+) MB", content)
-    if match:
-        hardware["gpu"] = {
-            "name": match.group(1),
-            "device_id": int(match.group(2)),
-            "compute_capability": match.group(3),
-            "memory_mb": int(match.group(4)),
-        }
+    Each rule is (literal keyword, regex, handler). The keyword is a cheap
+    substring pre-filter so most lines (e.g. solver progress) only cost a few
+    `in` checks. "First" rules mirror a `re.search` over the whole log and are
+    retired after their first match; "all" rules mirror `re.findall`.
+    """
 
-    # Peak memory usage
-    match = re.search(r"Peak CPU memory usage:\s+([\d.]+) GB \((\d+) Bytes\)", content)
-    if match:
-        hardware["peak_memory_gb"] = float(match.group(1))
-        hardware["peak_memory_bytes"] = int(match.group(2))
-
-    # MPI processes
-    match = re.search(r"Running MPI version ([\d.]+) on (\d+) process", content)
-    if match:
-        hardware["mpi_version"] = match.group(1)
-        hardware["mpi_processes"] = int(match.group(2))
-
-    # Number of threads
-    match = re.search(r"using (\d+) threads", content)
-    if match:
-        hardware["threads"] = int(match.group(1))
-
-    return hardware
-
-
-def _extract_simulation_info(content: str) -> dict[str, Any]:
-    """Extract simulation configuration information."""
-    simulation = {}
-
-    # Frequency
-    match = re.search(r"Trusted frequency is (\d+) MHz", content)
-    if match:
-        simulation["frequency_mhz"] = int(match.group(1))
-
-    # Excitation signal
-    match = re.search(r"Excitation signal: (.+)", content)
-    if match:
-        simulation["excitation_signal"] = match.group(1).strip()
-
-    # Harmonic frequency and ramp time
-    match = re.search(r"Harmonic signal with frequency (\d+) MHz and ramp time ([\d.]+) ns", content)
-    if match:
-        simulation["harmonic_frequency_mhz"] = int(match.group(1))
-        simulation["ramp_time_ns"] = float(match.group(2))
-
-    # Simulation time multiplier
-    match = re.search(r"Using simulation time multiplier: ([\d.]+)", content)
-    if match:
-        simulation["time_multiplier"] = float(match.group(1))
-
-    # Placement info
-    match = re.search(r"--- Starting Placement: (\w+) - (\w+) - (\w+) ---", content)
-    if match:
-        simulation["placement"] = {
-            "position": match.group(1),
-            "side": match.group(2),
-            "orientation": match.group(3),
+    def __init__(self, log_path: Path):
+        self.metadata: dict[str, Any] = {
+            "log_file": str(log_path),
+            "parse_timestamp": datetime.now().isoformat(),
         }
-
-    # Bounding box setting
-    match = re.search(r"Bounding box setting: '(\w+)'", content)
-    if match:
-        simulation["bounding_box_setting"] = match.group(1)
-
-    return simulation
-
-
-def _extract_edge_statistics(content: str) -> dict[str, Any]:
-    """Extract edge statistics."""
-    edges = {}
-
-    # Total edges calculated
-    match = re.search(r"Update coefficient calculation for (\d+) edges", content)
-    if match:
-        edges["total_edges"] = int(match.group(1))
-
-    # Edge-Material Statistics
-    match = re.search(r"Edge-Material Statistics \(Electric/Magnetic\):", content)
-    if match:
-        # Total
-        total_match = re.search(r"(\d+) / (\d+)\s+\([^)]+\) : Total", content)
-        if total_match:
-            edges["electric_total"] = int(total_match.group(1))
-            edges["magnetic_total"] = int(total_match.group(2))
-
-        # Dielectric
-        diel_match = re.search(r"(\d+) / (\d+)\s+\(\s*([\d.]+)% /\s*([\d.]+)%\) : Dielectric", content)
-        if diel_match:
-            edges["dielectric"] = {
-                "electric": int(diel_match.group(1)),
-                "magnetic": int(diel_match.group(2)),
-                "electric_pct": float(diel_match.group(3)),
-                "magnetic_pct": float(diel_match.group(4)),
+        # Extract phantom and frequency from path
+        parts = log_path.parts
+        for i, part in enumerate(parts):
+            if part == "near_field" and i + 3 < len(parts):
+                self.metadata["phantom_name"] = parts[i + 1]
+                self.metadata["frequency_folder"] = parts[i + 2]
+                self.metadata["placement"] = parts[i + 3]
+                break
+
+        self.phantom: dict[str, Any] = {}
+        self.grid: dict[str, Any] = {}
+        self.boundaries: dict[str, Any] = {"pml_layers": {}}
+        self.materials: dict[str, Any] = {"dielectric_count": 0, "lossy_metal_count": 0, "tissues": [], "antenna_components": []}
+        self.solver: dict[str, Any] = {}
+        self.timing: dict[str, Any] = {"subtasks": {}, "phases": {}, "operations": {}}
+        self.hardware: dict[str, Any] = {}
+        self.simulation: dict[str, Any] = {}
+        self.edges: dict[str, Any] = {}
+        self.edge_details: dict[str, Any] = {}
+        self.sensors: dict[str, Any] = {}
+        self.sources: dict[str, Any] = {}
+        self.results: dict[str, Any] = {}
+
+        # Substring flags checked anywhere in the log
+        self.flags = {phrase: False for phrase in _FLAG_PHRASES}
+        self._edge_header_seen = False
+        self._phantom_imported = False
+
+        # Solver speed statistics (running aggregates instead of a list)
+        self.speed_count = 0
+        self.speed_sum = 0.0
+        self.speed_max = float("-inf")
+        self.speed_min = float("inf")
+
+        self._first_rules: list[tuple[str, re.Pattern, Callable[[re.Match], None]]] = self._build_first_rules()
+        self._all_rules: list[tuple[str, re.Pattern, Callable[[re.Match], None]]] = self._build_all_rules()
+
+    def _build_first_rules(self) -> list:
+        """Rules that only need the first occurrence in the log."""
+        md, ph, gr, bd, mt = self.metadata, self.phantom, self.grid, self.boundaries, self.materials
+        sv, tm, hw, sim, ed, ex = self.solver, self.timing, self.hardware, self.simulation, self.edges, self.edge_details
+        sn, so, rs = self.sensors, self.sources, self.results
+
+        def setter(target: dict, key: str, group: int = 1, cast: Callable = str) -> Callable[[re.Match], None]:
+            def handler(m: re.Match) -> None:
+                target[key] = cast(m.group(group))
+
+            return handler
+
+        def sim_started(m: re.Match) -> None:
+            md["simulation_name"] = m.group(1)
+            md["start_time"] = m.group(2).strip()
+
+        def phantom_file(m: re.Match) -> None:
+            ph["file_path"] = m.group(1)
+            ph["file_name"] = Path(m.group(1)).name
+
+        def cells(key: str) -> Callable[[re.Match], None]:
+            suffix = "" if key == "dimensions" else "_with_pml"
+
+            def handler(m: re.Match) -> None:
+                gr[key] = {"x": int(m.group(1)), "y": int(m.group(2)), "z": int(m.group(3))}
+                gr[f"total_cells{suffix}"] = int(m.group(4))
+                gr[f"total_mcells{suffix}"] = float(m.group(5))
+
+            return handler
+
+        def axis_range(axis: str) -> Callable[[re.Match], None]:
+            def handler(m: re.Match) -> None:
+                gr[f"{axis}_range"] = _range_info(m)
+
+            return handler
+
+        def grid_resolution(m: re.Match) -> None:
+            gr["frequency_mhz"] = int(m.group(1))
+            gr["resolution_mm"] = float(m.group(2))
+
+        def pml_side(side: str) -> Callable[[re.Match], None]:
+            def handler(m: re.Match) -> None:
+                bd["pml_layers"][side] = int(m.group(1))
+
+            return handler
+
+        def solver_type(m: re.Match) -> None:
+            sv["type"], sv["precision"], sv["accelerator"] = m.group(1), m.group(2), m.group(3)
+
+        def isolve_version(m: re.Match) -> None:
+            sv["isolve_version"] = m.group(1)
+            sv["isolve_build"] = int(m.group(2))
+
+        def float_type(m: re.Match) -> None:
+            sv["float_type"] = m.group(1)
+            sv["float_bytes"] = int(m.group(2))
+
+        def wall_clock(m: re.Match) -> None:
+            hours, minutes, seconds = int(m.group(1)), int(m.group(2)), int(m.group(3))
+            tm["total_wall_clock_s"] = hours * 3600 + minutes * 60 + seconds
+            tm["total_wall_clock_formatted"] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+        def gpu(m: re.Match) -> None:
+            hw["gpu"] = {
+                "name": m.group(1),
+                "device_id": int(m.group(2)),
+                "compute_capability": m.group(3),
+                "memory_mb": int(m.group(4)),
             }
 
-        # Lossy Metal
-        metal_match = re.search(r"(\d+) /\s+(\d+)\s+\(\s*([\d.]+)% /\s*([\d.]+)%\) : Lossy Metal", content)
-        if metal_match:
-            edges["lossy_metal"] = {
-                "electric": int(metal_match.group(1)),
-                "magnetic": int(metal_match.group(2)),
-                "electric_pct": float(metal_match.group(3)),
-                "magnetic_pct": float(metal_match.group(4)),
+        def peak_memory(m: re.Match) -> None:
+            hw["peak_memory_gb"] = float(m.group(1))
+            hw["peak_memory_bytes"] = int(m.group(2))
+
+        def mpi(m: re.Match) -> None:
+            hw["mpi_version"] = m.group(1)
+            hw["mpi_processes"] = int(m.group(2))
+
+        def harmonic(m: re.Match) -> None:
+            sim["harmonic_frequency_mhz"] = int(m.group(1))
+            sim["ramp_time_ns"] = float(m.group(2))
+
+        def placement(m: re.Match) -> None:
+            sim["placement"] = {"position": m.group(1), "side": m.group(2), "orientation": m.group(3)}
+
+        def edge_totals(m: re.Match) -> None:
+            ex["electric_total"] = int(m.group(1))
+            ex["magnetic_total"] = int(m.group(2))
+
+        def edge_material(key: str) -> Callable[[re.Match], None]:
+            def handler(m: re.Match) -> None:
+                ex[key] = {
+                    "electric": int(m.group(1)),
+                    "magnetic": int(m.group(2)),
+                    "electric_pct": float(m.group(3)),
+                    "magnetic_pct": float(m.group(4)),
+                }
+
+            return handler
+
+        def coefficients(m: re.Match) -> None:
+            ed["e_coefficients"] = int(m.group(1))
+            ed["h_coefficients"] = int(m.group(2))
+
+        def edge_source(m: re.Match) -> None:
+            so["edge_source"] = {
+                "name": m.group(1).strip(),
+                "amplitude": int(m.group(2)),
+                "time_shift": float(m.group(3)),
+                "voltage_type": m.group(4),
             }
 
-    # Update coefficient database
-    match = re.search(r"Update coefficient database contains (\d+) E-coefficient\(s\) and (\d+) H-coefficient\(s\)", content)
-    if match:
-        edges["e_coefficients"] = int(match.group(1))
-        edges["h_coefficients"] = int(match.group(2))
-
-    return edges
-
-
-def _extract_sensor_info(content: str) -> dict[str, Any]:
-    """Extract sensor information."""
-    sensors = {}
-
-    # Number of sensors
-    match = re.search(r"Sensors \((\d+)\):", content)
-    if match:
-        sensors["count"] = int(match.group(1))
-
-    # Sensor types
-    sensors["types"] = []
-
-    if "path sensor" in content:
-        sensors["types"].append("path")
-    if "field sensor" in content:
-        sensors["types"].append("field")
-    if "point sensor" in content:
-        sensors["types"].append("point")
-
-    # DFT conversion
-    if "Using DFT to convert to frequency domain" in content:
-        sensors["dft_enabled"] = True
-
-    return sensors
-
-
-def _extract_source_info(content: str) -> dict[str, Any]:
-    """Extract source information."""
-    sources = {}
-
-    # Number of sources
-    match = re.search(r"Sources \((\d+)\):", content)
-    if match:
-        sources["count"] = int(match.group(1))
-
-    # Source type
-    if "Using Harmonic source" in content:
-        sources["type"] = "Harmonic"
-    elif "Using Gaussian source" in content:
-        sources["type"] = "Gaussian"
-
-    # Edge source details
-    match = re.search(r"edge source ([^(]+) \(amplitude (\d+), time shift([\d.]+), type (\w+)", content)
-    if match:
-        sources["edge_source"] = {
-            "name": match.group(1).strip(),
-            "amplitude": int(match.group(2)),
-            "time_shift": float(match.group(3)),
-            "voltage_type": match.group(4),
+        range_pattern = r"{}: Range \[([-\d.]+) \.\.\. ([-\d.]+)\] with minimal ([-\d.e+]+) and maximal step ([-\d.e+]+)"
+        rules = [
+            # Metadata
+            ("' started on ", r"Simulation '([^']+)' started on (.+)", sim_started),
+            (
+                "has ended successfully on",
+                r"Simulation '([^']+)' has ended successfully on (.+?) and took",
+                setter(md, "end_time", 2, str.strip),
+            ),
+            ("Saving project to", r"Saving project to ([^\s]+\.smash)", setter(md, "project_path")),
+            # Phantom
+            ("Importing from '", r"Importing from '([^']+)'", phantom_file),
+            # Grid
+            ("Number of cells: ", r"Number of cells: (\d+)x(\d+)x(\d+) = (\d+) cells = ([\d.]+) MCells", cells("dimensions")),
+            (
+                "Number of cells including PML: ",
+                r"Number of cells including PML: (\d+)x(\d+)x(\d+) = (\d+) cells = ([\d.]+) MCells",
+                cells("dimensions_with_pml"),
+            ),
+            *[(f"{axis.upper()}: Range [", range_pattern.format(axis.upper()), axis_range(axis)) for axis in ("x", "y", "z")],
+            (
+                "frequency-specific",
+                r"Global and added manual grid set with frequency-specific \((\d+)MHz\) resolution: ([\d.]+) mm",
+                grid_resolution,
+            ),
+            # Boundaries
+            *[(f"Side {side}: ABC", rf"Side {re.escape(side)}: ABC \(UPML, (\d+) layers\)", pml_side(side)) for side in PML_SIDES],
+            ("Setting global boundary conditions to", r"Setting global boundary conditions to: (\w+)", setter(bd, "type")),
+            ("Setting PML strength to", r"Setting PML strength to: (\w+)", setter(bd, "pml_strength")),
+            # Materials
+            ("Materials (", r"Materials \((\d+)\):", setter(mt, "total_count", cast=int)),
+            # Solver
+            ("Solver type: ", r"Solver type: (\w+), (\w+), (\w+)", solver_type),
+            ("Solver kernel set to", r"Solver kernel set to: ([^\[]+)", setter(sv, "kernel", cast=str.strip)),
+            ("Used Acceleware library", r"Used Acceleware library is '([^']+)'", setter(sv, "acceleware_version")),
+            ("iSolve X, Version", r"iSolve X, Version ([\d.]+) \((\d+)\)", isolve_version),
+            ("Floating Point Arithmetic", r"Floating Point Arithmetic: (\w+) \((\d+) Bytes\)", float_type),
+            ("Simulation Time Step:", r"Simulation Time Step:\s+([\d.e+-]+) sec", setter(sv, "time_step_s", cast=float)),
+            ("Simulation Iterations:", r"Simulation Iterations:\s+(\d+)", setter(sv, "iterations", cast=int)),
+            ("Max Simulated Time:", r"Max Simulated Time:\s+([\d.e+-]+) sec", setter(sv, "max_simulated_time_s", cast=float)),
+            ("Simulation time set to", r"Simulation time set to ([\d.]+) periods", setter(sv, "simulation_periods", cast=float)),
+            # Timing
+            ("wall clock time", r"took (\d+):(\d+):(\d+) wall clock time", wall_clock),
+            # Hardware
+            ("Host OS: ", r"Host OS: (.+)", setter(hw, "os", cast=str.strip)),
+            ("Host CPU: ", r"Host CPU: (.+)", setter(hw, "cpu", cast=str.strip)),
+            (
+                "Installed system RAM",
+                r"Installed system RAM visible to this process:\s+([\d.]+) GB",
+                setter(hw, "system_ram_gb", cast=float),
+            ),
+            ("Host memory: ", r"Host memory: (\d+) MB", setter(hw, "host_memory_mb", cast=int)),
+            ("NVIDIA ", r"(NVIDIA [^,]+) \(device ID = (\d+)\), compute capability ([\d.]+), total memory (\d+) MB", gpu),
+            ("Peak CPU memory usage", r"Peak CPU memory usage:\s+([\d.]+) GB \((\d+) Bytes\)", peak_memory),
+            ("Running MPI version", r"Running MPI version ([\d.]+) on (\d+) process", mpi),
+            (" threads", r"using (\d+) threads", setter(hw, "threads", cast=int)),
+            # Simulation
+            ("Trusted frequency is", r"Trusted frequency is (\d+) MHz", setter(sim, "frequency_mhz", cast=int)),
+            ("Excitation signal: ", r"Excitation signal: (.+)", setter(sim, "excitation_signal", cast=str.strip)),
+            ("Harmonic signal with frequency", r"Harmonic signal with frequency (\d+) MHz and ramp time ([\d.]+) ns", harmonic),
+            ("simulation time multiplier", r"Using simulation time multiplier: ([\d.]+)", setter(sim, "time_multiplier", cast=float)),
+            ("--- Starting Placement:", r"--- Starting Placement: (\w+) - (\w+) - (\w+) ---", placement),
+            ("Bounding box setting", r"Bounding box setting: '(\w+)'", setter(sim, "bounding_box_setting")),
+            # Edges
+            ("Update coefficient calculation for", r"Update coefficient calculation for (\d+) edges", setter(ed, "total_edges", cast=int)),
+            (": Total", r"(\d+) / (\d+)\s+\([^)]+\) : Total", edge_totals),
+            (": Dielectric", r"(\d+) / (\d+)\s+\(\s*([\d.]+)% /\s*([\d.]+)%\) : Dielectric", edge_material("dielectric")),
+            (": Lossy Metal", r"(\d+) /\s+(\d+)\s+\(\s*([\d.]+)% /\s*([\d.]+)%\) : Lossy Metal", edge_material("lossy_metal")),
+            (
+                "Update coefficient database contains",
+                r"Update coefficient database contains (\d+) E-coefficient\(s\) and (\d+) H-coefficient\(s\)",
+                coefficients,
+            ),
+            # Sensors
+            ("Sensors (", r"Sensors \((\d+)\):", setter(sn, "count", cast=int)),
+            # Sources
+            ("Sources (", r"Sources \((\d+)\):", setter(so, "count", cast=int)),
+            ("edge source ", r"edge source ([^(]+) \(amplitude (\d+), time shift([\d.]+), type (\w+)", edge_source),
+            ("Lumped Elements (", r"Lumped Elements \((\d+)\):", setter(so, "lumped_elements_count", cast=int)),
+            ("Resistor, ", r"Resistor, (\d+) ohm", setter(so, "resistor_ohm", cast=int)),
+            # Results
+            ("Final Balance: ", r"Final Balance: ([\d.]+)%", setter(rs, "power_balance_pct", cast=float)),
+            ("SAR results saved to", r"SAR results saved to: (.+\.json)", setter(rs, "sar_results_path", cast=str.strip)),
+        ]
+        return [(keyword, re.compile(pattern), handler) for keyword, pattern, handler in rules]
+
+    def _build_all_rules(self) -> list:
+        """Rules that collect every occurrence in the log."""
+        mt, tm = self.materials, self.timing
+
+        def subtask(m: re.Match) -> None:
+            tm["subtasks"][m.group(1)] = float(m.group(2))
+
+        def phase(m: re.Match) -> None:
+            tm["phases"][m.group(1)] = float(m.group(2))
+
+        def operation(m: re.Match) -> None:
+            tm["operations"][m.group(1)] = _hms_to_seconds(m.group(2), m.group(3), m.group(4))
+
+        def tissue(m: re.Match) -> None:
+            mt["tissues"].append({"name": m.group(1), "type": m.group(2)})
+
+        def antenna(m: re.Match) -> None:
+            mt["antenna_components"].append({"name": m.group(1), "type": m.group(2)})
+
+        def dielectric(m: re.Match) -> None:
+            mt["dielectric_count"] += 1
+
+        def lossy_metal(m: re.Match) -> None:
+            mt["lossy_metal_count"] += 1
+
+        def speed(m: re.Match) -> None:
+            value = float(m.group(1))
+            self.speed_count += 1
+            self.speed_sum += value
+            self.speed_max = max(self.speed_max, value)
+            self.speed_min = min(self.speed_min, value)
+
+        rules = [
+            ("MCells/s", r"@ ([\d.]+) MCells/s", speed),
+            ("Subtask '", r"Subtask '(\w+)' done in ([\d.]+)s", subtask),
+            ("--- Finished: ", r"--- Finished: (\w+) \(took ([\d.]+)s\)", phase),
+            ("Elapsed time for '", r"Elapsed time for '([^']+)' was (\d+):(\d+):(\d+)", operation),
+            (": dielectric (eps_r=", r": dielectric \(eps_r=", dielectric),
+            (": lossy metal (eps_r=", r": lossy metal \(eps_r=", lossy_metal),
+            ("(Eartha): ", r"(\w+(?:_\w+)*)\s+\(Eartha\): (\w+)", tissue),
+            ("(Antenna", r"([\w:]+)\s+\(Antenna[^)]+\): (\w+)", antenna),
+        ]
+        return [(keyword, re.compile(pattern), handler) for keyword, pattern, handler in rules]
+
+    def feed(self, line: str) -> None:
+        """Process one line of the log."""
+        for keyword, pattern, handler in self._all_rules:
+            if keyword in line:
+                for m in pattern.finditer(line):
+                    handler(m)
+
+        remaining = None
+        for rule in self._first_rules:
+            keyword, pattern, handler = rule
+            if keyword in line:
+                m = pattern.search(line)
+                if m:
+                    handler(m)
+                    if remaining is None:
+                        remaining = list(self._first_rules)
+                    remaining.remove(rule)
+        if remaining is not None:
+            self._first_rules = remaining
+
+        # Phantom import time: first "done in Xs" at or after "Phantom imported successfully"
+        if "import_time_s" not in self.phantom:
+            rest = None
+            if self._phantom_imported:
+                rest = line
+            else:
+                idx = line.find("Phantom imported successfully")
+                if idx >= 0:
+                    self._phantom_imported = True
+                    rest = line[idx:]
+            if rest is not None:
+                m = _DONE_IN_PATTERN.search(rest)
+                if m:
+                    self.phantom["import_time_s"] = float(m.group(1))
+
+        for phrase, seen in self.flags.items():
+            if not seen and phrase in line:
+                self.flags[phrase] = True
+        if not self._edge_header_seen and "Edge-Material Statistics (Electric/Magnetic):" in line:
+            self._edge_header_seen = True
+
+    def finish(self) -> dict[str, Any]:
+        """Assemble the metrics dict once the whole log has been fed."""
+        self.materials["tissue_count"] = len(self.materials["tissues"])
+        if self._edge_header_seen:
+            self.edges.update(self.edge_details)
+
+        self.sensors["types"] = [kind for kind in ("path", "field", "point") if self.flags[f"{kind} sensor"]]
+        if self.flags["Using DFT to convert to frequency domain"]:
+            self.sensors["dft_enabled"] = True
+
+        if self.flags["Using Harmonic source"]:
+            self.sources["type"] = "Harmonic"
+        elif self.flags["Using Gaussian source"]:
+            self.sources["type"] = "Gaussian"
+
+        self.results["success"] = self.flags["FDTD simulation finished successfully"]
+        self.results["isolve_success"] = self.flags["iSolve ended successfully"]
+
+        metrics = {
+            "metadata": self.metadata,
+            "phantom": self.phantom,
+            "grid": self.grid,
+            "boundaries": self.boundaries,
+            "materials": self.materials,
+            "solver": self.solver,
+            "timing": self.timing,
+            "hardware": self.hardware,
+            "simulation": self.simulation,
+            "edges": self.edges,
+            "sensors": self.sensors,
+            "sources": self.sources,
+            "results": self.results,
+        }
+        metrics["summary"] = _compute_summary(metrics, self._speed_stats())
+        return metrics
+
+    def _speed_stats(self) -> dict[str, float]:
+        """Average/peak/min solver speed over all progress lines."""
+        if not self.speed_count:
+            return {}
+        return {
+            "avg_mcells_per_s": self.speed_sum / self.speed_count,
+            "peak_mcells_per_s": self.speed_max,
+            "min_mcells_per_s": self.speed_min,
         }
-
-    # Lumped elements
-    match = re.search(r"Lumped Elements \((\d+)\):", content)
-    if match:
-        sources["lumped_elements_count"] = int(match.group(1))
-
-    match = re.search(r"Resistor, (\d+) ohm", content)
-    if match:
-        sources["resistor_ohm"] = int(match.group(1))
-
-    return sources
-
-
-def _extract_results_info(content: str) -> dict[str, Any]:
-    """Extract results information."""
-    results = {}
-
-    # Power balance
-    match = re.search(r"Final Balance: ([\d.]+)%", content)
-    if match:
-        results["power_balance_pct"] = float(match.group(1))
-
-    # SAR results path
-    match = re.search(r"SAR results saved to: (.+\.json)", content)
-    if match:
-        results["sar_results_path"] = match.group(1).strip()
-
-    # Success status
-    results["success"] = "FDTD simulation finished successfully" in content
-    results["isolve_success"] = "iSolve ended successfully" in content
-
-    return results
 
 
-def _compute_summary(metrics: dict[str, Any]) -> dict[str, Any]:
+def _compute_summary(metrics: dict[str, Any], speed_stats: dict[str, float]) -> dict[str, Any]:
     """Compute summary statistics from extracted metrics."""
     summary = {}
 
@@ -583,13 +491,8 @@ def _compute_summary(metrics: dict[str, Any]) -> dict[str, Any]:
     if "timing" in metrics:
         summary["total_time_s"] = metrics["timing"].get("total_wall_clock_s", 0)
 
-    # Performance - calculate average MCells/s from progress updates
-    progress_pattern = re.findall(r"@ ([\d.]+) MCells/s", metrics.get("_content", ""))
-    if progress_pattern:
-        speeds = [float(s) for s in progress_pattern]
-        summary["avg_mcells_per_s"] = sum(speeds) / len(speeds)
-        summary["peak_mcells_per_s"] = max(speeds)
-        summary["min_mcells_per_s"] = min(speeds)
+    # Performance - average MCells/s from progress updates
+    summary.update(speed_stats)
 
     return summary
 
@@ -0,0 +1,204 @@
+"""Fleet-wide performance report over the Parquet metadata store (`goliat perf`)."""
+
+import logging
+import os
+from typing import Optional, Sequence
+
+import pandas as pd
+
+from goliat.constants import PERF_REGRESSION_BASELINE_RUNS, PERF_REGRESSION_RATIO, PERF_REGRESSION_RECENT_RUNS, PERF_STORE_DIR
+
+PHASES = ("setup", "run", "extract")
+"""Phases whose times are stored as '<phase>_s' columns."""
+
+
+def throughput_distribution(df: pd.DataFrame, by: Sequence[str] = ("machine", "gpu_model")) -> pd.DataFrame:
+    """Summarizes the average iSolve throughput (MCells/s) per group.
+
+    Args:
+        df: Rows from `load_perf_store`.
+        by: Grouping columns.
+
+    Returns:
+        One row per group with 'runs', 'p10', 'median', 'p90' and 'mean', fastest first.
+    """
+    data = df.dropna(subset=["avg_mcells_per_s"])
+    if data.empty:
+        return pd.DataFrame(columns=[*by, "runs", "p10", "median", "p90", "mean"])
+    grouped = data.groupby(list(by), dropna=False)["avg_mcells_per_s"]
+    summary = grouped.quantile([0.1, 0.5, 0.9]).unstack()
+    summary.columns = ["p10", "median", "p90"]
+    summary.insert(0, "runs", grouped.size())
+    summary["mean"] = grouped.mean()
+    return summary.reset_index().sort_values("median", ascending=False, ignore_index=True)
+
+
+def detect_regressions(
+    df: pd.DataFrame,
+    by: Sequence[str] = ("machine", "gpu_model"),
+    baseline_runs: int = PERF_REGRESSION_BASELINE_RUNS,
+    recent_runs: int = PERF_REGRESSION_RECENT_RUNS,
+    ratio: float = PERF_REGRESSION_RATIO,
+) -> pd.DataFrame:
+    """Compares each group's latest throughput with its own history.
+
+    The median of the last `recent_runs` simulations is divided by the median
+    of up to `baseline_runs` simulations before them. Groups with fewer than
+    twice `recent_runs` simulations are skipped.
+
+    Args:
+        df: Rows from `load_perf_store`.
+        by: Grouping columns, usually the machine and its GPU.
+        baseline_runs: Simulations in the baseline window.
+        recent_runs: Simulations in the recent window.
+        ratio: Recent/baseline ratio below which a group is flagged.
+
+    Returns:
+        One row per group with 'baseline_median', 'recent_median', 'ratio',
+        'since' (first recent run) and 'regressed', worst ratio first.
+    """
+    columns = [*by, "baseline_median", "recent_median", "ratio", "since", "regressed"]
+    data = df.dropna(subset=["avg_mcells_per_s"]).sort_values("timestamp", kind="stable")
+    rows = []
+    for key, group in data.groupby(list(by), dropna=False, sort=True):
+        speeds = group["avg_mcells_per_s"].to_numpy()
+        if len(speeds) < recent_runs * 2:
+            continue
+        recent = speeds[-recent_runs:]
+        baseline = speeds[-recent_runs - baseline_runs : -recent_runs]
+        baseline_median = float(pd.Series(baseline).median())
+        recent_median = float(pd.Series(recent).median())
+        group_ratio = recent_median / baseline_median if baseline_median else None
+        rows.append(
+            (
+                *(key if isinstance(key, tuple) else (key,)),
+                baseline_median,
+                recent_median,
+                group_ratio,
+                group["timestamp"].iloc[-recent_runs],
+                group_ratio is not None and group_ratio < ratio,
+            )
+        )
+    return pd.DataFrame(rows, columns=columns).sort_values("ratio", ignore_index=True)
+
+
+def phase_breakdown(df: pd.DataFrame, by: Sequence[str] = ("machine",)) -> pd.DataFrame:
+    """Averages the setup/run/extract times per group and their share of the total.
+
+    Args:
+        df: Rows from `load_perf_store`.
+        by: Grouping columns.
+
+    Returns:
+        One row per group with 'runs', mean '<phase>_s' and '<phase>_share' columns.
+    """
+    phase_columns = [f"{phase}_s" for phase in PHASES]
+    grouped = df.groupby(list(by), dropna=False)
+    summary = grouped[phase_columns].mean()
+    total = summary.sum(axis=1)
+    for phase in PHASES:
+        summary[f"{phase}_share"] = summary[f"{phase}_s"] / total.where(total > 0)
+    summary.insert(0, "runs", grouped.size())
+    return summary.reset_index()
+
+
+def default_store_dir(base_dir: str, config_filename: Optional[str] = None) -> str:
+    """Store a project's simulations are appended to, resolved against its root like `ResultsExtractor`.
+
+    Args:
+        base_dir: Project root.
+        config_filename: Study config whose `execution_control.perf_store_dir`
+            names the store; PERF_STORE_DIR when omitted or unset.
+
+    Returns:
+        Absolute path of the store directory.
+    """
+    store_dir = None
+    if config_filename:
+        from goliat.config import Config
+
+        store_dir = Config(base_dir, config_filename)["execution_control.perf_store_dir"]
+    return os.path.abspath(os.path.join(base_dir, store_dir or PERF_STORE_DIR))
+
+
+def _parse_since(value: str) -> pd.Timestamp:
+    """Accepts a date ('2026-09-01') or a lookback ('30d', '12w')."""
+    if value[:-1].isdigit() and value[-1] in "dw":
+        return pd.Timestamp.now() - pd.Timedelta(int(value[:-1]) * (7 if value[-1] == "w" else 1), unit="D")
+    return pd.Timestamp(value)
+
+
+def _log_table(title: str, table: pd.DataFrame) -> None:
+    progress_logger = logging.getLogger("progress")
+    progress_logger.info(f"\n  {title}", extra={"log_type": "header"})
+    if table.empty:
+        progress_logger.info("    (no data)", extra={"log_type": "info"})
+        return
+    for line in table.to_string(index=False, float_format=lambda v: f"{v:.2f}").splitlines():
+        progress_logger.info(f"    {line}", extra={"log_type": "info"})
+
+
+def main():
+    """CLI entry point for `goliat perf`."""
+    import argparse
+
+    from goliat.perf_store import compact_perf_store, import_metadata_files, load_perf_store
+
+    parser = argparse.ArgumentParser(description="Throughput, regression and phase-time report from the performance store.")
+    parser.add_argument(
+        "store",
+        nargs="?",
+        default=None,
+        help=f"Performance store directory (default: from --config, else {PERF_STORE_DIR} in the project).",
+    )
+    parser.add_argument("--config", default=None, help="Study config whose execution_control.perf_store_dir names the store.")
+    parser.add_argument("--base-dir", default=None, help="Project root the store is resolved against (default: current directory).")
+    parser.add_argument(
+        "--since", type=_parse_since, default=None, help="Only simulations since a date or lookback, e.g. 2026-09-01 or 30d."
+    )
+    parser.add_argument("--machine", action="append", default=None, help="Only this machine (repeatable).")
+    parser.add_argument("--gpu", action="append", default=None, help="Only this GPU model (repeatable).")
+    parser.add_argument("--study-type", choices=["near_field", "far_field"], default=None)
+    parser.add_argument("--group-by", default="machine,gpu_model", help="Comma-separated grouping columns (default: machine,gpu_model).")
+    parser.add_argument("--import-results", metavar="DIR", default=None, help="First append every simulation_metadata.json under DIR.")
+    parser.add_argument("--as-machine", default=None, help="Machine name for --import-results (default: this host).")
+    parser.add_argument("--compact", action="store_true", help="Merge the per-simulation files of each partition first.")
+    parser.add_argument("-o", "--output", default=None, help="Also write the report tables as CSV files to this directory.")
+    args = parser.parse_args()
+    if args.store is None:
+        args.store = default_store_dir(args.base_dir or os.getcwd(), args.config)
+
+    from goliat.logging_manager import setup_loggers
+
+    setup_loggers()
+    progress_logger = logging.getLogger("progress")
+
+    if args.import_results:
+        added = import_metadata_files(args.store, args.import_results, machine=args.as_machine)
+        progress_logger.info(f"  Imported {added} simulation metadata files into {args.store}", extra={"log_type": "info"})
+    if args.compact:
+        merged = compact_perf_store(args.store)
+        progress_logger.info(f"  Compacted {merged} files in {args.store}", extra={"log_type": "info"})
+
+    by = [column.strip() for column in args.group_by.split(",") if column.strip()]
+    df = load_perf_store(args.store, machines=args.machine, since=args.since, study_type=args.study_type, gpu_models=args.gpu)
+    progress_logger.info(f"  {len(df)} simulations in {args.store}", extra={"log_type": "info"})
+
+    tables = {
+        "throughput": throughput_distribution(df, by=by),
+        "regressions": detect_regressions(df, by=by),
+        "phases": phase_breakdown(df, by=by),
+    }
+    _log_table("Throughput (MCells/s)", tables["throughput"])
+    _log_table("Throughput regressions", tables["regressions"])
+    _log_table("Phase times (s)", tables["phases"])
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        for name, table in tables.items():
+            table.to_csv(os.path.join(args.output, f"perf_{name}.csv"), index=False)
+        progress_logger.info(f"  Saved report tables to: {args.output}/", extra={"log_type": "success"})
+
+
+if __name__ == "__main__":
+    main()
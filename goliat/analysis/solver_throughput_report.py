@@ -0,0 +1,78 @@
+"""Sweep-level report of solver throughput recorded during manual iSolve runs."""
+
+import logging
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+from goliat.constants import SOLVER_THROUGHPUT_DEGRADATION_RATIO, SOLVER_THROUGHPUT_FILENAME
+from goliat.runners.solver_throughput import load_throughput_file
+
+
+def find_throughput_files(results_dir: str | Path) -> list[Path]:
+    """Find all solver throughput files in the results directory."""
+    return sorted(Path(results_dir).rglob(SOLVER_THROUGHPUT_FILENAME))
+
+
+def build_throughput_report(results_dir: str | Path, threshold: float = SOLVER_THROUGHPUT_DEGRADATION_RATIO) -> list[dict]:
+    """Summarizes solver throughput per simulation and flags degraded runs.
+
+    A simulation is flagged when its throughput dropped during the run
+    (late/early ratio below `threshold`), or when its median throughput is
+    below `threshold` times the sweep median of simulations that used the
+    same solver kernel. The first points at swapping or thermal throttling,
+    the second at a slow or shared machine.
+
+    Args:
+        results_dir: Root results directory to scan.
+        threshold: Ratio below which a simulation is flagged.
+
+    Returns:
+        One dict per simulation with 'path', 'kernel', the throughput summary,
+        'relative_to_sweep' and a list of 'flags' (empty if healthy).
+    """
+    rows = []
+    for path in find_throughput_files(results_dir):
+        try:
+            data = load_throughput_file(str(path))
+        except (OSError, ValueError) as e:
+            logging.getLogger("verbose").warning(f"Could not read {path}: {e}")
+            continue
+        summary = data.get("summary") or {}
+        if not summary:
+            continue
+        rows.append({"path": str(path.parent), "kernel": data.get("metadata", {}).get("kernel", "unknown"), **summary})
+
+    by_kernel = defaultdict(list)
+    for row in rows:
+        by_kernel[row["kernel"]].append(row["median_mcells_per_s"])
+    sweep_medians = {kernel: statistics.median(speeds) for kernel, speeds in by_kernel.items()}
+
+    for row in rows:
+        sweep_median = sweep_medians[row["kernel"]]
+        row["relative_to_sweep"] = row["median_mcells_per_s"] / sweep_median if sweep_median else None
+        row["flags"] = []
+        if row.get("degradation_ratio") is not None and row["degradation_ratio"] < threshold:
+            row["flags"].append("slowed_during_run")
+        if row["relative_to_sweep"] is not None and row["relative_to_sweep"] < threshold:
+            row["flags"].append("slow_vs_sweep")
+    return rows
+
+
+def log_throughput_report(rows: list[dict]) -> None:
+    """Logs flagged simulations from `build_throughput_report`."""
+    progress_logger = logging.getLogger("progress")
+    flagged = [row for row in rows if row["flags"]]
+    progress_logger.info(
+        f"  Solver throughput: {len(rows)} simulations recorded, {len(flagged)} degraded.",
+        extra={"log_type": "warning" if flagged else "info"},
+    )
+    for row in flagged:
+        ratio = row.get("degradation_ratio")
+        ratio_text = f", late/early {ratio:.0%}" if ratio is not None else ""
+        relative = row["relative_to_sweep"]
+        relative_text = f"{relative:.0%} of {row['kernel']} sweep median" if relative is not None else f"{row['kernel']} sweep median is 0"
+        progress_logger.info(
+            f"    - {row['path']}: {row['median_mcells_per_s']:.0f} MCells/s ({relative_text}{ratio_text}) [{', '.join(row['flags'])}]",
+            extra={"log_type": "warning"},
+        )
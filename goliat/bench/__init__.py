@@ -0,0 +1,34 @@
+"""Benchmarks of the extraction hot paths that run without Sim4Life.
+
+`generate_synthetic_phantom` writes `_Input.h5`/`_Output.h5` files in
+Sim4Life's layout, and `run_benchmarks` times the hot paths on them.
+`goliat bench` runs the suite and compares it against a stored baseline.
+"""
+
+from .runner import (
+    CASES,
+    BenchCase,
+    BenchComparison,
+    BenchContext,
+    BenchResult,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+from .synthetic import SyntheticPhantom, SyntheticSurfaceGrid, generate_synthetic_phantom
+
+__all__ = [
+    "CASES",
+    "BenchCase",
+    "BenchComparison",
+    "BenchContext",
+    "BenchResult",
+    "SyntheticPhantom",
+    "SyntheticSurfaceGrid",
+    "compare_to_baseline",
+    "generate_synthetic_phantom",
+    "load_baseline",
+    "run_benchmarks",
+    "save_baseline",
+]
@@ -0,0 +1,515 @@
+"""Benchmarks of the extraction hot paths on a synthetic phantom (`goliat bench`).
+
+Each case prepares its inputs untimed, then runs the hot path `repeat` times
+under a `ResourceTracker`. The fastest run is reported with its CPU time and
+I/O; memory is the largest rise of the peak RSS above the RSS at the start
+of a run, over all runs, so it does not depend on what was loaded before the
+case. Results can be stored as a baseline and later runs compared against
+it.
+"""
+
+import gc
+import json
+import logging
+import os
+import platform
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from ..constants import BENCH_AIR_POINTS, BENCH_REGRESSION_MIN_MB, BENCH_REGRESSION_MIN_S, BENCH_REGRESSION_RATIO, BENCH_REPEATS
+from ..resource_usage import ResourceTracker
+from .synthetic import SyntheticPhantom, phantom_surface
+
+
+class BenchResult(NamedTuple):
+    """Timing and resources of one benchmark case.
+
+    Attributes:
+        name: Case name.
+        repeats: Timed runs.
+        wall_s: Wall time of the fastest run.
+        median_wall_s: Median wall time over all runs.
+        cpu_s: CPU time of the fastest run, including worker threads.
+        rss_growth_mb: Largest rise of the peak resident memory above the
+            resident memory at the start of a run, over all runs. Memory
+            held by the phantom, earlier cases or the case's preparation is
+            not counted.
+        read_mb: Data read by the fastest run.
+        written_mb: Data written by the fastest run.
+    """
+
+    name: str
+    repeats: int
+    wall_s: float
+    median_wall_s: float
+    cpu_s: float
+    rss_growth_mb: Optional[float] = None
+    read_mb: Optional[float] = None
+    written_mb: Optional[float] = None
+
+    def as_dict(self) -> dict:
+        """Returns a JSON-ready dict without the name."""
+        return {key: value for key, value in self._asdict().items() if key != "name"}
+
+
+class BenchComparison(NamedTuple):
+    """One case compared against its baseline.
+
+    Attributes:
+        name: Case name.
+        wall_s: Current fastest wall time.
+        baseline_wall_s: Baseline fastest wall time.
+        time_ratio: Current over baseline wall time.
+        rss_growth_mb: Current memory growth.
+        baseline_rss_growth_mb: Baseline memory growth.
+        memory_ratio: Current over baseline memory growth, if both are known.
+        regressed: Whether time or memory exceeded the regression threshold.
+    """
+
+    name: str
+    wall_s: float
+    baseline_wall_s: float
+    time_ratio: float
+    rss_growth_mb: Optional[float]
+    baseline_rss_growth_mb: Optional[float]
+    memory_ratio: Optional[float]
+    regressed: bool
+
+
+@dataclass
+class BenchContext:
+    """Inputs shared by the benchmark cases, derived lazily from the phantom.
+
+    Attributes:
+        phantom: The synthetic phantom.
+        work_dir: Directory for files written by the cases.
+        n_air_points: Air focus points scored by the hotspot cases.
+        seed: Seed for sampling focus points and combination weights.
+    """
+
+    phantom: SyntheticPhantom
+    work_dir: str
+    n_air_points: int = BENCH_AIR_POINTS
+    seed: int = 0
+    _rng: np.random.Generator = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._rng = np.random.default_rng(self.seed)
+
+    @cached_property
+    def focus_points(self) -> tuple:
+        """(valid_air_indices, axis_x, axis_y, axis_z, skin_mask) from `find_valid_air_focus_points`."""
+        from ..utils.skin_voxel_utils import find_valid_air_focus_points
+
+        return find_valid_air_focus_points(self.phantom.input_h5)
+
+    @cached_property
+    def sampled_air_indices(self) -> np.ndarray:
+        valid = self.focus_points[0]
+        return valid[self._rng.choice(len(valid), size=min(self.n_air_points, len(valid)), replace=False)]
+
+    @cached_property
+    def skin_indices(self) -> np.ndarray:
+        return np.argwhere(self.focus_points[4])
+
+    @cached_property
+    def weights(self) -> np.ndarray:
+        n = len(self.phantom.output_h5s)
+        return np.exp(1j * self._rng.uniform(0, 2 * np.pi, n)) / np.sqrt(n)
+
+    @cached_property
+    def focus_center(self) -> np.ndarray:
+        return self.sampled_air_indices[0]
+
+    def output_path(self, name: str) -> str:
+        os.makedirs(self.work_dir, exist_ok=True)
+        return os.path.join(self.work_dir, name)
+
+
+class BenchCase(NamedTuple):
+    """A benchmark case.
+
+    Attributes:
+        name: Case name, used on the command line and in baselines.
+        description: One-line description.
+        prepare: Builds the inputs untimed and returns the callable to time.
+    """
+
+    name: str
+    description: str
+    prepare: Callable[[BenchContext], Callable[[], object]]
+
+
+def _field_cache_load(ctx: BenchContext):
+    from ..extraction.field_cache import FieldCache
+
+    return lambda: FieldCache(ctx.phantom.output_h5s, field_type="E", low_memory=False)
+
+
+def _field_cache_streaming(ctx: BenchContext):
+    from ..extraction.field_cache import FieldCache
+
+    indices = ctx.skin_indices
+
+    def run():
+        # A fresh cache per run, so every run starts with an empty slab cache
+        cache = FieldCache(ctx.phantom.output_h5s, field_type="E", low_memory=True, slab_cache_gb=0.25)
+        try:
+            for path in cache.h5_paths:
+                cache.read_at_indices(path, indices)
+        finally:
+            cache.close()
+
+    return run
+
+
+def _find_air_focus_points(ctx: BenchContext):
+    from ..utils.skin_voxel_utils import find_valid_air_focus_points
+
+    return lambda: find_valid_air_focus_points(ctx.phantom.input_h5)
+
+
+def _hotspot_scores_chunked(ctx: BenchContext):
+    from ..extraction.field_cache import FieldCache
+    from ..extraction.hotspot_scoring import compute_all_hotspot_scores_chunked
+
+    _, axis_x, axis_y, axis_z, skin_mask = ctx.focus_points
+    cache = FieldCache(ctx.phantom.output_h5s, field_type="E", low_memory=False)
+    return lambda: compute_all_hotspot_scores_chunked(
+        ctx.phantom.output_h5s, ctx.sampled_air_indices, skin_mask, axis_x, axis_y, axis_z, field_cache=cache
+    )
+
+
+def _hotspot_scores_streaming(ctx: BenchContext):
+    from ..extraction.hotspot_scoring import compute_all_hotspot_scores_streaming
+
+    _, axis_x, axis_y, axis_z, skin_mask = ctx.focus_points
+    return lambda: compute_all_hotspot_scores_streaming(ctx.phantom.output_h5s, ctx.sampled_air_indices, skin_mask, axis_x, axis_y, axis_z)
+
+
+def _combine_fields_chunked(ctx: BenchContext):
+    from ..extraction.field_combiner import combine_fields_chunked
+
+    paths, output = ctx.phantom.output_h5s, ctx.output_path("combined_Output.h5")
+    return lambda: combine_fields_chunked(paths, ctx.weights, paths[0], output)
+
+
+def _combine_fields_sliced(ctx: BenchContext):
+    from ..extraction.field_combiner_sliced import combine_fields_sliced
+
+    paths, output = ctx.phantom.output_h5s, ctx.output_path("combined_sliced_Output.h5")
+    return lambda: combine_fields_sliced(paths, ctx.weights, paths[0], output, center_idx=ctx.focus_center)
+
+
+def _h5_slicer(ctx: BenchContext):
+    import h5py
+
+    from ..utils.h5_slicer import slice_h5_output
+
+    with h5py.File(ctx.phantom.output_h5s[0], "r") as f:
+        mesh = next(iter(f["Meshes"].values()))
+        center_m = tuple(float(mesh[name][i]) for name, i in zip(("axis_x", "axis_y", "axis_z"), ctx.focus_center))
+    output = ctx.output_path("sliced_Output.h5")
+    return lambda: slice_h5_output(ctx.phantom.output_h5s[0], output, center_m, 0.1)
+
+
+def _surface_grid_to_arrays(ctx: BenchContext):
+    from ..extraction.sapd_extractor import SapdExtractor
+
+    grid = phantom_surface(ctx.phantom)
+    return lambda: SapdExtractor._surface_grid_to_arrays(grid)
+
+
+CASES: Dict[str, BenchCase] = {
+    case.name: case
+    for case in (
+        BenchCase("field_cache_load", "FieldCache pre-loading every E-field into memory", _field_cache_load),
+        BenchCase("field_cache_streaming", "FieldCache slab-cached reads of all skin voxels per direction", _field_cache_streaming),
+        BenchCase("find_valid_air_focus_points", "Air/skin extraction and shell dilation on the _Input.h5", _find_air_focus_points),
+        BenchCase("hotspot_scores_chunked", "compute_all_hotspot_scores_chunked on a pre-loaded FieldCache", _hotspot_scores_chunked),
+        BenchCase("hotspot_scores_streaming", "compute_all_hotspot_scores_streaming, direction-major", _hotspot_scores_streaming),
+        BenchCase("combine_fields_chunked", "Full-grid weighted E and H combination in z-slabs", _combine_fields_chunked),
+        BenchCase("combine_fields_sliced", "Weighted E and H combination in a 100 mm cube", _combine_fields_sliced),
+        BenchCase("h5_slicer", "slice_h5_output of one _Output.h5 to a 100 mm cube", _h5_slicer),
+        BenchCase("surface_grid_to_arrays", "SapdExtractor._surface_grid_to_arrays on a 50k-vertex skin", _surface_grid_to_arrays),
+    )
+}
+"""Benchmark cases in run order."""
+
+
+@contextmanager
+def _quiet():
+    """Silences the progress and verbose loggers the hot paths write to, except for errors."""
+    loggers = [logging.getLogger(name) for name in ("progress", "verbose")]
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        for logger, level in zip(loggers, levels):
+            logger.setLevel(level)
+
+
+def run_case(case: BenchCase, ctx: BenchContext, repeats: int = BENCH_REPEATS) -> BenchResult:
+    """Prepares a case and times it.
+
+    Args:
+        case: The case to run.
+        ctx: Shared inputs.
+        repeats: Timed runs.
+
+    Returns:
+        The fastest run's timing, with the largest memory growth over all runs.
+    """
+    tracker = ResourceTracker()
+    with _quiet():
+        fn = case.prepare(ctx)
+        runs = []
+        for _ in range(max(1, repeats)):
+            gc.collect()
+            measurement = tracker.start()
+            start = time.perf_counter()
+            fn()
+            wall_s = time.perf_counter() - start
+            runs.append((wall_s, tracker.stop(measurement)))
+        del fn
+
+    wall_s, usage = min(runs, key=lambda run: run[0])
+    growths = [
+        max(0.0, round(run[1].peak_rss_mb - run[1].start_rss_mb, 1))
+        for run in runs
+        if run[1].peak_rss_mb is not None and run[1].start_rss_mb is not None
+    ]
+    return BenchResult(
+        name=case.name,
+        repeats=len(runs),
+        wall_s=round(wall_s, 4),
+        median_wall_s=round(float(np.median([run[0] for run in runs])), 4),
+        cpu_s=round(usage.cpu_s, 4),
+        rss_growth_mb=max(growths) if growths else None,
+        read_mb=usage.read_mb,
+        written_mb=usage.written_mb,
+    )
+
+
+def run_benchmarks(
+    ctx: BenchContext,
+    names: Optional[Sequence[str]] = None,
+    repeats: int = BENCH_REPEATS,
+    on_result: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    """Runs benchmark cases in registry order.
+
+    Args:
+        ctx: Shared inputs.
+        names: Cases to run (default: all).
+        repeats: Timed runs per case.
+        on_result: Called with each result as soon as it is available.
+
+    Returns:
+        One result per case.
+
+    Raises:
+        ValueError: If a name is not a known case.
+    """
+    unknown = sorted(set(names or ()) - set(CASES))
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}. Available: {', '.join(CASES)}")
+    results = []
+    for name, case in CASES.items():
+        if names and name not in names:
+            continue
+        result = run_case(case, ctx, repeats=repeats)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def save_baseline(path: str, results: Sequence[BenchResult], phantom: SyntheticPhantom) -> None:
+    """Writes results as the baseline for later comparisons.
+
+    Cases already in the file but not in `results` are kept.
+    """
+    baseline = load_baseline(path) if os.path.exists(path) else None
+    stored = dict(baseline["results"]) if baseline and baseline.get("phantom") == phantom.params() else {}
+    stored.update({result.name: result.as_dict() for result in results})
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "machine": platform.node(),
+                "python": platform.python_version(),
+                "phantom": phantom.params(),
+                "results": stored,
+            },
+            f,
+            indent=2,
+        )
+
+
+def load_baseline(path: str) -> dict:
+    """Reads a baseline written by `save_baseline`."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(
+    results: Sequence[BenchResult],
+    baseline: dict,
+    ratio: float = BENCH_REGRESSION_RATIO,
+    min_slowdown_s: float = BENCH_REGRESSION_MIN_S,
+    min_growth_mb: float = BENCH_REGRESSION_MIN_MB,
+) -> List[BenchComparison]:
+    """Compares results against a baseline.
+
+    A case regresses when its fastest time grew by more than `ratio` and by
+    at least `min_slowdown_s`, or its memory growth during a run rose by
+    more than `ratio` and by at least `min_growth_mb`.
+
+    Args:
+        results: Current results.
+        baseline: Baseline from `load_baseline`.
+        ratio: Regression threshold for time and memory.
+        min_slowdown_s: Absolute slowdown below which time changes are ignored.
+        min_growth_mb: Absolute rise in memory growth below which memory changes are ignored.
+
+    Returns:
+        One comparison per case present in both, in the order of `results`.
+    """
+    comparisons = []
+    for result in results:
+        base = baseline.get("results", {}).get(result.name)
+        if base is None:
+            continue
+        time_ratio = result.wall_s / base["wall_s"] if base["wall_s"] else float("inf")
+        # Baselines from before rss_growth_mb recorded the absolute peak, which is not comparable
+        base_growth = base.get("rss_growth_mb")
+        memory_ratio = result.rss_growth_mb / base_growth if result.rss_growth_mb is not None and base_growth else None
+        slower = time_ratio > ratio and result.wall_s - base["wall_s"] >= min_slowdown_s
+        larger = memory_ratio is not None and memory_ratio > ratio and result.rss_growth_mb - base_growth >= min_growth_mb
+        comparisons.append(
+            BenchComparison(
+                name=result.name,
+                wall_s=result.wall_s,
+                baseline_wall_s=base["wall_s"],
+                time_ratio=round(time_ratio, 3),
+                rss_growth_mb=result.rss_growth_mb,
+                baseline_rss_growth_mb=base_growth,
+                memory_ratio=round(memory_ratio, 3) if memory_ratio is not None else None,
+                regressed=slower or larger,
+            )
+        )
+    return comparisons
+
+
+def _format_mb(value: Optional[float]) -> str:
+    return f"{value:8.0f}" if value is not None else f"{'-':>8}"
+
+
+def main():
+    """CLI entry point for `goliat bench`."""
+    import argparse
+    import sys
+
+    from ..constants import BENCH_BASELINE_PATH, BENCH_DIRECTIONS, BENCH_GRID, BENCH_SPACING_MM, BENCH_WORK_DIR
+
+    parser = argparse.ArgumentParser(description="Benchmark the extraction hot paths on a synthetic phantom.")
+    parser.add_argument("--grid", type=int, nargs=3, metavar=("NX", "NY", "NZ"), default=list(BENCH_GRID), help="Grid size in nodes.")
+    parser.add_argument("--directions", type=int, default=BENCH_DIRECTIONS, help=f"Incident directions (default: {BENCH_DIRECTIONS}).")
+    parser.add_argument("--spacing-mm", type=float, default=BENCH_SPACING_MM, help=f"Voxel size (default: {BENCH_SPACING_MM}).")
+    parser.add_argument("--cases", default=None, help="Comma-separated cases to run (default: all).")
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEATS, help=f"Timed runs per case (default: {BENCH_REPEATS}).")
+    parser.add_argument("--air-points", type=int, default=BENCH_AIR_POINTS, help="Air focus points for the hotspot cases.")
+    parser.add_argument(
+        "--work-dir", default=BENCH_WORK_DIR, help=f"Where the phantom is generated and reused (default: {BENCH_WORK_DIR})."
+    )
+    parser.add_argument("--baseline", default=BENCH_BASELINE_PATH, help=f"Baseline file (default: {BENCH_BASELINE_PATH}).")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run's results as the baseline.")
+    parser.add_argument("-o", "--output", default=None, help="Also write this run's results to a JSON file.")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit.")
+    args = parser.parse_args()
+
+    # The hot paths draw tqdm bars; tqdm reads this setting when it is first imported
+    os.environ.setdefault("TQDM_DISABLE", "1")
+
+    from ..logging_manager import setup_loggers
+
+    setup_loggers()
+    progress_logger = logging.getLogger("progress")
+
+    if args.list:
+        for case in CASES.values():
+            progress_logger.info(f"  {case.name:<30} {case.description}", extra={"log_type": "info"})
+        return
+
+    from .synthetic import generate_synthetic_phantom
+
+    phantom_dir = os.path.join(args.work_dir, "phantom_{}x{}x{}_{}dirs_{}mm".format(*args.grid, args.directions, args.spacing_mm))
+    t0 = time.perf_counter()
+    phantom = generate_synthetic_phantom(phantom_dir, grid=args.grid, n_directions=args.directions, spacing_mm=args.spacing_mm)
+    progress_logger.info(
+        f"  Synthetic phantom {phantom.grid} with {len(phantom.output_h5s)} directions ready in {time.perf_counter() - t0:.1f}s: {phantom_dir}",
+        extra={"log_type": "info"},
+    )
+
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else None
+    if baseline is not None and baseline.get("phantom") != phantom.params():
+        progress_logger.warning(
+            f"  Baseline {args.baseline} was recorded on a different phantom {baseline.get('phantom')}; not comparing.",
+            extra={"log_type": "warning"},
+        )
+        baseline = None
+
+    progress_logger.info(
+        f"\n  {'case':<30}{'best s':>9}{'median s':>10}{'cpu s':>9}{'+RSS MB':>9}{'read MB':>9}", extra={"log_type": "header"}
+    )
+
+    def report(result: BenchResult):
+        progress_logger.info(
+            f"  {result.name:<30}{result.wall_s:9.3f}{result.median_wall_s:10.3f}{result.cpu_s:9.2f}"
+            f" {_format_mb(result.rss_growth_mb)} {_format_mb(result.read_mb)}",
+            extra={"log_type": "info"},
+        )
+
+    names = [name.strip() for name in args.cases.split(",") if name.strip()] if args.cases else None
+    ctx = BenchContext(phantom, work_dir=os.path.join(args.work_dir, "scratch"), n_air_points=args.air_points)
+    results = run_benchmarks(ctx, names=names, repeats=args.repeat, on_result=report)
+
+    regressed = []
+    if baseline is not None:
+        progress_logger.info(
+            f"\n  Compared with {args.baseline} ({baseline.get('created')}, {baseline.get('machine')})", extra={"log_type": "header"}
+        )
+        for comparison in compare_to_baseline(results, baseline):
+            memory = f", memory x{comparison.memory_ratio:.2f}" if comparison.memory_ratio is not None else ""
+            line = f"  {comparison.name:<30} time x{comparison.time_ratio:.2f}{memory}"
+            if comparison.regressed:
+                regressed.append(comparison.name)
+                progress_logger.warning(f"{line}  REGRESSED", extra={"log_type": "warning"})
+            else:
+                progress_logger.info(line, extra={"log_type": "info"})
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({"phantom": phantom.params(), "results": {r.name: r.as_dict() for r in results}}, f, indent=2)
+    if args.save_baseline:
+        save_baseline(args.baseline, results, phantom)
+        progress_logger.info(f"  Saved baseline to: {args.baseline}", extra={"log_type": "success"})
+
+    if regressed:
+        progress_logger.error(f"  {len(regressed)} case(s) regressed: {', '.join(regressed)}", extra={"log_type": "error"})
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
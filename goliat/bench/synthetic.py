@@ -0,0 +1,317 @@
+"""Synthetic Sim4Life result files for benchmarking without Sim4Life.
+
+`generate_synthetic_phantom` writes an `_Input.h5` holding a voxel phantom
+(an ellipsoidal body with a one-voxel skin shell) and one `_Output.h5` per
+incident direction. The files use the group layout the extraction code reads:
+
+- `_Input.h5`: `Meshes/<id>/{voxels, id_map, axis_x, axis_y, axis_z}` and
+  `AllMaterialMaps/<group>/<uuid>/Property_0/_Object` carrying `material_name`.
+  Voxel ID 0 has no material, so it is detected as air.
+- `_Output.h5`: the same mesh axes, plus `FieldGroups/0` named "Overall Field"
+  with `AllFields/EM E(x,y,z,f0)` and `EM H(x,y,z,f0)` snapshots. Each
+  component is Yee-staggered (`comp0` is `(Nx-1, Ny, Nz, 2)` and so on) and
+  stores the real and imaginary parts of a plane wave, attenuated inside
+  the body.
+"""
+
+import json
+import os
+import uuid
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import h5py
+import numpy as np
+from scipy import ndimage
+
+from ..constants import BENCH_DIRECTIONS, BENCH_FREQUENCY_MHZ, BENCH_GRID, BENCH_SPACING_MM
+
+TISSUES = ("Skin", "Muscle", "Bone")
+"""Materials of voxel IDs 1, 2 and 3 (outer shell to inner core)."""
+
+BODY_ATTENUATION = 0.3
+"""Field amplitude inside the body relative to the incident wave."""
+
+ETA_0 = 376.730313668
+"""Impedance of free space in ohm."""
+
+_MANIFEST = "phantom.json"
+
+
+class SyntheticPhantom(NamedTuple):
+    """Files and parameters of a generated phantom.
+
+    Attributes:
+        input_h5: Path to the `_Input.h5` with the voxel phantom.
+        output_h5s: One `_Output.h5` per incident direction.
+        grid: Node count per axis (Nx, Ny, Nz); voxels are one fewer per axis.
+        spacing_mm: Voxel size in mm.
+        frequency_mhz: Frequency of the plane-wave fields.
+        seed: Seed of the random per-direction phase offsets.
+    """
+
+    input_h5: str
+    output_h5s: List[str]
+    grid: Tuple[int, int, int]
+    spacing_mm: float
+    frequency_mhz: float
+    seed: int
+
+    def params(self) -> dict:
+        """Returns the generation parameters, e.g. to check that benchmark results are comparable."""
+        return {
+            "grid": list(self.grid),
+            "n_directions": len(self.output_h5s),
+            "spacing_mm": self.spacing_mm,
+            "frequency_mhz": self.frequency_mhz,
+            "seed": self.seed,
+        }
+
+
+class SyntheticSurfaceGrid:
+    """Stands in for a Sim4Life `SurfaceGrid`, with the accessors the SAPD extractor uses."""
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
+        """Initializes the grid.
+
+        Args:
+            vertices: (V, 3) vertex coordinates.
+            faces: (T, 3) vertex indices of each triangle.
+        """
+        self._vertices = vertices
+        self._faces = faces
+
+    @property
+    def NumberOfPoints(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def NumberOfCells(self) -> int:
+        return len(self._faces)
+
+    def GetPoint(self, i: int) -> Tuple[float, float, float]:
+        return tuple(self._vertices[i].tolist())
+
+    def GetCellPoints(self, i: int) -> Tuple[int, int, int]:
+        return tuple(self._faces[i].tolist())
+
+
+def _axes(grid: Sequence[int], spacing_mm: float) -> List[np.ndarray]:
+    """Node coordinates in meters, centered on the origin."""
+    return [(np.arange(n) - (n - 1) / 2) * spacing_mm / 1000.0 for n in grid]
+
+
+def _body_semi_axes(axes: Sequence[np.ndarray]) -> np.ndarray:
+    """Semi-axes of the ellipsoidal body: 35% of the domain extent along each axis."""
+    return np.array([0.35 * (axis[-1] - axis[0]) for axis in axes])
+
+
+def _ellipsoid_level(x: np.ndarray, y: np.ndarray, z: np.ndarray, semi_axes: np.ndarray) -> np.ndarray:
+    """(x/a)^2 + (y/b)^2 + (z/c)^2 on the broadcast grid of the given 1-D coordinates."""
+    return (x[:, None, None] / semi_axes[0]) ** 2 + (y[None, :, None] / semi_axes[1]) ** 2 + (z[None, None, :] / semi_axes[2]) ** 2
+
+
+def build_voxels(axes: Sequence[np.ndarray]) -> np.ndarray:
+    """Labels every voxel: 0 air, 1 skin (one-voxel shell), 2 muscle, 3 bone.
+
+    Args:
+        axes: Node coordinates per axis.
+
+    Returns:
+        uint8 array of shape (Nx-1, Ny-1, Nz-1).
+    """
+    centers = [(axis[:-1] + axis[1:]) / 2 for axis in axes]
+    level = _ellipsoid_level(*centers, _body_semi_axes(axes))
+    body = level <= 1.0
+    voxels = np.where(body, 1, 0).astype(np.uint8)
+    voxels[ndimage.binary_erosion(body)] = 2
+    voxels[level <= 0.25] = 3
+    return voxels
+
+
+def fibonacci_directions(n: int) -> np.ndarray:
+    """Returns n unit vectors spread evenly over the sphere, shape (n, 3)."""
+    i = np.arange(n) + 0.5
+    theta = np.arccos(1 - 2 * i / n)
+    phi = np.pi * (1 + 5**0.5) * i
+    return np.column_stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)])
+
+
+def _polarization(k_hat: np.ndarray) -> np.ndarray:
+    """Theta-hat of the propagation direction, a unit vector perpendicular to it."""
+    theta = np.arccos(np.clip(k_hat[2], -1.0, 1.0))
+    phi = np.arctan2(k_hat[1], k_hat[0])
+    return np.array([np.cos(theta) * np.cos(phi), np.cos(theta) * np.sin(phi), -np.sin(theta)])
+
+
+def _staggered_coords(axes: Sequence[np.ndarray], component: int) -> List[np.ndarray]:
+    """Sample positions of a Yee component: edge centers along its own axis, nodes along the others."""
+    return [(axis[:-1] + axis[1:]) / 2 if i == component else axis for i, axis in enumerate(axes)]
+
+
+def plane_wave_component(
+    axes: Sequence[np.ndarray],
+    component: int,
+    k_vector: np.ndarray,
+    amplitude: complex,
+    semi_axes: np.ndarray,
+) -> np.ndarray:
+    """One Yee component of an attenuated plane wave.
+
+    Args:
+        axes: Node coordinates per axis.
+        component: 0, 1 or 2.
+        k_vector: Wave vector in rad/m.
+        amplitude: Complex amplitude of this component.
+        semi_axes: Body semi-axes; samples inside are scaled by `BODY_ATTENUATION`.
+
+    Returns:
+        complex64 array, one shorter than the node count along `component`.
+    """
+    x, y, z = _staggered_coords(axes, component)
+    # exp(-j k.r) separates into one factor per axis, so only 1-D exponentials are evaluated
+    field = (
+        np.exp(-1j * k_vector[0] * x).astype(np.complex64)[:, None, None]
+        * np.exp(-1j * k_vector[1] * y).astype(np.complex64)[None, :, None]
+        * np.exp(-1j * k_vector[2] * z).astype(np.complex64)[None, None, :]
+    )
+    field *= np.complex64(amplitude)
+    field[_ellipsoid_level(x, y, z, semi_axes) <= 1.0] *= BODY_ATTENUATION
+    return field
+
+
+def _mesh_uuid(name: str) -> uuid.UUID:
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"goliat-bench/{name}")
+
+
+def _write_mesh(f: h5py.File, axes: Sequence[np.ndarray], voxels: Optional[np.ndarray] = None) -> None:
+    mesh = f.create_group(f"Meshes/{_mesh_uuid('mesh')}")
+    for name, axis in zip(("axis_x", "axis_y", "axis_z"), axes):
+        mesh.create_dataset(name, data=axis)
+    if voxels is not None:
+        mesh.create_dataset("voxels", data=voxels)
+        ids = ["air", *TISSUES]
+        mesh.create_dataset("id_map", data=np.array([np.frombuffer(_mesh_uuid(t).bytes, dtype=np.uint8) for t in ids]))
+
+
+def write_input_h5(path: str, axes: Sequence[np.ndarray], voxels: np.ndarray) -> None:
+    """Writes the voxel phantom in `_Input.h5` layout.
+
+    Args:
+        path: Destination file.
+        axes: Node coordinates per axis.
+        voxels: Voxel labels from `build_voxels`.
+    """
+    with h5py.File(path, "w") as f:
+        _write_mesh(f, axes, voxels)
+        for tissue in TISSUES:
+            obj = f.create_group(f"AllMaterialMaps/0/{_mesh_uuid(tissue)}/Property_0/_Object")
+            obj.attrs["material_name"] = tissue.encode("utf-8")
+
+
+def write_output_h5(path: str, axes: Sequence[np.ndarray], fields: dict) -> None:
+    """Writes fields in `_Output.h5` layout.
+
+    Args:
+        path: Destination file.
+        axes: Node coordinates per axis.
+        fields: {"E": [comp0, comp1, comp2], "H": [...]} complex Yee components.
+    """
+    with h5py.File(path, "w") as f:
+        _write_mesh(f, axes)
+        f.create_group("FieldGroups/0/_Object").attrs["name"] = b"Overall Field"
+        for field_type, components in fields.items():
+            snapshot = f.create_group(f"FieldGroups/0/AllFields/EM {field_type}(x,y,z,f0)/_Object/Snapshots/0")
+            for comp, data in enumerate(components):
+                snapshot.create_dataset(f"comp{comp}", data=np.stack([data.real, data.imag], axis=-1).astype(np.float32))
+
+
+def generate_synthetic_phantom(
+    directory: str,
+    grid: Sequence[int] = BENCH_GRID,
+    n_directions: int = BENCH_DIRECTIONS,
+    spacing_mm: float = BENCH_SPACING_MM,
+    frequency_mhz: float = BENCH_FREQUENCY_MHZ,
+    seed: int = 0,
+) -> SyntheticPhantom:
+    """Generates a phantom and its per-direction fields, or reuses an identical earlier one.
+
+    Args:
+        directory: Where the files are written. A phantom already there with
+            the same parameters is reused.
+        grid: Node count per axis (Nx, Ny, Nz).
+        n_directions: Incident directions; one `_Output.h5` each.
+        spacing_mm: Voxel size in mm.
+        frequency_mhz: Frequency of the plane waves.
+        seed: Seed of the random per-direction phase offsets.
+
+    Returns:
+        The generated phantom.
+    """
+    grid = tuple(int(n) for n in grid)
+    phantom = SyntheticPhantom(
+        input_h5=os.path.join(directory, "phantom_Input.h5"),
+        output_h5s=[os.path.join(directory, f"direction_{i:02d}_Output.h5") for i in range(n_directions)],
+        grid=grid,
+        spacing_mm=float(spacing_mm),
+        frequency_mhz=float(frequency_mhz),
+        seed=seed,
+    )
+    manifest = os.path.join(directory, _MANIFEST)
+    if os.path.exists(manifest):
+        with open(manifest) as f:
+            if json.load(f) == phantom.params() and all(os.path.exists(p) for p in [phantom.input_h5, *phantom.output_h5s]):
+                return phantom
+        os.remove(manifest)
+
+    os.makedirs(directory, exist_ok=True)
+    axes = _axes(grid, spacing_mm)
+    semi_axes = _body_semi_axes(axes)
+    write_input_h5(phantom.input_h5, axes, build_voxels(axes))
+
+    k = 2 * np.pi * frequency_mhz * 1e6 / 299792458.0
+    offsets = np.exp(1j * np.random.default_rng(seed).uniform(0, 2 * np.pi, n_directions))
+    for path, k_hat, offset in zip(phantom.output_h5s, fibonacci_directions(n_directions), offsets):
+        e_hat = _polarization(k_hat)
+        h_hat = np.cross(k_hat, e_hat) / ETA_0
+        fields = {
+            field_type: [plane_wave_component(axes, c, k * k_hat, offset * unit[c], semi_axes) for c in range(3)]
+            for field_type, unit in (("E", e_hat), ("H", h_hat))
+        }
+        write_output_h5(path, axes, fields)
+
+    # Written last, so an interrupted generation is redone rather than reused
+    with open(manifest, "w") as f:
+        json.dump(phantom.params(), f)
+    return phantom
+
+
+def ellipsoid_surface(semi_axes: Sequence[float], n_theta: int = 200, n_phi: int = 250) -> SyntheticSurfaceGrid:
+    """Triangulates an ellipsoid, e.g. the skin of a synthetic phantom.
+
+    Args:
+        semi_axes: Ellipsoid semi-axes in meters.
+        n_theta: Vertex rings from pole to pole.
+        n_phi: Vertices per ring.
+
+    Returns:
+        Surface grid with n_theta * n_phi vertices.
+    """
+    theta, phi = np.meshgrid(np.linspace(0, np.pi, n_theta), np.linspace(0, 2 * np.pi, n_phi, endpoint=False), indexing="ij")
+    vertices = np.column_stack(
+        [
+            semi_axes[0] * (np.sin(theta) * np.cos(phi)).ravel(),
+            semi_axes[1] * (np.sin(theta) * np.sin(phi)).ravel(),
+            semi_axes[2] * np.cos(theta).ravel(),
+        ]
+    )
+    ring, col = np.meshgrid(np.arange(n_theta - 1), np.arange(n_phi), indexing="ij")
+    a = (ring * n_phi + col).ravel()
+    b = (ring * n_phi + (col + 1) % n_phi).ravel()
+    c, d = a + n_phi, b + n_phi
+    faces = np.concatenate([np.column_stack([a, c, b]), np.column_stack([b, c, d])]).astype(np.int32)
+    return SyntheticSurfaceGrid(vertices, faces)
+
+
+def phantom_surface(phantom: SyntheticPhantom) -> SyntheticSurfaceGrid:
+    """Skin surface of a generated phantom, as the SAPD extractor would receive it."""
+    return ellipsoid_surface(_body_semi_axes(_axes(phantom.grid, phantom.spacing_mm)))
@@ -0,0 +1,218 @@
+"""Compiled configuration views and the persisted inheritance-resolution cache."""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Iterable, Optional, Union
+
+CACHE_FORMAT_VERSION = 1
+"""Bumped whenever the layout of a resolution cache file changes."""
+
+OverridePath = Union[str, tuple[str, ...]]
+
+
+def flatten_paths(config: dict) -> dict[str, Any]:
+    """Maps every dot-path of a nested config to its value.
+
+    Intermediate dicts are included as well, so `flat["gridding_parameters"]`
+    and `flat["gridding_parameters.global_gridding"]` both resolve. Keys that
+    contain a dot cannot be addressed by dot-notation and are skipped, as are
+    their subtrees.
+
+    Args:
+        config: The nested configuration dictionary.
+
+    Returns:
+        A flat dictionary from dot-path to value. Values are shared, not copied.
+    """
+    flat: dict[str, Any] = {}
+    stack: list[tuple[str, dict]] = [("", config)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            if not isinstance(key, str) or "." in key:
+                continue
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, dict) and value:
+                stack.append((path + ".", value))
+    return flat
+
+
+class ConfigSnapshot:
+    """Read-only, compiled view of a resolved configuration.
+
+    All dot-paths are flattened once at construction, so each lookup is a
+    single dictionary probe instead of a split and a walk through the nested
+    dicts. The snapshot never modifies the dictionary it wraps; callers must
+    treat returned sub-dicts as read-only and use `derive` to get a variant.
+    """
+
+    __slots__ = ("_data", "_flat")
+
+    def __init__(self, data: dict):
+        """Compiles the lookup table for a configuration dictionary.
+
+        Args:
+            data: The resolved configuration. It is shared with the snapshot, not copied.
+        """
+        self._data = data
+        self._flat = flatten_paths(data)
+
+    def __getitem__(self, path: str) -> Any:
+        """Returns the value at a dot-path, or None if it does not exist.
+
+        Raises:
+            KeyError: If the path is empty.
+        """
+        if not path:
+            raise KeyError("Empty path")
+        return self._flat.get(path)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._flat
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Returns the value at a dot-path, or `default` if it does not exist."""
+        return self._flat.get(path, default)
+
+    def as_dict(self) -> dict:
+        """Returns the wrapped configuration dictionary (shared, do not modify)."""
+        return self._data
+
+    def derive(self, overrides: dict[OverridePath, Any]) -> "ConfigSnapshot":
+        """Returns a new snapshot with some values replaced; see `derive_config`."""
+        return ConfigSnapshot(derive_config(self._data, overrides))
+
+
+def _override_keys(path: OverridePath) -> tuple[str, ...]:
+    keys = tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+    if not keys or not all(keys):
+        raise KeyError(f"Invalid override path: {path!r}")
+    return keys
+
+
+def derive_config(base: dict, overrides: dict[OverridePath, Any]) -> dict:
+    """Derives a configuration variant without copying the whole tree.
+
+    Only the dicts on the path to each overridden value are copied; every
+    other subtree is shared with `base`, which is left unchanged. This
+    replaces `deepcopy(config)` followed by in-place edits when a study is
+    split into many per-worker configs.
+
+    Args:
+        base: The configuration to derive from.
+        overrides: Values to set, keyed by dot-path (`"antenna_config.700"`) or
+            by key tuple for keys that contain a dot. Missing intermediate
+            dicts are created.
+
+    Returns:
+        The derived configuration.
+
+    Raises:
+        KeyError: If an override path is empty or has an empty component.
+        TypeError: If an override path runs through a value that is not a dict.
+    """
+    result = dict(base)
+    # Dicts already copied for this derivation, by id, so sibling overrides share one copy
+    copied = {id(result): result}
+    for path, value in overrides.items():
+        keys = _override_keys(path)
+        node = result
+        for depth, key in enumerate(keys[:-1]):
+            child = node.get(key)
+            if child is not None and not isinstance(child, dict):
+                raise TypeError(f"Cannot override '{'.'.join(keys)}': '{'.'.join(keys[: depth + 1])}' is not a dict")
+            if child is None or id(child) not in copied:
+                child = dict(child or {})
+                copied[id(child)] = child
+                node[key] = child
+            node = child
+        node[keys[-1]] = value
+    return result
+
+
+def _file_fingerprint(path: str, with_hash: bool = True) -> dict:
+    stat = os.stat(path)
+    fingerprint = {"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if with_hash:
+        with open(path, "rb") as f:
+            fingerprint["sha256"] = hashlib.sha256(f.read()).hexdigest()
+    return fingerprint
+
+
+def resolution_cache_path(cache_dir: str, config_path: str) -> str:
+    """Returns the cache file for a top-level config file.
+
+    Args:
+        cache_dir: Directory holding the resolution cache files.
+        config_path: Path of the config file whose resolution is cached.
+
+    Returns:
+        Path of the cache file.
+    """
+    digest = hashlib.sha1(os.path.abspath(config_path).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.splitext(os.path.basename(config_path))[0]}_{digest}.json")
+
+
+def load_resolved_config(cache_file: str, resolve_extends: Callable[[str, str], str]) -> Optional[dict]:
+    """Returns a cached resolved config if no file of its `extends` chain changed.
+
+    A chain entry is still valid when its mtime and size match; otherwise its
+    content hash decides, so a touched but unchanged file keeps the cache.
+    Each `extends` reference is re-resolved as well, so a newly added user
+    config that shadows a packaged default invalidates the entry.
+
+    Args:
+        cache_file: Cache file written by `save_resolved_config`.
+        resolve_extends: Maps an `extends` value and the path of the file
+            containing it to the path of the parent config.
+
+    Returns:
+        The resolved configuration, or None on a cache miss.
+    """
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+        if cached.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        chain = cached["chain"]
+        for child, parent in zip(chain, chain[1:]):
+            if os.path.abspath(resolve_extends(parent["extends"], child["path"])) != parent["path"]:
+                return None
+        for entry in chain:
+            current = _file_fingerprint(entry["path"], with_hash=False)
+            if (current["mtime_ns"], current["size"]) == (entry["mtime_ns"], entry["size"]):
+                continue
+            if current["size"] != entry["size"] or _file_fingerprint(entry["path"])["sha256"] != entry["sha256"]:
+                return None
+        return cached["resolved"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_resolved_config(cache_file: str, chain: Iterable[tuple[str, Optional[str]]], resolved: dict) -> None:
+    """Persists a resolved config together with the fingerprints of its `extends` chain.
+
+    Failures are logged and otherwise ignored; the cache is an optimization only.
+
+    Args:
+        cache_file: Destination cache file.
+        chain: (path, extends value) pairs from the top-level config down to the
+            root ancestor; the extends value is None for the top-level file.
+        resolved: The fully resolved configuration.
+    """
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        entries = [dict(_file_fingerprint(os.path.abspath(path)), extends=extends) for path, extends in chain]
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump({"version": CACHE_FORMAT_VERSION, "chain": entries, "resolved": resolved}, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        logging.getLogger("verbose").warning(f"Could not write config resolution cache: {e}", extra={"log_type": "warning"})
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
@@ -7,6 +7,7 @@ from typing import Iterator, Optional, Tuple
 
 from dotenv import load_dotenv
 
+from goliat.config.compiled import ConfigSnapshot, load_resolved_config, resolution_cache_path, save_resolved_config
 from goliat.config.credentials import get_download_email, get_osparc_credentials
 from goliat.config.file_management import cleanup_old_data_files
 from goliat.config.merge import deep_merge
@@ -16,6 +17,7 @@ from goliat.config.simulation_config import (
     build_near_field_simulation_config,
     build_surgical_gridding,
 )
+from goliat.constants import CONFIG_CACHE_DIRNAME, ETA_HISTORY_FILENAME
 
 # Load environment variables from .env file
 load_dotenv()
@@ -52,8 +54,10 @@ class Config:
         cleanup_old_data_files(data_dir)
 
         self.profiling_config_path = os.path.join(data_dir, f"profiling_config_{session_timestamp}_{session_hash}.json")
+        self.eta_history_path = os.path.join(data_dir, ETA_HISTORY_FILENAME)
 
-        self.config = self._load_config_with_inheritance(self.config_path)
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._config = self._load_resolved_config(self.config_path, os.path.join(data_dir, CONFIG_CACHE_DIRNAME))
 
         # Load material mapping - provide helpful error if missing
         try:
@@ -68,16 +72,16 @@ class Config:
 
         # Load detuning config if enabled
         self.detuning_data = None
-        self.detuning_enabled = self.config.get("detuning_enabled", "") or False
-        self.detuning_write_during_calibration = self.config.get("detuning_write_during_calibration", "") or False
+        self.detuning_enabled = self._config.get("detuning_enabled", "") or False
+        self.detuning_write_during_calibration = self._config.get("detuning_write_during_calibration", "") or False
 
         if self.detuning_enabled:
             # Validate study type
-            study_type = self.config["study_type"]
+            study_type = self._config["study_type"]
             if study_type == "far_field":
                 raise ValueError("Detuning feature is only supported for near_field studies, not far_field")
 
-            detuning_config_path = self.config.get("detuning_config", "")
+            detuning_config_path = self._config.get("detuning_config", "")
             if detuning_config_path:
                 resolved_path = self._resolve_path_relative_to_config(self.config_path, detuning_config_path)
                 self.detuning_data = self._load_detuning_config(resolved_path)
@@ -87,7 +91,7 @@ class Config:
                 logging.getLogger("progress").warning(
                     "detuning_enabled is true but detuning_config not specified. Detuning will default to 0.", extra={"log_type": "warning"}
                 )
-        elif self.config.get("detuning_config", ""):
+        elif self._config.get("detuning_config", ""):
             # Only warn if config provided but both enabled and write are false
             # If write_during_calibration is true, we're in calibration mode (writing), so no warning needed
             if not self.detuning_write_during_calibration:
@@ -154,6 +158,28 @@ class Config:
         # Convert to absolute path
         return os.path.abspath(resolved)
 
+    @property
+    def config(self) -> dict:
+        """The resolved configuration dictionary.
+
+        Callers may modify the returned dictionary in place, so accessing it
+        drops the compiled lookup table; it is rebuilt on the next dot-path
+        lookup.
+        """
+        self._snapshot = None
+        return self._config
+
+    @config.setter
+    def config(self, value: dict) -> None:
+        self._config = value
+        self._snapshot = None
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Returns the compiled, read-only view of the current configuration."""
+        if self._snapshot is None:
+            self._snapshot = ConfigSnapshot(self._config)
+        return self._snapshot
+
     def __getitem__(self, path: str):
         """Allows dictionary-style access to config settings with dot-notation support.
 
@@ -161,6 +187,8 @@ class Config:
         - `config["simulation_parameters"] or {}`
         - `config["simulation_parameters.excitation_type"] or "Harmonic"`
 
+        Lookups go through the compiled snapshot, a flat table of all dot-paths.
+
         Args:
             path: The dot-separated path to the setting (e.g., "simulation_parameters" or "simulation_parameters.excitation_type").
 
@@ -172,29 +200,45 @@ class Config:
         """
         if not path:
             raise KeyError("Empty path")
-        keys = path.split(".")
-        current_config = self.config
-        for key in keys:
-            if isinstance(current_config, dict) and key in current_config:
-                current_config = current_config[key]
-            else:
-                return None
-        return current_config
+        return self.snapshot()[path]
 
-    def _load_config_with_inheritance(self, path: str) -> dict:
+    def _load_resolved_config(self, path: str, cache_dir: str) -> dict:
+        """Loads a config with inheritance, reusing the persisted resolution when still valid.
+
+        Args:
+            path: The path to the configuration file.
+            cache_dir: Directory holding the resolution cache.
+
+        Returns:
+            The fully resolved configuration dictionary.
+        """
+        cache_file = resolution_cache_path(cache_dir, path)
+        resolved = load_resolved_config(cache_file, lambda extends, child: self._resolve_config_path(extends, os.path.dirname(child)))
+        if resolved is not None:
+            return resolved
+        chain: list[tuple[str, Optional[str]]] = []
+        resolved = self._load_config_with_inheritance(path, chain=chain)
+        save_resolved_config(cache_file, chain, resolved)
+        return resolved
+
+    def _load_config_with_inheritance(self, path: str, chain: Optional[list] = None, extends: Optional[str] = None) -> dict:
         """Loads a JSON config and handles 'extends' for inheritance.
 
         Args:
             path: The path to the configuration file.
+            chain: If given, receives a (path, extends value) pair for each file read.
+            extends: The 'extends' value that led to this file, if any.
 
         Returns:
             The fully resolved configuration dictionary.
         """
         config = self._load_json(path)
+        if chain is not None:
+            chain.append((path, extends))
 
         if "extends" in config:
             base_config_path = self._resolve_config_path(config["extends"], base_path=os.path.dirname(path))
-            base_config = self._load_config_with_inheritance(base_config_path)
+            base_config = self._load_config_with_inheritance(base_config_path, chain=chain, extends=config["extends"])
             config = deep_merge(config, base_config)
 
         return config
@@ -364,7 +408,7 @@ class Config:
             "export_material_properties",
         ]
         for key in global_keys:
-            if key in self.config:
+            if key in self._config:
                 surgical_config[key] = self[key]
 
         # 2. Surgically handle gridding parameters
@@ -486,7 +530,7 @@ class Config:
         if not self.detuning_enabled or not self.detuning_write_during_calibration:
             return
 
-        detuning_config_path = self.config.get("detuning_config")
+        detuning_config_path = self._config.get("detuning_config")
         if not detuning_config_path:
             return
 
@@ -554,12 +598,12 @@ class Config:
         Yields:
             Tuple of (phantom_lower, freq_str, placement_name).
         """
-        phantoms = self.config["phantoms"] or []
+        phantoms = self._config["phantoms"] or []
         if not isinstance(phantoms, list):
             phantoms = [phantoms]
 
-        antenna_config = self.config["antenna_config"] or {}
-        all_scenarios = self.config["placement_scenarios"] or {}
+        antenna_config = self._config["antenna_config"] or {}
+        all_scenarios = self._config["placement_scenarios"] or {}
 
         for phantom in phantoms:
             phantom_lower = phantom.lower()
@@ -587,7 +631,7 @@ class Config:
         if not self.detuning_enabled or not self.detuning_write_during_calibration:
             return
 
-        detuning_config_path = self.config["detuning_config"]
+        detuning_config_path = self._config["detuning_config"]
         if not detuning_config_path:
             return
 
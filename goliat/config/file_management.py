@@ -5,7 +5,7 @@ import os
 
 
 def cleanup_old_data_files(data_dir: str):
-    """Removes old CSV/JSON files from data/ when there are more than 50.
+    """Removes old CSV/JSON/telemetry files from data/ when there are more than 50.
 
     Only cleans files matching specific patterns (time_remaining_, overall_progress_,
     profiling_config_). Files are sorted by creation time and oldest are deleted first.
@@ -14,10 +14,10 @@ def cleanup_old_data_files(data_dir: str):
         data_dir: The data directory to clean up.
     """
     try:
-        # Get all CSV and JSON files in the data directory
+        # Get all CSV, JSON and binary telemetry files in the data directory
         data_files = []
         for f in os.listdir(data_dir):
-            if f.endswith(".csv") or f.endswith(".json"):
+            if f.endswith(".csv") or f.endswith(".json") or f.endswith(".bin"):
                 # Only include files with the expected naming pattern
                 if any(prefix in f for prefix in ["time_remaining_", "overall_progress_", "profiling_config_"]):
                     full_path = os.path.join(data_dir, f)
@@ -4,25 +4,244 @@ This module centralizes magic numbers, thresholds, and hardcoded values
 to improve maintainability and reduce technical debt.
 """
 
-# File size thresholds
-MIN_H5_FILE_SIZE_BYTES = 8 * 1024 * 1024  # 8MB - minimum size for valid H5 output files
-"""Minimum size in bytes for a valid H5 output file.
+# Plotting constants
+PLOT_Y_AXIS_BUFFER_MULTIPLIER = 1.1
+"""Multiplier for y-axis maximum in plots.
 
-iSolve sometimes creates incomplete files that are smaller than this threshold.
-Files smaller than this are considered invalid.
+Adds 10% buffer above the maximum value for better visualization.
 """
 
-# File validation thresholds
-H5_SIZE_INCREASE_THRESHOLD = 1.1
-"""Minimum size increase ratio for Output.h5 compared to Input.h5.
+# GUI queue handling
+GUI_QUEUE_MAX_MESSAGES_PER_TICK = 2000
+"""Maximum number of worker messages drained from the GUI queue per timer tick.
 
-Output.h5 must be at least 10% bigger than Input.h5 to ensure the simulation
-completed successfully. This helps detect incomplete or corrupted output files.
+Anything beyond this is left for the next tick so a burst of log output
+cannot freeze the GUI thread.
 """
 
-# Plotting constants
-PLOT_Y_AXIS_BUFFER_MULTIPLIER = 1.1
-"""Multiplier for y-axis maximum in plots.
+GUI_QUEUE_SLOW_TICK_MS = 50.0
+"""Queue processing time (milliseconds) above which a tick is logged as slow."""
 
-Adds 10% buffer above the maximum value for better visualization.
+GUI_STATUS_LOG_MAX_LINES = 5000
+"""Maximum number of lines kept in the GUI status log.
+
+Older lines are discarded by the text widget so memory and layout cost stay
+bounded during multi-day studies.
 """
+
+HARDWARE_SAMPLE_INTERVAL_S = 1.0
+"""Seconds between hardware samples taken by the background sampler.
+
+CPU, RAM, disk I/O, swap and GPU metrics are all collected in one pass at
+this cadence; the GUI and telemetry only read the latest snapshot.
+"""
+
+HARDWARE_GPU_STALE_S = 10.0
+"""Age (seconds) after which the last GPU reading is reported as unavailable.
+
+Covers a hung driver or a crashed nvidia-smi that has not been restarted yet.
+"""
+
+# GUI screenshot streaming
+SCREENSHOT_INTERVAL_MS = 5000
+"""Milliseconds between screenshot capture cycles for the web dashboard."""
+
+SCREENSHOT_TILE_SIZE_PX = 64
+"""Edge length of the tiles whose hashes decide whether a tab changed."""
+
+SCREENSHOT_BANDWIDTH_BUDGET_BYTES_PER_S = 50_000
+"""Average upload rate screenshots should stay under.
+
+JPEG quality, then resolution, is lowered while a cycle exceeds its share of
+the budget and raised again once cycles use less than half of it.
+"""
+
+SCREENSHOT_JPEG_QUALITY_RANGE = (40, 85)
+"""Lowest and highest JPEG quality the bandwidth adaptation may choose."""
+
+SCREENSHOT_MIN_SCALE = 0.5
+"""Smallest resolution factor the bandwidth adaptation may choose."""
+
+SCREENSHOT_KEYFRAME_INTERVAL_S = 60.0
+"""Unchanged tabs are re-sent after this many seconds so a restarted dashboard catches up."""
+
+# Solver throughput telemetry
+SOLVER_THROUGHPUT_FILENAME = "solver_throughput.json"
+"""Per-simulation iSolve throughput time series, written next to the simulation results."""
+
+SOLVER_THROUGHPUT_DEGRADATION_RATIO = 0.8
+"""Throughput ratio below which a simulation is flagged as degraded.
+
+Applied both to late-run vs early-run throughput of one simulation and to a
+simulation's median throughput vs the sweep median for the same solver kernel.
+"""
+
+# Learned ETA model
+ETA_HISTORY_FILENAME = "eta_history.json"
+"""File in the data directory holding per-simulation phase timings with their features, per study type.
+
+Unlike the per-session profiling config, this file persists across sessions so
+the learned ETA model keeps improving.
+"""
+
+ETA_HISTORY_MAX_SAMPLES = 2000
+"""Maximum number of phase timing samples kept in the ETA history (oldest are dropped)."""
+
+ETA_HISTORY_FLUSH_INTERVAL_S = 300.0
+"""Minimum seconds between writes of new ETA samples during a study; the rest are written when it ends."""
+
+ETA_HISTORY_LOCK_STALE_S = 30.0
+"""Age after which an ETA history lock file is treated as left behind by a crashed process."""
+
+ETA_MODEL_MIN_SAMPLES = 5
+"""Minimum samples of a phase before its learned cost model replaces the running average."""
+
+ETA_CONFIDENCE_Z = 1.645
+"""Normal quantile for the ETA confidence band (1.645 = 90% two-sided)."""
+
+# oSPARC batch transfers
+OSPARC_STATUS_POLL_CONCURRENCY = 16
+"""Maximum number of simultaneous inspect_job requests per status sweep."""
+
+OSPARC_DOWNLOAD_CONCURRENCY = 4
+"""Number of result downloads running in parallel."""
+
+OSPARC_EXTRACT_CONCURRENCY = 2
+"""Number of result archives extracted in parallel while further downloads continue."""
+
+OSPARC_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+"""Chunk size used when streaming result files to disk."""
+
+OSPARC_DOWNLOAD_MAX_ATTEMPTS = 5
+"""Connection attempts per result file; each retry resumes from the bytes already on disk."""
+
+# Assignment result upload
+RESULT_UPLOAD_CHUNK_BYTES = 256 * 1024
+"""Read size when streaming result files to the monitoring dashboard."""
+
+RESULT_UPLOAD_MAX_ATTEMPTS = 5
+"""Attempts per result file before the upload is reported as failed."""
+
+RESULT_UPLOAD_TIMEOUT_S = 120
+"""Socket timeout per result upload request; the body is streamed, so this bounds stalls, not total time."""
+
+RESULT_UPLOAD_WAIT_S = 600
+"""How long a finished study waits for queued result uploads before exiting."""
+
+RESULT_UPLOAD_MANIFEST_FILENAME = ".upload_manifest.json"
+"""Per-simulation record of result files the dashboard has acknowledged, by content hash."""
+
+CONFIG_CACHE_DIRNAME = "config_cache"
+"""Directory under data/ holding resolved configs keyed by the fingerprints of their `extends` chain."""
+
+RESUME_MANIFEST_FILENAME = "resume_manifest.sqlite"
+"""SQLite database under results/ recording phase completion of every simulation, used to resume without probing each one."""
+
+RESUME_MANIFEST_TIMEOUT_S = 30
+"""How long a write to the resume manifest waits for another process holding the database lock."""
+
+RESUME_VERIFY_CONCURRENCY = 8
+"""Simulations checked in parallel when `execution_control.resume_verification` is "deep"."""
+
+RESULTS_CATALOG_FILENAME = ".results_catalog.sqlite"
+"""Index file of `goliat.results.ResultsCatalog`, kept in the cataloged directory."""
+
+RESULTS_CATALOG_SCAN_CONCURRENCY = 16
+"""Directories listed in parallel when the results catalog is refreshed."""
+
+CLEANUP_QUEUE_SIZE = 32
+"""Simulations whose released files may wait for background cleanup before the study blocks."""
+
+CLEANUP_BATCH_WINDOW_S = 2.0
+"""How long the cleanup worker collects released files before removing them as one batch."""
+
+CLEANUP_BATCH_MAX_FILES = 256
+"""Largest batch of files the cleanup worker removes at once."""
+
+CLEANUP_REMOVE_CONCURRENCY = 4
+"""Parallel removals within a cleanup batch; hides per-file latency on network filesystems."""
+
+CLEANUP_WAIT_S = 600
+"""How long a finished study waits for background cleanup before exiting."""
+
+PERF_STORE_DIR = "data/perf_store"
+"""Default performance store (partitioned Parquet) relative to the project root, used by `goliat perf`."""
+
+PERF_STORE_COMPACT_MIN_FILES = 16
+"""Files a performance-store partition must hold before `goliat perf --compact` merges them."""
+
+PERF_REGRESSION_BASELINE_RUNS = 20
+"""Earlier simulations per machine and GPU whose median throughput is the regression baseline."""
+
+PERF_REGRESSION_RECENT_RUNS = 5
+"""Latest simulations per machine and GPU compared against the baseline."""
+
+PERF_REGRESSION_RATIO = 0.85
+"""Recent/baseline median throughput ratio below which a machine is reported as regressed."""
+
+CROSS_SECTION_CHUNK_DIRECTIONS = 4096
+"""View directions projected per batch by the cross-section engine; bounds memory for fine angular grids."""
+
+CROSS_SECTION_CONCURRENCY = 4
+"""Threads evaluating direction batches in the cross-section engine."""
+
+# Per-subtask resource profiling
+PROFILER_STACK_SAMPLE_INTERVAL_S = 0.02
+"""Seconds between stack samples while stack sampling is enabled (`execution_control.sample_stacks`)."""
+
+PROFILER_STACK_MAX_DEPTH = 48
+"""Innermost frames kept per sampled stack; deeper frames are dropped from the root end."""
+
+PROFILER_STACK_TOP_N = 50
+"""Most frequent collapsed stacks kept per subtask in the exported metadata."""
+
+# Synthetic-phantom benchmarks (`goliat bench`)
+BENCH_WORK_DIR = "data/bench"
+"""Directory where `goliat bench` generates and reuses its synthetic phantoms."""
+
+BENCH_BASELINE_PATH = "data/bench_baseline.json"
+"""Stored benchmark results that `goliat bench` compares each run against."""
+
+BENCH_GRID = (80, 56, 128)
+"""Default synthetic grid size in nodes (x, y, z); about 27 MB of E and H field data per direction."""
+
+BENCH_DIRECTIONS = 8
+"""Default number of incident directions, i.e. `_Output.h5` files, in the synthetic phantom."""
+
+BENCH_SPACING_MM = 2.0
+"""Default voxel size of the synthetic phantom in mm."""
+
+BENCH_FREQUENCY_MHZ = 3500
+"""Frequency of the synthetic plane-wave fields."""
+
+BENCH_REPEATS = 3
+"""Times each benchmark case runs; the fastest run is reported."""
+
+BENCH_AIR_POINTS = 200
+"""Air focus points scored by the hotspot benchmark cases."""
+
+BENCH_REGRESSION_RATIO = 1.25
+"""Time or memory-growth ratio over the baseline above which a benchmark case is reported as regressed."""
+
+BENCH_REGRESSION_MIN_S = 0.05
+"""Seconds a case must slow down by, on top of the ratio, to count as regressed; filters timer noise on tiny cases."""
+
+BENCH_REGRESSION_MIN_MB = 32.0
+"""Megabytes a case's memory growth must rise by, on top of the ratio, to count as regressed; filters allocator noise."""
+
+# Partner Excel export
+PARTNER_EXCEL_CHUNK_ROWS = 50_000
+"""Rows of a phantom's results CSV parsed at a time by the partner Excel export."""
+
+PARTNER_EXCEL_WORKERS = 4
+"""Phantoms whose results the partner Excel export reads and sorts concurrently."""
+
+# Partner comparison (`goliat.analysis.compare`)
+COMPARISON_CACHE_DIR = "data/comparison_cache"
+"""Columnar copies of partner workbooks, one `.npz` per workbook content hash, reused until the workbook changes."""
+
+COMPARISON_MANIFEST_FILENAME = ".comparison_manifest.json"
+"""Record in the comparison output directory of the data fingerprint each figure was drawn from."""
+
+COMPARISON_PLOT_WORKERS = 4
+"""Processes drawing comparison figures in parallel; each loads the comparison data once."""
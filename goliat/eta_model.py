@@ -0,0 +1,344 @@
+"""Per-phase cost model that predicts simulation durations from simulation size features."""
+
+import contextlib
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from typing import Optional
+
+import numpy as np
+
+from .constants import ETA_CONFIDENCE_Z, ETA_HISTORY_LOCK_STALE_S, ETA_HISTORY_MAX_SAMPLES, ETA_MODEL_MIN_SAMPLES
+
+CATEGORICAL_FEATURES = ("phantom", "kernel")
+"""Features encoded one-hot; unseen values fall back to the baseline."""
+
+_CELLS_PER_FREQUENCY_EXPONENT = 3.0
+"""Grid cells scale with frequency cubed at a fixed cells-per-wavelength resolution."""
+
+_DEFAULT_LOG_SIGMA = 0.5
+"""Log-space spread used when there are not enough samples to measure one."""
+
+_MIN_LOG_SIGMA = 0.05
+"""Lower bound on the log-space spread so a lucky fit does not produce a zero-width band."""
+
+
+def normalize_kernel(kernel: Optional[str]) -> Optional[str]:
+    """Maps config and log spellings of a solver kernel ('Acceleware (AXware)', 'CUDA') to one key."""
+    if not kernel:
+        return None
+    return kernel.split()[0].lower()
+
+
+def simulation_features(
+    frequency_mhz: float,
+    phantom: str,
+    kernel: Optional[str] = None,
+    sensors: Optional[int] = None,
+    total_cells: Optional[int] = None,
+) -> dict:
+    """Builds the feature dict the ETA model uses for one simulation.
+
+    Args:
+        frequency_mhz: Simulation frequency (highest frequency for multi-sine runs).
+        phantom: Phantom name.
+        kernel: Solver kernel name.
+        sensors: Number of sensors in the simulation.
+        total_cells: Grid cell count, if known. Estimated from the frequency otherwise.
+
+    Returns:
+        JSON-serializable feature dict.
+    """
+    return {
+        "frequency_mhz": float(frequency_mhz),
+        "phantom": str(phantom).lower(),
+        "kernel": normalize_kernel(kernel),
+        "sensors": sensors,
+        "total_cells": total_cells,
+    }
+
+
+def samples_from_log_metrics(metrics: dict) -> list[dict]:
+    """Turns `parse_verbose_log` output into ETA history samples, one per timed phase.
+
+    Args:
+        metrics: Parsed verbose.log metrics, optionally with the 'category'
+            added by `parse_all_logs`.
+
+    Returns:
+        List of {'phase', 'seconds', 'features', 'source'} dicts.
+    """
+    grid = metrics.get("grid", {})
+    frequency = grid.get("frequency_mhz") or metrics.get("simulation", {}).get("frequency_mhz")
+    if not frequency:
+        return []
+    phantom = metrics.get("category", {}).get("phantom")
+    if not phantom:
+        phantom = (metrics.get("phantom", {}).get("file_name") or "unknown").rsplit(".", 1)[0]
+    features = simulation_features(
+        frequency,
+        phantom,
+        kernel=metrics.get("solver", {}).get("kernel"),
+        sensors=metrics.get("sensors", {}).get("count"),
+        total_cells=grid.get("total_cells"),
+    )
+    source = metrics.get("metadata", {}).get("log_file")
+    return [
+        {"phase": phase, "seconds": float(seconds), "features": features, "source": source}
+        for phase, seconds in metrics.get("timing", {}).get("phases", {}).items()
+        if phase in ("setup", "run", "extract") and seconds and seconds > 0
+    ]
+
+
+class PhaseCostModel:
+    """Ridge regression of log(duration) for one phase.
+
+    The design matrix holds an intercept, log frequency, log cell count, the
+    sensor count and one-hot phantom and kernel columns. Working in log space
+    makes the coefficients scaling exponents and turns the residual spread
+    into a multiplicative confidence band.
+    """
+
+    def __init__(self, samples: list[dict], ridge: float = 1.0):
+        """Fits the model.
+
+        Args:
+            samples: History samples of this phase (at least one).
+            ridge: L2 penalty on all coefficients except the intercept.
+        """
+        self.n_samples = len(samples)
+        self.categories = {name: sorted({s["features"].get(name) or "" for s in samples}) for name in CATEGORICAL_FEATURES}
+        self.cell_offsets, self.global_cell_offset = self._fit_cell_offsets(samples)
+        self.sensor_default = float(
+            np.median([s["features"]["sensors"] for s in samples if s["features"].get("sensors") is not None] or [0])
+        )
+
+        X = np.array([self._encode(s["features"]) for s in samples])
+        y = np.log([s["seconds"] for s in samples])
+        penalty = ridge * np.eye(X.shape[1])
+        penalty[0, 0] = 0.0
+        self._gram_inv = np.linalg.pinv(X.T @ X + penalty)
+        self.coef = self._gram_inv @ X.T @ y
+
+        residuals = y - X @ self.coef
+        dof = len(y) - np.linalg.matrix_rank(X)
+        self.sigma = max(math.sqrt(float(residuals @ residuals) / dof), _MIN_LOG_SIGMA) if dof > 0 else _DEFAULT_LOG_SIGMA
+
+    @staticmethod
+    def _fit_cell_offsets(samples: list[dict]) -> tuple[dict, Optional[float]]:
+        """Per-phantom log(cells) - 3*log(f), used to impute cell counts that were not logged."""
+        offsets = defaultdict(list)
+        for s in samples:
+            f = s["features"]
+            if f.get("total_cells") and f.get("frequency_mhz"):
+                offsets[f["phantom"]].append(math.log(f["total_cells"]) - _CELLS_PER_FREQUENCY_EXPONENT * math.log(f["frequency_mhz"]))
+        per_phantom = {phantom: float(np.mean(values)) for phantom, values in offsets.items()}
+        all_values = [v for values in offsets.values() for v in values]
+        return per_phantom, float(np.mean(all_values)) if all_values else None
+
+    def _log_cells(self, features: dict) -> float:
+        """Log cell count, imputed from frequency and phantom when unknown."""
+        log_f = math.log(features["frequency_mhz"])
+        if features.get("total_cells"):
+            return math.log(features["total_cells"])
+        offset = self.cell_offsets.get(features["phantom"], self.global_cell_offset)
+        if offset is None:
+            return _CELLS_PER_FREQUENCY_EXPONENT * log_f
+        return offset + _CELLS_PER_FREQUENCY_EXPONENT * log_f
+
+    def _encode(self, features: dict) -> list[float]:
+        """Design-matrix row for a feature dict."""
+        sensors = features.get("sensors")
+        row = [
+            1.0,
+            math.log(features["frequency_mhz"]),
+            self._log_cells(features),
+            float(self.sensor_default if sensors is None else sensors),
+        ]
+        for name in CATEGORICAL_FEATURES:
+            value = features.get(name) or ""
+            row.extend(1.0 if value == category else 0.0 for category in self.categories[name])
+        return row
+
+    def predict(self, features: dict) -> tuple[float, float]:
+        """Predicts a phase duration.
+
+        Args:
+            features: Feature dict from `simulation_features`.
+
+        Returns:
+            Tuple of (median duration in seconds, log-space standard deviation
+            including the uncertainty of the fit at this point).
+        """
+        x = np.array(self._encode(features))
+        leverage = float(x @ self._gram_inv @ x)
+        return math.exp(float(x @ self.coef)), self.sigma * math.sqrt(1.0 + leverage)
+
+
+class EtaModel:
+    """Learned per-phase cost models plus the timing history they are fitted on.
+
+    History samples are {'phase', 'seconds', 'features'} dicts. They are
+    stored in the ETA history file so the model improves across studies,
+    and can be seeded from parsed verbose.log files.
+    """
+
+    def __init__(self, history: Optional[list[dict]] = None):
+        """Initializes the model from saved history.
+
+        Args:
+            history: Previously recorded samples.
+        """
+        self.history: list[dict] = [s for s in (history or []) if s.get("seconds", 0) > 0 and s.get("features", {}).get("frequency_mhz")]
+        self._models: dict[str, Optional[PhaseCostModel]] = {}
+
+    def add_sample(self, phase: str, seconds: float, features: dict) -> Optional[dict]:
+        """Records one measured phase duration and invalidates the fitted model for that phase.
+
+        Returns:
+            The recorded sample, or None if it was rejected.
+        """
+        if seconds <= 0 or not features.get("frequency_mhz"):
+            return None
+        sample = {"phase": phase, "seconds": float(seconds), "features": dict(features)}
+        self.history.append(sample)
+        del self.history[:-ETA_HISTORY_MAX_SAMPLES]
+        self._models.pop(phase, None)
+        return sample
+
+    def _model(self, phase: str) -> Optional[PhaseCostModel]:
+        """Returns the fitted model for a phase, fitting it lazily; None if there is too little data."""
+        if phase not in self._models:
+            samples = [s for s in self.history if s["phase"] == phase]
+            self._models[phase] = PhaseCostModel(samples) if len(samples) >= ETA_MODEL_MIN_SAMPLES else None
+        return self._models[phase]
+
+    def predict(self, phase: str, features: dict) -> Optional[tuple[float, float, float]]:
+        """Predicts a phase duration with a confidence band.
+
+        Args:
+            phase: 'setup', 'run' or 'extract'.
+            features: Feature dict from `simulation_features`.
+
+        Returns:
+            (expected, low, high) seconds, or None if the phase has too few samples.
+        """
+        model = self._model(phase)
+        if model is None:
+            return None
+        median, log_sigma = model.predict(features)
+        # Expected value of a log-normal is above its median
+        return (
+            median * math.exp(0.5 * log_sigma**2),
+            median * math.exp(-ETA_CONFIDENCE_Z * log_sigma),
+            median * math.exp(ETA_CONFIDENCE_Z * log_sigma),
+        )
+
+
+def sum_predictions(predictions: list[tuple[tuple[float, float, float], int]]) -> list[float]:
+    """Sums independent (expected, low, high) predictions into one band.
+
+    Each band is read back as a log-normal (median sqrt(low * high), log
+    spread ln(high / low) / 2z). The means and variances of the independent
+    durations add, and the total is matched to a log-normal again
+    (Fenton-Wilkinson), so the band narrows relative to the total instead of
+    stacking every simulation's worst case.
+
+    Args:
+        predictions: (expected, low, high) seconds paired with how many
+            simulations share that prediction.
+
+    Returns:
+        [expected, low, high] seconds for the sum.
+    """
+    mean = variance = 0.0
+    for (expected, low, high), count in predictions:
+        mean += count * expected
+        if low > 0 and high > low:
+            log_sigma = math.log(high / low) / (2 * ETA_CONFIDENCE_Z)
+            variance += count * expected**2 * math.expm1(log_sigma**2)
+    if mean <= 0:
+        return [0.0, 0.0, 0.0]
+    log_sigma = math.sqrt(math.log1p(variance / mean**2))
+    median = mean * math.exp(-0.5 * log_sigma**2)
+    return [mean, median * math.exp(-ETA_CONFIDENCE_Z * log_sigma), median * math.exp(ETA_CONFIDENCE_Z * log_sigma)]
+
+
+def load_eta_history(path: str, study_type: str) -> list[dict]:
+    """Reads the saved ETA history of one study type; empty if the file is missing or unreadable."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get(study_type, [])
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return []
+
+
+@contextlib.contextmanager
+def _history_lock(path: str):
+    """Holds `<path>.lock` so studies sharing the history file do not drop each other's samples."""
+    lock_path = f"{path}.lock"
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > ETA_HISTORY_LOCK_STALE_S:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue  # Released between the two calls
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(lock_path)
+
+
+def append_eta_history(path: str, study_type: str, samples: list[dict]) -> None:
+    """Adds samples to the saved ETA history of one study type, keeping the newest.
+
+    The file is re-read under a lock file and replaced atomically, so
+    parallel studies writing to the same history keep each other's samples.
+
+    Args:
+        path: ETA history file.
+        study_type: Study type section to extend.
+        samples: New samples to store.
+    """
+    with _history_lock(path):
+        try:
+            with open(path, "r") as f:
+                full_history = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            full_history = {}
+        full_history[study_type] = (full_history.get(study_type, []) + samples)[-ETA_HISTORY_MAX_SAMPLES:]
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(full_history, f)
+        os.replace(tmp_path, path)
+
+
+def import_log_history(path: str, study_type: str, all_metrics: list[dict]) -> int:
+    """Appends phase timings from parsed verbose.log files to the saved ETA history.
+
+    Logs already imported (same log path) are skipped.
+
+    Args:
+        path: ETA history file.
+        study_type: Study type section to update.
+        all_metrics: Output of `parse_all_logs`.
+
+    Returns:
+        Number of samples added.
+    """
+    history = load_eta_history(path, study_type)
+    known_sources = {s.get("source") for s in history if s.get("source")}
+    new_samples = [s for metrics in all_metrics for s in samples_from_log_metrics(metrics) if s["source"] not in known_sources]
+    if new_samples:
+        append_eta_history(path, study_type, new_samples)
+    return len(new_samples)
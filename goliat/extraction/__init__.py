@@ -1,15 +1,46 @@
 """Results extraction package.
 
 This package contains specialized modules for extracting different types
-of data from Sim4Life simulation results.
+of data from Sim4Life simulation results. Extractors are imported on first
+access, since some of them pull in pandas and matplotlib.
 """
 
-from .cleaner import Cleaner
-from .power_extractor import PowerExtractor
-from .reporter import Reporter
-from .sapd_extractor import SapdExtractor
-from .sar_extractor import SarExtractor
-from .sensor_extractor import SensorExtractor
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_EXPORTS = {
+    "Cleaner": ".cleaner",
+    "PowerExtractor": ".power_extractor",
+    "Reporter": ".reporter",
+    "SapdExtractor": ".sapd_extractor",
+    "SarExtractor": ".sar_extractor",
+    "SensorExtractor": ".sensor_extractor",
+}
+"""Public name -> submodule that defines it."""
+
+if TYPE_CHECKING:
+    from .cleaner import Cleaner
+    from .power_extractor import PowerExtractor
+    from .reporter import Reporter
+    from .sapd_extractor import SapdExtractor
+    from .sar_extractor import SarExtractor
+    from .sensor_extractor import SensorExtractor
+
+
+def __getattr__(name: str):
+    """Imports the submodule defining `name` on first access and caches the attribute."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Lists lazily exported names alongside the already loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "Cleaner",
@@ -130,17 +130,19 @@ class AutoInducedProcessor(LoggingMixin, _AutoInducedExtractionMixin):
 
             # Only pre-load E (SAR) or E+H (SAPD) — same field types we'll combine
             # FieldCache only supports one field_type at a time, so load each separately
+            # Own subtask so the cache's memory and read volume are tracked separately
             field_caches = {}
-            for ft in field_types:
-                self._log(f"  Pre-loading {ft}-fields from {len(h5_paths)} files...", level="progress", log_type="info")
-                field_caches[ft] = FieldCache(
-                    h5_paths=[str(p) for p in h5_paths],
-                    field_type=ft,
-                    low_memory=low_memory_mode,
-                    slab_cache_gb=slab_cache_gb,
-                )
-                mode = "streaming" if field_caches[ft].streaming_mode else "memory"
-                self._log(f"    {ft}-field cache ready ({mode} mode)", level="progress", log_type="info")
+            with self.study.subtask("auto_induced_load_field_cache"):
+                for ft in field_types:
+                    self._log(f"  Pre-loading {ft}-fields from {len(h5_paths)} files...", level="progress", log_type="info")
+                    field_caches[ft] = FieldCache(
+                        h5_paths=[str(p) for p in h5_paths],
+                        field_type=ft,
+                        low_memory=low_memory_mode,
+                        slab_cache_gb=slab_cache_gb,
+                    )
+                    mode = "streaming" if field_caches[ft].streaming_mode else "memory"
+                    self._log(f"    {ft}-field cache ready ({mode} mode)", level="progress", log_type="info")
 
             # Create outer progress bar for candidates
             candidates_pbar = tqdm(
@@ -12,7 +12,9 @@ class Cleaner:
     """Manages deletion of simulation files to free disk space.
 
     Deletes output files, input files, and/or project files based on config.
-    Useful for long-running studies where disk space is limited.
+    Useful for long-running studies where disk space is limited. The files
+    are handed to the study's background `CleanupService` and removed once
+    the study confirms the extraction, so deletion stays off the critical path.
     """
 
     def __init__(self, parent: "ResultsExtractor"):
@@ -24,10 +26,11 @@ class Cleaner:
         self.parent = parent
 
     def cleanup_simulation_files(self):
-        """Deletes simulation files based on auto_cleanup config.
+        """Schedules simulation files for deletion based on auto_cleanup config.
 
-        Removes files matching specified patterns (output/input H5 files,
-        project files). Only runs if cleanup is enabled in config.
+        Collects files matching specified patterns (output/input H5 files,
+        project files) and holds them in the study's cleanup service under
+        the simulation directory. Only runs if cleanup is enabled in config.
         """
         cleanup_types = self.parent.config.get_auto_cleanup_previous_results()
         if not cleanup_types:
@@ -52,55 +55,32 @@ class Cleaner:
             "smash": (project_dir, "*.smash", "project"),
         }
 
-        total_deleted = self._delete_files(cleanup_types, file_patterns)
+        files_to_delete = self._collect_files(cleanup_types, file_patterns)
 
-        if total_deleted > 0:
+        if files_to_delete:
+            self.parent.study.cleanup_service.submit(files_to_delete, hold_key=project_dir)
             self.parent._log(
-                f"  - Cleaned up {total_deleted} file(s) to save disk space.",
-                level="progress",
-                log_type="info",
+                f"  - Scheduled {len(files_to_delete)} file(s) for cleanup once extraction is confirmed.",
+                log_type="verbose",
             )
 
-    def _delete_files(self, cleanup_types: list, file_patterns: dict) -> int:
-        """Deletes files matching specified cleanup patterns.
+    def _collect_files(self, cleanup_types: list, file_patterns: dict) -> list[str]:
+        """Finds files matching specified cleanup patterns.
 
         Args:
             cleanup_types: List of cleanup types to perform (e.g., ['output', 'smash']).
             file_patterns: Dict mapping cleanup types to (dir, pattern, description).
 
         Returns:
-            Total number of files successfully deleted.
+            Paths of the files to delete.
         """
-        total_deleted = 0
+        files_to_delete = []
 
         for cleanup_type in cleanup_types:
             if cleanup_type not in file_patterns:
                 continue
 
             search_dir, pattern, description = file_patterns[cleanup_type]
-            file_pattern = os.path.join(search_dir, pattern)
-            files_to_delete = glob.glob(file_pattern)
-
-            if files_to_delete:
-                for file_path in files_to_delete:
-                    if self._delete_single_file(file_path):
-                        total_deleted += 1
+            files_to_delete.extend(glob.glob(os.path.join(search_dir, pattern)))
 
-        return total_deleted
-
-    def _delete_single_file(self, file_path: str) -> bool:
-        """Deletes one file and logs success/failure."""
-        try:
-            os.remove(file_path)
-            self.parent._log(
-                f"    - Deleted: {os.path.basename(file_path)}",
-                log_type="verbose",
-            )
-            return True
-        except Exception as e:
-            self.parent._log(
-                f"    - Warning: Could not delete {os.path.basename(file_path)}: {e}",
-                level="progress",
-                log_type="warning",
-            )
-            return False
+        return files_to_delete
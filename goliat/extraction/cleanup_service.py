@@ -0,0 +1,250 @@
+"""Background removal of simulation files once their extraction is confirmed."""
+
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from goliat.constants import (
+    CLEANUP_BATCH_MAX_FILES,
+    CLEANUP_BATCH_WINDOW_S,
+    CLEANUP_QUEUE_SIZE,
+    CLEANUP_REMOVE_CONCURRENCY,
+)
+
+_FLUSH = object()
+"""Queue marker that ends the current batch window."""
+
+_STOP = object()
+"""Queue marker that stops the worker thread."""
+
+
+@dataclass
+class CleanupStats:
+    """Files removed by a cleanup service.
+
+    Attributes:
+        files: Files deleted or archived.
+        bytes_freed: Their total size in bytes.
+        failures: Files that could not be removed.
+    """
+
+    files: int = 0
+    bytes_freed: int = 0
+    failures: int = 0
+
+
+class CleanupService:
+    """Deletes or archives simulation files on a background thread.
+
+    Files are first submitted under a hold key (the simulation directory)
+    and only become eligible once `release` confirms that their extraction
+    succeeded; `discard` drops them instead. Released files go through a
+    bounded queue, so a study that produces files faster than they can be
+    removed is slowed down rather than growing the backlog without limit.
+    The worker collects released files for a short window and removes each
+    batch with a few parallel `os.remove` calls, which hides the per-file
+    latency of network filesystems.
+
+    With a disk budget (`min_free_bytes`), a submission made while free
+    space is below the budget skips the batch window, and
+    `ensure_free_space` blocks until the backlog is gone before the next
+    simulation writes new outputs.
+    """
+
+    def __init__(
+        self,
+        archive_dir: Optional[str] = None,
+        archive_root: Optional[str] = None,
+        min_free_bytes: int = 0,
+        max_pending: int = CLEANUP_QUEUE_SIZE,
+        batch_window_s: float = CLEANUP_BATCH_WINDOW_S,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initializes the service; the worker thread starts on the first release.
+
+        Args:
+            archive_dir: If set, files are moved here instead of being deleted.
+            archive_root: Directory that archived paths are made relative to,
+                so the archive mirrors the results tree.
+            min_free_bytes: Disk budget; 0 disables the free-space policy.
+            max_pending: Released jobs that may wait in the queue before `release` blocks.
+            batch_window_s: How long the worker waits for more jobs before removing a batch.
+            logger: Logger for cleanup messages.
+        """
+        self.archive_dir = archive_dir
+        self.archive_root = archive_root
+        self.min_free_bytes = min_free_bytes
+        self.batch_window_s = batch_window_s
+        self.logger = logger or logging.getLogger("verbose")
+        self.stats = CleanupStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._held: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, paths: Iterable[str], hold_key: str) -> int:
+        """Holds files for removal until `release(hold_key)`.
+
+        Args:
+            paths: Files to remove.
+            hold_key: Key that confirms or cancels the removal, usually the simulation directory.
+
+        Returns:
+            Number of files now held under the key.
+        """
+        with self._lock:
+            held = self._held.setdefault(hold_key, [])
+            held.extend(p for p in paths if p not in held)
+            return len(held)
+
+    def release(self, hold_key: str) -> int:
+        """Queues the files held under `hold_key` for removal.
+
+        Blocks while the queue is full.
+
+        Returns:
+            Number of files queued.
+        """
+        with self._lock:
+            paths = self._held.pop(hold_key, [])
+        if not paths:
+            return 0
+        self._start()
+        self._queue.put(paths)
+        if self._low_on_space(paths[0]):
+            self._queue.put(_FLUSH)
+        return len(paths)
+
+    def discard(self, hold_key: str) -> None:
+        """Forgets the files held under `hold_key`; they are kept on disk."""
+        with self._lock:
+            self._held.pop(hold_key, None)
+
+    def ensure_free_space(self, path: str) -> bool:
+        """Waits for queued removals if free space at `path` is below the budget.
+
+        Returns:
+            False if free space is still below the budget afterwards.
+        """
+        if not self._low_on_space(path):
+            return True
+        self.logger.warning(
+            f"Free disk space below {self.min_free_bytes / 1024**3:.1f} GB; waiting for pending cleanup.",
+            extra={"log_type": "warning"},
+        )
+        self.drain()
+        return not self._low_on_space(path)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every queued file has been removed.
+
+        Returns:
+            False if removals are still pending after `timeout` seconds.
+        """
+        if self._worker is None:
+            return True
+        self._queue.put(_FLUSH)
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: self._queue.unfinished_tasks == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Removes the queued files, stops the worker and drops unreleased files.
+
+        Returns:
+            False if the worker was still removing files after `timeout`
+            seconds; it keeps running as a daemon thread until the process exits.
+        """
+        with self._lock:
+            self._held.clear()
+        if self._worker is None:
+            return True
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+        finished = not self._worker.is_alive()
+        self._worker = None
+        return finished
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="simulation-cleanup", daemon=True)
+                self._worker.start()
+
+    def _low_on_space(self, path: str) -> bool:
+        if self.min_free_bytes <= 0:
+            return False
+        directory = os.path.dirname(os.path.abspath(path))
+        while not os.path.isdir(directory) and os.path.dirname(directory) != directory:
+            directory = os.path.dirname(directory)
+        try:
+            return shutil.disk_usage(directory).free < self.min_free_bytes
+        except OSError:
+            return False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            taken = 1
+            batch: list[str] = []
+            stop = item is _STOP
+            if isinstance(item, list):
+                batch.extend(item)
+                # Collect more jobs until the window closes, the batch is full or a flush is requested
+                deadline = time.monotonic() + self.batch_window_s
+                while len(batch) < CLEANUP_BATCH_MAX_FILES:
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if not isinstance(item, list):
+                        stop = item is _STOP
+                        break
+                    batch.extend(item)
+            try:
+                if batch:
+                    self._remove_batch(list(dict.fromkeys(batch)))
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    def _remove_batch(self, paths: list[str]) -> None:
+        with ThreadPoolExecutor(max_workers=CLEANUP_REMOVE_CONCURRENCY, thread_name_prefix="simulation-cleanup-rm") as pool:
+            results = list(pool.map(self._remove_one, paths))
+        freed = sum(size for size in results if size is not None)
+        removed = sum(1 for size in results if size is not None)
+        with self._lock:
+            self.stats.files += removed
+            self.stats.bytes_freed += freed
+            self.stats.failures += len(paths) - removed
+        if removed:
+            action = "Archived" if self.archive_dir else "Deleted"
+            self.logger.info(f"  - {action} {removed} simulation file(s), {freed / 1024**2:.1f} MB freed.", extra={"log_type": "info"})
+
+    def _remove_one(self, path: str) -> Optional[int]:
+        """Deletes or archives one file; returns its size, or None on failure."""
+        try:
+            size = os.path.getsize(path)
+            if self.archive_dir:
+                relpath = os.path.relpath(path, self.archive_root) if self.archive_root else os.path.basename(path)
+                if relpath.startswith(os.pardir):
+                    relpath = os.path.basename(path)
+                target = os.path.join(self.archive_dir, relpath)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(path, target)
+            else:
+                os.remove(path)
+            self.logger.info(
+                f"    - {'Archived' if self.archive_dir else 'Deleted'}: {os.path.basename(path)}", extra={"log_type": "verbose"}
+            )
+            return size
+        except Exception as e:
+            self.logger.warning(f"    - Warning: Could not delete {os.path.basename(path)}: {e}", extra={"log_type": "warning"})
+            return None
@@ -0,0 +1,183 @@
+"""Projected cross-section areas of a phantom mesh over the full sphere.
+
+The far-field power normalization divides by the area the phantom presents
+to the incident plane wave, approximated by the convex hull of its skin mesh
+projected onto the plane normal to the propagation direction. The projection
+of a convex hull is the hull of the projection, and for a closed convex
+surface Cauchy's projection formula gives its area directly:
+
+    A(n) = 1/2 * sum_f |n . a_f|
+
+where a_f is the area vector of hull face f. The mesh is therefore reduced to
+its 3-D hull once, and the areas for any number of directions are a single
+batched matrix product instead of one 2-D hull per direction.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from ..constants import CROSS_SECTION_CHUNK_DIRECTIONS, CROSS_SECTION_CONCURRENCY
+
+
+class AreaPattern(NamedTuple):
+    """Cross-section areas sampled on a (theta, phi) grid.
+
+    Attributes:
+        theta: Polar angles in radians, shape (n_theta, n_phi).
+        phi: Azimuthal angles in radians, shape (n_theta, n_phi).
+        areas: Projected areas, shape (n_theta, n_phi), in the squared units of the mesh
+            (m² for patterns loaded with `load_area_pattern`).
+        mesh_hash: `mesh_hash` of the mesh the pattern was computed from, if known.
+    """
+
+    theta: np.ndarray
+    phi: np.ndarray
+    areas: np.ndarray
+    mesh_hash: Optional[str] = None
+
+    def area_at(self, theta_rad: float, phi_rad: float) -> float:
+        """Returns the area at the grid point nearest to a direction."""
+        i_theta = int(np.argmin(np.abs(self.theta[:, 0] - theta_rad)))
+        i_phi = int(np.argmin(np.abs(self.phi[0, :] - phi_rad % (2 * np.pi))))
+        return float(self.areas[i_theta, i_phi])
+
+
+_patterns: dict[tuple[str, int, int], AreaPattern] = {}
+_loaded: dict[str, tuple[int, AreaPattern]] = {}
+_cache_lock = threading.Lock()
+
+
+def sample_sphere_directions(n_theta: int = 36, n_phi: int = 72) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Samples the sphere on a regular (theta, phi) grid, both ends included.
+
+    Returns:
+        Tuple of (theta, phi, directions) with shapes (n_theta, n_phi) and (n_theta, n_phi, 3).
+    """
+    theta, phi = np.meshgrid(np.linspace(0, np.pi, n_theta), np.linspace(0, 2 * np.pi, n_phi), indexing="ij")
+    directions = np.stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)], axis=-1)
+    return theta, phi, directions
+
+
+def mesh_hash(vertices: np.ndarray) -> str:
+    """Returns a content hash of the mesh vertices, the only input the areas depend on."""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    return hashlib.sha1(vertices.tobytes() + str(vertices.shape).encode("utf-8")).hexdigest()
+
+
+def hull_area_vectors(vertices: np.ndarray) -> np.ndarray:
+    """Reduces a point cloud to the area vectors of its 3-D convex hull faces.
+
+    Args:
+        vertices: Mesh vertices, shape (N, 3).
+
+    Returns:
+        Array of shape (F, 3); the orientation of each vector does not matter.
+
+    Raises:
+        scipy.spatial.QhullError: If the points are coplanar or too few.
+    """
+    from scipy.spatial import ConvexHull
+
+    points = np.asarray(vertices, dtype=np.float64)
+    hull = ConvexHull(points)
+    a, b, c = (points[hull.simplices[:, k]] for k in range(3))
+    return 0.5 * np.cross(b - a, c - a)
+
+
+class CrossSectionEngine:
+    """Projected convex-hull areas of one mesh for arbitrary view directions.
+
+    The hull is computed once per engine. Direction batches are split into
+    chunks evaluated on a thread pool (NumPy releases the GIL in the matrix
+    products), which also bounds memory for fine angular grids. Patterns are
+    cached in-process by mesh hash and resolution and, with `cache_dir`, on
+    disk as `<mesh hash>_<n_theta>x<n_phi>.npz`.
+    """
+
+    def __init__(self, vertices: np.ndarray, cache_dir: Optional[str] = None, max_workers: int = CROSS_SECTION_CONCURRENCY):
+        """Initializes the engine; the hull is built on first use.
+
+        Args:
+            vertices: Mesh vertices, shape (N, 3).
+            cache_dir: Directory for computed patterns, or None for the in-process cache only.
+            max_workers: Threads evaluating direction chunks.
+        """
+        self.vertices = np.asarray(vertices, dtype=np.float64)
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.mesh_hash = mesh_hash(self.vertices)
+        self._area_vectors: Optional[np.ndarray] = None
+
+    @property
+    def area_vectors(self) -> np.ndarray:
+        """Area vectors of the hull faces, shape (F, 3)."""
+        if self._area_vectors is None:
+            self._area_vectors = hull_area_vectors(self.vertices)
+        return self._area_vectors
+
+    def areas(self, directions: np.ndarray) -> np.ndarray:
+        """Projected areas for view directions of shape (..., 3), in squared mesh units.
+
+        Directions need not be normalized.
+        """
+        directions = np.asarray(directions, dtype=np.float64)
+        flat = directions.reshape(-1, 3)
+        flat = flat / np.linalg.norm(flat, axis=1, keepdims=True)
+        face_vectors_t = self.area_vectors.T
+        chunks = [flat[start : start + CROSS_SECTION_CHUNK_DIRECTIONS] for start in range(0, len(flat), CROSS_SECTION_CHUNK_DIRECTIONS)]
+
+        def project(chunk: np.ndarray) -> np.ndarray:
+            return 0.5 * np.abs(chunk @ face_vectors_t).sum(axis=1)
+
+        if len(chunks) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(project, chunks))
+        else:
+            results = [project(chunk) for chunk in chunks]
+        return (np.concatenate(results) if results else np.zeros(0)).reshape(directions.shape[:-1])
+
+    def pattern(self, n_theta: int = 36, n_phi: int = 72) -> AreaPattern:
+        """Areas over the sphere sampled as in `sample_sphere_directions`."""
+        key = (self.mesh_hash, n_theta, n_phi)
+        with _cache_lock:
+            cached = _patterns.get(key)
+        if cached is not None:
+            return cached
+
+        cache_path = os.path.join(self.cache_dir, f"{self.mesh_hash}_{n_theta}x{n_phi}.npz") if self.cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            with np.load(cache_path, allow_pickle=False) as data:
+                pattern = AreaPattern(data["theta"], data["phi"], data["areas"], self.mesh_hash)
+        else:
+            theta, phi, directions = sample_sphere_directions(n_theta, n_phi)
+            pattern = AreaPattern(theta, phi, self.areas(directions), self.mesh_hash)
+            if cache_path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.savez_compressed(cache_path, theta=pattern.theta, phi=pattern.phi, areas=pattern.areas)
+        with _cache_lock:
+            _patterns[key] = pattern
+        return pattern
+
+
+def load_area_pattern(path: str) -> AreaPattern:
+    """Loads a saved cross_section_pattern.npz, reusing it while the file is unchanged.
+
+    Args:
+        path: Path to the pattern file (areas in m²).
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    with _cache_lock:
+        cached = _loaded.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with np.load(path, allow_pickle=False) as data:
+        stored_hash = str(data["mesh_hash"]) if "mesh_hash" in data.files else None
+        pattern = AreaPattern(data["theta"], data["phi"], data["areas"], stored_hash)
+    with _cache_lock:
+        _loaded[path] = (mtime_ns, pattern)
+    return pattern
@@ -0,0 +1,117 @@
+"""Structural integrity check for Sim4Life _Output.h5 files.
+
+A solver run that dies while writing leaves an _Output.h5 that is large and
+recent but unusable, which used to surface only minutes later inside the
+field cache or the SAR extractor. The check here opens the file, confirms
+that the 'Overall Field' E and H snapshots exist with shapes that fit a mesh
+in the file, and reads a few elements of every component. It touches only
+metadata and a handful of chunks, so it takes milliseconds per file.
+"""
+
+import os
+from typing import NamedTuple, Optional
+
+import h5py
+
+from .field_reader import find_overall_field_group, get_field_path
+
+
+class OutputCheck(NamedTuple):
+    """Verdict of `check_output_h5`.
+
+    Attributes:
+        ok: Whether the file is a complete solver output.
+        reason: Why the file was rejected; empty if it is valid.
+    """
+
+    ok: bool
+    reason: str = ""
+
+
+def _mesh_shapes(f: h5py.File) -> list[tuple[int, int, int]]:
+    """Returns the (Nx, Ny, Nz) node counts of every mesh with axes in the file."""
+    shapes = []
+    if "Meshes" not in f:
+        return shapes
+    for mesh_key in f["Meshes"].keys():
+        mesh = f[f"Meshes/{mesh_key}"]
+        if all(f"axis_{axis}" in mesh for axis in "xyz"):
+            shapes.append(tuple(mesh[f"axis_{axis}"].shape[0] for axis in "xyz"))
+    return shapes
+
+
+def _fits_mesh(shape: tuple, meshes: list[tuple[int, int, int]]) -> bool:
+    """True if a field shape matches node or cell counts (Yee staggering) of one of the meshes."""
+    return any(all(n in (axis_n, axis_n - 1) for n, axis_n in zip(shape, mesh)) for mesh in meshes)
+
+
+def _storage_problem(dataset: h5py.Dataset, file_size: int) -> Optional[str]:
+    """Checks that the data of a dataset was written and lies inside the file.
+
+    A file cut short as a whole already fails to open; this catches datasets
+    the solver allocated but never finished filling.
+    """
+    dsid = dataset.id
+    if dataset.chunks is None:
+        offset = dsid.get_offset()
+        if offset is None:
+            return "data was never written"
+        if offset + dsid.get_storage_size() > file_size:
+            return "data extends past the end of the file"
+        return None
+    if not hasattr(dsid, "get_num_chunks"):
+        return None
+    expected = 1
+    for n, chunk in zip(dataset.shape, dataset.chunks):
+        expected *= -(-n // chunk)
+    written = dsid.get_num_chunks()
+    if written < expected:
+        return f"only {written} of {expected} chunks written"
+    return None
+
+
+def check_output_h5(h5_path: str, input_h5_path: Optional[str] = None) -> OutputCheck:
+    """Checks that an _Output.h5 file holds complete E and H fields.
+
+    Args:
+        h5_path: Path to the _Output.h5 file.
+        input_h5_path: Matching _Input.h5, whose meshes are used if the
+            output file has none.
+
+    Returns:
+        The verdict; never raises for a damaged file.
+    """
+    try:
+        if not h5py.is_hdf5(h5_path):
+            return OutputCheck(False, "not an HDF5 file")
+        file_size = os.path.getsize(h5_path)
+        with h5py.File(h5_path, "r") as f:
+            fg_path = find_overall_field_group(f)
+            if fg_path is None:
+                return OutputCheck(False, "no 'Overall Field' group")
+            meshes = _mesh_shapes(f)
+            if not meshes and input_h5_path and os.path.exists(input_h5_path):
+                with h5py.File(input_h5_path, "r") as input_f:
+                    meshes = _mesh_shapes(input_f)
+
+            for field_type in ("E", "H"):
+                field_path = get_field_path(fg_path, field_type)
+                for comp in range(3):
+                    name = f"{field_type} comp{comp}"
+                    dataset = f.get(f"{field_path}/comp{comp}")
+                    if not isinstance(dataset, h5py.Dataset):
+                        return OutputCheck(False, f"{name} missing")
+                    shape = dataset.shape
+                    if len(shape) != 4 or shape[3] != 2 or 0 in shape:
+                        return OutputCheck(False, f"{name} has unexpected shape {shape}")
+                    if meshes and not _fits_mesh(shape[:3], meshes):
+                        return OutputCheck(False, f"{name} shape {shape[:3]} does not match any mesh")
+                    problem = _storage_problem(dataset, file_size)
+                    if problem:
+                        return OutputCheck(False, f"{name}: {problem}")
+                    # First, middle and last element: one chunk each
+                    for index in ((0, 0, 0), tuple(n // 2 for n in shape[:3]), tuple(n - 1 for n in shape[:3])):
+                        dataset[index]
+    except (OSError, KeyError, ValueError, RuntimeError) as e:
+        return OutputCheck(False, f"unreadable ({e})")
+    return OutputCheck(True)
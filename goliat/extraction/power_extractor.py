@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from ..logging_manager import LoggingMixin
+from .cross_section import load_area_pattern
 
 if TYPE_CHECKING:
     import s4l_v1.analysis as analysis
@@ -256,22 +257,9 @@ class PowerExtractor(LoggingMixin):
             return 0.5, "phantom_fallback"
 
         try:
-            cs_data = np.load(cross_section_path, allow_pickle=False)
-
-            theta_grid = cs_data["theta"]
-            phi_grid = cs_data["phi"]
-            areas = cs_data["areas"]
-
-            # Normalize phi to [0, 2π]
+            # Parsed once per process and reused while the file is unchanged
+            area_m2 = load_area_pattern(cross_section_path).area_at(theta_rad, phi_rad)
             phi_rad_norm = phi_rad % (2 * np.pi)
-
-            # Find closest indices
-            theta_vals = theta_grid[:, 0]
-            phi_vals = phi_grid[0, :]
-            i_theta = int(np.argmin(np.abs(theta_vals - theta_rad)))
-            i_phi = int(np.argmin(np.abs(phi_vals - phi_rad_norm)))
-
-            area_m2 = float(areas[i_theta, i_phi])
             self._log(
                 f"  - Phantom cross-section ({phantom_name}) at theta={np.degrees(theta_rad):.1f} deg, "
                 f"phi={np.degrees(phi_rad_norm):.1f} deg: {area_m2:.4f} m2",
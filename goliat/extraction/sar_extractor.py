@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 import pandas as pd
 
 from ..logging_manager import LoggingMixin
-from .tissue_grouping import TissueGrouper
+from .tissue_grouping import TissueGrouper, TissueTaxonomy
 
 if TYPE_CHECKING:
     import s4l_v1.analysis as analysis
@@ -294,6 +294,8 @@ class SarExtractor(LoggingMixin):
         Peak SAR is simply the maximum peak SAR value across all tissues in the group,
         which identifies the worst-case exposure within that anatomical region.
 
+        Both are computed for all groups at once through a `TissueTaxonomy`.
+
         Args:
             df: DataFrame with per-tissue SAR statistics including 'Total Mass' and
                 'Mass-Averaged SAR' columns.
@@ -302,47 +304,24 @@ class SarExtractor(LoggingMixin):
 
         Returns:
             Dict with 'weighted_avg_sar' and 'peak_sar' for each group. Groups with
-            no matching tissues are skipped.
+            no matching tissues get 0 for both.
         """
-        group_sar_data = {}
         peak_sar_col = "Peak Spatial-Average SAR[IEEE/IEC62704-1] (10g)"
-
-        for group_name, tissues in tissue_groups.items():
-            if not tissues:
-                # Return 0 SAR for empty groups (they should still appear in reports)
-                group_sar_data[group_name] = {
-                    "weighted_avg_sar": 0.0,
-                    "peak_sar": 0.0,
-                }
-                continue
-
-            # Filter out "(not present)" entries for SAR calculation
-            present_tissues = [t for t in tissues if "(not present)" not in t]
-
-            if not present_tissues:
-                # All tissues are marked as "(not present)" - return 0 SAR
-                group_sar_data[group_name] = {
-                    "weighted_avg_sar": 0.0,
-                    "peak_sar": 0.0,
-                }
-                continue
-
-            group_df = df[df["Tissue"].isin(present_tissues)]
-
-            if not group_df.empty:
-                total_mass = group_df["Total Mass"].sum()
-                weighted_avg_sar = (group_df["Total Mass"] * group_df["Mass-Averaged SAR"]).sum() / total_mass if total_mass > 0 else 0
-                peak_sar = group_df[peak_sar_col].max() if peak_sar_col in group_df.columns else -1.0
-                group_sar_data[group_name] = {
-                    "weighted_avg_sar": weighted_avg_sar,
-                    "peak_sar": peak_sar,
-                }
-            else:
-                # Set SAR to 0 if no present tissues are found in DataFrame
-                group_sar_data[group_name] = {
-                    "weighted_avg_sar": 0.0,
-                    "peak_sar": 0.0,
-                }
+        # Groups whose tissues are all "(not present)" or missing from df keep 0 SAR
+        group_sar_data = {group_name: {"weighted_avg_sar": 0.0, "peak_sar": 0.0} for group_name in tissue_groups}
+
+        taxonomy = TissueTaxonomy.from_groups(tissue_groups, df["Tissue"])
+        weighted = taxonomy.aggregate(df, ["Mass-Averaged SAR"], weights="Total Mass", tissue_column="Tissue")
+        peaks = (
+            taxonomy.aggregate(df, [peak_sar_col], how="max", tissue_column="Tissue").set_index("group")[peak_sar_col]
+            if peak_sar_col in df.columns
+            else None
+        )
+        for group_name, weighted_avg_sar in zip(weighted["group"], weighted["Mass-Averaged SAR"]):
+            group_sar_data[group_name] = {
+                "weighted_avg_sar": 0.0 if pd.isna(weighted_avg_sar) else float(weighted_avg_sar),
+                "peak_sar": -1.0 if peaks is None else float(peaks[group_name]),
+            }
 
         return group_sar_data
 
@@ -2,14 +2,26 @@
 
 Groups tissues into logical categories (eyes, skin, brain) for aggregated
 SAR metrics calculation. Uses explicit mapping from material_name_mapping.json.
+
+`TissueTaxonomy` compiles a grouping into tissue codes and a sparse
+group x tissue membership matrix, so group aggregates over a whole organ
+table are sparse products instead of one `isin` filter per group.
 """
 
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
 
 if TYPE_CHECKING:
     from ..config import Config
     from ..logging_manager import LoggingMixin
 
+NOT_PRESENT_MARKER = "(not present)"
+"""Suffix `TissueGrouper` gives group entries whose tissue is missing from the results."""
+
 
 class TissueGrouper:
     """Handles grouping of tissues into logical categories for SAR analysis."""
@@ -49,8 +61,8 @@ class TissueGrouper:
         """Groups tissues using explicit configuration from material mapping.
 
         Simple approach:
-        1. Build reverse map: material_name -> entity_name
-        2. For each tissue: match to entity, check if entity is in group
+        1. Build reverse maps: material_name -> entity_name, entity_name -> groups
+        2. For each tissue: match to entity, add it to the entity's groups
 
         Args:
             material_mapping: Material mapping dictionary from config.
@@ -63,75 +75,193 @@ class TissueGrouper:
 
         # Build simple reverse mapping: material_name -> entity_name
         material_to_entity = {}
-        entity_to_material = {}
         for entity_name, material_name in material_mapping.items():
             if entity_name == "_tissue_groups":
                 continue
             material_to_entity[material_name] = entity_name
-            entity_to_material[entity_name] = material_name
+
+        # Strip phantom suffix (e.g., "Cornea  (Thelonious_6y_V6)" -> "Cornea")
+        # Sim4Life appends phantom name and version to tissue names
+        cleaned_tissues = [tissue.split("  (")[0].strip() if "  (" in tissue else tissue for tissue in available_tissues]
+        first_position: dict[str, int] = {}
+        for position, cleaned_tissue in enumerate(cleaned_tissues):
+            first_position.setdefault(cleaned_tissue, position)
 
         # Initialize groups with all expected tissues from JSON config
         # This ensures all groups show up in reports even if some tissues aren't present
         tissue_groups = {}
+        entity_groups: dict[str, list[str]] = {}
         for group_name, entity_list in phantom_groups.items():
             tissue_groups[group_name] = []
-            # Pre-populate with entity names - will be replaced with actual tissue names if found
             for entity_name in entity_list:
-                # Try to find matching tissue from Sim4Life results
-                found_tissue = None
-                for tissue in available_tissues:
-                    cleaned_tissue = tissue.split("  (")[0].strip() if "  (" in tissue else tissue
-                    # Check if this tissue matches the entity
-                    if cleaned_tissue == entity_name:
-                        found_tissue = tissue  # Use original tissue name with phantom suffix
-                        break
-                    # Also check material name match
-                    elif entity_name in material_mapping:
-                        material_name = material_mapping[entity_name]
-                        if cleaned_tissue == material_name:
-                            found_tissue = tissue
-                            break
-
-                if found_tissue:
-                    tissue_groups[group_name].append(found_tissue)
+                entity_groups.setdefault(entity_name, []).append(group_name)
+                # First tissue from Sim4Life matching the entity name or its material name
+                candidates = [first_position.get(entity_name)]
+                if entity_name in material_mapping:
+                    candidates.append(first_position.get(material_mapping[entity_name]))
+                found = [position for position in candidates if position is not None]
+
+                if found:
+                    tissue_groups[group_name].append(available_tissues[min(found)])  # Original name with phantom suffix
                 else:
                     # Tissue not found in simulation - still include entity name for display
                     # Format: "EntityName (not present)"
-                    tissue_groups[group_name].append(f"{entity_name} (not present)")
+                    tissue_groups[group_name].append(f"{entity_name} {NOT_PRESENT_MARKER}")
 
         # For each tissue from Sim4Life, find which group(s) it belongs to
         # (This ensures we catch any tissues that might have been missed)
-        for tissue in available_tissues:
-            # Strip phantom suffix (e.g., "Cornea  (Thelonious_6y_V6)" -> "Cornea")
-            # Sim4Life appends phantom name and version to tissue names
-            cleaned_tissue = tissue
-            if "  (" in tissue:
-                cleaned_tissue = tissue.split("  (")[0].strip()
-
-            entity_name = None
-
+        for tissue, cleaned_tissue in zip(available_tissues, cleaned_tissues):
             # Try 1: Direct entity name match (Sim4Life returned entity name)
             if cleaned_tissue in material_mapping and cleaned_tissue != "_tissue_groups":
                 entity_name = cleaned_tissue
-
             # Try 2: Material name match (Sim4Life returned material name)
             elif cleaned_tissue in material_to_entity:
                 entity_name = material_to_entity[cleaned_tissue]
-
-            if entity_name is None:
+            else:
                 continue
 
-            # Check which group(s) this entity belongs to
-            matched_groups = []
-            for group_name, entity_list in phantom_groups.items():
-                if entity_name in entity_list:
-                    # Replace "(not present)" entry with actual tissue name if it exists
-                    if f"{entity_name} (not present)" in tissue_groups[group_name]:
-                        idx = tissue_groups[group_name].index(f"{entity_name} (not present)")
-                        tissue_groups[group_name][idx] = tissue
-                    elif tissue not in tissue_groups[group_name]:
-                        # Only add if not already present (shouldn't happen, but safety check)
-                        tissue_groups[group_name].append(tissue)
-                    matched_groups.append(group_name)
+            for group_name in dict.fromkeys(entity_groups.get(entity_name, ())):
+                group_tissues = tissue_groups[group_name]
+                placeholder = f"{entity_name} {NOT_PRESENT_MARKER}"
+                # Replace "(not present)" entry with actual tissue name if it exists
+                if placeholder in group_tissues:
+                    group_tissues[group_tissues.index(placeholder)] = tissue
+                elif tissue not in group_tissues:
+                    group_tissues.append(tissue)
 
         return tissue_groups
+
+
+class TissueTaxonomy:
+    """Tissue codes and tissue-group membership of one phantom.
+
+    Tissues are numbered in `tissues` order, and `membership` is a sparse
+    (groups x tissues) 0/1 matrix. `aggregate` computes a group statistic for
+    every group and every key of an organ table at once: the table's tissue
+    column is mapped to codes, and the per-group sums are the product of the
+    membership columns of those codes with a one-hot matrix of the keys.
+
+    Attributes:
+        tissues: Tissue names; a name's position is its code.
+        groups: Group names, in the order of the input grouping.
+        members: Tissue codes of each group, sorted.
+        membership: CSC matrix of shape (len(groups), len(tissues)).
+    """
+
+    def __init__(self, tissues: Sequence[str], groups: Sequence[str], members: Sequence[Iterable[int]]):
+        """Builds the membership matrix.
+
+        Args:
+            tissues: Distinct tissue names.
+            groups: Group names.
+            members: For each group, the codes of its tissues.
+        """
+        self.tissues = list(tissues)
+        self.groups = list(groups)
+        self.members = [sorted({int(code) for code in codes}) for codes in members]
+        rows = np.repeat(np.arange(len(self.groups)), [len(codes) for codes in self.members])
+        cols = np.fromiter((code for codes in self.members for code in codes), dtype=np.int64, count=len(rows))
+        self._tissue_index = pd.Index(self.tissues)
+        self.membership = sparse.csc_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(self.groups), len(self.tissues)))
+
+    @classmethod
+    def from_groups(cls, tissue_groups: Mapping[str, Iterable[str]], tissues: Iterable[str] = ()) -> "TissueTaxonomy":
+        """Compiles a grouping such as `TissueGrouper.group_tissues` returns.
+
+        Entries marked "(not present)" are placeholders and are not members.
+
+        Args:
+            tissue_groups: Group name -> tissue names.
+            tissues: Further tissues that get a code even if they belong to no group,
+                typically the tissue column of the table to aggregate.
+        """
+        groups = {group: [t for t in group_tissues if NOT_PRESENT_MARKER not in t] for group, group_tissues in tissue_groups.items()}
+        codes = {name: i for i, name in enumerate(dict.fromkeys([t for members in groups.values() for t in members] + list(tissues)))}
+        return cls(list(codes), list(groups), [[codes[t] for t in members] for members in groups.values()])
+
+    def to_dict(self) -> dict:
+        """Returns a plain-data form for storing with results; see `from_dict`."""
+        return {"tissues": self.tissues, "groups": self.groups, "members": self.members}
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "TissueTaxonomy":
+        """Rebuilds a taxonomy stored with `to_dict`."""
+        return cls(data["tissues"], data["groups"], data["members"])
+
+    def codes(self, tissue_names: Iterable[str]) -> np.ndarray:
+        """Returns the code of each tissue name, or -1 for names without one."""
+        return self._tissue_index.get_indexer(pd.Index(tissue_names)).astype(np.int64)
+
+    def aggregate(
+        self,
+        df: pd.DataFrame,
+        values: Sequence[str],
+        by: Sequence[str] = (),
+        how: str = "mean",
+        weights: Optional[str] = None,
+        tissue_column: str = "tissue",
+    ) -> pd.DataFrame:
+        """Aggregates organ-level columns per group and key.
+
+        Matches filtering the rows of each group with `isin` and then using
+        `groupby(by)`. Rows whose tissue has no code, or that have a missing
+        key, are left out. Missing values are skipped, as pandas does.
+
+        Args:
+            df: Organ-level table with one row per tissue and key.
+            values: Columns to aggregate.
+            by: Key columns; empty aggregates each group over the whole table.
+            how: "mean" or "max".
+            weights: Column to weight the mean with, e.g. the tissue mass. Rows
+                missing either the value or the weight are skipped.
+            tissue_column: Column holding the tissue names.
+
+        Returns:
+            One row for each group and key that has rows, ordered by group and then
+            by sorted key. The columns are `by`, "group" and `values`. A statistic
+            without any valid value is NaN.
+        """
+        if how not in ("mean", "max"):
+            raise ValueError(f"Unknown aggregation '{how}'; expected 'mean' or 'max'.")
+
+        tissue_codes = self.codes(df[tissue_column])
+        if by:
+            grouped = df.groupby(list(by), sort=True)
+            key_codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+            keys = grouped.size().index.to_frame(index=False)
+        else:
+            key_codes = np.zeros(len(df), dtype=np.int64)
+            keys = pd.DataFrame(index=range(1))
+
+        rows = np.flatnonzero((tissue_codes >= 0) & (key_codes >= 0))
+        row_keys = key_codes[rows]
+        # incidence[g, r] = 1 when row r belongs to group g; one_hot[r, k] = 1 when row r has key k
+        incidence = self.membership[:, tissue_codes[rows]].tocsr()
+        one_hot = sparse.csr_matrix((np.ones(len(rows)), (np.arange(len(rows)), row_keys)), shape=(len(rows), len(keys)))
+
+        def per_key(row_values: np.ndarray) -> np.ndarray:
+            return (incidence @ sparse.diags(row_values) @ one_hot).toarray()
+
+        group_idx, key_idx = np.nonzero(per_key(np.ones(len(rows))))
+        result = keys.iloc[key_idx].reset_index(drop=True)
+        result["group"] = [self.groups[g] for g in group_idx]
+
+        row_weights = None if weights is None else df[weights].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+        for column in values:
+            column_values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+            valid = ~np.isnan(column_values)
+            if how == "max":
+                stat = np.full((len(self.groups), len(keys)), -np.inf)
+                group_of, row_of = incidence.nonzero()
+                keep = valid[row_of]
+                np.maximum.at(stat, (group_of[keep], row_keys[row_of[keep]]), column_values[row_of[keep]])
+                stat[np.isneginf(stat)] = np.nan
+            else:
+                if row_weights is not None:
+                    valid &= ~np.isnan(row_weights)
+                weight = np.where(valid, 1.0 if row_weights is None else row_weights, 0.0)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    stat = per_key(weight * np.where(valid, column_values, 0.0)) / per_key(weight)
+                stat[~np.isfinite(stat)] = np.nan
+            result[column] = stat[group_idx, key_idx]
+        return result
@@ -40,6 +40,9 @@ class ClockManager:
 
             if eta_sec is not None:
                 time_remaining_str = format_time(eta_sec)
+                band = self.gui.profiler.get_time_remaining_band(current_stage_progress=current_stage_progress_ratio)
+                if band is not None:
+                    time_remaining_str += f" ({format_time(band[0])} - {format_time(band[1])})"
                 self.gui.eta_label.setText(f"Time Remaining: {time_remaining_str}")
             else:
                 self.gui.eta_label.setText("Time Remaining: N/A")
@@ -1,6 +1,5 @@
-"""Data management for GUI: CSV file handling and cleanup."""
+"""Data management for GUI: telemetry persistence and cleanup."""
 
-import csv
 import hashlib
 import os
 import time
@@ -8,92 +7,98 @@ from datetime import datetime
 from logging import Logger
 from typing import List, Optional
 
-from goliat.gui.components.plots.utils import get_ntp_utc_time
+from goliat.gui.components.telemetry_store import TelemetryStore
+
+SYSTEM_UTILIZATION_COLUMNS = [
+    "cpu_percent",
+    "ram_percent",
+    "gpu_percent",
+    "gpu_vram_percent",
+    "disk_read_mbps",
+    "disk_write_mbps",
+    "page_faults_per_sec",
+]
 
 
 class DataManager:
-    """Manages CSV data files for time remaining and overall progress tracking.
+    """Manages telemetry for time remaining, overall progress and system utilization.
 
-    Writes timestamped data points to CSV files for plotting and analysis.
+    Samples are kept in a TelemetryStore: bounded in-memory ring buffers that
+    the plots read directly, flushed in batches to compact binary files.
     Automatically cleans up old files (keeps last 50) to prevent disk bloat.
     Creates unique session files using timestamp and process hash.
     """
 
-    def __init__(self, data_dir: str, verbose_logger: Logger) -> None:
-        """Create session-specific CSV files for progress tracking.
+    def __init__(self, data_dir: str, verbose_logger: Logger, clock_offset_s: Optional[float] = None) -> None:
+        """Create the session-specific telemetry store.
 
         Args:
             data_dir: Directory where data files will be stored.
             verbose_logger: Logger for verbose messages.
+            clock_offset_s: Offset added to the system clock for timestamps.
+                Measured once via NTP if None.
         """
         self.data_dir: str = data_dir
         self.verbose_logger: Logger = verbose_logger
         self.session_hash: str = hashlib.md5(f"{time.time()}_{os.getpid()}".encode()).hexdigest()[:8]
         session_timestamp = datetime.now().strftime("%d-%m_%H-%M-%S")
 
-        # Cleanup old CSV files before creating new ones
+        # Cleanup old data files before creating new ones
         self._cleanup_old_data_files()
 
-        self.time_remaining_file: str = os.path.join(self.data_dir, f"time_remaining_{session_timestamp}_{self.session_hash}.csv")
-        self.overall_progress_file: str = os.path.join(self.data_dir, f"overall_progress_{session_timestamp}_{self.session_hash}.csv")
-        self.system_utilization_file: str = os.path.join(self.data_dir, f"system_utilization_{session_timestamp}_{self.session_hash}.csv")
-
-        # Initialize data files
-        self._initialize_files()
-
-    def _initialize_files(self) -> None:
-        """Initializes CSV files with headers."""
-        with open(self.time_remaining_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "hours_remaining"])
+        self.store: TelemetryStore = TelemetryStore(
+            data_dir, f"{session_timestamp}_{self.session_hash}", verbose_logger, clock_offset_s=clock_offset_s
+        )
+        self.store.register_series("time_remaining", ["hours_remaining"])
+        self.store.register_series("overall_progress", ["progress_percent"])
+        self.store.register_series("system_utilization", SYSTEM_UTILIZATION_COLUMNS)
 
-        with open(self.overall_progress_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "progress_percent"])
+        self.time_remaining_file: str = os.path.join(self.data_dir, f"time_remaining_{session_timestamp}_{self.session_hash}.bin")
+        self.overall_progress_file: str = os.path.join(self.data_dir, f"overall_progress_{session_timestamp}_{self.session_hash}.bin")
+        self.system_utilization_file: str = os.path.join(self.data_dir, f"system_utilization_{session_timestamp}_{self.session_hash}.bin")
 
-        with open(self.system_utilization_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                ["timestamp", "cpu_percent", "ram_percent", "gpu_percent", "gpu_vram_percent", "disk_read_mbps", "disk_write_mbps"]
-            )
-
-    def _write_csv_row(self, file_path: str, value: float, value_name: str) -> None:
-        """Appends a timestamped data point to a CSV file.
+    def _append(self, series: str, values: List[Optional[float]], value_name: str) -> datetime:
+        """Records a sample, logging instead of raising on failure.
 
         Args:
-            file_path: Path to the CSV file.
-            value: The numeric value to write.
+            series: Telemetry series name.
+            values: Values to record.
             value_name: Name of the value for error messages.
+
+        Returns:
+            Timestamp of the sample.
         """
         try:
-            current_time = get_ntp_utc_time()  # Use NTP time (bypasses system clock issues)
-            with open(file_path, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow([current_time.isoformat(), value])
+            return self.store.append(series, values)
         except Exception as e:
             self.verbose_logger.error(f"Failed to write {value_name} data: {e}")
+            return self.store.now()
 
-    def write_time_remaining(self, hours_remaining: float) -> None:
-        """Appends a time remaining data point to CSV.
+    def write_time_remaining(self, hours_remaining: float) -> datetime:
+        """Records a time remaining data point.
 
-        Writes timestamp and hours remaining to session-specific CSV file.
         Used for plotting ETA trends over time.
 
         Args:
             hours_remaining: Estimated hours remaining as float.
+
+        Returns:
+            Timestamp of the sample (NTP-corrected UTC).
         """
-        self._write_csv_row(self.time_remaining_file, hours_remaining, "time remaining")
+        return self._append("time_remaining", [hours_remaining], "time remaining")
 
-    def write_overall_progress(self, progress_percent: float) -> None:
-        """Appends an overall progress data point to CSV.
+    def write_overall_progress(self, progress_percent: float) -> datetime:
+        """Records an overall progress data point.
 
-        Writes timestamp and progress percentage to session-specific CSV file.
         Used for plotting progress trends over time.
 
         Args:
             progress_percent: Overall progress percentage (0-100).
+
+        Returns:
+            Timestamp of the sample (NTP-corrected UTC).
         """
-        self._write_csv_row(self.overall_progress_file, progress_percent, "overall progress")
+        return self._append("overall_progress", [progress_percent], "overall progress")
 
     def write_system_utilization(
         self,
@@ -103,11 +108,12 @@ class DataManager:
         gpu_vram_percent: Optional[float] = None,
         disk_read_mbps: Optional[float] = None,
         disk_write_mbps: Optional[float] = None,
-    ) -> None:
-        """Appends a system utilization data point to CSV.
+        page_faults_per_sec: Optional[float] = None,
+    ) -> datetime:
+        """Records a system utilization data point.
 
-        Writes timestamp and CPU, RAM, GPU utilization, GPU VRAM, and disk I/O
-        throughput to session-specific CSV file. Used for plotting utilization trends over time.
+        Stores CPU, RAM, GPU utilization, GPU VRAM, disk I/O throughput and
+        page faults. Used for plotting utilization trends over time.
 
         Args:
             cpu_percent: CPU utilization percentage (0-100).
@@ -116,27 +122,20 @@ class DataManager:
             gpu_vram_percent: GPU VRAM utilization percentage (0-100), or None if unavailable.
             disk_read_mbps: Disk read throughput in MB/s, or None if unavailable.
             disk_write_mbps: Disk write throughput in MB/s, or None if unavailable.
+            page_faults_per_sec: Page faults per second, or None if unavailable.
+
+        Returns:
+            Timestamp of the sample (NTP-corrected UTC).
         """
-        try:
-            current_time = get_ntp_utc_time()  # Use NTP time (bypasses system clock issues)
-            with open(self.system_utilization_file, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        current_time.isoformat(),
-                        cpu_percent,
-                        ram_percent,
-                        gpu_percent if gpu_percent is not None else "",
-                        gpu_vram_percent if gpu_vram_percent is not None else "",
-                        f"{disk_read_mbps:.2f}" if disk_read_mbps is not None else "",
-                        f"{disk_write_mbps:.2f}" if disk_write_mbps is not None else "",
-                    ]
-                )
-        except Exception as e:
-            self.verbose_logger.error(f"Failed to write system utilization data: {e}")
+        values = [cpu_percent, ram_percent, gpu_percent, gpu_vram_percent, disk_read_mbps, disk_write_mbps, page_faults_per_sec]
+        return self._append("system_utilization", values, "system utilization")
+
+    def close(self) -> None:
+        """Flushes buffered telemetry to disk."""
+        self.store.close()
 
     def _cleanup_old_data_files(self) -> None:
-        """Removes old CSV and JSON files when more than 50 exist.
+        """Removes old data files when more than 50 exist.
 
         Keeps disk usage manageable by deleting oldest files first. Only
         removes files matching expected naming patterns (time_remaining_,
@@ -145,7 +144,7 @@ class DataManager:
         try:
             data_files: List[str] = []
             for f in os.listdir(self.data_dir):
-                if f.endswith((".csv", ".json")):
+                if f.endswith((".csv", ".json", ".bin")):
                     # Only include files with expected naming pattern
                     if any(prefix in f for prefix in ["time_remaining_", "overall_progress_", "system_utilization_", "profiling_config_"]):
                         full_path = os.path.join(self.data_dir, f)
@@ -2,8 +2,6 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from goliat.gui.components.plots.utils import get_ntp_utc_time
-
 if TYPE_CHECKING:
     from goliat.gui.progress_gui import ProgressGUI
 
@@ -20,12 +18,12 @@ class GraphManager:
         self.gui = gui
 
     def update(self) -> None:
-        """Updates time remaining, overall progress, and system utilization graphs (called every 5 seconds).
+        """Updates time remaining and overall progress graphs (called every 5 seconds).
 
-        Gets current ETA and progress values, writes them to CSV files (via
-        DataManager), and adds data points to matplotlib plots. The plots
-        show trends over time, helping users see if ETA is converging or
-        progress is steady.
+        Gets current ETA and progress values, records them in the telemetry
+        store (via DataManager), and redraws the plots from the store's
+        in-memory history. The plots show trends over time, helping users see
+        if ETA is converging or progress is steady.
 
         This runs less frequently than clock updates (5s vs 1s) because
         plotting is more expensive and the trends don't need millisecond
@@ -39,17 +37,15 @@ class GraphManager:
 
         # Get current progress
         progress_percent = max(0, self.gui.overall_progress_bar.value() / 100.0)
+        store = self.gui.data_manager.store
 
         # Update time remaining data
         if eta_sec is not None:
-            current_time = get_ntp_utc_time()  # Use NTP time (bypasses system clock issues)
-            hours_remaining = eta_sec / 3600.0
-            self.gui.data_manager.write_time_remaining(hours_remaining)
-            self.gui.time_remaining_plot.add_data_point(current_time, hours_remaining)
+            self.gui.data_manager.write_time_remaining(eta_sec / 3600.0)
+            self.gui.time_remaining_plot.set_data([(t, v[0]) for t, v in store.get_series("time_remaining")])
 
         # Update overall progress data
-        current_time = get_ntp_utc_time()  # Use NTP time (bypasses system clock issues)
         self.gui.data_manager.write_overall_progress(progress_percent)
-        self.gui.overall_progress_plot.add_data_point(current_time, progress_percent)
+        self.gui.overall_progress_plot.set_data([(t, v[0]) for t, v in store.get_series("overall_progress")])
 
         # Note: System utilization plot is updated separately via utilization_plot_timer (every 2s)
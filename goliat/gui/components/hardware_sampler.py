@@ -0,0 +1,394 @@
+"""Background sampler that collects all hardware metrics in one pass.
+
+A single daemon thread samples CPU, RAM, disk I/O and swap through psutil and
+reads the GPU through a long-lived backend: an NVML session when `pynvml` is
+installed, otherwise one `nvidia-smi --loop-ms` process whose output is parsed
+as it arrives. Each pass publishes an immutable `HardwareSnapshot` by
+replacing a single reference, so readers (GUI timers, telemetry, the web
+bridge) never take a lock, spawn a process or wait on the driver.
+"""
+
+import logging
+import shutil
+import subprocess
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from goliat.constants import HARDWARE_GPU_STALE_S, HARDWARE_SAMPLE_INTERVAL_S
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+NVIDIA_SMI_QUERY = "index,name,utilization.gpu,memory.used,memory.total"
+"""Fields requested from nvidia-smi, one CSV line per GPU and loop."""
+
+_NVIDIA_SMI_MAX_RESTART_DELAY_S = 60.0
+
+_NVIDIA_SMI_MAX_FAILED_STARTS = 3
+"""Consecutive nvidia-smi runs that exit without a reading before the backend gives up."""
+
+
+class GpuReading(NamedTuple):
+    """One reading of the first GPU.
+
+    Attributes:
+        name: GPU name without the "NVIDIA " prefix.
+        utilization_percent: GPU utilization (0-100).
+        memory_used_mb: Used VRAM in MiB.
+        memory_total_mb: Total VRAM in MiB.
+        monotonic_time: `time.monotonic()` when the reading was taken.
+    """
+
+    name: str
+    utilization_percent: float
+    memory_used_mb: float
+    memory_total_mb: float
+    monotonic_time: float
+
+
+class HardwareSnapshot(NamedTuple):
+    """All hardware metrics from one sampling pass.
+
+    GPU fields are None when no GPU backend is available or the last reading
+    is stale; rate fields are None until two samples have been taken.
+    """
+
+    timestamp: float = 0.0
+    cpu_percent: float = 0.0
+    cpu_cores: int = 0
+    ram_used_gb: float = 0.0
+    ram_total_gb: float = 0.0
+    ram_percent: float = 0.0
+    ram_percent_without_cache: float = 0.0
+    disk_read_mbps: Optional[float] = None
+    disk_write_mbps: Optional[float] = None
+    page_faults_per_sec: Optional[float] = None
+    gpu_name: Optional[str] = None
+    gpu_percent: Optional[float] = None
+    vram_used_gb: Optional[float] = None
+    vram_total_gb: Optional[float] = None
+
+
+def _clean_gpu_name(name: str) -> str:
+    return name.replace("NVIDIA ", "").strip()
+
+
+def parse_nvidia_smi_line(line: str) -> Optional[GpuReading]:
+    """Parses one line of `nvidia-smi --query-gpu=<NVIDIA_SMI_QUERY> --format=csv,noheader,nounits`.
+
+    Returns:
+        The reading for GPU 0, or None for other GPUs and unparsable lines.
+    """
+    parts = [part.strip() for part in line.split(",")]
+    if len(parts) != 5 or parts[0] != "0":
+        return None
+    try:
+        return GpuReading(_clean_gpu_name(parts[1]), float(parts[2]), float(parts[3]), float(parts[4]), time.monotonic())
+    except ValueError:
+        return None
+
+
+class NvidiaSmiLoopBackend:
+    """Keeps one `nvidia-smi --loop-ms` process running and tracks its latest line.
+
+    The process is restarted with exponential backoff if it exits. If the
+    executable cannot be found or started, or it keeps exiting without
+    printing a reading (e.g. no driver or no GPU), the backend becomes
+    unavailable.
+    """
+
+    def __init__(
+        self,
+        interval_s: float = HARDWARE_SAMPLE_INTERVAL_S,
+        executable: str = "nvidia-smi",
+        max_failed_starts: int = _NVIDIA_SMI_MAX_FAILED_STARTS,
+    ) -> None:
+        """Starts the reader thread.
+
+        Args:
+            interval_s: Loop interval passed to nvidia-smi.
+            executable: nvidia-smi executable name or path.
+            max_failed_starts: Consecutive runs without a reading before giving up.
+        """
+        self.command = [
+            executable,
+            f"--query-gpu={NVIDIA_SMI_QUERY}",
+            "--format=csv,noheader,nounits",
+            f"--loop-ms={max(100, int(interval_s * 1000))}",
+        ]
+        self.available = True
+        self.max_failed_starts = max_failed_starts
+        self._latest: Optional[GpuReading] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="goliat-nvidia-smi", daemon=True)
+        self._thread.start()
+
+    def latest(self) -> Optional[GpuReading]:
+        """Returns the most recent reading without blocking."""
+        return self._latest
+
+    def _run(self) -> None:
+        delay = 1.0
+        failed_starts = 0
+        while not self._closed.is_set():
+            try:
+                process = subprocess.Popen(
+                    self.command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                )
+            except OSError:
+                self.available = False
+                return
+            self._process = process
+            assert process.stdout is not None
+            failed_starts += 1
+            for line in process.stdout:
+                reading = parse_nvidia_smi_line(line)
+                if reading is not None:
+                    self._latest = reading
+                    delay = 1.0
+                    failed_starts = 0
+            process.wait()
+            if failed_starts >= self.max_failed_starts:
+                self.available = False
+                return
+            if self._closed.wait(delay):
+                break
+            delay = min(delay * 2, _NVIDIA_SMI_MAX_RESTART_DELAY_S)
+
+    def close(self) -> None:
+        """Stops the nvidia-smi process and the reader thread."""
+        self._closed.set()
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._thread.join(timeout=2)
+
+
+class NvmlBackend:
+    """Reads the first GPU through an NVML session (`pip install nvidia-ml-py`)."""
+
+    def __init__(self) -> None:
+        """Opens the NVML session.
+
+        Raises:
+            ImportError: If pynvml is not installed.
+            pynvml.NVMLError: If no NVIDIA driver or GPU is present.
+        """
+        import pynvml
+
+        self._nvml = pynvml
+        pynvml.nvmlInit()
+        self._handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(self._handle)
+        self._name = _clean_gpu_name(name.decode("utf-8") if isinstance(name, bytes) else name)
+        self.available = True
+
+    def latest(self) -> Optional[GpuReading]:
+        """Queries utilization and memory in-process."""
+        try:
+            utilization = self._nvml.nvmlDeviceGetUtilizationRates(self._handle)
+            memory = self._nvml.nvmlDeviceGetMemoryInfo(self._handle)
+        except self._nvml.NVMLError:
+            return None
+        return GpuReading(self._name, float(utilization.gpu), memory.used / 1024**2, memory.total / 1024**2, time.monotonic())
+
+    def close(self) -> None:
+        """Closes the NVML session."""
+        try:
+            self._nvml.nvmlShutdown()
+        except self._nvml.NVMLError:
+            pass
+
+
+def create_gpu_backend(interval_s: float = HARDWARE_SAMPLE_INTERVAL_S):
+    """Returns the best available GPU backend: NVML, then nvidia-smi, else None."""
+    try:
+        return NvmlBackend()
+    except Exception:
+        pass
+    if shutil.which("nvidia-smi"):
+        return NvidiaSmiLoopBackend(interval_s)
+    return None
+
+
+_DEFAULT_BACKEND = object()
+
+
+class HardwareSampler:
+    """Samples every hardware metric on one background thread.
+
+    `snapshot()` returns the latest `HardwareSnapshot` without locking; the
+    sampler replaces it as a whole after each pass, so a reader never sees a
+    partially updated sample.
+    """
+
+    def __init__(self, interval_s: float = HARDWARE_SAMPLE_INTERVAL_S, gpu_backend=_DEFAULT_BACKEND) -> None:
+        """Initializes the sampler; call `start` to begin sampling.
+
+        Args:
+            interval_s: Seconds between samples.
+            gpu_backend: Object with `latest()`, `close()` and `available`, or
+                None for no GPU. Defaults to `create_gpu_backend`.
+        """
+        self.interval_s = interval_s
+        self.gpu_backend = gpu_backend
+        self._snapshot = HardwareSnapshot()
+        self._gpu_name: Optional[str] = None
+        self._last_disk_io: Optional[tuple] = None
+        self._last_swap_in: Optional[tuple] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "HardwareSampler":
+        """Takes a first sample and starts the background thread."""
+        if self._thread is not None:
+            return self
+        if self.gpu_backend is _DEFAULT_BACKEND:
+            self.gpu_backend = create_gpu_backend(self.interval_s)
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)  # type: ignore[possibly-unbound]
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="goliat-hardware-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops sampling and closes the GPU backend."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_s + 2)
+        if self.gpu_backend is not None and self.gpu_backend is not _DEFAULT_BACKEND:
+            self.gpu_backend.close()
+
+    def snapshot(self) -> HardwareSnapshot:
+        """Returns the latest snapshot without blocking."""
+        return self._snapshot
+
+    def gpu_available(self) -> bool:
+        """Whether a GPU backend exists and has not given up."""
+        return self.gpu_backend is not None and self.gpu_backend is not _DEFAULT_BACKEND and bool(self.gpu_backend.available)
+
+    def wait_for_gpu(self, timeout: float) -> bool:
+        """Waits up to `timeout` seconds for a first GPU reading.
+
+        Returns:
+            True once the backend has a fresh reading, False if there is no
+            usable backend or none arrived in time.
+        """
+        deadline = time.monotonic() + timeout
+        while self.gpu_available():
+            if self._gpu_fields()["gpu_percent"] is not None:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.05, remaining))
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.sample()
+            except Exception as e:
+                logging.getLogger("verbose").warning(f"Hardware sampling failed: {e}", extra={"log_type": "warning"})
+
+    def _gpu_fields(self) -> dict:
+        reading = self.gpu_backend.latest() if self.gpu_available() else None
+        if reading is not None:
+            self._gpu_name = reading.name
+        if reading is None or time.monotonic() - reading.monotonic_time > HARDWARE_GPU_STALE_S:
+            return {"gpu_name": self._gpu_name, "gpu_percent": None, "vram_used_gb": None, "vram_total_gb": None}
+        return {
+            "gpu_name": reading.name,
+            "gpu_percent": max(0.0, min(100.0, reading.utilization_percent)),
+            "vram_used_gb": reading.memory_used_mb / 1024.0,
+            "vram_total_gb": reading.memory_total_mb / 1024.0,
+        }
+
+    def _rate(self, previous: Optional[tuple], current: tuple, now: float) -> Optional[tuple]:
+        if previous is None or now <= previous[-1]:
+            return None
+        elapsed = now - previous[-1]
+        # Clamp to non-negative (counters can wrap on some systems)
+        return tuple(max(0.0, (c - p) / elapsed) for c, p in zip(current, previous[:-1]))
+
+    def sample(self) -> HardwareSnapshot:
+        """Collects every metric once and publishes the snapshot."""
+        now = time.time()
+        fields = self._gpu_fields()
+        if PSUTIL_AVAILABLE:
+            try:
+                memory = psutil.virtual_memory()  # type: ignore[possibly-unbound]
+                fields.update(
+                    cpu_percent=max(0.0, min(100.0, psutil.cpu_percent(interval=None))),  # type: ignore[possibly-unbound]
+                    cpu_cores=psutil.cpu_count(logical=True) or 0,  # type: ignore[possibly-unbound]
+                    ram_used_gb=memory.used / 1024**3,
+                    ram_total_gb=memory.total / 1024**3,
+                    ram_percent=memory.percent,
+                    # Excludes cacheable memory that can be freed
+                    ram_percent_without_cache=(memory.total - memory.available) / memory.total * 100 if memory.total else 0.0,
+                )
+            except Exception:
+                pass
+            try:
+                io_counters = psutil.disk_io_counters()  # type: ignore[possibly-unbound]
+                if io_counters is not None:
+                    current = (io_counters.read_bytes / 1024**2, io_counters.write_bytes / 1024**2)
+                    rates = self._rate(self._last_disk_io, current, now)
+                    self._last_disk_io = (*current, now)
+                    if rates is not None:
+                        fields.update(disk_read_mbps=rates[0], disk_write_mbps=rates[1])
+            except Exception:
+                pass
+            try:
+                # Pages swapped in from disk (hard faults), assuming 4 KB pages
+                current = (psutil.swap_memory().sin / 4096,)  # type: ignore[possibly-unbound]
+                rates = self._rate(self._last_swap_in, current, now)
+                self._last_swap_in = (*current, now)
+                if rates is not None:
+                    fields.update(page_faults_per_sec=rates[0])
+            except Exception:
+                pass
+        snapshot = HardwareSnapshot(timestamp=now, **fields)
+        self._snapshot = snapshot
+        return snapshot
+
+
+_sampler: Optional[HardwareSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_hardware_sampler() -> HardwareSampler:
+    """Returns the process-wide sampler, starting it on first use."""
+    global _sampler
+    sampler = _sampler
+    if sampler is not None:
+        return sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = HardwareSampler().start()
+        return _sampler
+
+
+def stop_hardware_sampler() -> None:
+    """Stops the process-wide sampler, if it was started."""
+    global _sampler
+    with _sampler_lock:
+        sampler, _sampler = _sampler, None
+    if sampler is not None:
+        sampler.stop()
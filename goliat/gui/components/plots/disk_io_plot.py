@@ -100,6 +100,24 @@ class DiskIOPlot:
 
         self._refresh()
 
+    def set_data(self, points: List[Tuple[datetime, Tuple[Optional[float], Optional[float], Optional[float]]]]) -> None:
+        """Replaces the plotted history and refreshes plot.
+
+        Args:
+            points: (timestamp, (disk_read_mbps, disk_write_mbps, page_faults_per_sec)) tuples, oldest first.
+        """
+        timestamps = [convert_to_utc_plus_one(t) for t, _ in points]
+        self.disk_read_data = [(t, v[0]) for t, (_, v) in zip(timestamps, points)]
+        self.disk_write_data = [(t, v[1]) for t, (_, v) in zip(timestamps, points)]
+        self.page_faults_data = [(t, v[2]) for t, (_, v) in zip(timestamps, points)]
+
+        if any(v[0] is not None or v[1] is not None for _, v in points):
+            self.disk_available = True
+        if any(v[2] is not None for _, v in points):
+            self.page_faults_available = True
+
+        self._refresh()
+
     def _refresh(self) -> None:
         """Refreshes plot with current data."""
         if not self.disk_read_data:
@@ -75,6 +75,17 @@ class OverallProgressPlot:
         self.data.append((utc_plus_one_timestamp, progress_percent))
         self._refresh()
 
+    def set_data(self, points: List[Tuple[datetime, float]]) -> None:
+        """Replaces the plotted history and refreshes plot.
+
+        Args:
+            points: (timestamp, progress percent) tuples, oldest first.
+        """
+        self.data = [(convert_to_utc_plus_one(t), v) for t, v in points]
+        if self.data:
+            self.max_progress_seen = max(self.max_progress_seen, max(v for _, v in self.data))
+        self._refresh()
+
     def _refresh(self) -> None:
         """Refreshes plot with current data."""
         if not self.data:
@@ -128,6 +128,38 @@ class SystemUtilizationPlot:
 
         self._refresh()
 
+    def set_data(
+        self,
+        points: List[Tuple[datetime, Tuple[float, float, Optional[float], Optional[float]]]],
+        cpu_cores: int = 0,
+        total_ram_gb: float = 0.0,
+        gpu_name: Optional[str] = None,
+        total_gpu_vram_gb: float = 0.0,
+    ) -> None:
+        """Replaces the plotted history and refreshes plot.
+
+        Args:
+            points: (timestamp, (cpu, ram, gpu, gpu_vram)) tuples, oldest first.
+            cpu_cores: Number of CPU cores (for legend).
+            total_ram_gb: Total RAM in GB (for legend).
+            gpu_name: GPU model name (for legend).
+            total_gpu_vram_gb: Total GPU VRAM in GB (for legend).
+        """
+        self.cpu_cores = cpu_cores
+        self.total_ram_gb = total_ram_gb
+        self.gpu_name = gpu_name
+        self.total_gpu_vram_gb = total_gpu_vram_gb
+
+        timestamps = [convert_to_utc_plus_one(t) for t, _ in points]
+        self.cpu_data = [(t, v[0]) for t, (_, v) in zip(timestamps, points) if v[0] is not None]
+        self.ram_data = [(t, v[1]) for t, (_, v) in zip(timestamps, points) if v[1] is not None]
+        self.gpu_data = [(t, v[2]) for t, (_, v) in zip(timestamps, points)]
+        self.gpu_vram_data = [(t, v[3]) for t, (_, v) in zip(timestamps, points)]
+        if any(v is not None for _, v in self.gpu_data) or any(v is not None for _, v in self.gpu_vram_data):
+            self.gpu_available = True
+
+        self._refresh()
+
     def _refresh(self) -> None:
         """Refreshes plot with current data."""
         if not self.cpu_data:
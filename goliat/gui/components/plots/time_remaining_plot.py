@@ -76,6 +76,17 @@ class TimeRemainingPlot:
         self.data.append((utc_plus_one_timestamp, hours_remaining))
         self._refresh()
 
+    def set_data(self, points: List[Tuple[datetime, float]]) -> None:
+        """Replaces the plotted history and refreshes plot.
+
+        Args:
+            points: (timestamp, hours remaining) tuples, oldest first.
+        """
+        self.data = [(convert_to_utc_plus_one(t), h) for t, h in points]
+        if self.data:
+            self.max_time_remaining_seen = max(self.max_time_remaining_seen, max(h for _, h in self.data))
+        self._refresh()
+
     def _refresh(self) -> None:
         """Refreshes plot with current data."""
         if not self.data:
@@ -65,6 +65,26 @@ def get_ntp_utc_time() -> datetime:
         return fallback_time
 
 
+_ntp_offset: Optional[float] = None
+
+
+def get_ntp_offset() -> float:
+    """Get the offset in seconds between NTP time and the system clock.
+
+    Queried once per process and reused, so callers that timestamp many
+    samples can use `time.time() + offset` instead of repeated NTP lookups.
+    Falls back to 0.0 (system clock) if NTP is unreachable.
+
+    Returns:
+        Seconds to add to `time.time()` to get NTP-corrected UTC time.
+    """
+    global _ntp_offset
+
+    if _ntp_offset is None:
+        _ntp_offset = get_ntp_utc_time().timestamp() - time.time()
+    return _ntp_offset
+
+
 def convert_to_utc_plus_one(timestamp: datetime) -> datetime:
     """Convert a datetime to UTC+1 timezone.
 
@@ -1,26 +1,37 @@
 """Queue message handler for processing messages from worker process."""
 
+import time
 import traceback
 from queue import Empty
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from colorama import Style
 
 from goliat.colors import get_color
+from goliat.constants import GUI_QUEUE_MAX_MESSAGES_PER_TICK, GUI_QUEUE_SLOW_TICK_MS
+from goliat.profiler import Profiler
 
 if TYPE_CHECKING:
     from goliat.gui.progress_gui import ProgressGUI
 
+# Log-style messages, appended to the GUI and terminal in bulk
+_LOG_MESSAGE_TYPES = ("status", "terminal_only", "print")
+# State messages where only the most recent one per tick matters (applied in this order)
+_LATEST_WINS_MESSAGE_TYPES = ("sim_details", "stage_progress", "overall_progress", "profiler_update")
+
 
 class QueueHandler:
     """Handles processing of messages from the worker process queue.
 
     Polls the multiprocessing queue and dispatches messages to the matching
     GUI update methods. This decouples message handling from queue polling,
-    making the code cleaner and easier to test.
+    making the code cleaner and easier to test. Messages are coalesced per
+    tick, so a burst of progress updates costs one GUI update.
 
     Message types:
     - 'status': Log message with color coding
+    - 'terminal_only': Verbose log message, printed to the terminal only
+    - 'print': stdout/stderr of the worker process, printed to the terminal
     - 'overall_progress': Update overall progress bar
     - 'stage_progress': Update stage progress bar
     - 'start_animation': Start animated progress bar
@@ -39,9 +50,6 @@ class QueueHandler:
         """
         self.gui: "ProgressGUI" = gui_instance
         self._MESSAGE_HANDLERS = {
-            "status": self._handle_status,
-            "terminal_only": self._handle_terminal_only,  # Verbose logs - terminal only, no GUI update
-            "print": self._handle_print,  # stdout/stderr from child process
             "overall_progress": self._handle_overall_progress,
             "stage_progress": self._handle_stage_progress,
             "start_animation": self._handle_start_animation,
@@ -52,45 +60,14 @@ class QueueHandler:
             "fatal_error": self._handle_fatal_error,
             "memory_error": self._handle_memory_error,
         }
-
-    def _handle_status(self, msg: Dict[str, Any]) -> None:
-        """Update GUI status box and print to terminal with colors."""
-        message = msg["message"]
-        log_type = msg.get("log_type", "default")
-        # Update GUI
-        self.gui.update_status(message, log_type)
-        # Also print to terminal with colors (child process stdout may be broken on S4L 9.2)
-        color = get_color(log_type)
-        print(f"{color}{message}{Style.RESET_ALL}")
-
-    def _handle_terminal_only(self, msg: Dict[str, Any]) -> None:
-        """Handles terminal_only message type (verbose logs).
-
-        These messages only print to terminal, not to GUI status box.
-        This is for verbose logs that would clutter the GUI.
-        """
-        message = msg["message"]
-        log_type = msg.get("log_type", "default")
-        # Only print to terminal, don't update GUI
-        color = get_color(log_type)
-        print(f"{color}{message}{Style.RESET_ALL}")
-
-    def _handle_print(self, msg: Dict[str, Any]) -> None:
-        """Handles print message type (stdout/stderr from child process).
-
-        This enables print() statements in the child process to appear in the
-        main terminal. Essential for Sim4Life 9.2 where child process stdout
-        doesn't work normally.
-        """
-        message = msg.get("message", "")
-        stream = msg.get("stream", "stdout")
-        if stream == "stderr":
-            # Print stderr in warning color
-            color = get_color("warning")
-            print(f"{color}{message}{Style.RESET_ALL}")
-        else:
-            # Print stdout as-is (no color modification)
-            print(message)
+        self.stats: Dict[str, float] = {
+            "ticks": 0,
+            "messages": 0,
+            "last_queue_depth": 0,
+            "max_queue_depth": 0,
+            "last_tick_ms": 0.0,
+            "max_tick_ms": 0.0,
+        }
 
     def _handle_overall_progress(self, msg: Dict[str, Any]) -> None:
         """Handles overall progress message type."""
@@ -109,8 +86,15 @@ class QueueHandler:
         self.gui.end_stage_animation()
 
     def _handle_profiler_update(self, msg: Dict[str, Any]) -> None:
-        """Handles profiler update message type."""
-        self.gui.profiler = msg.get("profiler")
+        """Handles profiler update message type.
+
+        Accepts the serialized snapshot sent by QueueGUI as well as a live
+        Profiler instance.
+        """
+        profiler = msg.get("profiler")
+        if isinstance(profiler, dict):
+            profiler = Profiler.from_snapshot(profiler)
+        self.gui.profiler = profiler
         if self.gui.profiler:
             self.gui.profiler_phase = self.gui.profiler.current_phase
             self.gui.timings_table.update(self.gui.profiler)
@@ -157,65 +141,174 @@ class QueueHandler:
         # Don't call study_finished here - wait for the "finished" message
         # which will come right after this one
 
+    def _handle_log_batch(self, msgs: List[Dict[str, Any]]) -> None:
+        """Handles a run of status/terminal_only/print messages in one go.
+
+        Status lines are appended to the GUI in a single batch and all terminal
+        output is written with one print call, instead of one widget update and
+        one print per message. Status and terminal_only lines are also printed
+        because the worker's own stdout is broken on Sim4Life 9.2; stderr
+        output is shown in the warning color.
+        """
+        status_entries: List[Tuple[str, str]] = []
+        terminal_lines: List[str] = []
+        for msg in msgs:
+            msg_type = msg.get("type")
+            if msg_type == "print":
+                message = msg.get("message", "")
+                if msg.get("stream", "stdout") == "stderr":
+                    terminal_lines.append(f"{get_color('warning')}{message}{Style.RESET_ALL}")
+                else:
+                    terminal_lines.append(message)
+                continue
+            message = msg["message"]
+            log_type = msg.get("log_type", "default")
+            terminal_lines.append(f"{get_color(log_type)}{message}{Style.RESET_ALL}")
+            if msg_type == "status":
+                status_entries.append((message, log_type))
+
+        if status_entries:
+            self.gui.update_status_batch(status_entries)
+        if terminal_lines:
+            print("\n".join(terminal_lines))
+
     def process_queue(self) -> None:
         """Processes messages from worker process queue and updates UI.
 
-        Polls queue non-blockingly and processes all available messages in one
-        call. Routes each message type to its handler method.
+        Drains up to `GUI_QUEUE_MAX_MESSAGES_PER_TICK` messages non-blockingly,
+        then coalesces them before touching the GUI:
+        - Log messages are appended in bulk.
+        - For progress, simulation details and profiler updates only the latest
+          message of each type is applied (and forwarded to the web bridge).
+        - Any other message (animations, finished, errors) acts as a barrier:
+          everything received before it is applied first, so ordering holds.
+
         Catches and logs exceptions to prevent one bad message from crashing GUI.
+        Queue depth and tick latency are recorded in `stats`.
 
         This method is called every 100ms by Qt timer to keep UI responsive.
-
-        After processing each message for the GUI, forwards a copy to WebGUIBridge
-        if it exists (for web dashboard monitoring).
         """
-        while not self.gui.queue.empty():
+        tick_start = time.perf_counter()
+        queue_depth = self._get_queue_depth()
+        messages = self._drain_queue()
+
+        pending_logs: List[Dict[str, Any]] = []
+        latest: Dict[str, Dict[str, Any]] = {}
+        for msg in messages:
+            msg_type = msg.get("type")
+            if msg_type in _LOG_MESSAGE_TYPES:
+                pending_logs.append(msg)
+            elif msg_type in _LATEST_WINS_MESSAGE_TYPES:
+                latest[msg_type] = msg
+            else:
+                self._flush(pending_logs, latest)
+                pending_logs, latest = [], {}
+                self._dispatch(msg)
+                self._forward_to_web(msg)
+        self._flush(pending_logs, latest)
+
+        self._record_tick(queue_depth if queue_depth is not None else len(messages), len(messages), tick_start)
+
+    def _drain_queue(self) -> List[Dict[str, Any]]:
+        """Reads all currently available messages, up to the per-tick cap."""
+        messages: List[Dict[str, Any]] = []
+        while len(messages) < GUI_QUEUE_MAX_MESSAGES_PER_TICK:
             try:
-                msg: Dict[str, Any] = self.gui.queue.get_nowait()
-                msg_type: Optional[str] = msg.get("type")
-
-                # Dispatch message to its handler
-                if msg_type:
-                    handler = self._MESSAGE_HANDLERS.get(msg_type)
-                    if handler:
-                        handler(msg)
-
-                # Forward message to web bridge if enabled
-                if hasattr(self.gui, "web_bridge_manager") and self.gui.web_bridge_manager.web_bridge is not None:
-                    try:
-                        # Sanitize profiler_update messages before forwarding
-                        if msg_type == "profiler_update" and "profiler" in msg:
-                            profiler = msg.get("profiler")
-                            # Extract only serializable data from profiler
-                            # Calculate eta_seconds using get_time_remaining() method
-                            eta_seconds = None
-                            if profiler and hasattr(profiler, "get_time_remaining"):
-                                try:
-                                    # Get current stage progress ratio from GUI if available
-                                    current_stage_progress = 0.0
-                                    if hasattr(self.gui, "stage_progress_bar"):
-                                        stage_value = self.gui.stage_progress_bar.value()
-                                        stage_max = self.gui.stage_progress_bar.maximum()
-                                        if stage_max > 0:
-                                            current_stage_progress = stage_value / stage_max
-                                    # Call get_time_remaining() to get ETA in seconds
-                                    eta_seconds = profiler.get_time_remaining(current_stage_progress=current_stage_progress)
-                                except Exception as e:
-                                    # If calculation fails, log but don't crash
-                                    if hasattr(self.gui, "verbose_logger"):
-                                        self.gui.verbose_logger.debug(f"Failed to calculate ETA: {e}")
-                            sanitized_msg = {
-                                "type": "profiler_update",
-                                "eta_seconds": eta_seconds,
-                            }
-                            self.gui.web_bridge_manager.web_bridge.enqueue(sanitized_msg)
-                        else:
-                            self.gui.web_bridge_manager.web_bridge.enqueue(msg)
-                    except Exception as e:
-                        # Don't let web bridge errors crash the GUI
-                        self.gui.verbose_logger.warning(f"Failed to forward message to web bridge: {e}")
-
+                messages.append(self.gui.queue.get_nowait())
             except Empty:
                 break
+            except Exception as e:
+                self.gui.verbose_logger.error(f"Error reading GUI queue: {e}\n{traceback.format_exc()}")
+                break
+        return messages
+
+    def _get_queue_depth(self) -> Optional[int]:
+        """Returns the approximate queue size, or None where qsize() is unsupported (macOS)."""
+        try:
+            return self.gui.queue.qsize()
+        except (NotImplementedError, AttributeError):
+            return None
+
+    def _flush(self, pending_logs: List[Dict[str, Any]], latest: Dict[str, Dict[str, Any]]) -> None:
+        """Applies buffered log messages and the latest coalesced state messages."""
+        if pending_logs:
+            try:
+                self._handle_log_batch(pending_logs)
             except Exception as e:
                 self.gui.verbose_logger.error(f"Error processing GUI queue: {e}\n{traceback.format_exc()}")
+            for msg in pending_logs:
+                self._forward_to_web(msg)
+
+        for msg_type in _LATEST_WINS_MESSAGE_TYPES:
+            msg = latest.get(msg_type)
+            if msg is not None:
+                self._dispatch(msg)
+                self._forward_to_web(msg)
+
+    def _dispatch(self, msg: Dict[str, Any]) -> None:
+        """Routes a single message to its handler."""
+        msg_type: Optional[str] = msg.get("type")
+        if not msg_type:
+            return
+        handler = self._MESSAGE_HANDLERS.get(msg_type)
+        if handler is None:
+            return
+        try:
+            handler(msg)
+        except Exception as e:
+            self.gui.verbose_logger.error(f"Error processing GUI queue: {e}\n{traceback.format_exc()}")
+
+    def _forward_to_web(self, msg: Dict[str, Any]) -> None:
+        """Forwards a message to WebGUIBridge if it exists (for web dashboard monitoring).
+
+        profiler_update messages are replaced by a small dict carrying only the
+        ETA and its confidence band, computed once from the profiler the GUI
+        already rebuilt.
+        """
+        if not hasattr(self.gui, "web_bridge_manager") or self.gui.web_bridge_manager.web_bridge is None:
+            return
+        try:
+            if msg.get("type") == "profiler_update":
+                eta_seconds, eta_band = self._compute_eta()
+                msg = {
+                    "type": "profiler_update",
+                    "eta_seconds": eta_seconds,
+                    "eta_low_seconds": eta_band[0] if eta_band else None,
+                    "eta_high_seconds": eta_band[1] if eta_band else None,
+                }
+            self.gui.web_bridge_manager.web_bridge.enqueue(msg)
+        except Exception as e:
+            # Don't let web bridge errors crash the GUI
+            self.gui.verbose_logger.warning(f"Failed to forward message to web bridge: {e}")
+
+    def _compute_eta(self) -> Tuple[Optional[float], Optional[Tuple[float, float]]]:
+        """Computes the study ETA and its confidence band from the GUI's current profiler and stage progress."""
+        profiler = getattr(self.gui, "profiler", None)
+        if not profiler:
+            return None, None
+        try:
+            current_stage_progress = 0.0
+            if hasattr(self.gui, "stage_progress_bar"):
+                stage_value = self.gui.stage_progress_bar.value()
+                stage_max = self.gui.stage_progress_bar.maximum()
+                if stage_max > 0:
+                    current_stage_progress = stage_value / stage_max
+            eta_seconds = profiler.get_time_remaining(current_stage_progress=current_stage_progress)
+            return eta_seconds, profiler.get_time_remaining_band(current_stage_progress=current_stage_progress)
+        except Exception as e:
+            # If calculation fails, log but don't crash
+            if hasattr(self.gui, "verbose_logger"):
+                self.gui.verbose_logger.debug(f"Failed to calculate ETA: {e}")
+            return None, None
+
+    def _record_tick(self, queue_depth: int, num_messages: int, tick_start: float) -> None:
+        """Updates queue depth and tick latency statistics, logging slow ticks."""
+        tick_ms = (time.perf_counter() - tick_start) * 1000.0
+        self.stats["ticks"] += 1
+        self.stats["messages"] += num_messages
+        self.stats["last_queue_depth"] = queue_depth
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], queue_depth)
+        self.stats["last_tick_ms"] = tick_ms
+        self.stats["max_tick_ms"] = max(self.stats["max_tick_ms"], tick_ms)
+        if tick_ms > GUI_QUEUE_SLOW_TICK_MS:
+            self.gui.verbose_logger.debug(f"Slow GUI queue tick: {tick_ms:.1f} ms for {num_messages} messages (queue depth {queue_depth})")
@@ -1,129 +1,272 @@
 """Screenshot capture component for GUI tabs."""
 
+import hashlib
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from goliat.constants import (
+    SCREENSHOT_BANDWIDTH_BUDGET_BYTES_PER_S,
+    SCREENSHOT_INTERVAL_MS,
+    SCREENSHOT_JPEG_QUALITY_RANGE,
+    SCREENSHOT_KEYFRAME_INTERVAL_S,
+    SCREENSHOT_MIN_SCALE,
+    SCREENSHOT_TILE_SIZE_PX,
+)
 
 if TYPE_CHECKING:
     from goliat.gui.progress_gui import ProgressGUI
 
 try:
-    from PySide6.QtCore import QBuffer, QIODevice, QRect
-    from PySide6.QtGui import QPixmap
-    from PySide6.QtWidgets import QApplication, QWidget
+    from PySide6.QtCore import QBuffer, QIODevice, Qt
+    from PySide6.QtGui import QImage
 except ImportError:
     # Fallback for environments without PySide6
     QBuffer = None  # type: ignore
     QIODevice = None  # type: ignore
-    QPixmap = None  # type: ignore
-    QWidget = None  # type: ignore
-    QRect = None  # type: ignore
-    QApplication = None  # type: ignore
+    QImage = None  # type: ignore
+    Qt = None  # type: ignore
+
+
+class CaptureStats(NamedTuple):
+    """Cost and output of one capture cycle.
+
+    Attributes:
+        gui_thread_ms: Time spent rendering tabs on the GUI thread.
+        tabs_rendered: Tabs rendered this cycle.
+        tabs_sent: Tabs whose JPEG was handed to the uploader.
+        changed_tiles: Tiles that differ from the previous cycle, over all tabs.
+        bytes_sent: Total JPEG bytes handed to the uploader.
+        quality: JPEG quality used.
+        scale: Resolution factor used.
+    """
+
+    gui_thread_ms: float
+    tabs_rendered: int
+    tabs_sent: int
+    changed_tiles: int
+    bytes_sent: int
+    quality: int
+    scale: float
+
+
+def tile_hashes(image: Any, tile_size: int = SCREENSHOT_TILE_SIZE_PX) -> Tuple[Tuple[int, int], List[bytes]]:
+    """Hashes an RGB32 QImage in square tiles.
+
+    Returns:
+        Tuple of ((width, height), one digest per tile in row-major order).
+    """
+    width, height = image.width(), image.height()
+    pixels = np.frombuffer(image.constBits(), dtype=np.uint8).reshape(height, image.bytesPerLine())[:, : width * 4]
+    return (width, height), [
+        hashlib.blake2b(pixels[y : y + tile_size, x * 4 : (x + tile_size) * 4].tobytes(), digest_size=8).digest()
+        for y in range(0, height, tile_size)
+        for x in range(0, width, tile_size)
+    ]
 
 
 class ScreenshotCapture:
-    """Captures screenshots of GUI tabs for web monitoring."""
-
-    def __init__(self, gui: "ProgressGUI") -> None:
+    """Captures screenshots of GUI tabs for web monitoring.
+
+    Each cycle renders the tabs on the GUI thread and hands the images to a
+    single worker thread. The worker hashes them in tiles, skips tabs whose
+    tiles did not change since the last cycle (re-sending each tab at least
+    every `SCREENSHOT_KEYFRAME_INTERVAL_S`), and JPEG-encodes the rest. JPEG
+    quality and resolution adapt so the bytes per cycle stay within the
+    bandwidth budget. Finished screenshots are passed to `on_screenshots`
+    from the worker thread.
+    """
+
+    def __init__(
+        self,
+        gui: "ProgressGUI",
+        on_screenshots: Optional[Callable[[Dict[str, bytes]], None]] = None,
+        interval_s: float = SCREENSHOT_INTERVAL_MS / 1000,
+        bandwidth_budget: float = SCREENSHOT_BANDWIDTH_BUDGET_BYTES_PER_S,
+    ) -> None:
         """Initialize screenshot capture component.
 
         Args:
             gui: ProgressGUI instance with tabs to capture.
+            on_screenshots: Called with {tab name: JPEG bytes} for the changed tabs of each cycle.
+            interval_s: Seconds between capture cycles, used to split the bandwidth budget.
+            bandwidth_budget: Target upload rate in bytes per second.
         """
         self.gui = gui
         self.verbose_logger = logging.getLogger("screenshot_capture")
-
-    def capture_all_tabs(self) -> Dict[str, bytes]:
-        """Capture all GUI tabs as JPEG bytes.
+        self.on_screenshots = on_screenshots
+        self.cycle_budget_bytes = bandwidth_budget * interval_s
+        self.quality = SCREENSHOT_JPEG_QUALITY_RANGE[1]
+        self.scale = 1.0
+        self.last_stats: Optional[CaptureStats] = None
+        self._tile_hashes: Dict[str, Tuple[Tuple[int, int], List[bytes]]] = {}
+        self._last_sent: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+
+    def _render_tabs(self) -> Dict[str, Any]:
+        """Renders every tab except Progress into an RGB32 QImage (GUI thread).
 
         Captures each tab widget individually without switching tabs,
         so it doesn't interfere with the user's current view.
+        """
+        images: Dict[str, Any] = {}
+        if not hasattr(self.gui, "tabs"):
+            self.verbose_logger.warning("GUI has no tabs attribute")
+            return images
+
+        tabs = self.gui.tabs
+        for i in range(tabs.count()):
+            try:
+                tab_widget = tabs.widget(i)
+                tab_name = tabs.tabText(i)
+
+                if tab_widget is None:
+                    self.verbose_logger.warning(f"Tab {i} ({tab_name}) has no widget")
+                    continue
+
+                # Skip the main "Progress" tab - its data is already sent via other mechanisms
+                if tab_name == "Progress":
+                    continue
+
+                # Non-visible tabs might have zero size, so use the QTabWidget size as reference
+                parent_size = tabs.size()
+                widget_width = tab_widget.width() if tab_widget.width() > 0 else parent_size.width()
+                widget_height = tab_widget.height() if tab_widget.height() > 0 else parent_size.height()
+
+                # QImage rather than QPixmap: it can be read and encoded outside the GUI thread
+                image = QImage(widget_width or 800, widget_height or 600, QImage.Format.Format_RGB32)
+                image.fill(Qt.GlobalColor.white)
+                tab_widget.render(image)
+
+                if image.isNull():
+                    self.verbose_logger.warning(f"Failed to render tab {tab_name}")
+                    continue
+                images[tab_name] = image
+
+            except Exception as e:
+                # Log error but continue capturing other tabs
+                self.verbose_logger.warning(f"Failed to capture tab {i}: {e}", exc_info=True)
+        return images
+
+    def capture_cycle(self) -> Optional[Future]:
+        """Runs one capture cycle; only the rendering happens on the calling (GUI) thread.
+
+        Skips the cycle while the previous one is still being encoded, so a
+        slow worker never builds up a backlog of frames.
 
         Returns:
-            Dictionary mapping tab names to JPEG bytes.
-            Empty dict if capture fails or PySide6 not available.
+            Future resolving to the screenshots sent this cycle, or None if the
+            cycle was skipped or PySide6 is not available.
         """
-        if QBuffer is None or QWidget is None or QPixmap is None:
-            return {}
+        if QImage is None:
+            return None
+        if self._pending is not None and not self._pending.done():
+            self.verbose_logger.debug("Previous screenshot cycle still encoding, skipping")
+            return None
 
+        start = time.perf_counter()
+        images = self._render_tabs()
+        gui_thread_ms = (time.perf_counter() - start) * 1000
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot_encode")
+        self._pending = self._executor.submit(self._process_cycle, images, gui_thread_ms)
+        return self._pending
+
+    def _process_cycle(self, images: Dict[str, Any], gui_thread_ms: float) -> Dict[str, bytes]:
+        """Diffs, encodes and delivers one cycle's images (worker thread)."""
+        now = time.monotonic()
+        quality, scale = self.quality, self.scale
         screenshots: Dict[str, bytes] = {}
+        changed_tiles = 0
 
         try:
-            if not hasattr(self.gui, "tabs"):
-                self.verbose_logger.warning("GUI has no tabs attribute")
-                return {}
-
-            tabs = self.gui.tabs
-            tab_count = tabs.count()
-
-            for i in range(tab_count):
-                try:
-                    tab_widget = tabs.widget(i)
-                    tab_name = tabs.tabText(i)
-
-                    if tab_widget is None:
-                        self.verbose_logger.warning(f"Tab {i} ({tab_name}) has no widget")
-                        continue
-
-                    # Skip the main "Progress" tab - its data is already sent via other mechanisms
-                    if tab_name == "Progress":
-                        continue
-
-                    # Get the size of the tab widget's parent (QTabWidget) to know the proper size
-                    # Non-visible tabs might have zero size, so we use parent size as reference
-                    parent_size = tabs.size()
-                    widget_width = tab_widget.width() if tab_widget.width() > 0 else parent_size.width()
-                    widget_height = tab_widget.height() if tab_widget.height() > 0 else parent_size.height()
-
-                    # Fallback to reasonable defaults if sizes are still zero
-                    if widget_width == 0:
-                        widget_width = 800
-                    if widget_height == 0:
-                        widget_height = 600
-
-                    # Process events to ensure all widgets are painted
-                    if QApplication is not None:
-                        QApplication.processEvents()
-
-                    pixmap = QPixmap(widget_width, widget_height)
-                    pixmap.fill()
-                    tab_widget.render(pixmap)
-
-                    # Process events after rendering
-                    if QApplication is not None:
-                        QApplication.processEvents()
-
-                    if pixmap.isNull():
-                        self.verbose_logger.warning(f"Failed to grab pixmap for tab {tab_name}")
-                        continue
-
-                    # Verify pixmap has content (not just empty/white)
-                    if pixmap.width() == 0 or pixmap.height() == 0:
-                        self.verbose_logger.warning(f"Pixmap for tab {tab_name} has zero size")
-                        continue
-
-                    # Convert to JPEG bytes
-                    jpeg_bytes = self._compress_to_jpeg(pixmap)
-
-                    if jpeg_bytes:
-                        screenshots[tab_name] = jpeg_bytes
-                        self.verbose_logger.debug(f"Captured screenshot for tab '{tab_name}' ({len(jpeg_bytes)} bytes)")
-
-                except Exception as e:
-                    # Log error but continue capturing other tabs
-                    self.verbose_logger.warning(f"Failed to capture tab {i}: {e}", exc_info=True)
+            for tab_name, image in images.items():
+                size, hashes = tile_hashes(image)
+                previous = self._tile_hashes.get(tab_name)
+                if previous is None or previous[0] != size:
+                    changed = len(hashes)
+                else:
+                    changed = sum(old != new for old, new in zip(previous[1], hashes))
+                keyframe_due = now - self._last_sent.get(tab_name, float("-inf")) >= SCREENSHOT_KEYFRAME_INTERVAL_S
+                if not changed and not keyframe_due:
                     continue
 
+                jpeg_bytes = self._compress_to_jpeg(image, quality=quality, scale=scale)
+                if jpeg_bytes:
+                    screenshots[tab_name] = jpeg_bytes
+                    self._tile_hashes[tab_name] = (size, hashes)
+                    self._last_sent[tab_name] = now
+                    changed_tiles += changed
+                    self.verbose_logger.debug(
+                        f"Captured screenshot for tab '{tab_name}' ({len(jpeg_bytes)} bytes, {changed} tiles changed)"
+                    )
+
+            bytes_sent = sum(len(data) for data in screenshots.values())
+            self._adapt_to_budget(bytes_sent)
+            self.last_stats = CaptureStats(gui_thread_ms, len(images), len(screenshots), changed_tiles, bytes_sent, quality, scale)
+
+            if screenshots and self.on_screenshots is not None:
+                self.on_screenshots(screenshots)
         except Exception as e:
-            self.verbose_logger.error(f"Failed to capture screenshots: {e}", exc_info=True)
+            self.verbose_logger.error(f"Failed to process screenshots: {e}", exc_info=True)
+        return screenshots
+
+    def _adapt_to_budget(self, bytes_sent: int) -> None:
+        """Steps JPEG quality and resolution towards the per-cycle byte budget.
 
+        Quality is lowered first and resolution only once quality is at its
+        minimum; on the way back up, resolution is restored first.
+        """
+        min_quality, max_quality = SCREENSHOT_JPEG_QUALITY_RANGE
+        if bytes_sent > self.cycle_budget_bytes:
+            if self.quality > min_quality:
+                self.quality = max(min_quality, self.quality - 10)
+            else:
+                self.scale = max(SCREENSHOT_MIN_SCALE, round(self.scale - 0.1, 2))
+        elif 0 < bytes_sent < self.cycle_budget_bytes / 2:
+            if self.scale < 1.0:
+                self.scale = min(1.0, round(self.scale + 0.1, 2))
+            else:
+                self.quality = min(max_quality, self.quality + 5)
+
+    def capture_all_tabs(self) -> Dict[str, bytes]:
+        """Capture all GUI tabs as JPEG bytes, synchronously and without change detection.
+
+        Returns:
+            Dictionary mapping tab names to JPEG bytes.
+            Empty dict if capture fails or PySide6 not available.
+        """
+        if QImage is None or QBuffer is None:
+            return {}
+
+        screenshots: Dict[str, bytes] = {}
+        try:
+            for tab_name, image in self._render_tabs().items():
+                jpeg_bytes = self._compress_to_jpeg(image, quality=self.quality, scale=self.scale)
+                if jpeg_bytes:
+                    screenshots[tab_name] = jpeg_bytes
+        except Exception as e:
+            self.verbose_logger.error(f"Failed to capture screenshots: {e}", exc_info=True)
         return screenshots
 
-    def _compress_to_jpeg(self, pixmap: Any, quality: int = 70) -> Optional[bytes]:
-        """Convert QPixmap to JPEG bytes.
+    def close(self) -> None:
+        """Stops the encoding worker; a cycle in progress is finished in the background."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _compress_to_jpeg(self, image: Any, quality: int = 70, scale: float = 1.0) -> Optional[bytes]:
+        """Convert a QImage (or QPixmap) to JPEG bytes.
 
         Args:
-            pixmap: QPixmap to compress.
+            image: QImage to compress; safe to call outside the GUI thread.
             quality: JPEG quality (0-100), default 70 for balanced compression/quality.
+            scale: Resolution factor applied before encoding.
 
         Returns:
             JPEG bytes, or None if compression fails.
@@ -132,18 +275,26 @@ class ScreenshotCapture:
             return None
 
         try:
+            if scale < 1.0:
+                image = image.scaled(
+                    max(1, int(image.width() * scale)),
+                    max(1, int(image.height() * scale)),
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+
             buffer = QBuffer()
             buffer.open(QIODevice.OpenModeFlag.WriteOnly)
 
-            success = pixmap.save(buffer, "JPEG", quality=quality)
+            success = image.save(buffer, "JPEG", quality=quality)
 
             if not success:
-                self.verbose_logger.warning("Failed to save pixmap as JPEG")
+                self.verbose_logger.warning("Failed to save image as JPEG")
                 return None
 
             buffer.close()
-            return buffer.data()
+            return bytes(buffer.data())
 
         except Exception as e:
-            self.verbose_logger.warning(f"Failed to compress pixmap to JPEG: {e}", exc_info=True)
+            self.verbose_logger.warning(f"Failed to compress image to JPEG: {e}", exc_info=True)
             return None
@@ -1,45 +1,36 @@
 """System resource monitoring component for GUI."""
 
-import subprocess
 from typing import Optional, Tuple
 
-try:
-    import psutil
+from goliat.gui.components.hardware_sampler import PSUTIL_AVAILABLE, HardwareSnapshot, get_hardware_sampler  # noqa: F401 - re-export
 
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+GPU_DETECTION_TIMEOUT_S = 2.0
+"""Seconds a background thread waits for the first GPU reading, e.g. before reporting the GPU name."""
 
 
 class SystemMonitor:
     """Monitors system resource utilization (CPU, RAM, GPU).
 
-    Provides methods to get current CPU usage percentage, RAM usage in GB,
-    and GPU utilization percentage (via nvidia-smi). Gracefully handles
-    missing dependencies (psutil) and unavailable GPU.
+    All values come from the latest snapshot of the process-wide
+    `HardwareSampler`, which collects every metric in one pass on a background
+    thread. These calls therefore never block on psutil, the GPU driver or a
+    subprocess. Gracefully handles missing dependencies (psutil) and an
+    unavailable GPU.
     """
 
+    @staticmethod
+    def snapshot() -> HardwareSnapshot:
+        """Gets the latest hardware snapshot (all metrics from one sample)."""
+        return get_hardware_sampler().snapshot()
+
     @staticmethod
     def get_cpu_utilization() -> float:
         """Gets current CPU utilization percentage.
 
-        Uses non-blocking approach by calling cpu_percent() without interval,
-        which returns utilization since last call. For accurate measurement,
-        ensure this is called at consistent intervals (e.g., every 1 second).
-
         Returns:
             CPU usage percentage (0-100), or 0.0 if psutil unavailable.
         """
-        if not PSUTIL_AVAILABLE:
-            return 0.0
-        try:
-            # Non-blocking call - returns utilization since last call
-            # psutil is guaranteed to be available here due to PSUTIL_AVAILABLE check
-            cpu_percent = psutil.cpu_percent(interval=None)  # type: ignore[possibly-unbound]
-            # Clamp to valid range (psutil can sometimes return slightly negative or >100)
-            return max(0.0, min(100.0, cpu_percent))
-        except Exception:
-            return 0.0
+        return SystemMonitor.snapshot().cpu_percent
 
     @staticmethod
     def get_ram_utilization() -> Tuple[float, float]:
@@ -48,16 +39,8 @@ class SystemMonitor:
         Returns:
             Tuple of (used_GB, total_GB), or (0.0, 0.0) if psutil unavailable.
         """
-        if not PSUTIL_AVAILABLE:
-            return (0.0, 0.0)
-        try:
-            # psutil is guaranteed to be available here due to PSUTIL_AVAILABLE check
-            memory = psutil.virtual_memory()  # type: ignore[possibly-unbound]
-            used_gb = memory.used / (1024**3)
-            total_gb = memory.total / (1024**3)
-            return (used_gb, total_gb)
-        except Exception:
-            return (0.0, 0.0)
+        snapshot = SystemMonitor.snapshot()
+        return (snapshot.ram_used_gb, snapshot.ram_total_gb)
 
     @staticmethod
     def get_ram_utilization_detailed() -> Tuple[float, float, float]:
@@ -69,100 +52,38 @@ class SystemMonitor:
             - percent_without_cache: ((total - available) / total) * 100 (excludes cacheable memory)
             - total_GB: Total RAM in GB
         """
-        if not PSUTIL_AVAILABLE:
-            return (0.0, 0.0, 0.0)
-        try:
-            # psutil is guaranteed to be available here due to PSUTIL_AVAILABLE check
-            memory = psutil.virtual_memory()  # type: ignore[possibly-unbound]
-            total_gb = memory.total / (1024**3)
-
-            # With cache: used / total
-            percent_with_cache = memory.percent
-
-            # Without cache: (total - available) / total
-            # This excludes cacheable memory that can be freed
-            percent_without_cache = ((memory.total - memory.available) / memory.total) * 100
-
-            return (percent_with_cache, percent_without_cache, total_gb)
-        except Exception:
-            return (0.0, 0.0, 0.0)
+        snapshot = SystemMonitor.snapshot()
+        return (snapshot.ram_percent, snapshot.ram_percent_without_cache, snapshot.ram_total_gb)
 
     @staticmethod
     def get_gpu_vram_utilization() -> Optional[Tuple[float, float]]:
         """Gets current GPU VRAM usage and total VRAM.
 
         Returns:
-            Tuple of (used_GB, total_GB), or None if nvidia-smi unavailable.
+            Tuple of (used_GB, total_GB), or None if no GPU reading is available.
         """
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                # Get first GPU's memory usage
-                memory_str = result.stdout.strip().split("\n")[0].strip()
-                parts = memory_str.split(", ")
-                if len(parts) == 2:
-                    used_mb = float(parts[0].strip())
-                    total_mb = float(parts[1].strip())
-                    used_gb = used_mb / 1024.0
-                    total_gb = total_mb / 1024.0
-                    return (used_gb, total_gb)
-            return None
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError, ValueError, IndexError):
+        snapshot = SystemMonitor.snapshot()
+        if snapshot.vram_used_gb is None or snapshot.vram_total_gb is None:
             return None
+        return (snapshot.vram_used_gb, snapshot.vram_total_gb)
 
     @staticmethod
     def get_gpu_utilization() -> Optional[float]:
-        """Gets current GPU utilization percentage via nvidia-smi.
+        """Gets current GPU utilization percentage.
 
         Returns:
-            GPU usage percentage (0-100), or None if nvidia-smi unavailable.
+            GPU usage percentage (0-100), or None if no GPU reading is available.
         """
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                # Get first GPU's utilization
-                utilization_str = result.stdout.strip().split("\n")[0].strip()
-                return float(utilization_str)
-            return None
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError, ValueError):
-            return None
+        return SystemMonitor.snapshot().gpu_percent
 
     @staticmethod
     def get_gpu_name() -> Optional[str]:
-        """Gets GPU name via nvidia-smi.
+        """Gets GPU name.
 
         Returns:
-            GPU name (e.g., "RTX 4090"), or None if nvidia-smi unavailable.
+            GPU name (e.g., "RTX 4090"), or None if no GPU has been detected.
         """
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                # Get first GPU's name and clean it up
-                gpu_name = result.stdout.strip().split("\n")[0].strip()
-                # Remove common prefixes like "NVIDIA " and clean up
-                gpu_name = gpu_name.replace("NVIDIA ", "").strip()
-                return gpu_name
-            return None
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            return None
+        return SystemMonitor.snapshot().gpu_name
 
     @staticmethod
     def get_cpu_cores() -> int:
@@ -171,12 +92,7 @@ class SystemMonitor:
         Returns:
             Number of CPU cores, or 0 if psutil unavailable.
         """
-        if not PSUTIL_AVAILABLE:
-            return 0
-        try:
-            return psutil.cpu_count(logical=True) or 0  # type: ignore[possibly-unbound]
-        except Exception:
-            return 0
+        return SystemMonitor.snapshot().cpu_cores
 
     @staticmethod
     def get_total_ram_gb() -> float:
@@ -185,76 +101,43 @@ class SystemMonitor:
         Returns:
             Total RAM in GB, or 0.0 if psutil unavailable.
         """
-        if not PSUTIL_AVAILABLE:
-            return 0.0
-        try:
-            memory = psutil.virtual_memory()  # type: ignore[possibly-unbound]
-            return memory.total / (1024**3)
-        except Exception:
-            return 0.0
-
-    # Class-level state for disk I/O delta calculation
-    _last_disk_io: Optional[Tuple[int, int, float]] = None  # (read_bytes, write_bytes, timestamp)
-
-    # Class-level state for page faults delta calculation
-    _last_page_faults: Optional[Tuple[int, float]] = None  # (page_faults, timestamp)
+        return SystemMonitor.snapshot().ram_total_gb
 
     @staticmethod
     def get_disk_io_throughput() -> Optional[Tuple[float, float]]:
         """Gets current disk I/O throughput in MB/s.
 
-        Calculates read and write speeds by comparing current I/O counters
-        with values from the previous call. First call returns None as there's
-        no baseline for comparison.
+        Computed by the sampler from the I/O counters of its last two samples.
 
         Returns:
-            Tuple of (read_MB_per_sec, write_MB_per_sec), or None if unavailable.
+            Tuple of (read_MB_per_sec, write_MB_per_sec), or None until two samples exist.
         """
-        if not PSUTIL_AVAILABLE:
+        snapshot = SystemMonitor.snapshot()
+        if snapshot.disk_read_mbps is None or snapshot.disk_write_mbps is None:
             return None
-        try:
-            import time
-
-            current_time = time.time()
-            # psutil is guaranteed to be available here due to PSUTIL_AVAILABLE check
-            io_counters = psutil.disk_io_counters()  # type: ignore[possibly-unbound]
-            if io_counters is None:
-                return None
+        return (snapshot.disk_read_mbps, snapshot.disk_write_mbps)
 
-            current_read = io_counters.read_bytes
-            current_write = io_counters.write_bytes
-
-            if SystemMonitor._last_disk_io is None:
-                # First call - store baseline and return None
-                SystemMonitor._last_disk_io = (current_read, current_write, current_time)
-                return None
-
-            last_read, last_write, last_time = SystemMonitor._last_disk_io
-            time_delta = current_time - last_time
-
-            if time_delta <= 0:
-                return None
-
-            # Calculate throughput in MB/s
-            read_speed = (current_read - last_read) / (1024 * 1024) / time_delta
-            write_speed = (current_write - last_write) / (1024 * 1024) / time_delta
+    @staticmethod
+    def is_gpu_available(timeout_s: float = 0.0) -> bool:
+        """Checks if a GPU can be monitored.
 
-            # Update stored values for next call
-            SystemMonitor._last_disk_io = (current_read, current_write, current_time)
+        Does not block by default, so it is safe to call on the GUI thread;
+        right after startup it may return False until the first reading
+        arrives. Pass `GPU_DETECTION_TIMEOUT_S` from a background thread to
+        wait for it.
 
-            # Clamp to non-negative (counters can wrap on some systems)
-            return (max(0.0, read_speed), max(0.0, write_speed))
-        except Exception:
-            return None
-
-    @staticmethod
-    def is_gpu_available() -> bool:
-        """Checks if GPU is available via nvidia-smi.
+        Args:
+            timeout_s: Seconds to wait for the sampler's first GPU reading.
 
         Returns:
-            True if nvidia-smi is available and returns successfully, False otherwise.
+            True if the GPU backend delivered a reading, False otherwise.
         """
-        return SystemMonitor.get_gpu_utilization() is not None
+        return get_hardware_sampler().wait_for_gpu(timeout_s)
+
+    @staticmethod
+    def has_gpu_backend() -> bool:
+        """Whether a GPU backend is running that may still deliver a reading, without waiting."""
+        return get_hardware_sampler().gpu_available()
 
     @staticmethod
     def get_page_faults_per_second() -> Optional[float]:
@@ -262,50 +145,10 @@ class SystemMonitor:
 
         Hard page faults (major faults) occur when the system needs to read data
         from disk because it's not in RAM. High rates indicate memory pressure
-        and can significantly impact performance.
-
-        Calculates the rate by comparing current page fault count with the
-        previous call. First call returns None as there's no baseline.
+        and can significantly impact performance. Derived from the bytes swapped
+        in between the sampler's last two samples, assuming 4 KB pages.
 
         Returns:
-            Page faults per second, or None if unavailable.
+            Page faults per second, or None until two samples exist.
         """
-        if not PSUTIL_AVAILABLE:
-            return None
-        try:
-            import time
-
-            current_time = time.time()
-            # psutil is guaranteed to be available here due to PSUTIL_AVAILABLE check
-            swap_info = psutil.swap_memory()  # type: ignore[possibly-unbound]
-
-            # On Windows, swap_memory().sin and .sout track page-ins and page-outs
-            # We use sin (swap in) as it represents data being read from disk to RAM
-            # which is the hard fault scenario
-            # Note: On Linux, we could also use /proc/vmstat for more detailed stats
-            current_faults = swap_info.sin  # Bytes swapped in from disk
-
-            if SystemMonitor._last_page_faults is None:
-                # First call - store baseline and return None
-                SystemMonitor._last_page_faults = (current_faults, current_time)
-                return None
-
-            last_faults, last_time = SystemMonitor._last_page_faults
-            time_delta = current_time - last_time
-
-            if time_delta <= 0:
-                return None
-
-            # Calculate faults per second (convert bytes to pages, assuming 4KB pages)
-            page_size = 4096  # Standard page size in bytes
-            faults_delta = current_faults - last_faults
-            pages_swapped = faults_delta / page_size
-            faults_per_second = pages_swapped / time_delta
-
-            # Update stored values for next call
-            SystemMonitor._last_page_faults = (current_faults, current_time)
-
-            # Clamp to non-negative (counters can wrap on some systems)
-            return max(0.0, faults_per_second)
-        except Exception:
-            return None
+        return SystemMonitor.snapshot().page_faults_per_sec
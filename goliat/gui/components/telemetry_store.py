@@ -0,0 +1,228 @@
+"""In-memory time-series store for GUI telemetry with batched binary persistence."""
+
+import json
+import os
+import struct
+import time
+from collections import deque
+from datetime import datetime, timezone
+from logging import Logger
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TELEMETRY_FILE_MAGIC = b"GOLIAT-TELEMETRY-1\n"
+"""First line of every telemetry file, followed by a JSON header line and packed float64 rows."""
+
+Sample = Tuple[float, Tuple[Optional[float], ...]]
+
+
+class _Series:
+    """Ring buffers and on-disk file state for one telemetry series."""
+
+    def __init__(self, name: str, columns: Sequence[str], base_path: str, recent_capacity: int, archive_capacity: int) -> None:
+        self.name = name
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.base_path = base_path
+        self.part = 1
+        self.path = f"{base_path}.bin"
+        self.recent: Deque[Sample] = deque(maxlen=recent_capacity)
+        self.archive: Deque[Sample] = deque(maxlen=archive_capacity)
+        self.evicted: List[Sample] = []
+        self.pending: List[Sample] = []
+        self.row_struct = struct.Struct(f"<{1 + len(self.columns)}d")
+
+
+class TelemetryStore:
+    """Keeps GUI telemetry in fixed-size ring buffers and flushes it in batches.
+
+    Each series holds the most recent samples at full resolution. Samples that
+    fall out of that window are averaged in blocks of `downsample_factor` into
+    a second, coarser ring buffer, so memory stays constant over multi-day
+    studies while the plots still cover the whole run.
+
+    Samples are persisted to one append-only binary file per series: a magic
+    line, a JSON header line with the column names, then little-endian float64
+    rows of (unix timestamp, *values) with NaN for missing values. Files are
+    written once every `flush_every` samples or `flush_interval_s` seconds and
+    rotated to a new part once they exceed `max_file_bytes`.
+
+    Timestamps come from the system clock corrected by an NTP offset that is
+    measured once per store, not on every sample.
+
+    Since the history is already bounded and downsampled, the GUI plots keep
+    no history of their own: their `set_data` redraws straight from `get_series`.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        session_id: str,
+        verbose_logger: Logger,
+        recent_capacity: int = 3600,
+        archive_capacity: int = 3600,
+        downsample_factor: int = 10,
+        flush_every: int = 30,
+        flush_interval_s: float = 60.0,
+        max_file_bytes: int = 16 * 1024 * 1024,
+        clock_offset_s: Optional[float] = None,
+    ) -> None:
+        """Sets up an empty store.
+
+        Args:
+            data_dir: Directory where telemetry files are written.
+            session_id: Suffix that makes file names unique per GUI session.
+            verbose_logger: Logger for verbose messages.
+            recent_capacity: Samples kept at full resolution per series.
+            archive_capacity: Downsampled samples kept per series.
+            downsample_factor: Number of evicted samples averaged into one archive sample.
+            flush_every: Number of pending samples that triggers a write.
+            flush_interval_s: Maximum time pending samples are kept in memory.
+            max_file_bytes: Size after which a series file is rotated.
+            clock_offset_s: Offset added to the system clock. Measured via NTP
+                if None.
+        """
+        self.data_dir = data_dir
+        self.session_id = session_id
+        self.verbose_logger = verbose_logger
+        self.recent_capacity = recent_capacity
+        self.archive_capacity = archive_capacity
+        self.downsample_factor = max(1, downsample_factor)
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self.max_file_bytes = max_file_bytes
+        self._series: Dict[str, _Series] = {}
+        self._last_flush = time.monotonic()
+
+        if clock_offset_s is None:
+            from goliat.gui.components.plots.utils import get_ntp_offset
+
+            clock_offset_s = get_ntp_offset()
+        self.clock_offset_s: float = clock_offset_s
+
+    def register_series(self, name: str, columns: Sequence[str]) -> None:
+        """Declares a series and its value columns.
+
+        Args:
+            name: Series name, also used as the file name prefix.
+            columns: Names of the values recorded with each sample.
+        """
+        base_path = os.path.join(self.data_dir, f"{name}_{self.session_id}")
+        self._series[name] = _Series(name, columns, base_path, self.recent_capacity, self.archive_capacity)
+
+    def now(self) -> datetime:
+        """Returns the current NTP-corrected UTC time."""
+        return datetime.fromtimestamp(time.time() + self.clock_offset_s, tz=timezone.utc)
+
+    def append(self, name: str, values: Sequence[Optional[float]], timestamp: Optional[datetime] = None) -> datetime:
+        """Records one sample.
+
+        Args:
+            name: Registered series name.
+            values: One value per column; None marks a missing value.
+            timestamp: Sample time. Defaults to `now()`.
+
+        Returns:
+            The timestamp that was recorded, so callers can reuse it for plots.
+        """
+        series = self._series[name]
+        if len(values) != len(series.columns):
+            raise ValueError(f"Series '{name}' expects {len(series.columns)} values, got {len(values)}")
+        if timestamp is None:
+            timestamp = self.now()
+        sample: Sample = (timestamp.timestamp(), tuple(None if v is None else float(v) for v in values))
+
+        if len(series.recent) == series.recent.maxlen:
+            self._evict(series, series.recent[0])
+        series.recent.append(sample)
+        series.pending.append(sample)
+
+        if len(series.pending) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval_s:
+            self.flush()
+        return timestamp
+
+    def _evict(self, series: _Series, sample: Sample) -> None:
+        """Folds a sample leaving the recent window into the downsampled archive."""
+        series.evicted.append(sample)
+        if len(series.evicted) < self.downsample_factor:
+            return
+        block = series.evicted
+        series.evicted = []
+        mean_time = sum(t for t, _ in block) / len(block)
+        mean_values = []
+        for i in range(len(series.columns)):
+            present = [v[i] for _, v in block if v[i] is not None]
+            mean_values.append(sum(present) / len(present) if present else None)  # type: ignore[arg-type]
+        series.archive.append((mean_time, tuple(mean_values)))
+
+    def get_series(self, name: str) -> List[Tuple[datetime, Tuple[Optional[float], ...]]]:
+        """Returns the in-memory history of a series, oldest first.
+
+        Downsampled archive samples come first, followed by the full-resolution
+        recent window.
+
+        Args:
+            name: Registered series name.
+
+        Returns:
+            List of (UTC timestamp, values) tuples.
+        """
+        series = self._series[name]
+        samples = list(series.archive) + series.evicted + list(series.recent)
+        return [(datetime.fromtimestamp(t, tz=timezone.utc), values) for t, values in samples]
+
+    def get_file_paths(self, name: str) -> List[str]:
+        """Returns all files written for a series in this session, oldest part first."""
+        series = self._series[name]
+        paths = [f"{series.base_path}.bin"] + [f"{series.base_path}_part{i}.bin" for i in range(2, series.part + 1)]
+        return [p for p in paths if os.path.exists(p)]
+
+    def flush(self) -> None:
+        """Writes all pending samples to disk."""
+        self._last_flush = time.monotonic()
+        for series in self._series.values():
+            if not series.pending:
+                continue
+            try:
+                self._write_rows(series)
+            except OSError as e:
+                self.verbose_logger.error(f"Failed to write {series.name} telemetry: {e}")
+            series.pending = []
+
+    def _write_rows(self, series: _Series) -> None:
+        """Appends pending rows to the series file, rotating it when it grows too large."""
+        if os.path.exists(series.path) and os.path.getsize(series.path) >= self.max_file_bytes:
+            series.part += 1
+            series.path = f"{series.base_path}_part{series.part}.bin"
+
+        nan = float("nan")
+        payload = b"".join(series.row_struct.pack(t, *(nan if v is None else v for v in values)) for t, values in series.pending)
+        new_file = not os.path.exists(series.path)
+        with open(series.path, "ab") as f:
+            if new_file:
+                header = json.dumps({"series": series.name, "columns": ["timestamp", *series.columns]})
+                f.write(TELEMETRY_FILE_MAGIC + header.encode() + b"\n")
+            f.write(payload)
+
+    def close(self) -> None:
+        """Flushes remaining samples. The store stays usable afterwards."""
+        self.flush()
+
+
+def read_telemetry_file(path: str) -> Tuple[List[str], np.ndarray]:
+    """Loads a telemetry file written by TelemetryStore.
+
+    Args:
+        path: Path to a `.bin` telemetry file.
+
+    Returns:
+        Tuple of (column names, 2-D float64 array with one row per sample).
+        The first column is the unix timestamp; missing values are NaN.
+    """
+    with open(path, "rb") as f:
+        if f.readline() != TELEMETRY_FILE_MAGIC:
+            raise ValueError(f"Not a GOLIAT telemetry file: {path}")
+        columns = json.loads(f.readline())["columns"]
+        rows = np.frombuffer(f.read(), dtype="<f8")
+    usable = (len(rows) // len(columns)) * len(columns)  # Ignore a partially written trailing row
+    return columns, rows[:usable].reshape(-1, len(columns))
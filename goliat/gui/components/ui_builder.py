@@ -18,6 +18,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from goliat.constants import GUI_STATUS_LOG_MAX_LINES
 from goliat.gui.components.plots import DiskIOPlot, OverallProgressPlot, PieChartsManager, SystemUtilizationPlot, TimeRemainingPlot
 from goliat.gui.components.timings_table import TimingsTable
 
@@ -370,6 +371,8 @@ class UIBuilder:
         progress_layout.addWidget(gui_instance.status_log_label)
         gui_instance.status_text = QTextEdit(gui_instance)
         gui_instance.status_text.setReadOnly(True)
+        # Cap the log so long studies don't grow the document without bound
+        gui_instance.status_text.document().setMaximumBlockCount(GUI_STATUS_LOG_MAX_LINES)
         progress_layout.addWidget(gui_instance.status_text)
 
     @staticmethod
@@ -2,7 +2,6 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from goliat.gui.components.plots.utils import get_ntp_utc_time
 from goliat.gui.components.system_monitor import SystemMonitor
 
 if TYPE_CHECKING:
@@ -31,32 +30,32 @@ class UtilizationManager:
     def update(self) -> None:
         """Updates CPU, RAM, and GPU utilization displays.
 
-        Called every second by Qt timer. Gets current utilization values
-        from SystemMonitor and updates the progress bars and labels.
+        Called every second by Qt timer. Reads the latest snapshot from the
+        background hardware sampler and updates the progress bars and labels.
         """
+        # One snapshot per tick: every value comes from the same background sample
+        snapshot = SystemMonitor.snapshot()
+
         # Update CPU utilization
-        cpu_percent = SystemMonitor.get_cpu_utilization()
+        cpu_percent = snapshot.cpu_percent
         self.gui.cpu_bar.setValue(int(cpu_percent))
         self.gui.cpu_bar.setFormat(f"{cpu_percent:.0f}%")
 
         # Update RAM utilization
-        ram_percent_with_cache, _, total_gb = SystemMonitor.get_ram_utilization_detailed()
-        used_gb, _ = SystemMonitor.get_ram_utilization()
-
+        total_gb = snapshot.ram_total_gb
         if total_gb > 0:
-            ram_percent = ram_percent_with_cache
+            ram_percent = snapshot.ram_percent
             self.gui.ram_bar.setValue(int(ram_percent))
-            self.gui.ram_bar.setFormat(f"{used_gb:.1f}/{total_gb:.1f} GB")
+            self.gui.ram_bar.setFormat(f"{snapshot.ram_used_gb:.1f}/{total_gb:.1f} GB")
         else:
             ram_percent = 0.0
             self.gui.ram_bar.setValue(0)
             self.gui.ram_bar.setFormat("N/A")
 
         # Update GPU utilization
-        # Always try to get GPU data, not just when gpu_available is True
+        # Always read GPU data, not just when gpu_available is True
         # This allows recovery after temporary failures
-        gpu_percent: Optional[float] = None
-        gpu_percent = SystemMonitor.get_gpu_utilization()
+        gpu_percent = snapshot.gpu_percent
         if gpu_percent is not None:
             self.gui.gpu_bar.setValue(int(gpu_percent))
             self.gui.gpu_bar.setFormat(f"{gpu_percent:.0f}%")
@@ -71,40 +70,26 @@ class UtilizationManager:
         self._last_ram_percent = ram_percent
         self._last_gpu_percent = gpu_percent
 
-        # Get GPU VRAM utilization for plot (not shown in main tab)
-        # Always try to get VRAM data, not just when gpu_available is True
-        # This allows recovery after temporary failures
-        vram_info = SystemMonitor.get_gpu_vram_utilization()
-        if vram_info is not None:
-            used_vram_gb, total_vram_gb = vram_info
-            if total_vram_gb > 0:
-                self._last_gpu_vram_percent = (used_vram_gb / total_vram_gb) * 100
-                self.gui.gpu_available = True  # Reset to True if we get VRAM data
-            else:
-                self._last_gpu_vram_percent = None
+        # GPU VRAM utilization for plot (not shown in main tab)
+        if snapshot.vram_used_gb is not None and snapshot.vram_total_gb:
+            self._last_gpu_vram_percent = (snapshot.vram_used_gb / snapshot.vram_total_gb) * 100
+            self.gui.gpu_available = True  # Reset to True if we get VRAM data
         else:
             self._last_gpu_vram_percent = None
 
-        # Get disk I/O throughput for plot (not shown in main tab)
-        disk_io = SystemMonitor.get_disk_io_throughput()
-        if disk_io is not None:
-            self._last_disk_read_mbps, self._last_disk_write_mbps = disk_io
-        else:
-            self._last_disk_read_mbps = None
-            self._last_disk_write_mbps = None
-
-        # Get page faults per second for plot (indicates memory pressure)
-        self._last_page_faults_per_sec = SystemMonitor.get_page_faults_per_second()
+        # Disk I/O throughput and page faults for plot (indicates memory pressure)
+        self._last_disk_read_mbps = snapshot.disk_read_mbps
+        self._last_disk_write_mbps = snapshot.disk_write_mbps
+        self._last_page_faults_per_sec = snapshot.page_faults_per_sec
 
     def update_plot(self) -> None:
         """Updates the system utilization plot with current values.
 
         Called less frequently (every 2 seconds) to avoid excessive plot updates.
-        Writes to CSV and adds data point to plot.
+        Records the sample in the telemetry store and redraws the utilization
+        and disk I/O plots from the store's in-memory history.
         """
-        current_time = get_ntp_utc_time()  # Use NTP time (bypasses system clock issues)
-
-        # Write to CSV (includes RAM, GPU VRAM, and disk I/O)
+        # Record sample (includes RAM, GPU VRAM, disk I/O and page faults)
         try:
             self.gui.data_manager.write_system_utilization(
                 self._last_cpu_percent,
@@ -113,51 +98,32 @@ class UtilizationManager:
                 self._last_gpu_vram_percent,
                 self._last_disk_read_mbps,
                 self._last_disk_write_mbps,
+                self._last_page_faults_per_sec,
             )
         except Exception as e:
-            self.gui.verbose_logger.error(f"[UtilizationPlot] CSV write failed: {e}")
+            self.gui.verbose_logger.error(f"[UtilizationPlot] Telemetry write failed: {e}")
+        history = self.gui.data_manager.store.get_series("system_utilization")
 
-        # Add to system utilization plot (CPU, RAM, GPU, VRAM)
+        # Redraw system utilization plot (CPU, RAM, GPU, VRAM)
         if hasattr(self.gui, "system_utilization_plot"):
-            # Get system info for legend
-            from goliat.gui.components.system_monitor import SystemMonitor
-
-            cpu_cores = SystemMonitor.get_cpu_cores()
-            total_ram_gb = SystemMonitor.get_total_ram_gb()
-            gpu_name = SystemMonitor.get_gpu_name()
-
-            # Get GPU VRAM total for legend
-            # Always try to get VRAM info, not just when gpu_available is True
-            total_gpu_vram_gb = 0.0
-            vram_info = SystemMonitor.get_gpu_vram_utilization()
-            if vram_info is not None:
-                _, total_gpu_vram_gb = vram_info
-
+            # System info for legend
+            snapshot = SystemMonitor.snapshot()
             try:
-                self.gui.system_utilization_plot.add_data_point(
-                    timestamp=current_time,
-                    cpu_percent=self._last_cpu_percent,
-                    ram_percent=self._last_ram_percent,
-                    gpu_percent=self._last_gpu_percent,
-                    gpu_vram_percent=self._last_gpu_vram_percent,
-                    cpu_cores=cpu_cores,
-                    total_ram_gb=total_ram_gb,
-                    gpu_name=gpu_name,
-                    total_gpu_vram_gb=total_gpu_vram_gb,
+                self.gui.system_utilization_plot.set_data(
+                    [(t, v[:4]) for t, v in history],
+                    cpu_cores=snapshot.cpu_cores,
+                    total_ram_gb=snapshot.ram_total_gb,
+                    gpu_name=snapshot.gpu_name,
+                    total_gpu_vram_gb=snapshot.vram_total_gb or 0.0,
                 )
             except Exception as e:
-                self.gui.verbose_logger.error(f"[UtilizationPlot] Failed to add plot data point: {e}")
+                self.gui.verbose_logger.error(f"[UtilizationPlot] Failed to refresh plot: {e}")
         else:
             self.gui.verbose_logger.warning("[UtilizationPlot] system_utilization_plot attribute not found on GUI")
 
-        # Add to disk I/O plot (includes page faults on secondary axis)
+        # Redraw disk I/O plot (includes page faults on secondary axis)
         if hasattr(self.gui, "disk_io_plot"):
             try:
-                self.gui.disk_io_plot.add_data_point(
-                    timestamp=current_time,
-                    disk_read_mbps=self._last_disk_read_mbps,
-                    disk_write_mbps=self._last_disk_write_mbps,
-                    page_faults_per_sec=self._last_page_faults_per_sec,
-                )
+                self.gui.disk_io_plot.set_data([(t, v[4:7]) for t, v in history])
             except Exception as e:
-                self.gui.verbose_logger.error(f"[DiskIOPlot] Failed to add plot data point: {e}")
+                self.gui.verbose_logger.error(f"[DiskIOPlot] Failed to refresh plot: {e}")
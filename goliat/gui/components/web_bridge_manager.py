@@ -1,7 +1,7 @@
 """Web bridge manager component for remote monitoring."""
 
 import socket
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
     from goliat.gui.progress_gui import ProgressGUI
@@ -55,7 +55,7 @@ class WebBridgeManager:
 
                 self.web_bridge = WebGUIBridge(self.server_url, self.machine_id)
 
-                # Collect system info
+                # Collect system info without waiting for the GPU; its name follows once detected
                 gpu_name = SystemMonitor.get_gpu_name()
                 cpu_cores = SystemMonitor.get_cpu_cores()
                 total_ram_gb = SystemMonitor.get_total_ram_gb()
@@ -68,6 +68,8 @@ class WebBridgeManager:
                 self.web_bridge.set_connection_callback(self.gui._update_web_status)
                 # start() already sends initial heartbeat, no need to send again
                 self.web_bridge.start()
+                if gpu_name is None and SystemMonitor.has_gpu_backend() and self.web_bridge.request_executor is not None:
+                    self.web_bridge.request_executor.submit(self._send_gpu_name_when_detected, system_info)
 
                 # Initialize screenshot capture
                 self._initialize_screenshot_capture()
@@ -84,6 +86,19 @@ class WebBridgeManager:
             if hasattr(self.gui, "error_counter_label") and hasattr(self.gui, "status_manager"):
                 self.gui._update_web_status(False)
 
+    def _send_gpu_name_when_detected(self, system_info: Dict[str, Any]) -> None:
+        """Waits off the GUI thread for the first GPU reading, then re-sends the system info with the GPU name."""
+        from goliat.gui.components.system_monitor import GPU_DETECTION_TIMEOUT_S, SystemMonitor
+
+        if self.web_bridge is None or not SystemMonitor.is_gpu_available(GPU_DETECTION_TIMEOUT_S):
+            return
+        gpu_name = SystemMonitor.get_gpu_name()
+        if gpu_name:
+            system_info = dict(system_info, gpuName=gpu_name)
+            self.web_bridge.set_system_info(system_info)
+            self.web_bridge.send_heartbeat_with_system_info(system_info)
+            self.gui.verbose_logger.info(f"GPU detected: {gpu_name}")
+
     def sync_progress(self) -> None:
         """Periodically sync actual GUI progress bar values to web dashboard.
 
@@ -120,50 +135,51 @@ class WebBridgeManager:
     def _initialize_screenshot_capture(self) -> None:
         """Initialize screenshot capture timer.
 
-        Sets up a timer to capture screenshots every 1 second (1 FPS)
-        and send them via the web bridge.
+        Sets up a timer that starts a capture cycle every SCREENSHOT_INTERVAL_MS.
+        Changed tabs are encoded off the GUI thread and sent via the web bridge.
         """
         if QTimer is None:
             return
 
         try:
+            from goliat.constants import SCREENSHOT_INTERVAL_MS
             from goliat.gui.components.screenshot_capture import ScreenshotCapture
 
-            self.screenshot_capture = ScreenshotCapture(self.gui)
+            self.screenshot_capture = ScreenshotCapture(self.gui, on_screenshots=self._send_screenshots)
 
-            # Create timer for screenshot capture (0.2 FPS = every 5000ms)
             if QTimer is not None:
                 timer = QTimer(self.gui)
                 timer.timeout.connect(self._capture_and_send_screenshots)
-                timer.start(5000)  # 5 seconds interval
+                timer.start(SCREENSHOT_INTERVAL_MS)
                 self.screenshot_timer = timer
 
-            self.gui.verbose_logger.info("Screenshot capture initialized (0.2 FPS)")
+            self.gui.verbose_logger.info(f"Screenshot capture initialized (every {SCREENSHOT_INTERVAL_MS / 1000:g} s, changed tabs only)")
 
         except Exception as e:
             self.gui.verbose_logger.warning(f"Failed to initialize screenshot capture: {e}. Continuing without screenshots.")
 
     def _capture_and_send_screenshots(self) -> None:
-        """Capture screenshots and send via web bridge.
+        """Start a screenshot capture cycle.
 
-        Called by QTimer every second. Captures all tabs asynchronously
-        and enqueues them for sending via the web bridge.
+        Called by QTimer. Only renders the tabs on the GUI thread; diffing,
+        encoding and the hand-off to `_send_screenshots` run on the capture
+        worker thread.
         """
         if self.web_bridge is None or self.screenshot_capture is None:
             return
 
         try:
-            screenshots = self.screenshot_capture.capture_all_tabs()
-
-            if screenshots:
-                # Enqueue screenshots message for web bridge
-                self.web_bridge.enqueue({"type": "gui_screenshots", "screenshots": screenshots})
-
+            self.screenshot_capture.capture_cycle()
         except Exception as e:
             # Don't let screenshot failures break the GUI
             if hasattr(self.gui, "verbose_logger"):
                 self.gui.verbose_logger.debug(f"Failed to capture/send screenshots: {e}")
 
+    def _send_screenshots(self, screenshots: Dict[str, bytes]) -> None:
+        """Enqueue changed screenshots for the web bridge (called from the capture worker)."""
+        if self.web_bridge is not None:
+            self.web_bridge.enqueue({"type": "gui_screenshots", "screenshots": screenshots})
+
     def stop(self) -> None:
         """Stops the web bridge and screenshot capture."""
         # Stop screenshot timer
@@ -173,6 +189,8 @@ class WebBridgeManager:
             except Exception as e:
                 if hasattr(self.gui, "verbose_logger"):
                     self.gui.verbose_logger.warning(f"Error stopping screenshot timer: {e}")
+        if self.screenshot_capture is not None:
+            self.screenshot_capture.close()
 
         # Stop web bridge
         if self.web_bridge is not None:
@@ -5,7 +5,7 @@ import os
 import time
 from multiprocessing import Process, Queue
 from multiprocessing.synchronize import Event
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import matplotlib
 
@@ -29,12 +29,13 @@ except ImportError:
 from goliat.gui.components.clock_manager import ClockManager
 from goliat.gui.components.data_manager import DataManager
 from goliat.gui.components.graph_manager import GraphManager
+from goliat.gui.components.hardware_sampler import stop_hardware_sampler
 from goliat.gui.components.machine_id_detector import MachineIdDetector
 from goliat.gui.components.progress_animation import ProgressAnimation
 from goliat.gui.components.progress_manager import ProgressManager
 from goliat.gui.components.queue_handler import QueueHandler
 from goliat.gui.components.status_manager import StatusManager
-from goliat.gui.components.system_monitor import PSUTIL_AVAILABLE, SystemMonitor
+from goliat.gui.components.system_monitor import SystemMonitor
 from goliat.gui.components.tray_manager import TrayManager
 from goliat.gui.components.ui_builder import UIBuilder
 from goliat.gui.components.utilization_manager import UtilizationManager
@@ -55,7 +56,7 @@ class ProgressGUI(QWidget):  # type: ignore[misc]
     The GUI architecture:
     - Main window runs in main process, worker runs in separate process
     - Communication via multiprocessing.Queue for thread-safe message passing
-    - QueueHandler polls queue every 100ms and updates UI
+    - QueueHandler polls queue every 100ms, coalesces messages and updates UI
     - Multiple timers handle different update frequencies (queue, clock, graphs)
 
     Features:
@@ -200,18 +201,8 @@ class ProgressGUI(QWidget):  # type: ignore[misc]
 
     def _initialize_system_monitoring(self) -> None:
         """Initializes system monitoring (GPU availability, CPU measurement)."""
-        # Initialize GPU availability check
-        # SystemMonitor is imported at module level, so it's always available
-        self.gpu_available: bool = SystemMonitor.is_gpu_available()  # type: ignore[possibly-unbound]
-
-        # Initialize CPU measurement (first call needs to be blocking)
-        if PSUTIL_AVAILABLE:
-            try:
-                import psutil
-
-                psutil.cpu_percent(interval=0.1)  # Initialize measurement
-            except Exception:
-                pass
+        # Does not wait for the first GPU reading; UtilizationManager sets the flag once one arrives
+        self.gpu_available: bool = SystemMonitor.is_gpu_available()
 
     def update_overall_progress(self, current_step: float, total_steps: int) -> None:
         """Updates overall progress bar across all simulations."""
@@ -271,8 +262,18 @@ class ProgressGUI(QWidget):  # type: ignore[misc]
             message: Message text.
             log_type: Log type for color coding.
         """
-        self.status_manager.record_log(log_type)
-        # Update error counter with current web status
+        self.update_status_batch([(message, log_type)])
+
+    def update_status_batch(self, entries: List[Tuple[str, str]]) -> None:
+        """Appends several status messages with a single repaint.
+
+        Used by QueueHandler to flush all log lines received in one tick.
+
+        Args:
+            entries: (message, log_type) pairs in arrival order.
+        """
+        for _, log_type in entries:
+            self.status_manager.record_log(log_type)
         web_connected = False
         if (
             hasattr(self, "web_bridge_manager")
@@ -281,8 +282,12 @@ class ProgressGUI(QWidget):  # type: ignore[misc]
         ):
             web_connected = self.web_bridge_manager.web_bridge.is_connected
         self.error_counter_label.setText(self.status_manager.get_error_summary(web_connected=web_connected))
-        formatted_message = self.status_manager.format_message(message, log_type)
-        self.status_text.append(formatted_message)
+        self.status_text.setUpdatesEnabled(False)
+        try:
+            for message, log_type in entries:
+                self.status_text.append(self.status_manager.format_message(message, log_type))
+        finally:
+            self.status_text.setUpdatesEnabled(True)
 
     def update_utilization(self) -> None:
         """Updates CPU, RAM, and GPU utilization displays."""
@@ -354,6 +359,7 @@ class ProgressGUI(QWidget):  # type: ignore[misc]
         self.utilization_plot_timer.stop()
         self.progress_sync_timer.stop()
         self.progress_animation.stop()
+        self.data_manager.close()
         if not error:
             self.update_status("--- Study Finished ---", log_type="success")
             self.overall_progress_bar.setValue(self.overall_progress_bar.maximum())
@@ -413,5 +419,11 @@ class ProgressGUI(QWidget):  # type: ignore[misc]
         # Stop web bridge if enabled
         self.web_bridge_manager.stop()
 
+        # Persist buffered telemetry samples
+        self.data_manager.close()
+
+        # Stop hardware sampling (terminates the nvidia-smi process, if any)
+        stop_hardware_sampler()
+
         shutdown_loggers()
         event.accept()
@@ -147,8 +147,12 @@ class QueueGUI(LoggingMixin):
         self.queue.put({"type": "end_animation"})
 
     def update_profiler(self) -> None:
-        """Sends profiler state to GUI for ETA display."""
-        self.queue.put({"type": "profiler_update", "profiler": self.profiler})
+        """Sends a serialized profiler snapshot to GUI for ETA display.
+
+        The live profiler carries a subtask stack and config path the GUI never
+        uses; the snapshot keeps queue payloads small and picklable.
+        """
+        self.queue.put({"type": "profiler_update", "profiler": self.profiler.snapshot()})
 
     def process_events(self) -> None:
         """No-op for interface compatibility with ProgressGUI."""
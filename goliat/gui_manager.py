@@ -1,16 +1,32 @@
 """Main GUI manager module."""
 
-# Re-export QueueGUI for backward compatibility
-# Handle missing PySide6 in CI/test environments
-try:
-    from goliat.gui.queue_gui import QueueGUI
-except ImportError:
-    QueueGUI = None
+import importlib
+from typing import TYPE_CHECKING
+
+# Re-export the GUI classes for backward compatibility. They are imported on
+# first access because PySide6 and matplotlib dominate start-up time.
+_LAZY_EXPORTS = {
+    "QueueGUI": "goliat.gui.queue_gui",
+    "ProgressGUI": "goliat.gui.progress_gui",
+}
+"""Public name -> module that defines it."""
 
-try:
+if TYPE_CHECKING:
     from goliat.gui.progress_gui import ProgressGUI
-except (ImportError, ModuleNotFoundError):
-    # In CI/test environments where PySide6 is not available
-    ProgressGUI = None
+    from goliat.gui.queue_gui import QueueGUI
+
+
+def __getattr__(name: str):
+    """Imports a GUI class on first access; None in CI/test environments without PySide6."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
 
 __all__ = ["QueueGUI", "ProgressGUI"]
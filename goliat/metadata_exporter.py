@@ -2,8 +2,9 @@
 Simulation Metadata Exporter.
 
 Exports simulation metadata to pickle and JSON files at the end of extraction.
-Captures timing data, performance metrics, file sizes, and grid information
-for post-hoc analysis.
+Captures timing data, per-phase and per-subtask resource usage, performance
+metrics, file sizes, and grid information for post-hoc analysis. Optionally appends the same metadata to the
+partitioned Parquet store in `goliat.perf_store`, which `goliat perf` reads.
 """
 
 import glob
@@ -21,13 +22,20 @@ if TYPE_CHECKING:
 
 @dataclass
 class TimingBreakdown:
-    """Breakdown of timing data for a single phase."""
+    """Breakdown of timing data for a single phase.
+
+    `resources` and `subtask_resources` hold `ResourceUsage.as_dict()` of the
+    phase and of each subtask: CPU time, peak RSS, MB read and written, and
+    sampled stacks when `execution_control.sample_stacks` is enabled.
+    """
 
     phase_name: str
     avg_time_s: float
     total_time_s: float
     num_executions: int
     subtasks: dict[str, float] = field(default_factory=dict)
+    resources: Optional[dict] = None
+    subtask_resources: dict[str, dict] = field(default_factory=dict)
 
 
 @dataclass
@@ -137,6 +145,7 @@ class MetadataExporter:
         config_path: Optional[str] = None,
         extract_sar: bool = True,
         extract_sapd: bool = False,
+        store_dir: Optional[str] = None,
     ):
         """Initialize the exporter.
 
@@ -150,6 +159,7 @@ class MetadataExporter:
             config_path: Path to the config file.
             extract_sar: Whether SAR extraction was enabled.
             extract_sapd: Whether SAPD extraction was enabled.
+            store_dir: Performance store to append the metadata to, if any.
         """
         self.profiler = profiler
         self.project_path = project_path
@@ -161,6 +171,7 @@ class MetadataExporter:
         self.config_path = config_path
         self.extract_sar = extract_sar
         self.extract_sapd = extract_sapd
+        self.store_dir = store_dir
         self.logger = logging.getLogger("progress")
         self.verbose_logger = logging.getLogger("verbose")
 
@@ -174,7 +185,7 @@ class MetadataExporter:
             return None, None
 
         try:
-            metadata = self._collect_metadata()
+            metadata = asdict(self._collect_metadata())
 
             # Save metadata files in the project directory (same level as .smash file)
             os.makedirs(self.project_dir, exist_ok=True)
@@ -182,12 +193,15 @@ class MetadataExporter:
             # Export to pickle
             pickle_path = os.path.join(self.project_dir, "simulation_metadata.pkl")
             with open(pickle_path, "wb") as f:
-                pickle.dump(asdict(metadata), f)
+                pickle.dump(metadata, f)
 
             # Export to JSON
             json_path = os.path.join(self.project_dir, "simulation_metadata.json")
             with open(json_path, "w") as f:
-                json.dump(asdict(metadata), f, indent=2, default=str)
+                json.dump(metadata, f, indent=2, default=str)
+
+            if self.store_dir:
+                self._append_to_store(metadata)
 
             self.logger.info("    - Metadata extraction completed.", extra={"log_type": "success"})
             return pickle_path, json_path
@@ -196,6 +210,18 @@ class MetadataExporter:
             self.verbose_logger.error(f"Metadata export failed: {e}")
             return None, None
 
+    def _append_to_store(self, metadata: dict):
+        """Appends the metadata to the performance store; failures only cost the store row."""
+        try:
+            from .perf_store import append_metadata
+
+            path = append_metadata(self.store_dir, metadata)
+            self.verbose_logger.debug(f"Appended metadata to performance store: {path}")
+        except Exception as e:
+            self.verbose_logger.warning(
+                f"Could not append metadata to performance store {self.store_dir}: {e}", extra={"log_type": "warning"}
+            )
+
     def _collect_metadata(self) -> SimulationMetadata:
         """Collect all metadata from various sources."""
         timing = self._extract_timing_data()
@@ -250,8 +276,12 @@ class MetadataExporter:
                 this_sim_time = 0.0
                 num_executions = 0
 
+            usages = self.profiler.subtask_resources.get(phase, [])
+            phase_resources = usages[-1].as_dict() if usages else None
+
             # Extract subtasks for this phase - get the LAST raw time, not the average
             subtasks = {}
+            subtask_resources = {}
             for key in self.profiler.subtask_times.keys():
                 # Match subtasks that belong to this phase (e.g., "run_isolve_execution")
                 if key.startswith(f"{phase}_"):
@@ -262,6 +292,9 @@ class MetadataExporter:
                         if subtask_times:
                             # Use the LAST entry (current simulation's time)
                             subtasks[subtask_name] = subtask_times[-1]
+                        subtask_usages = self.profiler.subtask_resources.get(key, [])
+                        if subtask_usages:
+                            subtask_resources[subtask_name] = subtask_usages[-1].as_dict()
 
             timing[phase] = TimingBreakdown(
                 phase_name=phase,
@@ -269,6 +302,8 @@ class MetadataExporter:
                 total_time_s=this_sim_time,  # For single sim, total = actual time
                 num_executions=num_executions,
                 subtasks=subtasks,
+                resources=phase_resources,
+                subtask_resources=subtask_resources,
             )
 
         return timing
@@ -441,6 +476,7 @@ def export_simulation_metadata(
     config_path: Optional[str] = None,
     extract_sar: bool = True,
     extract_sapd: bool = False,
+    store_dir: Optional[str] = None,
 ) -> tuple[Optional[str], Optional[str]]:
     """Convenience function to export simulation metadata.
 
@@ -454,6 +490,7 @@ def export_simulation_metadata(
         config_path: Path to the config file.
         extract_sar: Whether SAR extraction was enabled.
         extract_sapd: Whether SAPD extraction was enabled.
+        store_dir: Performance store to append the metadata to, if any.
 
     Returns:
         Tuple of (pickle_path, json_path) or (None, None) if export failed.
@@ -468,5 +505,6 @@ def export_simulation_metadata(
         config_path=config_path,
         extract_sar=extract_sar,
         extract_sapd=extract_sapd,
+        store_dir=store_dir,
     )
     return exporter.export()
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 import colorama
 
 from goliat.osparc_batch.logging_utils import setup_console_logging
+from goliat.results import get_catalog
 
 if TYPE_CHECKING:
     from goliat.config import Config
@@ -12,6 +13,19 @@ if TYPE_CHECKING:
 main_logger = setup_console_logging()
 
 
+def _list_input_files(results_base_dir: Path, project_dir: Path, results_folder: Path) -> list[Path] | None:
+    """Lists the `*_Input.h5` files of a results folder from the results catalog.
+
+    Returns:
+        The input files, or None if the results folder does not exist.
+    """
+    catalog = get_catalog(str(results_base_dir))
+    entry = catalog.simulation(str(project_dir))
+    if entry is None or not catalog.is_dir(str(results_folder)):
+        return None
+    return [Path(info.path) for info in entry.select("_Input.h5", subdir=results_folder.name)]
+
+
 def _select_input_file(found_files: list[Path], results_folder: Path) -> Path:
     """Selects the most recent input file from multiple candidates and cleans up older files.
 
@@ -70,6 +84,9 @@ def find_input_files(config: "Config") -> list[Path]:
     if not all([study_type, phantoms]):
         raise ValueError("Config must specify 'study_type' and 'phantoms'.")
 
+    # One incremental scan of the study's subtree instead of a stat and glob per placement
+    get_catalog(str(results_base_dir)).refresh(under=study_type)
+
     all_input_files: list[Path] = []
     if phantoms:
         for phantom in phantoms:
@@ -126,11 +143,11 @@ def _find_far_field_input_files(config: "Config", results_base_dir: Path, phanto
             project_filename_base = f"far_field_{phantom.lower()}_{freq}MHz_{placement_name}"
             results_folder = project_dir / f"{project_filename_base}.smash_Results"
 
-            if not results_folder.exists():
+            found_files = _list_input_files(results_base_dir, project_dir, results_folder)
+            if found_files is None:
                 main_logger.warning(f"{colorama.Fore.YELLOW}WARNING: Results directory does not exist: {results_folder}")
                 continue
 
-            found_files = list(results_folder.glob("*_Input.h5"))
             if not found_files:
                 main_logger.warning(f"{colorama.Fore.YELLOW}WARNING: No input files found in: {results_folder}")
                 continue
@@ -184,11 +201,11 @@ def _find_near_field_input_files(config: "Config", results_base_dir: Path, phant
         project_filename_base = f"near_field_{phantom.lower()}_{freq}MHz_{placement_name}"
         results_folder = project_dir / f"{project_filename_base}.smash_Results"
 
-        if not results_folder.exists():
+        found_files = _list_input_files(results_base_dir, project_dir, results_folder)
+        if found_files is None:
             main_logger.warning(f"{colorama.Fore.YELLOW}WARNING: Results directory does not exist: {results_folder}")
             continue
 
-        found_files = list(results_folder.glob("*_Input.h5"))
         if not found_files:
             main_logger.warning(f"{colorama.Fore.YELLOW}WARNING: No input files found in: {results_folder}")
             continue
@@ -0,0 +1,86 @@
+"""Concurrent oSPARC job status polling over a persistent API client."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
+
+from goliat.constants import OSPARC_STATUS_POLL_CONCURRENCY
+from goliat.osparc_batch.transfer import create_download_session
+
+
+class StatusBuffer:
+    """Thread-safe buffer of job status changes, drained once per monitor tick.
+
+    Download and extraction threads report status through `emit` (the same
+    call signature as the Qt signal used before), and the worker applies the
+    latest status of each job in one go instead of one queued signal per
+    change.
+    """
+
+    def __init__(self):
+        """Creates an empty buffer."""
+        self._lock = threading.Lock()
+        self._pending: dict[str, str] = {}
+
+    def emit(self, job_id: str, status: str) -> None:
+        """Records a status change; a later change for the same job replaces it."""
+        with self._lock:
+            self._pending[job_id] = status
+
+    def drain(self) -> dict[str, str]:
+        """Returns and clears all pending status changes."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+
+class JobMonitor:
+    """Owns the oSPARC API client, HTTP session and thread pool for a batch run.
+
+    One ApiClient is opened for the whole run instead of once per timer tick,
+    and `poll` inspects all active jobs in parallel with bounded concurrency.
+    """
+
+    def __init__(self, client_cfg, osparc_module, max_concurrent_polls: int = OSPARC_STATUS_POLL_CONCURRENCY):
+        """Opens the API client.
+
+        Args:
+            client_cfg: osparc.Configuration.
+            osparc_module: The osparc package (or a compatible fake for tests).
+            max_concurrent_polls: Maximum simultaneous inspect_job requests.
+        """
+        # Let urllib3 keep one connection per polling thread alive
+        client_cfg.connection_pool_maxsize = max(getattr(client_cfg, "connection_pool_maxsize", 0) or 0, max_concurrent_polls)
+        self.client_cfg = client_cfg
+        self.api_client = osparc_module.ApiClient(client_cfg)
+        self.solvers_api = osparc_module.SolversApi(self.api_client)
+        self.session = create_download_session(client_cfg)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_polls, thread_name_prefix="osparc-poll")
+
+    def _inspect(self, job, solver) -> Any:
+        """Returns the job status, or the exception raised while fetching it."""
+        try:
+            return self.solvers_api.inspect_job(solver.id, solver.version, job.id)
+        except Exception as e:
+            return e
+
+    def poll(self, jobs: Iterable[tuple[Any, Any, Any]]) -> list[tuple[Any, Any, Any, Any]]:
+        """Inspects jobs concurrently.
+
+        Args:
+            jobs: (key, job, solver) tuples; the key is passed through untouched.
+
+        Returns:
+            (key, job, solver, status_or_exception) tuples in input order.
+        """
+        jobs = list(jobs)
+        statuses = self._executor.map(lambda item: self._inspect(item[1], item[2]), jobs)
+        return [(key, job, solver, status) for (key, job, solver), status in zip(jobs, statuses)]
+
+    def close(self) -> None:
+        """Stops the polling threads and closes the API client and HTTP session."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        close = getattr(self.api_client, "close", None)
+        if close:
+            close()
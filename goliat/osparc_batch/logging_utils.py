@@ -48,6 +48,7 @@ STATUS_COLORS = {
     "FAILED": colorama.Fore.RED,
     "RETRYING": colorama.Fore.LIGHTRED_EX,
     "DOWNLOADING": colorama.Fore.BLUE,
+    "EXTRACTING": colorama.Fore.LIGHTBLUE_EX,
     "FINISHED": colorama.Fore.GREEN,
     "COMPLETED": colorama.Fore.GREEN,
     "UNKNOWN": colorama.Fore.WHITE,
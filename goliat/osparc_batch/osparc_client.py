@@ -1,12 +1,11 @@
 import logging
-import os
-import shutil
 import traceback
-import zipfile
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from goliat.osparc_batch.logging_utils import setup_console_logging
+from goliat.osparc_batch.transfer import create_download_session, download_resumable, extract_results_archive, file_content_url
 
 if TYPE_CHECKING:
     import osparc
@@ -87,62 +86,92 @@ def download_and_process_results(
     input_file_path: Path,
     osparc_module,
     status_callback=None,
+    solvers_api=None,
+    session=None,
+    extract_executor: Optional[Executor] = None,
 ):
-    """Downloads and processes the results for a single job."""
+    """Downloads and processes the results for a single job.
+
+    Result files are streamed to disk with resume and checksum verification.
+    Archives are extracted on `extract_executor` when one is given, so the
+    calling download thread can move on to the next job while the previous
+    archive is still being unpacked.
+
+    Args:
+        job: Finished oSPARC job.
+        solver: Solver the job ran on.
+        client_cfg: oSPARC client configuration.
+        input_file_path: Input file of the job; results are placed next to it.
+        osparc_module: The osparc package.
+        status_callback: Object with an `emit(job_id, status)` method.
+        solvers_api: Shared SolversApi; a temporary client is opened if None.
+        session: Shared HTTP session for downloads; a temporary one is created if None.
+        extract_executor: Executor for archive extraction; extracts inline if None.
+
+    Returns:
+        Future of the pending extraction, or None if nothing is pending.
+    """
     job_logger = logging.getLogger(f"job_{job.id}")
-    try:
-        with osparc_module.ApiClient(client_cfg) as api_client:
-            files_api = osparc_module.FilesApi(api_client)
-            solvers_api = osparc_module.SolversApi(api_client)
 
-            job_logger.info(f"--- Downloading results for job {job.id} ---")
-            if status_callback:
-                status_callback.emit(job.id, "DOWNLOADING")
-            outputs = solvers_api.get_job_outputs(solver.id, solver.version, job.id)
+    def _report(status: str):
+        if status_callback:
+            status_callback.emit(job.id, status)
 
-            output_dir = input_file_path.parent
+    try:
+        job_logger.info(f"--- Downloading results for job {job.id} ---")
+        _report("DOWNLOADING")
+        if solvers_api is None:
+            with osparc_module.ApiClient(client_cfg) as api_client:
+                outputs = osparc_module.SolversApi(api_client).get_job_outputs(solver.id, solver.version, job.id)
+        else:
+            outputs = solvers_api.get_job_outputs(solver.id, solver.version, job.id)
 
+        output_dir = input_file_path.parent
+        uuid = input_file_path.stem.replace("_Input", "")
+        temp_dir = Path(client_cfg.temp_folder_path or output_dir)
+        own_session = session is None
+        session = session or create_download_session(client_cfg)
+        archives = []
+        try:
             for output_name, result_file in outputs.results.items():
                 job_logger.info(f"Downloading {output_name} for job {job.id}...")
-
-                download_path = files_api.download_file(file_id=result_file.id)
+                url = file_content_url(client_cfg.host, result_file.id)
+                checksum = getattr(result_file, "checksum", None)
 
                 if result_file.filename.endswith(".zip"):
-                    job_logger.info(f"Extracting {result_file.filename} to {output_dir}")
-                    with zipfile.ZipFile(download_path, "r") as zip_ref:
-                        zip_ref.extractall(output_dir)
-
-                        # --- Enhanced Log File Handling ---
-                        uuid = input_file_path.stem.replace("_Input", "")
-                        extracted_files = zip_ref.namelist()
-
-                        for filename in extracted_files:
-                            if filename.endswith(".log"):
-                                extracted_path = output_dir / filename
-                                if "input.log" in filename:
-                                    new_name = f"iSolve-output-{uuid}.log"
-                                else:
-                                    new_name = f"{uuid}_AxLog.log"
-
-                                final_log_path = output_dir / new_name
-                                shutil.move(extracted_path, final_log_path)
-                                job_logger.info(f"Renamed and moved log file to {final_log_path}")
-
-                    os.remove(download_path)
+                    # Keyed by file id so an interrupted download of the same file resumes
+                    zip_path = temp_dir / f"{result_file.id}_{result_file.filename}"
+                    download_resumable(session, url, zip_path, expected_sha256=checksum, logger=job_logger)
+                    archives.append(zip_path)
                 else:
                     if "output.h5" in result_file.filename:
                         output_filename = input_file_path.stem.replace("_Input", "_Output") + ".h5"
                     else:
                         output_filename = result_file.filename
-
-                    final_path = output_dir / output_filename
-                    shutil.move(download_path, final_path)
+                    final_path = download_resumable(session, url, output_dir / output_filename, expected_sha256=checksum, logger=job_logger)
                     job_logger.info(f"Saved {output_name} to {final_path}")
-
-                if status_callback:
-                    status_callback.emit(job.id, "COMPLETED")
+        finally:
+            if own_session:
+                session.close()
+
+        def _extract_and_complete():
+            try:
+                for zip_path in archives:
+                    job_logger.info(f"Extracting {zip_path.name} to {output_dir}")
+                    for path in extract_results_archive(zip_path, output_dir, uuid, logger=job_logger):
+                        if path.suffix == ".log":
+                            job_logger.info(f"Renamed and moved log file to {path}")
+                _report("COMPLETED")
+            except Exception as e:
+                job_logger.error(f"Could not extract results for job {job.id}: {e}\n{traceback.format_exc()}")
+                _report("FAILED")
+
+        if archives and extract_executor is not None:
+            _report("EXTRACTING")
+            return extract_executor.submit(_extract_and_complete)
+        _extract_and_complete()
 
     except Exception as e:
         job_logger.error(f"Could not retrieve results for job {job.id}: {e}\n{traceback.format_exc()}")
-        if status_callback:
-            status_callback.emit(job.id, "FAILED")
+        _report("FAILED")
+    return None
@@ -0,0 +1,193 @@
+"""Resumable, checksummed result downloads and streaming archive extraction for oSPARC jobs."""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from goliat.constants import OSPARC_DOWNLOAD_CHUNK_BYTES, OSPARC_DOWNLOAD_MAX_ATTEMPTS
+
+_COPY_BUFFER_BYTES = 1024 * 1024
+_CONTENT_RANGE_TOTAL = re.compile(r"/(\d+)$")
+
+
+class DownloadError(RuntimeError):
+    """Raised when a download cannot be completed or fails its checksum."""
+
+
+def file_content_url(host: str, file_id: str) -> str:
+    """Returns the oSPARC API URL that serves (or redirects to) a file's content."""
+    return f"{host.rstrip('/')}/v0/files/{file_id}/content"
+
+
+def create_download_session(client_cfg) -> requests.Session:
+    """Creates a keep-alive HTTP session authenticated like the oSPARC API client.
+
+    Args:
+        client_cfg: osparc.Configuration with the API key as username and secret as password.
+
+    Returns:
+        A requests session reused for all downloads.
+    """
+    session = requests.Session()
+    session.auth = (client_cfg.username, client_cfg.password)
+    return session
+
+
+def _hash_file(path: Path, hasher) -> None:
+    """Feeds an existing file into a hash object."""
+    with open(path, "rb") as f:
+        while chunk := f.read(_COPY_BUFFER_BYTES):
+            hasher.update(chunk)
+
+
+def _expected_total(response: requests.Response, offset: int) -> Optional[int]:
+    """Total file size announced by the server, if any."""
+    content_range = response.headers.get("Content-Range")
+    if content_range:
+        match = _CONTENT_RANGE_TOTAL.search(content_range)
+        if match:
+            return int(match.group(1))
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None:
+        return offset + int(content_length)
+    return None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed request is worth resuming: connection trouble, or a 5xx or 429 response."""
+    if not isinstance(error, requests.HTTPError):
+        return True
+    status = error.response.status_code if error.response is not None else None
+    return status is not None and (status >= 500 or status == 429)
+
+
+def download_resumable(
+    session: requests.Session,
+    url: str,
+    dest_path: Path,
+    expected_sha256: Optional[str] = None,
+    chunk_size: int = OSPARC_DOWNLOAD_CHUNK_BYTES,
+    max_attempts: int = OSPARC_DOWNLOAD_MAX_ATTEMPTS,
+    timeout: float = 60.0,
+    logger: Optional[logging.Logger] = None,
+) -> Path:
+    """Streams a file to disk, resuming from a partial `.part` file with HTTP range requests.
+
+    The partial file survives dropped connections and restarts of the batch
+    run, so a multi-GB download continues where it stopped instead of
+    starting from zero. The SHA-256 is computed while streaming and checked
+    before the file is moved into place.
+
+    Args:
+        session: HTTP session (see `create_download_session`).
+        url: File content URL.
+        dest_path: Final file path.
+        expected_sha256: Hex digest to verify, if the API provided one.
+        chunk_size: Bytes written per chunk.
+        max_attempts: Connection attempts before giving up.
+        timeout: Socket timeout in seconds.
+        logger: Logger for retry messages.
+
+    Returns:
+        dest_path, once the complete file is in place.
+
+    Raises:
+        DownloadError: If all attempts fail or the checksum does not match.
+        requests.HTTPError: On a 4xx response other than 429, without retrying.
+    """
+    logger = logger or logging.getLogger("osparc_batch")
+    dest_path = Path(dest_path)
+    part_path = dest_path.with_name(dest_path.name + ".part")
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    for attempt in range(1, max_attempts + 1):
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        hasher = hashlib.sha256()
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                if response.status_code == 416:  # Range starts at the end: the part file is already complete
+                    _hash_file(part_path, hasher)
+                    break
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    offset = 0  # Server ignored the range; start over
+                if offset:
+                    _hash_file(part_path, hasher)
+                total = _expected_total(response, offset)
+
+                written = offset
+                with open(part_path, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        written += len(chunk)
+            if total is not None and written < total:
+                raise requests.ConnectionError(f"Connection closed after {written} of {total} bytes")
+            break
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, requests.HTTPError) as e:
+            if not _is_transient(e):
+                raise
+            if attempt == max_attempts:
+                raise DownloadError(f"Download of {dest_path.name} failed after {max_attempts} attempts: {e}") from e
+            delay = min(2**attempt, 30)
+            logger.warning(f"Download of {dest_path.name} interrupted ({e}); resuming in {delay}s (attempt {attempt + 1}/{max_attempts})")
+            time.sleep(delay)
+
+    if expected_sha256 and hasher.hexdigest() != expected_sha256.lower():
+        part_path.unlink(missing_ok=True)
+        raise DownloadError(f"Checksum mismatch for {dest_path.name}: expected {expected_sha256}, got {hasher.hexdigest()}")
+
+    os.replace(part_path, dest_path)
+    return dest_path
+
+
+def extract_results_archive(zip_path: Path, output_dir: Path, uuid: str, logger: Optional[logging.Logger] = None) -> list[Path]:
+    """Extracts a result archive member by member, renaming solver logs on the way.
+
+    Members are streamed straight to their final names, so there is no
+    `extractall` followed by a second move of the log files. Each member is
+    written to a temporary name and renamed, so an interrupted extraction
+    never leaves a truncated file under the final name.
+
+    Args:
+        zip_path: Downloaded archive; deleted after extraction.
+        output_dir: Directory the results belong in.
+        uuid: Simulation id, used for the log file names.
+        logger: Logger for progress messages.
+
+    Returns:
+        Paths of the extracted files.
+    """
+    logger = logger or logging.getLogger("osparc_batch")
+    output_dir = Path(output_dir)
+    root = output_dir.resolve()
+    extracted = []
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for member in zip_ref.infolist():
+            if member.is_dir():
+                continue
+            if member.filename.endswith(".log"):
+                target = output_dir / (f"iSolve-output-{uuid}.log" if "input.log" in member.filename else f"{uuid}_AxLog.log")
+            else:
+                target = output_dir / member.filename
+            if not target.resolve().is_relative_to(root):
+                logger.warning(f"Skipping archive member outside the output directory: {member.filename}")
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_target = target.with_name(target.name + ".extracting")
+            with zip_ref.open(member) as src, open(tmp_target, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_BYTES)
+            os.replace(tmp_target, target)
+            extracted.append(target)
+    os.remove(zip_path)
+    return extracted
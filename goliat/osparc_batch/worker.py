@@ -7,13 +7,15 @@ from typing import Any, Callable
 
 from PySide6.QtCore import QObject, QTimer, Signal, Slot
 
+from goliat.constants import OSPARC_DOWNLOAD_CONCURRENCY, OSPARC_EXTRACT_CONCURRENCY
+from goliat.osparc_batch.job_monitor import JobMonitor, StatusBuffer
+
 
 class Worker(QObject):
     """Worker thread for oSPARC batch logic, polling, and downloads."""
 
     finished = Signal()
     progress = Signal(str)
-    status_update_requested = Signal(str, str)
 
     def __init__(
         self,
@@ -45,104 +47,138 @@ class Worker(QObject):
         self.jobs_being_downloaded = set()
         self.file_retries = {}  # Correct: Associate retries with the file path
         self.client_cfg = None
+        self.monitor = None  # JobMonitor, created on the first status check
+        self.status_buffer = StatusBuffer()
 
         # Executors and timers
-        self.download_executor = ThreadPoolExecutor(max_workers=4)
+        self.download_executor = ThreadPoolExecutor(max_workers=OSPARC_DOWNLOAD_CONCURRENCY, thread_name_prefix="osparc-download")
+        self.extract_executor = ThreadPoolExecutor(max_workers=OSPARC_EXTRACT_CONCURRENCY, thread_name_prefix="osparc-extract")
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._check_jobs_status)
-        self.status_update_requested.connect(self._update_job_status)
 
     def run(self):
         """Starts the long-running task."""
         self.main_process_logic(self)
 
     def _download_job_in_thread(self, job, solver, file_path: Path):
-        """Runs a single download in a thread."""
+        """Runs a single download in a thread; extraction continues on the extract executor."""
         import osparc as osparc_module
 
+        extraction = None
         try:
             client_cfg = self.get_osparc_client_config(self.config, osparc_module)
-            self.download_and_process_results(
+            extraction = self.download_and_process_results(
                 job,
                 solver,
                 client_cfg,
                 file_path,
                 osparc_module,
-                self.status_update_requested,
+                self.status_buffer,
+                solvers_api=self.monitor.solvers_api if self.monitor else None,
+                session=self.monitor.session if self.monitor else None,
+                extract_executor=self.extract_executor,
             )
         except Exception as e:
             job_logger = logging.getLogger(f"job_{job.id}")
             job_logger.error(f"Error during download for job {job.id}: {e}\n{traceback.format_exc()}")
-            self.status_update_requested.emit(job.id, "FAILED")
+            self.status_buffer.emit(job.id, "FAILED")
         finally:
-            if job.id in self.jobs_being_downloaded:
-                self.jobs_being_downloaded.remove(job.id)
-            self.downloaded_jobs.add(job.id)
+            if extraction is not None:
+                extraction.add_done_callback(lambda _future: self._mark_job_done(job.id))
+            else:
+                self._mark_job_done(job.id)
+
+    def _mark_job_done(self, job_id: str):
+        """Marks a job's results as fully downloaded and extracted (or failed)."""
+        self.jobs_being_downloaded.discard(job_id)
+        self.downloaded_jobs.add(job_id)
+
+    def _apply_buffered_statuses(self):
+        """Applies the status changes reported by download threads since the last tick."""
+        for job_id, status in self.status_buffer.drain().items():
+            self._update_job_status(job_id, status)
+
+    def _shutdown_transfers(self, wait: bool = True):
+        """Stops the download and extraction pools and closes the API client."""
+        self.download_executor.shutdown(wait=wait, cancel_futures=not wait)
+        self.extract_executor.shutdown(wait=wait, cancel_futures=not wait)
+        if self.monitor is not None:
+            self.monitor.close()
+            self.monitor = None
 
     def _check_jobs_status(self):
-        """Periodically checks the status of running jobs."""
+        """Periodically checks the status of running jobs.
+
+        All active jobs are inspected concurrently over the run's persistent
+        API client, and status changes reported by download threads are
+        applied once per tick.
+        """
+        self._apply_buffered_statuses()
         if self.stop_requested or len(self.downloaded_jobs) >= len(self.running_jobs):
             if self.timer.isActive():
                 self.timer.stop()
-            self.download_executor.shutdown()
+            self._shutdown_transfers()
+            self._apply_buffered_statuses()
             self.logger.info("\n--- All Jobs Finished or Stopped ---")
             final_report = self.get_progress_report(self.input_files, self.job_statuses, self.file_to_job_id)
             self.logger.info(final_report)
             self.finished.emit()
             return
 
-        import osparc as osparc_module
+        if self.monitor is None:
+            import osparc as osparc_module
 
-        with osparc_module.ApiClient(self.client_cfg) as api_client:
-            solvers_api = osparc_module.SolversApi(api_client)
-            # Iterate over a copy of the items, as the dictionary may be modified during the loop
-            for file_path, (job, solver) in list(self.running_jobs.items()):
-                if job.id in self.downloaded_jobs or job.id in self.jobs_being_downloaded:
-                    continue
-
-                try:
-                    status = solvers_api.inspect_job(solver.id, solver.version, job.id)
-                    job_logger = logging.getLogger(f"job_{job.id}")
-                    new_status_str = f"{status.state} ({status.progress}%)"
-
-                    current_status_str, _ = self.job_statuses.get(job.id, ("UNKNOWN", time.time()))
-
-                    if status.state == current_status_str.split(" "):
-                        self.job_statuses[job.id] = (
-                            new_status_str,
-                            self.job_statuses[job.id],
-                        )
+            self.monitor = JobMonitor(self.client_cfg, osparc_module)
+
+        # Iterate over a snapshot, as running_jobs may be modified by resubmissions below
+        active = [
+            (file_path, job, solver)
+            for file_path, (job, solver) in list(self.running_jobs.items())
+            if job.id not in self.downloaded_jobs and job.id not in self.jobs_being_downloaded
+        ]
+        for file_path, job, solver, status in self.monitor.poll(active):
+            job_logger = logging.getLogger(f"job_{job.id}")
+            if isinstance(status, Exception):
+                job_logger.error(f"Error inspecting job {job.id}: {status}\n{''.join(traceback.format_exception(status))}")
+                self.job_statuses[job.id] = ("FAILED", time.time())
+                self.downloaded_jobs.add(job.id)
+                continue
+
+            try:
+                new_status_str = f"{status.state} ({status.progress}%)"
+                current_status_str, since = self.job_statuses.get(job.id, ("UNKNOWN", time.time()))
+
+                if status.state == current_status_str.split(" ")[0]:
+                    self.job_statuses[job.id] = (new_status_str, since)
+                else:
+                    self.job_statuses[job.id] = (new_status_str, time.time())
+                    job_logger.info(f"Status update: {new_status_str}")
+
+                if status.state == "SUCCESS":
+                    self.logger.info(f"\nJob {job.id} for {file_path.name} finished. Starting download...")
+                    self.jobs_being_downloaded.add(job.id)
+                    self.job_statuses[job.id] = ("DOWNLOADING", time.time())
+                    self.download_executor.submit(self._download_job_in_thread, job, solver, file_path)
+
+                elif status.state == "FAILED":
+                    job_logger.error(f"Job {job.id} for {file_path.name} has failed.")
+
+                    retries = self.file_retries.get(file_path, 0)
+                    if retries < 3:
+                        new_retry_count = retries + 1
+                        self.file_retries[file_path] = new_retry_count
+                        job_logger.warning(f"Retrying job for {file_path.name} (attempt {new_retry_count}/3)...")
+                        self.job_statuses[job.id] = (f"RETRYING ({new_retry_count}/3)", time.time())
+                        self._resubmit_job(file_path)
                     else:
-                        self.job_statuses[job.id] = (new_status_str, time.time())
-                        job_logger.info(f"Status update: {new_status_str}")
-
-                    if status.state == "SUCCESS":
-                        self.logger.info(f"\nJob {job.id} for {file_path.name} finished. Starting download...")
-                        self.jobs_being_downloaded.add(job.id)
-                        self.job_statuses[job.id] = ("DOWNLOADING", time.time())
-                        self.download_executor.submit(self._download_job_in_thread, job, solver, file_path)
-
-                    elif status.state == "FAILED":
-                        job_logger.error(f"Job {job.id} for {file_path.name} has failed.")
-
-                        retries = self.file_retries.get(file_path, 0)
-                        if retries < 3:
-                            new_retry_count = retries + 1
-                            self.file_retries[file_path] = new_retry_count
-                            job_logger.warning(f"Retrying job for {file_path.name} (attempt {new_retry_count}/3)...")
-                            self.status_update_requested.emit(job.id, f"RETRYING ({new_retry_count}/3)")
-                            self._resubmit_job(file_path)
-                        else:
-                            job_logger.error(f"Job for {file_path.name} has failed after {retries} retries. Giving up.")
-                            self.downloaded_jobs.add(job.id)
-                            if self.job_statuses.get(job.id, ("dummy", 0)) != "FAILED":
-                                self.job_statuses[job.id] = ("FAILED", time.time())
-
-                except Exception as exc:
-                    job_logger = logging.getLogger(f"job_{job.id}")
-                    job_logger.error(f"Error inspecting job {job.id}: {exc}\n{traceback.format_exc()}")
-                    self.job_statuses[job.id] = ("FAILED", time.time())
-                    self.downloaded_jobs.add(job.id)
+                        job_logger.error(f"Job for {file_path.name} has failed after {retries} retries. Giving up.")
+                        self.downloaded_jobs.add(job.id)
+                        self.job_statuses[job.id] = ("FAILED", time.time())
+
+            except Exception as exc:
+                job_logger.error(f"Error handling status of job {job.id}: {exc}\n{traceback.format_exc()}")
+                self.job_statuses[job.id] = ("FAILED", time.time())
+                self.downloaded_jobs.add(job.id)
 
     def _resubmit_job(self, file_path: Path):
         """Resubmits a failed job."""
@@ -185,9 +221,8 @@ class Worker(QObject):
         except Exception as e:
             self.logger.error(f"Critical error during job resubmission for {file_path.name}: {e}\n{traceback.format_exc()}")
 
-    @Slot(str, str)
     def _update_job_status(self, job_id: str, status: str):
-        """Thread-safe method to update job status."""
+        """Records a job status change; called on the worker thread only."""
         self.job_statuses[job_id] = (status, time.time())
 
     @Slot()
@@ -208,9 +243,7 @@ class Worker(QObject):
         self.stop_requested = True
         if self.timer.isActive():
             self.timer.stop()
-        # The cancel_futures parameter is available in Python 3.9+
-        # For older versions, this will still shut down cleanly.
-        self.download_executor.shutdown(wait=False, cancel_futures=True)
+        self._shutdown_transfers(wait=False)
         self.finished.emit()
         if self.thread():
             self.thread().quit()
@@ -245,7 +278,7 @@ class Worker(QObject):
         except Exception as e:
             self.logger.error(f"An unexpected error occurred during job cancellation: {e}")
         finally:
-            self.download_executor.shutdown(wait=False, cancel_futures=True)
+            self._shutdown_transfers(wait=False)
             self.finished.emit()
             if self.thread():
                 self.thread().quit()
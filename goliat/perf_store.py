@@ -0,0 +1,293 @@
+"""Partitioned Parquet store of simulation metadata for fleet-wide performance analysis.
+
+Every simulation whose metadata is exported can also be appended here as one
+flat row: identification, phase timings, solver and grid size, hardware and
+iSolve throughput. Rows are written as small Parquet files under
+`machine=<host>/month=<YYYY-MM>/`, so queries filtered by machine or date only
+open the matching directories, and the remaining filters are pushed down to
+the Parquet row-group statistics. `compact_perf_store` merges the small files
+of each partition once they pile up.
+
+pyarrow is an optional dependency (`pip install goliat[perf]`).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import socket
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+
+import pandas as pd
+
+from .constants import PERF_STORE_COMPACT_MIN_FILES
+
+PARTITION_COLUMNS = ("machine", "month")
+"""Hive partition keys of the store, outermost first."""
+
+_COLUMNS = (
+    ("timestamp", "timestamp"),
+    ("simulation_name", "string"),
+    ("study_type", "string"),
+    ("phantom_name", "string"),
+    ("frequency_mhz", "string"),
+    ("project_path", "string"),
+    ("setup_s", "float64"),
+    ("run_s", "float64"),
+    ("extract_s", "float64"),
+    ("total_s", "float64"),
+    ("subtasks", "string"),
+    ("iterations", "int64"),
+    ("time_step_s", "float64"),
+    ("grid_resolution_mm", "float64"),
+    ("total_cell_iterations", "int64"),
+    ("power_balance_pct", "float64"),
+    ("total_mcells", "float64"),
+    ("total_mcells_with_pml", "float64"),
+    ("gpu_model", "string"),
+    ("gpu_memory_mb", "int64"),
+    ("peak_memory_gb", "float64"),
+    ("avg_mcells_per_s", "float64"),
+    ("peak_mcells_per_s", "float64"),
+    ("min_mcells_per_s", "float64"),
+    ("output_h5_mb", "float64"),
+    ("project_smash_mb", "float64"),
+    ("extract_sar", "bool"),
+    ("extract_sapd", "bool"),
+)
+"""Stored columns and their Arrow types; partition columns are not stored in the files."""
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("pyarrow is required for the performance store; install with `pip install goliat[perf]`") from exc
+    return pa, ds, pq
+
+
+def _schema(pa):
+    types = {"timestamp": pa.timestamp("us"), "string": pa.string(), "float64": pa.float64(), "int64": pa.int64(), "bool": pa.bool_()}
+    return pa.schema([(name, types[kind]) for name, kind in _COLUMNS])
+
+
+def _partition_value(value: str) -> str:
+    """Makes a machine name safe to use as a directory name."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", value) or "unknown"
+
+
+def _latest_indices(keys: Sequence) -> list[int]:
+    """Indices of the last row of each key, in row order; rows must be sorted by timestamp."""
+    latest = {key: i for i, key in enumerate(keys)}
+    return sorted(latest.values())
+
+
+def default_machine_name() -> str:
+    """Name under which this host's simulations are stored."""
+    return _partition_value(socket.gethostname())
+
+
+def metadata_row(metadata: dict) -> dict:
+    """Flattens an exported `SimulationMetadata` dict into one store row.
+
+    Args:
+        metadata: Contents of a simulation_metadata.json file, or `asdict` of a `SimulationMetadata`.
+
+    Returns:
+        Dict with one value per store column.
+    """
+    timing = metadata.get("timing") or {}
+    solver = metadata.get("solver") or {}
+    hardware = metadata.get("hardware") or {}
+    performance = metadata.get("performance") or {}
+    grid = metadata.get("grid") or {}
+    file_sizes = metadata.get("file_sizes") or {}
+    frequency = metadata.get("frequency_mhz")
+    phase_times = {phase: (timing.get(phase) or {}).get("total_time_s") for phase in ("setup", "run", "extract")}
+    subtasks = {phase: data.get("subtasks") or {} for phase, data in timing.items() if isinstance(data, dict)}
+
+    row = {
+        "timestamp": pd.Timestamp(metadata["timestamp"]).tz_localize(None).to_pydatetime() if metadata.get("timestamp") else None,
+        "simulation_name": metadata.get("simulation_name"),
+        "study_type": metadata.get("study_type"),
+        "phantom_name": metadata.get("phantom_name"),
+        "frequency_mhz": "+".join(str(f) for f in frequency) if isinstance(frequency, list) else (str(frequency) if frequency else None),
+        "project_path": metadata.get("project_path"),
+        "setup_s": phase_times["setup"],
+        "run_s": phase_times["run"],
+        "extract_s": phase_times["extract"],
+        "total_s": metadata.get("total_study_time_s"),
+        "subtasks": json.dumps(subtasks, sort_keys=True),
+        "extract_sar": metadata.get("extract_sar"),
+        "extract_sapd": metadata.get("extract_sapd"),
+    }
+    for source in (solver, hardware, performance, grid, file_sizes):
+        for name, kind in _COLUMNS:
+            if source.get(name) is not None and name not in row:
+                row[name] = int(source[name]) if kind == "int64" else source[name]
+    return {name: row.get(name) for name, _ in _COLUMNS}
+
+
+def append_metadata(store_dir: str, metadata: dict, machine: Optional[str] = None) -> str:
+    """Appends one simulation's metadata to the store.
+
+    The file name is derived from the machine and project only, since the
+    metadata timestamp is the export time. Re-exporting a simulation
+    therefore replaces its earlier per-simulation file, including one filed
+    under another month. A row already merged by `compact_perf_store` stays
+    in the store; `load_perf_store` keeps only the newest row per simulation.
+
+    Args:
+        store_dir: Root directory of the store.
+        metadata: Exported simulation metadata (see `metadata_row`).
+        machine: Machine name; defaults to this host.
+
+    Returns:
+        Path of the written Parquet file.
+    """
+    pa, _, pq = _require_pyarrow()
+    row = metadata_row(metadata)
+    machine = _partition_value(machine) if machine else default_machine_name()
+    timestamp = row["timestamp"] or datetime.now()
+    row["timestamp"] = timestamp
+    partition_dir = os.path.join(store_dir, f"machine={machine}", f"month={timestamp:%Y-%m}")
+    os.makedirs(partition_dir, exist_ok=True)
+
+    identity = f"{machine}|{row['project_path'] or row['simulation_name']}"
+    filename = f"sim-{hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]}.parquet"
+    path = os.path.join(partition_dir, filename)
+    # Readers skip dot-files, so they never see a half-written row
+    tmp_path = os.path.join(partition_dir, f".{uuid.uuid4().hex}.tmp")
+    pq.write_table(pa.Table.from_pylist([row], schema=_schema(pa)), tmp_path)
+    os.replace(tmp_path, path)
+    for stale in glob.glob(os.path.join(store_dir, f"machine={machine}", "month=*", filename)):
+        if os.path.normpath(stale) != os.path.normpath(path):
+            os.remove(stale)
+    return path
+
+
+def import_metadata_files(store_dir: str, results_dir: str, machine: Optional[str] = None) -> int:
+    """Appends every simulation_metadata.json under a results directory to the store.
+
+    Args:
+        store_dir: Root directory of the store.
+        results_dir: Results tree to scan.
+        machine: Machine the simulations ran on; defaults to this host.
+
+    Returns:
+        Number of rows written.
+    """
+    from .results import get_catalog
+
+    written = 0
+    for info in get_catalog(results_dir).find("simulation_metadata.json"):
+        try:
+            with open(info.path, "r") as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        append_metadata(store_dir, metadata, machine=machine)
+        written += 1
+    return written
+
+
+def _filter_expression(ds, machines, since, until, study_type, gpu_models):
+    conditions = []
+    if machines:
+        conditions.append(ds.field("machine").isin([_partition_value(m) for m in machines]))
+    if since is not None:
+        since = pd.Timestamp(since)
+        # The month partition prunes whole directories; the timestamp filter uses row-group statistics
+        conditions.append(ds.field("month") >= f"{since:%Y-%m}")
+        conditions.append(ds.field("timestamp") >= since.to_pydatetime())
+    if until is not None:
+        until = pd.Timestamp(until)
+        conditions.append(ds.field("month") <= f"{until:%Y-%m}")
+        conditions.append(ds.field("timestamp") < until.to_pydatetime())
+    if study_type:
+        conditions.append(ds.field("study_type") == study_type)
+    if gpu_models:
+        conditions.append(ds.field("gpu_model").isin(list(gpu_models)))
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def load_perf_store(
+    store_dir: str,
+    columns: Optional[Sequence[str]] = None,
+    machines: Optional[Iterable[str]] = None,
+    since=None,
+    until=None,
+    study_type: Optional[str] = None,
+    gpu_models: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Reads rows from the store, filtering before the data is loaded.
+
+    Args:
+        store_dir: Root directory of the store.
+        columns: Columns to read (partition columns included); all by default.
+        machines: Only these machines.
+        since: Only simulations at or after this time (anything `pd.Timestamp` accepts).
+        until: Only simulations before this time.
+        study_type: Only this study type.
+        gpu_models: Only these GPU models.
+
+    Returns:
+        One row per simulation (the newest, if it was exported more than
+        once), ordered by timestamp.
+    """
+    pa, ds, _ = _require_pyarrow()
+    if not os.path.isdir(store_dir):
+        return pd.DataFrame(columns=list(columns) if columns else [name for name, _ in _COLUMNS] + list(PARTITION_COLUMNS))
+    partitioning = ds.partitioning(pa.schema([(name, pa.string()) for name in PARTITION_COLUMNS]), flavor="hive")
+    dataset = ds.dataset(
+        store_dir, schema=pa.unify_schemas([_schema(pa), partitioning.schema]), format="parquet", partitioning=partitioning
+    )
+    key_columns = ["machine", "project_path", "simulation_name"]
+    read_columns = None if columns is None else list(dict.fromkeys(list(columns) + ["timestamp"] + key_columns))
+    table = dataset.to_table(columns=read_columns, filter=_filter_expression(ds, machines, since, until, study_type, gpu_models))
+    df = table.to_pandas().sort_values("timestamp", kind="stable").reset_index(drop=True)
+    keys = zip(df["machine"], df["project_path"].fillna(df["simulation_name"]))
+    df = df.iloc[_latest_indices(list(keys))].reset_index(drop=True)
+    if columns is not None:
+        df = df[list(dict.fromkeys(list(columns) + ["timestamp"]))]
+    return df
+
+
+def compact_perf_store(store_dir: str, min_files: int = PERF_STORE_COMPACT_MIN_FILES) -> int:
+    """Merges the per-simulation files of each partition into one file.
+
+    Partitions with fewer than `min_files` files are left alone. Only the
+    newest row of a simulation exported more than once is kept. Rows appended
+    while compacting are kept, since only the files that were read are removed.
+
+    Args:
+        store_dir: Root directory of the store.
+        min_files: Smallest number of files worth merging.
+
+    Returns:
+        Number of files merged away.
+    """
+    pa, _, pq = _require_pyarrow()
+    merged = 0
+    for partition_dir in sorted(glob.glob(os.path.join(store_dir, "machine=*", "month=*"))):
+        files = sorted(glob.glob(os.path.join(partition_dir, "*.parquet")))
+        if len(files) < min_files:
+            continue
+        table = pa.concat_tables([pq.read_table(path, schema=_schema(pa)) for path in files]).sort_by("timestamp")
+        keys = [path or name for path, name in zip(table["project_path"].to_pylist(), table["simulation_name"].to_pylist())]
+        table = table.take(_latest_indices(keys))
+        tmp_path = os.path.join(partition_dir, f".{uuid.uuid4().hex}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, os.path.join(partition_dir, f"part-{uuid.uuid4().hex[:16]}.parquet"))
+        for path in files:
+            os.remove(path)
+        merged += len(files)
+    return merged
@@ -3,6 +3,10 @@ import json
 import time
 from collections import defaultdict
 
+from .constants import ETA_HISTORY_FLUSH_INTERVAL_S
+from .eta_model import EtaModel, append_eta_history, load_eta_history, sum_predictions
+from .resource_usage import ResourceTracker
+
 
 class Profiler:
     """Manages execution time tracking, ETA estimation, and study phase management.
@@ -10,7 +14,8 @@ class Profiler:
     This class divides a study into phases (setup, run, extract), calculates
     weighted progress, and estimates the time remaining. It also saves updated
     time estimates to a configuration file after each run, making it
-    self-improving.
+    self-improving. Alongside the wall time, every phase and subtask records
+    its CPU time, peak RSS and I/O (see `goliat.resource_usage`).
     """
 
     def __init__(
@@ -19,6 +24,8 @@ class Profiler:
         profiling_config: dict,
         study_type: str,
         config_path: str,
+        eta_history_path: str | None = None,
+        sample_stacks: bool = False,
     ):
         """Initialize profiler with phase weights and timing config.
 
@@ -27,6 +34,9 @@ class Profiler:
             profiling_config: Historical timing data for estimates.
             study_type: Study type ('near_field' or 'far_field').
             config_path: Path where profiling config is saved.
+            eta_history_path: Persistent history file for the learned ETA model.
+                The model starts empty and nothing is saved if None.
+            sample_stacks: Also record sampled Python stacks for every phase and subtask.
         """
         self.execution_control = execution_control
         self.profiling_config = profiling_config
@@ -35,7 +45,10 @@ class Profiler:
 
         self.phase_weights = self._calculate_phase_weights()
         self.subtask_times = defaultdict(list)
+        self.subtask_resources = defaultdict(list)
         self.subtask_stack = []
+        self.resource_tracker = ResourceTracker(sample_stacks=sample_stacks)
+        self._phase_measurement = None
 
         self.total_simulations = 0
         self.completed_simulations = 0
@@ -48,6 +61,15 @@ class Profiler:
         self.phase_start_time = None
         self.phase_skipped = False
         self.run_phase_total_duration = 0
+        self.solver_progress = None
+
+        self.eta_history_path = eta_history_path
+        self.eta_model = EtaModel(load_eta_history(eta_history_path, study_type) if eta_history_path else None)
+        self._unsaved_eta_samples: list[dict] = []
+        self._eta_saved_at = time.monotonic()
+        self.simulation_plan: list[dict] = []
+        self._eta_forecast = None
+        self._eta_forecast_key = None
 
     def _calculate_phase_weights(self) -> dict:
         """Calculates normalized weights for each enabled phase.
@@ -75,6 +97,20 @@ class Profiler:
         """Sets total simulation count for progress tracking."""
         self.total_simulations = total
 
+    def set_simulation_plan(self, plan: list[dict]):
+        """Sets the features of every simulation in execution order.
+
+        With a plan, each remaining simulation is predicted individually by the
+        learned ETA model instead of assuming all simulations take the average
+        time.
+
+        Args:
+            plan: One feature dict (see `goliat.eta_model.simulation_features`)
+                per simulation, in the order they will run.
+        """
+        self.simulation_plan = list(plan)
+        self._eta_forecast_key = None
+
     def set_project_scope(self, total_projects: int):
         """Sets total project count for progress tracking."""
         self.total_projects = total_projects
@@ -94,14 +130,21 @@ class Profiler:
             phase_name: Phase name like 'setup', 'run', or 'extract'.
             total_stages: Number of stages within this phase.
         """
+        if self._phase_measurement is not None:
+            # Previous phase never ended; drop its measurement
+            self.resource_tracker.stop(self._phase_measurement)
+        self._phase_measurement = self.resource_tracker.start()
         self.current_phase = phase_name
         self.phase_start_time = time.monotonic()
         self.phase_skipped = False
         self.completed_stages_in_phase = 0
         self.total_stages_in_phase = total_stages
+        self.solver_progress = None
 
     def end_stage(self):
         """Ends current phase and records its duration for future estimates."""
+        usage = self.resource_tracker.stop(self._phase_measurement) if self._phase_measurement is not None else None
+        self._phase_measurement = None
         if self.phase_start_time:
             elapsed = time.monotonic() - self.phase_start_time
 
@@ -114,12 +157,70 @@ class Profiler:
             else:
                 # Real phase: add to statistics and compute simple average for display
                 self.subtask_times[self.current_phase].append(elapsed)
+                if usage is not None:
+                    self.subtask_resources[self.current_phase].append(usage)
+                if self.completed_simulations < len(self.simulation_plan):
+                    sample = self.eta_model.add_sample(self.current_phase, elapsed, self.simulation_plan[self.completed_simulations])
+                    if sample is not None:
+                        self._unsaved_eta_samples.append(sample)
+                    self._eta_forecast_key = None
+                    self._save_eta_history()
                 times = self.subtask_times[self.current_phase]
                 # Store simple average for pie charts, timings table, etc.
                 self.profiling_config[f"avg_{self.current_phase}_time"] = sum(times) / len(times)
 
         self.current_phase = None
         self.phase_skipped = False  # Reset for next phase
+        self.solver_progress = None
+
+    def record_solver_progress(self, percent: int, remaining_s: float | None, mcells_per_s: float, elapsed_s: float):
+        """Stores the latest solver progress sample measured during the run phase.
+
+        Args:
+            percent: Solver progress in percent.
+            remaining_s: Remaining solver time reported by iSolve, if parsed.
+            mcells_per_s: Measured solver throughput.
+            elapsed_s: Seconds since the solver attempt started.
+        """
+        self.solver_progress = {
+            "percent": percent,
+            "remaining_s": remaining_s,
+            "mcells_per_s": mcells_per_s,
+            "elapsed_s": elapsed_s,
+        }
+
+    def _get_solver_time_remaining(self) -> float | None:
+        """Remaining run time derived from measured solver throughput, if available.
+
+        Prefers iSolve's own estimate, which is based on its current throughput;
+        otherwise extrapolates elapsed solver time over the remaining percent.
+        """
+        progress = self.solver_progress
+        if not progress:
+            return None
+        if progress.get("remaining_s") is not None:
+            return float(progress["remaining_s"])
+        percent = progress.get("percent", 0)
+        if percent <= 0:
+            return None
+        return progress["elapsed_s"] * (100 - percent) / percent
+
+    def _save_eta_history(self, force: bool = False):
+        """Appends the samples recorded since the last save to the ETA history file, if one is configured.
+
+        Args:
+            force: Save even if the last save was less than `ETA_HISTORY_FLUSH_INTERVAL_S` ago.
+        """
+        if not self.eta_history_path or not self._unsaved_eta_samples:
+            return
+        if not force and time.monotonic() - self._eta_saved_at < ETA_HISTORY_FLUSH_INTERVAL_S:
+            return
+        try:
+            append_eta_history(self.eta_history_path, self.study_type, self._unsaved_eta_samples)
+            self._unsaved_eta_samples = []
+            self._eta_saved_at = time.monotonic()
+        except OSError:
+            pass  # ETA history is best effort; never fail a study over it
 
     def complete_run_phase(self):
         """Stores the total duration of the 'run' phase from its subtasks."""
@@ -243,6 +344,82 @@ class Profiler:
 
         return estimate
 
+    def _predict_phase(self, phase: str, features: dict) -> tuple[float, float, float]:
+        """(expected, low, high) seconds for one phase of one simulation.
+
+        Falls back to the recent-weighted average with a fixed +-50% band when
+        the learned model has too little history for this phase.
+        """
+        prediction = self.eta_model.predict(phase, features)
+        if prediction is None:
+            estimate = self._get_smart_phase_estimate(phase)
+            return estimate, estimate * 0.5, estimate * 1.5
+        return prediction
+
+    def get_eta_forecast(self) -> dict | None:
+        """Predicted durations for the current and all future simulations.
+
+        Returns:
+            Dict with 'current' mapping each enabled phase to [expected, low,
+            high] seconds for the running simulation, and 'future' holding the
+            summed [expected, low, high] of all simulations after it. None
+            without a simulation plan. Profilers rebuilt from a snapshot return
+            the forecast computed by the worker.
+        """
+        if not self.simulation_plan:
+            return self._eta_forecast
+        memo_key = (self.completed_simulations, len(self.eta_model.history))
+        if memo_key == self._eta_forecast_key:
+            return self._eta_forecast
+
+        phases = [p for p in ["setup", "run", "extract"] if self.execution_control.get(f"do_{p}", False)]
+        index = min(self.completed_simulations, len(self.simulation_plan) - 1)
+        current = {phase: list(self._predict_phase(phase, self.simulation_plan[index])) for phase in phases}
+        # Sweeps repeat the same phantom/frequency for many placements, so predict each combination once
+        counts: dict = defaultdict(int)
+        for features in self.simulation_plan[index + 1 :]:
+            for phase in phases:
+                counts[(phase, *sorted(features.items()))] += 1
+        predictions = [(self._predict_phase(key[0], dict(key[1:])), count) for key, count in counts.items()]
+
+        self._eta_forecast = {"current": current, "future": sum_predictions(predictions)}
+        self._eta_forecast_key = memo_key
+        return self._eta_forecast
+
+    def _get_forecast_time_remaining(self, current_stage_progress: float) -> tuple[float, float, float] | None:
+        """(expected, low, high) remaining seconds from the learned forecast, or None without one."""
+        forecast = self.get_eta_forecast()
+        if not forecast or not self.current_phase or self.current_phase not in forecast["current"]:
+            return None
+
+        progress = max(0.0, min(1.0, current_stage_progress))
+        phases = list(forecast["current"])
+        remaining = list(forecast["future"])
+        solver_remaining = self._get_solver_time_remaining() if self.current_phase == "run" else None
+        for phase in phases[phases.index(self.current_phase) :]:
+            for i, value in enumerate(forecast["current"][phase]):
+                if phase != self.current_phase:
+                    remaining[i] += value
+                elif solver_remaining is not None:
+                    remaining[i] += solver_remaining
+                else:
+                    remaining[i] += value * (1.0 - progress)
+        return remaining[0], remaining[1], remaining[2]
+
+    def get_time_remaining_band(self, current_stage_progress: float = 0.0) -> tuple[float, float] | None:
+        """Confidence band around `get_time_remaining`.
+
+        Args:
+            current_stage_progress: Progress within current stage (0.0 to 1.0).
+
+        Returns:
+            (low, high) seconds, or None if no learned forecast is available.
+        """
+        remaining = self._get_forecast_time_remaining(current_stage_progress)
+        if remaining is None:
+            return None
+        return max(0.0, remaining[1]), max(0.0, remaining[2])
+
     def get_time_remaining(self, current_stage_progress: float = 0.0) -> float:
         """Estimates total time remaining for the entire study.
 
@@ -266,6 +443,10 @@ class Profiler:
         if not self.current_phase or self.total_simulations == 0:
             return 0.0
 
+        forecast_remaining = self._get_forecast_time_remaining(current_stage_progress)
+        if forecast_remaining is not None:
+            return max(0.0, forecast_remaining[0])
+
         # Calculate the total estimated time for one simulation using smart estimates
         total_time_per_sim = 0
         for phase in ["setup", "run", "extract"]:
@@ -285,6 +466,11 @@ class Profiler:
         current_phase_time = self._get_smart_phase_estimate(self.current_phase)
         time_remaining_in_current_sim = current_phase_time * (1.0 - progress)
 
+        # While the solver runs, its measured throughput beats the historical average
+        solver_remaining = self._get_solver_time_remaining() if self.current_phase == "run" else None
+        if solver_remaining is not None:
+            time_remaining_in_current_sim = solver_remaining
+
         # Add time for phases not yet started in current simulation
         for i in range(current_phase_index + 1, len(ordered_phases)):
             phase = ordered_phases[i]
@@ -297,9 +483,62 @@ class Profiler:
         eta = time_remaining_in_current_sim + (remaining_simulations * total_time_per_sim)
         return max(0, eta)
 
+    def snapshot(self) -> dict:
+        """Returns a lightweight, picklable copy of the state the GUI needs.
+
+        Only plain dicts, lists and numbers are included, so the snapshot is
+        cheap to send through a multiprocessing queue and can be forwarded to
+        the web dashboard as-is.
+
+        Returns:
+            Dict that can be turned back into a read-only profiler with
+            `Profiler.from_snapshot`.
+        """
+        return {
+            "execution_control": dict(self.execution_control),
+            "profiling_config": dict(self.profiling_config),
+            "study_type": self.study_type,
+            "phase_weights": dict(self.phase_weights),
+            "subtask_times": {name: list(times) for name, times in self.subtask_times.items() if times},
+            "total_simulations": self.total_simulations,
+            "completed_simulations": self.completed_simulations,
+            "current_phase": self.current_phase,
+            "solver_progress": dict(self.solver_progress) if self.solver_progress else None,
+            "eta_forecast": self.get_eta_forecast(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "Profiler":
+        """Rebuilds a profiler from `snapshot()` output for ETA and progress queries.
+
+        The returned instance has no config path and must not be used to
+        record timings; it only answers the read-side methods the GUI calls.
+
+        Args:
+            snapshot: Dict produced by `snapshot()`.
+
+        Returns:
+            Profiler populated with the snapshot state.
+        """
+        profiler = cls(
+            snapshot.get("execution_control", {}),
+            snapshot.get("profiling_config", {}),
+            snapshot.get("study_type", ""),
+            "",
+        )
+        profiler.phase_weights = snapshot.get("phase_weights", profiler.phase_weights)
+        profiler.subtask_times.update(snapshot.get("subtask_times", {}))
+        profiler.total_simulations = snapshot.get("total_simulations", 0)
+        profiler.completed_simulations = snapshot.get("completed_simulations", 0)
+        profiler.current_phase = snapshot.get("current_phase")
+        profiler.solver_progress = snapshot.get("solver_progress")
+        profiler._eta_forecast = snapshot.get("eta_forecast")
+        return profiler
+
     @contextlib.contextmanager
     def subtask(self, task_name: str):
-        """A context manager to time a subtask."""
+        """A context manager to time a subtask and measure its resource usage."""
+        measurement = self.resource_tracker.start()
         self.subtask_stack.append({"name": task_name, "start_time": time.monotonic()})
         try:
             yield
@@ -307,6 +546,7 @@ class Profiler:
             subtask = self.subtask_stack.pop()
             elapsed = time.monotonic() - subtask["start_time"]
             self.subtask_times[subtask["name"]].append(elapsed)
+            self.subtask_resources[subtask["name"]].append(self.resource_tracker.stop(measurement))
             self.update_and_save_estimates()
 
     def update_and_save_estimates(self):
@@ -335,9 +575,32 @@ class Profiler:
                 # Also update the in-memory profiling_config so it's available when sent to GUI
                 self.profiling_config[avg_key] = round(avg_task_time, 2)
 
+        resources = full_config[self.study_type].setdefault("resources", {})
+        for task_name, usages in self.subtask_resources.items():
+            if usages:
+                resources[task_name] = self._summarize_resources(usages)
+
         with open(self.config_path, "w") as f:
             json.dump(full_config, f, indent=4)
 
+    @staticmethod
+    def _summarize_resources(usages: list) -> dict:
+        """Averages CPU time and I/O over a task's runs and keeps its largest peak RSS."""
+
+        def average(values):
+            values = [v for v in values if v is not None]
+            return round(sum(values) / len(values), 2) if values else None
+
+        peaks = [u.peak_rss_mb for u in usages if u.peak_rss_mb is not None]
+        return {
+            "runs": len(usages),
+            "avg_cpu_s": average(u.cpu_s for u in usages),
+            "max_peak_rss_mb": max(peaks) if peaks else None,
+            "avg_read_mb": average(u.read_mb for u in usages),
+            "avg_written_mb": average(u.written_mb for u in usages),
+        }
+
     def save_estimates(self):
-        """Saves the final profiling estimates at the end of the study."""
+        """Saves the final profiling estimates and ETA history at the end of the study."""
+        self._save_eta_history(force=True)
         self.update_and_save_estimates()
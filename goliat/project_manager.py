@@ -1,14 +1,17 @@
 import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Tuple
 
 import h5py
 
-from .constants import H5_SIZE_INCREASE_THRESHOLD, MIN_H5_FILE_SIZE_BYTES
+from .constants import RESUME_MANIFEST_FILENAME, RESUME_VERIFY_CONCURRENCY
+from .extraction.output_validator import check_output_h5
 from .logging_manager import LoggingMixin
 from .results_extractor import ResultsExtractor
+from .resume_manifest import ResumeManifest, ResumeRecord, file_fingerprint
 from .utils import apply_run_tag, open_project
 
 if TYPE_CHECKING:
@@ -55,6 +58,7 @@ class ProjectManager(LoggingMixin):
 
         self.document = s4l_v1.document
         self.project_path: Optional[str] = None
+        self._resume_manifest: Optional[ResumeManifest] = None
         self.execution_control = self.config["execution_control"] or {"do_setup": True, "do_run": True, "do_extract": True}
 
     def _generate_config_hash(self, config_dict: dict) -> str:
@@ -62,6 +66,83 @@ class ProjectManager(LoggingMixin):
         config_string = json.dumps(config_dict, sort_keys=True)
         return hashlib.sha256(config_string.encode("utf-8")).hexdigest()
 
+    @property
+    def resume_manifest(self) -> ResumeManifest:
+        """The study-wide resume manifest in the results directory, opened on first use."""
+        if self._resume_manifest is None:
+            self._resume_manifest = ResumeManifest(os.path.join(self._results_root(), RESUME_MANIFEST_FILENAME))
+        return self._resume_manifest
+
+    def _results_root(self) -> str:
+        return os.path.join(self.config.base_dir, "results")
+
+    def _manifest_key(self, project_dir: str) -> str:
+        """Returns the manifest key of a simulation directory: its path relative to the results root."""
+        return os.path.relpath(os.path.abspath(project_dir), os.path.abspath(self._results_root())).replace(os.sep, "/")
+
+    def _deliverable_fingerprints(self, project_dir: str, project_file: Optional[str]) -> dict:
+        """Fingerprints the extract deliverables and the solver input/output files of a simulation.
+
+        Args:
+            project_dir: Directory containing the project file.
+            project_file: File name of the .smash project, if known.
+
+        Returns:
+            Dict from path relative to `project_dir` to `mtime_ns:size`, for existing files only.
+        """
+        names = list(ResultsExtractor.get_required_deliverable_filenames().values())
+        if project_file:
+            results_name = project_file + "_Results"
+            results_dir = os.path.join(project_dir, results_name)
+            if os.path.isdir(results_dir):
+                names += [f"{results_name}/{f}" for f in os.listdir(results_dir) if f.endswith(("_Output.h5", "_Input.h5"))]
+        fingerprints = {}
+        for name in names:
+            fingerprint = file_fingerprint(os.path.join(project_dir, name))
+            if fingerprint:
+                fingerprints[name] = fingerprint
+        return fingerprints
+
+    def _record_resume_state(
+        self,
+        meta_path: str,
+        metadata: dict,
+        project_path: Optional[str] = None,
+        refresh_deliverables: bool = False,
+        **phases: bool,
+    ):
+        """Records the phase state of a simulation in the resume manifest.
+
+        Called right after the metadata file was written or verified, so the
+        stored fingerprint of `meta_path` matches what is on disk.
+
+        Args:
+            meta_path: Path to the simulation's metadata file.
+            metadata: Contents of the metadata file.
+            project_path: Path to the .smash project; defaults to the current project if it lives next to `meta_path`.
+            refresh_deliverables: If True, re-fingerprints the deliverables of completed phases.
+            **phases: Phase flags to set ('setup_done', 'run_done', 'extract_done'). Omitted flags keep
+                their recorded value, unless the record belongs to a different config hash.
+        """
+        project_dir = os.path.dirname(meta_path)
+        key = self._manifest_key(project_dir)
+        record = self.resume_manifest.get(key)
+        if record is None or record.config_hash != metadata["config_hash"]:
+            record = ResumeRecord(key=key, config_hash=metadata["config_hash"])
+            refresh_deliverables = True
+        for name, value in phases.items():
+            setattr(record, name, bool(value))
+
+        project_path = project_path or self.project_path
+        if project_path and os.path.dirname(os.path.abspath(project_path)) == os.path.abspath(project_dir):
+            record.project_file = os.path.basename(project_path)
+        record.setup_timestamp = metadata.get("setup_timestamp")
+        record.meta_fingerprint = file_fingerprint(meta_path)
+        if refresh_deliverables:
+            done = record.run_done or record.extract_done
+            record.deliverables = self._deliverable_fingerprints(project_dir, record.project_file) if done else {}
+        self.resume_manifest.put(record)
+
     def write_simulation_metadata(self, meta_path: str, surgical_config: dict, update_setup_timestamp: bool = False):
         """Writes config metadata and hash to disk for verification/resume.
 
@@ -98,6 +179,11 @@ class ProjectManager(LoggingMixin):
         os.makedirs(os.path.dirname(meta_path), exist_ok=True)
         with open(meta_path, "w") as f:
             json.dump(metadata, f, indent=4)
+        if update_setup_timestamp:
+            self._record_resume_state(meta_path, metadata, setup_done=True, run_done=False, extract_done=False)
+        else:
+            # Setup was verified and skipped: keep the recorded run/extract state
+            self._record_resume_state(meta_path, metadata, setup_done=True)
         self._log(
             f"  - Saved configuration metadata to {os.path.basename(meta_path)}",
             log_type="info",
@@ -124,6 +210,9 @@ class ProjectManager(LoggingMixin):
             f.seek(0)
             json.dump(metadata, f, indent=4)
             f.truncate()
+        phases = {name: value for name, value in (("run_done", run_done), ("extract_done", extract_done)) if value is not None}
+        if "config_hash" in metadata:
+            self._record_resume_state(meta_path, metadata, refresh_deliverables=True, **phases)
         self._log(f"Updated metadata in {os.path.basename(meta_path)}", log_type="info")
 
     def _check_extract_deliverables(self, project_dir: str, setup_timestamp: float) -> bool:
@@ -143,12 +232,13 @@ class ProjectManager(LoggingMixin):
         return all(os.path.exists(file_path) and os.path.getmtime(file_path) > setup_timestamp for file_path in extract_files)
 
     def _validate_h5_file(self, h5_file_path: str, results_dir: str, setup_timestamp: float) -> bool:
-        """Validates that an H5 output file meets size and timestamp requirements.
+        """Validates that an H5 output file is complete and belongs to the current setup.
 
-        Checks that the file is:
-        - Larger than 8MB (iSolve sometimes creates incomplete files)
-        - Newer than setup_timestamp
-        - At least 10% bigger than corresponding Input.h5 (if Input.h5 exists)
+        The file must be newer than setup_timestamp and pass the structural
+        check of `check_output_h5` (Overall Field E/H snapshots present, shapes
+        matching the mesh, sampled chunks readable). The verdict is cached in
+        the resume manifest under the file's fingerprint, so resuming a study
+        re-checks only files that changed.
 
         Args:
             h5_file_path: Path to the _Output.h5 file.
@@ -158,30 +248,24 @@ class ProjectManager(LoggingMixin):
         Returns:
             True if the H5 file is valid, False otherwise.
         """
-        if not h5_file_path:
-            return False
-
-        file_size = os.path.getsize(h5_file_path)
-        file_mtime = os.path.getmtime(h5_file_path)
-
-        # Check basic size and timestamp requirements
-        if file_size <= MIN_H5_FILE_SIZE_BYTES or file_mtime <= setup_timestamp:
+        if not h5_file_path or os.path.getmtime(h5_file_path) <= setup_timestamp:
             return False
 
-        # Check if Output.h5 is at least 10% bigger than Input.h5
-        output_filename = os.path.basename(h5_file_path)
-        if not output_filename.endswith("_Output.h5"):
-            return True  # Fallback: if filename doesn't match pattern, use original check
-
-        hash_prefix = output_filename[:-10]  # Remove "_Output.h5" suffix
-        input_file_path = os.path.join(results_dir, f"{hash_prefix}_Input.h5")
+        key = self._manifest_key(h5_file_path)
+        fingerprint = file_fingerprint(h5_file_path)
+        cached = self.resume_manifest.get_output_check(key, fingerprint) if fingerprint else None
+        if cached is not None:
+            ok, reason = cached
+        else:
+            output_filename = os.path.basename(h5_file_path)
+            input_file_path = os.path.join(results_dir, output_filename[: -len("_Output.h5")] + "_Input.h5")
+            ok, reason = check_output_h5(h5_file_path, input_file_path)
+            if fingerprint:
+                self.resume_manifest.put_output_check(key, fingerprint, ok, reason)
 
-        if os.path.exists(input_file_path):
-            input_size = os.path.getsize(input_file_path)
-            return file_size >= input_size * H5_SIZE_INCREASE_THRESHOLD
-
-        # If Input.h5 doesn't exist, fall back to just size check (>8MB)
-        return True
+        if not ok:
+            self._log(f"Ignoring incomplete solver output {os.path.basename(h5_file_path)}: {reason}", log_type="warning")
+        return ok
 
     def _check_auto_cleanup_scenario(self, extract_done: bool) -> bool:
         """Checks if run phase should be considered done due to auto-cleanup.
@@ -246,10 +330,8 @@ class ProjectManager(LoggingMixin):
         phase, checks for JSON, PKL, and HTML report files.
 
         Important safeguards:
-        - Only considers H5 files larger than MIN_H5_FILE_SIZE_BYTES (iSolve sometimes creates incomplete
-          files that are smaller)
-        - Output.h5 must be at least H5_SIZE_INCREASE_THRESHOLD times bigger than the corresponding Input.h5 file
-          (if Input.h5 exists) to ensure the simulation completed successfully
+        - The newest _Output.h5 must pass a structural integrity check (iSolve sometimes leaves
+          incomplete or truncated files behind)
         - Files must be newer than setup_timestamp to ensure they're from this run,
           not an old run
         - All extract deliverables must exist (not just some) to mark extract as done
@@ -302,10 +384,7 @@ class ProjectManager(LoggingMixin):
             self._log("Project path not set, cannot verify .smash file.", log_type="error")
             return False, None
 
-        original_path = self.project_path
-        self.project_path = path_to_check
-        is_valid = self._is_valid_smash_file()
-        self.project_path = original_path
+        is_valid = self._is_valid_smash_file(path_to_check)
 
         if not is_valid:
             self._log(f"Project file '{os.path.basename(path_to_check)}' is missing or corrupted.", log_type="warning")
@@ -400,6 +479,13 @@ class ProjectManager(LoggingMixin):
         always requires run completion - if extract is done but run isn't, both are
         marked incomplete to prevent inconsistent states.
 
+        Before any of this, the resume manifest is consulted: a simulation recorded
+        as complete with the same config hash, whose metadata file and
+        deliverables still have the size and mtime recorded when its phases
+        finished, is reported done without opening its project file or
+        reading its deliverables. Results of the full checks are recorded in
+        the manifest so the next resume takes the fast path.
+
         Args:
             meta_path: Path to the metadata file containing config hash and timestamps.
             surgical_config: Current config snapshot to compare against stored hash.
@@ -411,10 +497,17 @@ class ProjectManager(LoggingMixin):
         """
         status = {"setup_done": False, "run_done": False, "extract_done": False}
 
-        if not os.path.exists(meta_path):
+        meta_fingerprint = file_fingerprint(meta_path)
+        if meta_fingerprint is None:
             self._log(f"No metadata file found at {os.path.basename(meta_path)}.", log_type="info")
             return status
 
+        if self._find_completed_record(meta_path, meta_fingerprint, surgical_config) is not None:
+            self._log("Resume manifest records all phases as done for this configuration.", log_type="info")
+            status = {"setup_done": True, "run_done": True, "extract_done": True}
+            self._log_status_summary(status)
+            return status
+
         try:
             with open(meta_path, "r") as f:
                 metadata = json.load(f)
@@ -422,28 +515,118 @@ class ProjectManager(LoggingMixin):
             if not self._verify_config_hash(metadata, surgical_config, meta_path):
                 return status
 
-            is_valid, path_to_check = self._verify_project_file(smash_path)
-            if not is_valid or path_to_check is None:
-                return status
+            status = self._probe_status(metadata, smash_path)
+            self._record_resume_state(meta_path, metadata, project_path=smash_path, refresh_deliverables=True, **status)
+            if status["setup_done"]:
+                self._log_status_summary(status)
+            return status
 
-            status["setup_done"] = True
+        except (json.JSONDecodeError, KeyError):
+            self._log(f"Metadata file {os.path.basename(meta_path)} is corrupted.", log_type="error")
+            return status
 
-            setup_timestamp = self._parse_setup_timestamp(metadata)
-            if setup_timestamp is None:
-                return status
+    def _find_completed_record(self, meta_path: str, meta_fingerprint: str, surgical_config: dict) -> Optional[ResumeRecord]:
+        """Returns the manifest record of a simulation if it proves all phases are done.
 
-            deliverables_status = self._verify_deliverables(path_to_check, setup_timestamp)
-            status["run_done"] = deliverables_status["run_done"]
-            status["extract_done"] = deliverables_status["extract_done"]
+        Args:
+            meta_path: Path to the simulation's metadata file.
+            meta_fingerprint: Current fingerprint of `meta_path`.
+            surgical_config: Current config snapshot of the simulation.
 
-            status = self._normalize_status(status)
-            self._log_status_summary(status)
+        Returns:
+            The record, or None if there is none, it is incomplete, or it is
+            stale: the config changed, or the metadata file or a recorded
+            deliverable was changed or deleted since the phases finished.
+        """
+        project_dir = os.path.dirname(meta_path)
+        record = self.resume_manifest.get(self._manifest_key(project_dir))
+        if record is None or not record.complete or record.meta_fingerprint != meta_fingerprint:
+            return None
+        if record.config_hash != self._generate_config_hash(surgical_config):
+            return None
+        # One stat per file; anything unrecorded or changed falls back to the full checks, which re-record it
+        if not record.deliverables:
+            return None
+        for name, fingerprint in record.deliverables.items():
+            if file_fingerprint(os.path.join(project_dir, name)) != fingerprint:
+                return None
+        return record
+
+    def _probe_status(self, metadata: dict, smash_path: Optional[str]) -> dict:
+        """Checks the project file and deliverables of a simulation on disk.
+
+        Args:
+            metadata: Parsed metadata dictionary.
+            smash_path: Optional override for project file path.
+
+        Returns:
+            Dict with boolean flags: 'setup_done', 'run_done', 'extract_done'.
+        """
+        status = {"setup_done": False, "run_done": False, "extract_done": False}
+        is_valid, path_to_check = self._verify_project_file(smash_path)
+        if not is_valid or path_to_check is None:
             return status
 
-        except (json.JSONDecodeError, KeyError):
-            self._log(f"Metadata file {os.path.basename(meta_path)} is corrupted.", log_type="error")
+        status["setup_done"] = True
+
+        setup_timestamp = self._parse_setup_timestamp(metadata)
+        if setup_timestamp is None:
             return status
 
+        deliverables_status = self._verify_deliverables(path_to_check, setup_timestamp)
+        status["run_done"] = deliverables_status["run_done"]
+        status["extract_done"] = deliverables_status["extract_done"]
+        return self._normalize_status(status)
+
+    def deep_verify_resume_manifest(self, max_workers: int = RESUME_VERIFY_CONCURRENCY) -> dict:
+        """Re-checks every simulation in the resume manifest against the filesystem, in parallel.
+
+        Runs the full checks of `verify_simulation_metadata` (project file
+        integrity, deliverable presence, size and freshness) for each recorded
+        simulation and rewrites its record with the outcome. Enabled with
+        `execution_control.resume_verification: "deep"`, for when files may
+        have been changed outside GOLIAT since the phases finished.
+
+        Args:
+            max_workers: Number of simulations checked at once.
+
+        Returns:
+            Dict with the number of records 'checked' and of records whose state 'changed'.
+        """
+        records = [record for record in self.resume_manifest.records() if record.setup_done]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resume-verify") as executor:
+            changed = sum(executor.map(self._reverify_record, records))
+        self._log(
+            f"Deep-verified {len(records)} recorded simulation(s); {changed} no longer match their record.",
+            log_type="warning" if changed else "info",
+        )
+        return {"checked": len(records), "changed": changed}
+
+    def _reverify_record(self, record: ResumeRecord) -> bool:
+        """Runs the full checks for one manifest record and stores the result.
+
+        Returns:
+            True if the recorded phase state changed.
+        """
+        project_dir = os.path.join(self._results_root(), *record.key.split("/"))
+        meta_path = os.path.join(project_dir, "config.json")
+        before = (record.setup_done, record.run_done, record.extract_done)
+        try:
+            with open(meta_path, "r") as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            metadata = None
+        smash_path = os.path.join(project_dir, record.project_file) if record.project_file else None
+
+        if metadata is None or smash_path is None or metadata.get("config_hash") != record.config_hash:
+            record.setup_done = record.run_done = record.extract_done = False
+            self.resume_manifest.put(record)
+            return before != (False, False, False)
+
+        status = self._probe_status(metadata, smash_path)
+        self._record_resume_state(meta_path, metadata, project_path=smash_path, refresh_deliverables=True, **status)
+        return before != (status["setup_done"], status["run_done"], status["extract_done"])
+
     def get_setup_timestamp_from_metadata(self, meta_path: str) -> Optional[float]:
         """Retrieves the setup timestamp from the metadata file.
 
@@ -472,20 +655,24 @@ class ProjectManager(LoggingMixin):
         except (json.JSONDecodeError, KeyError, ValueError):
             return None
 
-    def _is_valid_smash_file(self) -> bool:
+    def _is_valid_smash_file(self, project_path: Optional[str] = None) -> bool:
         """Checks if a project file is valid and not locked.
 
         Performs two checks: file lock detection (via rename test) and HDF5
         structure validation. Returns False if locked or corrupted.
 
+        Args:
+            project_path: Project file to check; defaults to the current project.
+
         Returns:
             True if file is valid and accessible, False otherwise.
         """
-        if not self.project_path:
+        project_path = project_path or self.project_path
+        if not project_path:
             return False
         lock_file_path = os.path.join(
-            os.path.dirname(self.project_path),
-            f".{os.path.basename(self.project_path)}.s4l_lock",
+            os.path.dirname(project_path),
+            f".{os.path.basename(project_path)}.s4l_lock",
         )
         if os.path.exists(lock_file_path):
             self._log(
@@ -495,10 +682,10 @@ class ProjectManager(LoggingMixin):
             return False
 
         try:
-            os.rename(self.project_path, self.project_path)
+            os.rename(project_path, project_path)
         except OSError as e:
             self._log(
-                f"  - File lock detected on {self.project_path}: {e}",
+                f"  - File lock detected on {project_path}: {e}",
                 log_type="warning",
             )
             self._log(
@@ -508,11 +695,11 @@ class ProjectManager(LoggingMixin):
             return False
 
         try:
-            with h5py.File(self.project_path, "r"):
+            with h5py.File(project_path, "r"):
                 pass
             return True
         except OSError as e:
-            self._log(f"  - HDF5 format error in {self.project_path}: {e}", log_type="error")
+            self._log(f"  - HDF5 format error in {project_path}: {e}", log_type="error")
             return False
 
     def _validate_placement_params(
@@ -844,9 +1031,11 @@ class ProjectManager(LoggingMixin):
         self.document.Close()
 
     def cleanup(self):
-        """Closes any open project."""
+        """Closes any open project and the resume manifest."""
         if self.document and hasattr(self.document, "IsOpen") and self.document.IsOpen():  # type: ignore
             self.close()
+        if self._resume_manifest is not None:
+            self._resume_manifest.close()
 
     def reload_project(self):
         """Saves, closes, and reopens the project to load simulation results.
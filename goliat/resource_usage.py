@@ -0,0 +1,256 @@
+"""Low-overhead resource accounting for profiler subtasks.
+
+Every subtask records the CPU time, peak resident memory and bytes read and
+written by this process while it ran. On Linux all of it comes from
+`/proc/self`: the peak is the kernel's `VmHWM` high-water mark, reset at the
+start of each subtask through `/proc/self/clear_refs`, and I/O is `rchar` /
+`wchar` from `/proc/self/io`, i.e. bytes passed through read and write calls
+whether or not they were served from the page cache. Other platforms use
+psutil where it offers the same counters. A measurement costs a few small
+file reads, so it is always on.
+
+Optionally, a background thread samples the Python stack of the thread that
+opened the subtask and counts collapsed stacks ("module:function;..." ->
+samples), the input format of common flame graph tools.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from .constants import PROFILER_STACK_MAX_DEPTH, PROFILER_STACK_SAMPLE_INTERVAL_S, PROFILER_STACK_TOP_N
+
+try:
+    import psutil
+
+    _process = psutil.Process()
+except ImportError:
+    _process = None
+
+_MB = 1024 * 1024
+_HAS_PROC = os.path.exists("/proc/self/status")
+
+
+def _memory() -> tuple[Optional[int], Optional[int]]:
+    """Returns (peak, current) resident memory in bytes; None where unavailable."""
+    if _HAS_PROC:
+        values = {}
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(("VmHWM:", "VmRSS:")):
+                    name, kb = line.split()[:2]
+                    values[name] = int(kb) * 1024
+        return values.get("VmHWM:"), values.get("VmRSS:")
+    if _process is not None:
+        info = _process.memory_info()
+        return getattr(info, "peak_wset", None), info.rss
+    return None, None
+
+
+def _io() -> tuple[Optional[int], Optional[int]]:
+    """Returns cumulative (read, written) bytes of this process; None where unavailable."""
+    if _HAS_PROC:
+        try:
+            values = {}
+            with open("/proc/self/io") as f:
+                for line in f:
+                    name, value = line.split(":")
+                    values[name] = int(value)
+            return values.get("rchar"), values.get("wchar")
+        except OSError:
+            return None, None
+    try:
+        counters = _process.io_counters()  # type: ignore[union-attr]
+        return counters.read_bytes, counters.write_bytes
+    except Exception:
+        return None, None
+
+
+def _reset_peak() -> bool:
+    """Resets the kernel's peak RSS to the current RSS; False if the platform doesn't allow it."""
+    if not _HAS_PROC:
+        return False
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _collapse(frame) -> str:
+    """Formats a frame's call stack, outermost first, as 'module:function;...'."""
+    names = []
+    while frame is not None and len(names) < PROFILER_STACK_MAX_DEPTH:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / _MB, 1)
+
+
+class ResourceUsage(NamedTuple):
+    """Resources used by one subtask.
+
+    Attributes:
+        cpu_s: CPU time (user + system) of this process.
+        peak_rss_mb: Highest resident memory while the subtask ran. Where the
+            peak cannot be reset per subtask this is exact only if the subtask
+            set a new process-wide peak, and a lower bound otherwise.
+        read_mb: Data read by this process.
+        written_mb: Data written by this process.
+        stacks: Sample count per collapsed stack, if stack sampling was enabled.
+        start_rss_mb: Resident memory when the subtask started, so
+            `peak_rss_mb - start_rss_mb` is what the subtask itself added.
+    """
+
+    cpu_s: float
+    peak_rss_mb: Optional[float] = None
+    read_mb: Optional[float] = None
+    written_mb: Optional[float] = None
+    stacks: Optional[dict[str, int]] = None
+    start_rss_mb: Optional[float] = None
+
+    def as_dict(self) -> dict:
+        """Returns a JSON-ready dict; `stacks` is only included when sampled."""
+        data: dict = {
+            "cpu_s": round(self.cpu_s, 3),
+            "peak_rss_mb": self.peak_rss_mb,
+            "read_mb": self.read_mb,
+            "written_mb": self.written_mb,
+        }
+        if self.stacks is not None:
+            data["stacks"] = self.stacks
+        return data
+
+    def summary(self) -> str:
+        """Returns a short human-readable form for log lines."""
+        parts = [f"CPU {self.cpu_s:.1f}s"]
+        for label, value in (("peak RSS", self.peak_rss_mb), ("read", self.read_mb), ("written", self.written_mb)):
+            if value is not None:
+                parts.append(f"{label} {value:.0f} MB")
+        return ", ".join(parts)
+
+
+class _Measurement:
+    """Counters at the start of a subtask, plus the peak observed so far."""
+
+    __slots__ = ("cpu", "read", "written", "start_peak", "start_rss", "peak", "thread_id", "stacks")
+
+    def __init__(self, peak: Optional[int], rss: Optional[int], sample_stacks: bool):
+        self.cpu = time.process_time()
+        self.read, self.written = _io()
+        self.start_peak, self.start_rss = peak, rss
+        self.peak = peak
+        self.thread_id = threading.get_ident()
+        self.stacks: Optional[Counter] = Counter() if sample_stacks else None
+
+
+class ResourceTracker:
+    """Measures the resources of (possibly nested) subtasks.
+
+    Resetting the peak for an inner subtask would hide the outer subtask's
+    earlier peak, so the current peak is folded into every open measurement
+    before each reset and again when an inner measurement ends.
+    """
+
+    def __init__(self, sample_stacks: bool = False, interval_s: float = PROFILER_STACK_SAMPLE_INTERVAL_S):
+        """Initializes the tracker.
+
+        Args:
+            sample_stacks: Also sample the Python stack of measured subtasks.
+            interval_s: Seconds between stack samples.
+        """
+        self.sample_stacks = sample_stacks
+        self.interval_s = interval_s
+        self._open: list[_Measurement] = []
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+        self._peak_resettable: Optional[bool] = None
+
+    def start(self) -> _Measurement:
+        """Starts measuring a subtask.
+
+        Returns:
+            Handle to pass to `stop`.
+        """
+        peak, rss = _memory()
+        if self._peak_resettable is not False:
+            self._fold_peak(peak)
+            self._peak_resettable = _reset_peak()
+            if self._peak_resettable:
+                peak, rss = _memory()
+
+        measurement = _Measurement(peak, rss, self.sample_stacks)
+        with self._lock:
+            self._open.append(measurement)
+            if self.sample_stacks and self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample_stacks, name="profiler-stack-sampler", daemon=True)
+                self._sampler.start()
+        return measurement
+
+    def stop(self, measurement: _Measurement) -> ResourceUsage:
+        """Stops measuring a subtask.
+
+        Args:
+            measurement: Handle returned by the matching `start`.
+
+        Returns:
+            Resources used since `start`.
+        """
+        cpu = time.process_time()
+        read, written = _io()
+        peak, rss = _memory()
+        with self._lock:
+            if measurement in self._open:
+                self._open.remove(measurement)
+            stacks = dict(measurement.stacks.most_common(PROFILER_STACK_TOP_N)) if measurement.stacks is not None else None
+
+        if self._peak_resettable:
+            self._fold_peak(peak)
+            peak_bytes = max(v for v in (measurement.peak, peak) if v is not None) if peak is not None else None
+        elif peak is not None and measurement.start_peak is not None and peak > measurement.start_peak:
+            peak_bytes = peak  # A new process-wide peak was set during the subtask
+        else:
+            peak_bytes = max((v for v in (measurement.start_rss, rss) if v is not None), default=None)
+
+        return ResourceUsage(
+            cpu_s=cpu - measurement.cpu,
+            peak_rss_mb=_mb(peak_bytes),
+            read_mb=_mb(read - measurement.read) if read is not None and measurement.read is not None else None,
+            written_mb=_mb(written - measurement.written) if written is not None and measurement.written is not None else None,
+            stacks=stacks,
+            start_rss_mb=_mb(measurement.start_rss),
+        )
+
+    def _fold_peak(self, peak: Optional[int]):
+        if peak is None:
+            return
+        with self._lock:
+            for measurement in self._open:
+                measurement.peak = peak if measurement.peak is None else max(measurement.peak, peak)
+
+    def _sample_stacks(self):
+        """Sampler thread; exits once no sampled measurement is open."""
+        while True:
+            time.sleep(self.interval_s)
+            frames = sys._current_frames()
+            with self._lock:
+                sampled = [m for m in self._open if m.stacks is not None]
+                if not sampled:
+                    self._sampler = None
+                    return
+                collapsed: dict[int, str] = {}
+                for measurement in sampled:
+                    frame = frames.get(measurement.thread_id)
+                    if frame is None:
+                        continue
+                    if measurement.thread_id not in collapsed:
+                        collapsed[measurement.thread_id] = _collapse(frame)
+                    measurement.stacks[collapsed[measurement.thread_id]] += 1
+            del frames
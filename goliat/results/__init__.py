@@ -0,0 +1,9 @@
+"""Catalog of the results tree.
+
+`get_catalog` returns an indexed view of a results directory that analysis,
+uncertainty, auto-induced and batch tools query instead of walking the tree.
+"""
+
+from .catalog import FileInfo, ResultsCatalog, SimulationEntry, get_catalog, parse_simulation_dir
+
+__all__ = ["FileInfo", "ResultsCatalog", "SimulationEntry", "get_catalog", "parse_simulation_dir"]
@@ -0,0 +1,419 @@
+"""Indexed catalog of the results tree.
+
+The catalog scans a results directory once into a small SQLite index of
+directories, files (size and mtime) and simulation directories, and answers
+lookups from the index instead of walking the tree again. Later scans are
+incremental: a directory whose mtime is unchanged is not listed again, so
+refreshing an unchanged tree costs one `stat` per directory, done in
+parallel.
+
+A directory's mtime changes when entries are added, removed or renamed, not
+when a file is rewritten in place. Sizes and mtimes of such files are
+therefore those of the last listing of their directory; callers that compare
+file timestamps should `stat` the returned paths.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from goliat.constants import RESULTS_CATALOG_FILENAME, RESULTS_CATALOG_SCAN_CONCURRENCY
+
+_FREQUENCY_DIR_RE = re.compile(r"^(\d+(?:\+\d+)*)MHz$")
+_NON_PLACEMENT_DIR_RE = re.compile(r"^auto_induced(?:__.+)?$")
+_FAR_FIELD_PLACEMENT_RE = re.compile(r"^environmental_([xyz]_(?:pos|neg))_(theta|phi)(?:__(.+))?$")
+
+_MTIME_SLACK_NS = 2_000_000_000
+"""Directories modified this recently are listed again on the next scan, since a
+change within the same mtime tick would not be visible (coarse share timestamps)."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE TABLE IF NOT EXISTS files (dir TEXT NOT NULL, name TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,
+                                  PRIMARY KEY (dir, name));
+CREATE INDEX IF NOT EXISTS files_name ON files(name);
+CREATE TABLE IF NOT EXISTS simulations (dir TEXT PRIMARY KEY, study_type TEXT, phantom TEXT NOT NULL, frequency TEXT NOT NULL,
+                                        placement TEXT NOT NULL, direction TEXT, polarization TEXT, run_tag TEXT);
+CREATE INDEX IF NOT EXISTS simulations_lookup ON simulations(study_type, phantom, frequency);
+"""
+
+
+class FileInfo(NamedTuple):
+    """A file in the catalog."""
+
+    path: str
+    """Absolute path."""
+    relpath: str
+    """Path relative to the catalog root, with '/' separators."""
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class SimulationEntry:
+    """A simulation directory (`[study_type/]phantom/<freq>MHz/placement`) and the files below it.
+
+    Attributes:
+        path: Absolute path of the simulation directory.
+        key: Path relative to the catalog root, with '/' separators.
+        study_type: 'near_field' or 'far_field', or None if the catalog root is below that level.
+        phantom: Phantom directory name.
+        frequency: Frequency directory without the 'MHz' suffix ('700', or '700+900' for multi-sine).
+        placement: Placement directory name, including any run tag.
+        direction: Far-field incident direction (e.g. 'x_pos'), if the placement encodes one.
+        polarization: Far-field polarization ('theta' or 'phi'), if the placement encodes one.
+        run_tag: Run tag suffix of a far-field placement, if any.
+        files: Files in the directory and its subdirectories, keyed by path relative to `path`.
+    """
+
+    path: str
+    key: str
+    study_type: Optional[str]
+    phantom: str
+    frequency: str
+    placement: str
+    direction: Optional[str] = None
+    polarization: Optional[str] = None
+    run_tag: Optional[str] = None
+    files: dict[str, FileInfo] = field(default_factory=dict)
+
+    @property
+    def frequencies_mhz(self) -> list[int]:
+        """The frequencies of the simulation in MHz."""
+        return [int(f) for f in self.frequency.split("+")]
+
+    def select(self, suffix: str, subdir: Optional[str] = None) -> list[FileInfo]:
+        """Returns the files whose name ends with `suffix`.
+
+        Args:
+            suffix: File name suffix, e.g. '_Output.h5'.
+            subdir: If given, only files directly in this subdirectory are returned.
+        """
+        return [info for name, info in self.files.items() if name.endswith(suffix) and (subdir is None or _parent(name) == subdir)]
+
+    def newest(self, suffix: str, subdir: Optional[str] = None) -> Optional[FileInfo]:
+        """Returns the most recently modified file whose name ends with `suffix`; see `select`."""
+        return max(self.select(suffix, subdir), key=lambda info: info.mtime_ns, default=None)
+
+
+def _parent(relpath: str) -> str:
+    return relpath.rpartition("/")[0]
+
+
+def _child_range(key: str) -> tuple[str, str]:
+    """Bounds such that `lo <= path < hi` selects exactly the paths strictly below `key`."""
+    # '0' sorts right after '/', so this avoids LIKE and its '_' wildcard in placement names
+    return (key + "/", key + "0") if key else ("", "￿")
+
+
+def parse_simulation_dir(key: str) -> Optional[dict]:
+    """Extracts the simulation fields from a catalog-relative directory path.
+
+    Args:
+        key: Directory path relative to the catalog root.
+
+    Returns:
+        Column values for the simulations table, or None if the path is not a simulation directory.
+    """
+    parts = key.split("/")
+    if len(parts) < 3:
+        return None
+    match = _FREQUENCY_DIR_RE.match(parts[-2])
+    if not match:
+        return None
+    placement = parts[-1]
+    if _NON_PLACEMENT_DIR_RE.match(placement):
+        return None
+    placement_match = _FAR_FIELD_PLACEMENT_RE.match(placement)
+    direction, polarization, run_tag = placement_match.groups() if placement_match else (None, None, None)
+    return {
+        "dir": key,
+        "study_type": parts[-4] if len(parts) >= 4 else None,
+        "phantom": parts[-3],
+        "frequency": match.group(1),
+        "placement": placement,
+        "direction": direction,
+        "polarization": polarization,
+        "run_tag": run_tag,
+    }
+
+
+class ResultsCatalog:
+    """Persistent, incrementally refreshed index of a results directory."""
+
+    def __init__(self, root: str, db_path: Optional[str] = None, max_workers: int = RESULTS_CATALOG_SCAN_CONCURRENCY):
+        """Opens the catalog of `root`; nothing is scanned until the first refresh or query.
+
+        Args:
+            root: The directory to catalog, usually `<base_dir>/results`.
+            db_path: Index file; defaults to a hidden file in `root`. If it cannot be
+                opened (e.g. read-only share), the index is kept in memory.
+            max_workers: Number of directories listed in parallel during a scan.
+        """
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or os.path.join(self.root, RESULTS_CATALOG_FILENAME)
+        self.max_workers = max_workers
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._scanned = False
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        # No journal file next to the index, so writing it does not change the root's mtime
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            try:
+                if not os.path.isdir(os.path.dirname(self.db_path)):
+                    raise sqlite3.OperationalError("catalog directory does not exist")
+                conn = self._open(self.db_path)
+            except sqlite3.DatabaseError:
+                # The index is a cache: rebuild it if it is unreadable, keep it in memory if that fails too
+                try:
+                    os.remove(self.db_path)
+                    conn = self._open(self.db_path)
+                except (OSError, sqlite3.Error):
+                    conn = self._open(":memory:")
+            except sqlite3.Error:
+                conn = self._open(":memory:")
+            self._conn = conn
+        return self._conn
+
+    def _key(self, path: str) -> str:
+        """Converts an absolute or root-relative path to a catalog key."""
+        relpath = os.path.relpath(os.path.abspath(os.path.join(self.root, path)), self.root)
+        if relpath == os.curdir:
+            return ""
+        if relpath == os.pardir or relpath.startswith(os.pardir + os.sep):
+            raise ValueError(f"{path} is outside the catalog root {self.root}")
+        return relpath.replace(os.sep, "/")
+
+    def _abs(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/")) if key else self.root
+
+    def _scan_dir(self, key: str, known_mtime_ns: Optional[int]) -> tuple:
+        """Lists one directory unless its mtime is unchanged.
+
+        Returns:
+            (key, mtime_ns, files, subdirs); mtime_ns is None if the directory is gone,
+            files and subdirs are None if the directory was not listed.
+        """
+        try:
+            mtime_ns = os.stat(self._abs(key)).st_mtime_ns
+            if mtime_ns == known_mtime_ns:
+                return key, mtime_ns, None, None
+            files, subdirs = [], []
+            with os.scandir(self._abs(key)) as entries:
+                for entry in entries:
+                    if entry.name.startswith(RESULTS_CATALOG_FILENAME):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(f"{key}/{entry.name}" if key else entry.name)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            files.append((entry.name, stat.st_size, stat.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            return key, None, None, None
+        if time.time_ns() - mtime_ns < _MTIME_SLACK_NS:
+            mtime_ns = -1  # Not trusted: list again next time
+        return key, mtime_ns, files, subdirs
+
+    def refresh(self, under: Optional[str] = None) -> dict:
+        """Brings the index up to date with the filesystem.
+
+        Args:
+            under: Only refresh this subtree (absolute or root-relative path).
+
+        Returns:
+            Dict with the number of directories 'checked', 'listed' again and 'removed'.
+        """
+        start = self._key(under) if under else ""
+        lo, hi = _child_range(start)
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT path, parent, mtime_ns FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (start, lo, hi)
+            ).fetchall()
+        known = {path: mtime_ns for path, _, mtime_ns in rows}
+        children: dict[str, list[str]] = {}
+        for path, parent, _ in rows:
+            if parent is not None and path != start:
+                children.setdefault(parent, []).append(path)
+
+        listed: dict[str, tuple] = {}
+        seen: set[str] = set()
+        frontier = [start]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="results-catalog") as executor:
+            while frontier:
+                next_frontier = []
+                for key, mtime_ns, files, subdirs in executor.map(lambda k: self._scan_dir(k, known.get(k)), frontier):
+                    if mtime_ns is None:
+                        continue
+                    seen.add(key)
+                    if files is None:
+                        next_frontier.extend(children.get(key, ()))
+                    else:
+                        listed[key] = (mtime_ns, files)
+                        next_frontier.extend(subdirs)
+                frontier = next_frontier
+
+        removed = [key for key in known if key not in seen]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for key in removed:
+                    self._delete_dir(conn, key)
+                for key, (mtime_ns, files) in listed.items():
+                    parent = None if key == "" else _parent(key)
+                    conn.execute("INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)", (key, parent, mtime_ns))
+                    conn.execute("DELETE FROM files WHERE dir = ?", (key,))
+                    conn.executemany("INSERT INTO files (dir, name, size, mtime_ns) VALUES (?, ?, ?, ?)", [(key, *f) for f in files])
+                    simulation = parse_simulation_dir(key)
+                    if simulation:
+                        conn.execute(
+                            f"INSERT OR REPLACE INTO simulations ({', '.join(simulation)}) VALUES ({', '.join('?' * len(simulation))})",
+                            tuple(simulation.values()),
+                        )
+            # A subtree refresh says nothing about the rest of the tree, so queries still scan it once
+            if start == "":
+                self._scanned = True
+        return {"checked": len(seen), "listed": len(listed), "removed": len(removed)}
+
+    @staticmethod
+    def _delete_dir(conn: sqlite3.Connection, key: str) -> None:
+        conn.execute("DELETE FROM dirs WHERE path = ?", (key,))
+        conn.execute("DELETE FROM files WHERE dir = ?", (key,))
+        conn.execute("DELETE FROM simulations WHERE dir = ?", (key,))
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            if not self._scanned:
+                self.refresh()
+            return self._connection().execute(sql, params).fetchall()
+
+    def is_dir(self, path: str) -> bool:
+        """Whether a directory was present at the last scan of its subtree."""
+        return bool(self._query("SELECT 1 FROM dirs WHERE path = ?", (self._key(path),)))
+
+    def find(self, name: str, under: Optional[str] = None) -> list[FileInfo]:
+        """Returns all files with exactly this name, ordered by path.
+
+        Args:
+            name: File name, e.g. 'verbose.log'.
+            under: Only return files below this directory (absolute or root-relative path).
+        """
+        sql, params = "SELECT dir, name, size, mtime_ns FROM files WHERE name = ?", (name,)
+        if under:
+            key = self._key(under)
+            lo, hi = _child_range(key)
+            sql += " AND (dir = ? OR (dir >= ? AND dir < ?))"
+            params += (key, lo, hi)
+        return [self._file_info(*row) for row in self._query(sql + " ORDER BY dir", params)]
+
+    def _file_info(self, dir_key: str, name: str, size: int, mtime_ns: int) -> FileInfo:
+        relpath = f"{dir_key}/{name}" if dir_key else name
+        return FileInfo(os.path.join(self._abs(dir_key), name), relpath, size, mtime_ns)
+
+    def simulations(
+        self,
+        study_type: Optional[str] = None,
+        phantom: Optional[str] = None,
+        frequency: Optional[str | int] = None,
+        placement: Optional[str] = None,
+        direction: Optional[str] = None,
+        polarization: Optional[str] = None,
+    ) -> list[SimulationEntry]:
+        """Returns the simulation directories matching all given fields, ordered by path.
+
+        Args:
+            study_type: 'near_field' or 'far_field'.
+            phantom: Phantom directory name (lower case, as on disk).
+            frequency: Frequency in MHz, or '700+900' for multi-sine directories.
+            placement: Placement directory name.
+            direction: Far-field incident direction.
+            polarization: Far-field polarization.
+        """
+        filters = {
+            "study_type": study_type,
+            "phantom": phantom,
+            "frequency": None if frequency is None else str(frequency),
+            "placement": placement,
+            "direction": direction,
+            "polarization": polarization,
+        }
+        where = [(f"{column} = ?", value) for column, value in filters.items() if value is not None]
+        sql = "SELECT dir, study_type, phantom, frequency, placement, direction, polarization, run_tag FROM simulations"
+        if where:
+            sql += " WHERE " + " AND ".join(clause for clause, _ in where)
+        rows = self._query(sql + " ORDER BY dir", tuple(value for _, value in where))
+        return [self._simulation_entry(row) for row in rows]
+
+    def simulation(self, path: str) -> Optional[SimulationEntry]:
+        """Returns the simulation in a directory, or None if it is not a known simulation directory.
+
+        Args:
+            path: The simulation directory (absolute or root-relative path).
+        """
+        try:
+            key = self._key(path)
+        except ValueError:
+            return None
+        rows = self._query(
+            "SELECT dir, study_type, phantom, frequency, placement, direction, polarization, run_tag FROM simulations WHERE dir = ?", (key,)
+        )
+        return self._simulation_entry(rows[0]) if rows else None
+
+    def _simulation_entry(self, row: tuple) -> SimulationEntry:
+        key, study_type, phantom, frequency, placement, direction, polarization, run_tag = row
+        lo, hi = _child_range(key)
+        with self._lock:
+            files = (
+                self._connection()
+                .execute("SELECT dir, name, size, mtime_ns FROM files WHERE dir = ? OR (dir >= ? AND dir < ?)", (key, lo, hi))
+                .fetchall()
+            )
+        entry = SimulationEntry(self._abs(key), key, study_type, phantom, frequency, placement, direction, polarization, run_tag)
+        for row_file in files:
+            info = self._file_info(*row_file)
+            entry.files[info.relpath[len(key) + 1 :]] = info
+        return entry
+
+    def close(self) -> None:
+        """Closes the index."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._scanned = False
+
+
+_catalogs: dict[str, ResultsCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(root: str) -> ResultsCatalog:
+    """Returns the process-wide catalog of a results directory.
+
+    The first query scans the tree; call `refresh` to pick up later changes.
+
+    Args:
+        root: The directory to catalog.
+    """
+    root = os.path.abspath(root)
+    with _catalogs_lock:
+        if root not in _catalogs:
+            _catalogs[root] = ResultsCatalog(root)
+        return _catalogs[root]
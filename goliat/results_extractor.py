@@ -168,6 +168,11 @@ class ResultsExtractor(LoggingMixin):
         # Return default
         return default
 
+    def _perf_store_dir(self) -> Optional[str]:
+        """Performance store from `execution_control.perf_store_dir`, resolved against the project root."""
+        store_dir = self.config["execution_control.perf_store_dir"]
+        return os.path.join(self.config.base_dir, store_dir) if store_dir else None
+
     @staticmethod
     def get_required_deliverable_filenames() -> dict:
         """Returns the required deliverable filenames that must exist for extract to be considered done.
@@ -312,6 +317,7 @@ class ResultsExtractor(LoggingMixin):
                     config_path=self.config.config_path,
                     extract_sar=self._get_extraction_flag("sar", default=True),
                     extract_sapd=self._get_extraction_flag("sapd", default=False),
+                    store_dir=self._perf_store_dir(),
                 )
 
         # Cleanup if configured
@@ -0,0 +1,238 @@
+"""Study-wide record of simulation phase completion for fast resume."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .constants import RESUME_MANIFEST_TIMEOUT_S
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS simulations (
+    key TEXT PRIMARY KEY,
+    project_file TEXT,
+    config_hash TEXT NOT NULL,
+    setup_timestamp TEXT,
+    setup_done INTEGER NOT NULL,
+    run_done INTEGER NOT NULL,
+    extract_done INTEGER NOT NULL,
+    meta_fingerprint TEXT,
+    deliverables TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS output_checks (
+    path TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    reason TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "key",
+    "project_file",
+    "config_hash",
+    "setup_timestamp",
+    "setup_done",
+    "run_done",
+    "extract_done",
+    "meta_fingerprint",
+    "deliverables",
+    "updated_at",
+)
+
+
+def file_fingerprint(path: str) -> Optional[str]:
+    """Returns a cheap `mtime_ns:size` fingerprint of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+@dataclass
+class ResumeRecord:
+    """Phase completion of one simulation, as recorded when its phases finished.
+
+    Attributes:
+        key: Simulation directory relative to the results root, with '/' separators.
+        config_hash: Hash of the surgical config the phases were run with.
+        setup_timestamp: ISO 8601 time of the last setup.
+        setup_done: Whether setup completed.
+        run_done: Whether the run phase completed.
+        extract_done: Whether extraction completed.
+        project_file: File name of the .smash project.
+        meta_fingerprint: Fingerprint of the simulation's config.json when the record was written.
+        deliverables: Fingerprints of the run and extract deliverables, by file name.
+        updated_at: Time the record was written (seconds since epoch).
+    """
+
+    key: str
+    config_hash: str
+    setup_timestamp: Optional[str] = None
+    setup_done: bool = False
+    run_done: bool = False
+    extract_done: bool = False
+    project_file: Optional[str] = None
+    meta_fingerprint: Optional[str] = None
+    deliverables: dict = field(default_factory=dict)
+    updated_at: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """True if all three phases are done."""
+        return self.setup_done and self.run_done and self.extract_done
+
+
+class ResumeManifest:
+    """SQLite-backed manifest of all simulations under one results directory.
+
+    Records are written as phases finish, so resuming a study needs a single
+    indexed lookup per simulation instead of reading its metadata, opening its
+    project file and probing its deliverables. It also caches the integrity
+    verdict of each solver output file by fingerprint. The manifest is an optimization
+    only: if the database cannot be opened or written (for example on a share
+    without working file locks), it disables itself and callers fall back to
+    the filesystem checks.
+    """
+
+    def __init__(self, path: str):
+        """Initializes the manifest; the database is opened on first use.
+
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=RESUME_MANIFEST_TIMEOUT_S, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _disable(self, error: Exception) -> None:
+        self._disabled = True
+        logging.getLogger("verbose").warning(
+            f"Resume manifest {self.path} unavailable ({error}); falling back to per-simulation checks.", extra={"log_type": "warning"}
+        )
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str) -> Optional[ResumeRecord]:
+        """Returns the record of a simulation, or None if there is none."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM simulations WHERE key = ?", (key,)).fetchone() if conn else None
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+                return None
+        return self._from_row(row) if row else None
+
+    def records(self) -> list[ResumeRecord]:
+        """Returns all records."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                rows = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM simulations ORDER BY key").fetchall() if conn else []
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+                return []
+        return [self._from_row(row) for row in rows]
+
+    def put(self, record: ResumeRecord) -> None:
+        """Inserts or replaces a record in its own transaction."""
+        record.updated_at = time.time()
+        values = (
+            record.key,
+            record.project_file,
+            record.config_hash,
+            record.setup_timestamp,
+            int(record.setup_done),
+            int(record.run_done),
+            int(record.extract_done),
+            record.meta_fingerprint,
+            json.dumps(record.deliverables, sort_keys=True),
+            record.updated_at,
+        )
+        with self._lock:
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return
+                with conn:
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO simulations ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})", values
+                    )
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+
+    def get_output_check(self, path: str, fingerprint: str) -> Optional[tuple[bool, str]]:
+        """Returns the cached integrity verdict of a solver output file.
+
+        Args:
+            path: File path relative to the results root, with '/' separators.
+            fingerprint: Current `file_fingerprint` of the file.
+
+        Returns:
+            `(ok, reason)`, or None if the file was not checked in its current state.
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute("SELECT fingerprint, ok, reason FROM output_checks WHERE path = ?", (path,)).fetchone() if conn else None
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+                return None
+        if row is None or row[0] != fingerprint:
+            return None
+        return bool(row[1]), row[2]
+
+    def put_output_check(self, path: str, fingerprint: str, ok: bool, reason: str = "") -> None:
+        """Caches the integrity verdict of a solver output file for its current fingerprint."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO output_checks (path, fingerprint, ok, reason) VALUES (?, ?, ?, ?)",
+                        (path, fingerprint, int(ok), reason),
+                    )
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _from_row(row: tuple) -> ResumeRecord:
+        values = dict(zip(_COLUMNS, row))
+        return ResumeRecord(
+            key=values["key"],
+            config_hash=values["config_hash"],
+            setup_timestamp=values["setup_timestamp"],
+            setup_done=bool(values["setup_done"]),
+            run_done=bool(values["run_done"]),
+            extract_done=bool(values["extract_done"]),
+            project_file=values["project_file"],
+            meta_fingerprint=values["meta_fingerprint"],
+            deliverables=json.loads(values["deliverables"]),
+            updated_at=values["updated_at"],
+        )
@@ -19,15 +19,17 @@ except ImportError:
     win32gui = None  # type: ignore
     win32con = None  # type: ignore
 
+from ..constants import SOLVER_THROUGHPUT_DEGRADATION_RATIO
 from ..logging_manager import LoggingMixin
 from ..utils import StudyCancelledError, open_project
 from ..utils.python_interpreter import find_sim4life_root
 from .execution_strategy import ExecutionStrategy
-from .isolve_output_parser import ISolveOutputParser
+from .isolve_output_parser import ISolveOutputParser, ProgressInfo
 from .isolve_process_manager import ISolveProcessManager
 from .keep_awake_handler import KeepAwakeHandler
 from .post_simulation_handler import PostSimulationHandler
 from .retry_handler import RetryHandler
+from .solver_throughput import SolverThroughputRecorder
 
 
 class MemoryErrorRetryException(Exception):
@@ -68,6 +70,7 @@ class ISolveManualStrategy(ExecutionStrategy, LoggingMixin):
         super().__init__(*args, **kwargs)
         self.current_isolve_process = None
         self.current_process_manager = None
+        self.throughput_recorder: SolverThroughputRecorder | None = None
 
     @classmethod
     def reset_memory_error_count(cls) -> None:
@@ -214,11 +217,30 @@ class ISolveManualStrategy(ExecutionStrategy, LoggingMixin):
         if "Time Update, estimated remaining time" in parsed.raw_line:
             keep_awake_handler.trigger_on_progress()
 
-        # Check for progress milestones (0%, 33%, 66%)
+        # Record every progress sample, log milestones (0%, 33%, 66%)
         if parsed.has_progress and parsed.progress_info:
+            self._record_progress(parsed.progress_info)
             if output_parser.should_log_milestone(parsed.progress_info.percentage):
                 output_parser.log_milestone(parsed.progress_info)
 
+    def _record_progress(self, progress_info: ProgressInfo) -> None:
+        """Stores a progress sample in the throughput series and forwards it to the profiler.
+
+        Args:
+            progress_info: Parsed iSolve progress line.
+        """
+        if self.throughput_recorder is None:
+            return
+        row = self.throughput_recorder.record(progress_info)
+        self.profiler.record_solver_progress(
+            percent=progress_info.percentage,
+            remaining_s=progress_info.remaining_seconds,
+            mcells_per_s=float(progress_info.mcells_per_sec),
+            elapsed_s=row[1],
+        )
+        if self.gui:
+            self.gui.update_profiler()
+
     def _monitor_running_process(
         self,
         process_manager: ISolveProcessManager,
@@ -280,8 +302,9 @@ class ISolveManualStrategy(ExecutionStrategy, LoggingMixin):
                 # Check for memory/alloc errors and exit immediately if found
                 self._check_for_memory_error_and_exit([parsed.error_message])
 
-            # Check for progress milestones in remaining output
+            # Record progress and check for milestones in remaining output
             if parsed.has_progress and parsed.progress_info:
+                self._record_progress(parsed.progress_info)
                 if output_parser.should_log_milestone(parsed.progress_info.percentage):
                     output_parser.log_milestone(parsed.progress_info)
 
@@ -455,6 +478,8 @@ class ISolveManualStrategy(ExecutionStrategy, LoggingMixin):
             process_manager = ISolveProcessManager(command, self.gui, self.verbose_logger, self.progress_logger)
             process_manager.start()
             self.current_isolve_process = process_manager.process
+            if self.throughput_recorder is not None:
+                self.throughput_recorder.start_attempt(getattr(process_manager.process, "pid", None))
             self.current_process_manager = process_manager
 
             self._monitor_running_process(process_manager, output_parser, keep_awake_handler, detected_errors)
@@ -538,6 +563,12 @@ class ISolveManualStrategy(ExecutionStrategy, LoggingMixin):
             self._log("    - Execute iSolve...", level="progress", log_type="progress")
             with self.profiler.subtask("run_isolve_execution"):
                 output_parser = ISolveOutputParser(self.verbose_logger, self.progress_logger, self.gui)
+                self.throughput_recorder = SolverThroughputRecorder(
+                    {
+                        "simulation": getattr(self.simulation, "Name", None),
+                        "kernel": (self.config["solver_settings"] or {}).get("kernel", "Software"),
+                    }
+                )
                 keep_awake_handler = KeepAwakeHandler(self.config)
                 retry_handler = RetryHandler(self.progress_logger, self.gui)
                 keep_awake_handler.trigger_before_retry()
@@ -569,8 +600,32 @@ class ISolveManualStrategy(ExecutionStrategy, LoggingMixin):
             self.verbose_logger.error(traceback.format_exc())
             raise
         finally:
+            self._save_throughput()
             self._cleanup()
 
+    def _save_throughput(self) -> None:
+        """Writes the recorded solver throughput next to the results and logs a slowdown."""
+        if self.throughput_recorder is None:
+            return
+        recorder, self.throughput_recorder = self.throughput_recorder, None
+        try:
+            path = recorder.save(os.path.dirname(self.project_path))
+        except OSError as e:
+            self._log(f"Could not save solver throughput: {e}", log_type="warning")
+            return
+        if path is None:
+            return
+        summary = recorder.summary()
+        ratio = summary.get("degradation_ratio")
+        if ratio is not None and ratio < SOLVER_THROUGHPUT_DEGRADATION_RATIO:
+            self._log(
+                f"      - Solver throughput dropped to {ratio:.0%} of its early-run rate "
+                f"({summary['early_median_mcells_per_s']:.0f} -> {summary['late_median_mcells_per_s']:.0f} MCells/s)",
+                level="progress",
+                log_type="warning",
+            )
+        self._log(f"Solver throughput saved to {path}", log_type="verbose")
+
     def _cleanup(self) -> None:
         """Clean up process and threads."""
         if self.current_process_manager is not None:
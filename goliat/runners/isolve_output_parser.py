@@ -19,6 +19,7 @@ class ProgressInfo:
     percentage: int
     time_remaining: str
     mcells_per_sec: str
+    remaining_seconds: Optional[int] = None
 
 
 @dataclass
@@ -183,20 +184,21 @@ class ISolveOutputParser(LoggingMixin):
                 percentage=percentage,
                 time_remaining=time_formatted,
                 mcells_per_sec=mcells_per_sec,
+                remaining_seconds=self._parse_time_remaining(time_remaining),
             )
         return None
 
-    def _format_time_remaining(self, time_str: str) -> str:
-        """Convert time remaining string to HH:MM:SS format.
+    def _parse_time_remaining(self, time_str: str) -> int:
+        """Convert a time remaining string to seconds.
 
         Parses strings like "1 hours 9 minutes", "3 minutes 27 seconds", or "27 seconds"
-        to "1:09:00", "0:03:27", or "0:00:27" respectively.
+        to 4140, 207, or 27 respectively.
 
         Args:
             time_str: Time string from iSolve output.
 
         Returns:
-            Formatted time as "HH:MM:SS" where HH is hours, MM is minutes, and SS is seconds.
+            Remaining time in seconds.
         """
         hours = 0
         minutes = 0
@@ -217,4 +219,20 @@ class ISolveOutputParser(LoggingMixin):
         if seconds_match:
             seconds = int(seconds_match.group(1))
 
+        return hours * 3600 + minutes * 60 + seconds
+
+    def _format_time_remaining(self, time_str: str) -> str:
+        """Convert time remaining string to HH:MM:SS format.
+
+        Parses strings like "1 hours 9 minutes", "3 minutes 27 seconds", or "27 seconds"
+        to "1:09:00", "0:03:27", or "0:00:27" respectively.
+
+        Args:
+            time_str: Time string from iSolve output.
+
+        Returns:
+            Formatted time as "HH:MM:SS" where HH is hours, MM is minutes, and SS is seconds.
+        """
+        hours, rest = divmod(self._parse_time_remaining(time_str), 3600)
+        minutes, seconds = divmod(rest, 60)
         return f"{hours}:{minutes:02d}:{seconds:02d}"
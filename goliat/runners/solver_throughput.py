@@ -0,0 +1,172 @@
+"""Per-simulation solver throughput time series recorded from iSolve progress lines."""
+
+import json
+import os
+import statistics
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # type: ignore
+
+from ..constants import SOLVER_THROUGHPUT_FILENAME
+
+if TYPE_CHECKING:
+    from .isolve_output_parser import ProgressInfo
+
+THROUGHPUT_COLUMNS = ("wall_time", "elapsed_s", "attempt", "percent", "mcells_per_s", "remaining_s", "rss_mb")
+"""Column order of the rows stored in a solver throughput file."""
+
+_WARMUP_PERCENT = 5
+"""Samples below this percentage are ignored for the early/late comparison (solver ramp-up)."""
+
+
+def summarize_throughput(samples: List[List[Optional[float]]]) -> dict:
+    """Computes throughput statistics for one simulation.
+
+    The early and late medians compare the first and last quarter of the run
+    (by solver percentage, after warm-up). A late/early ratio well below 1
+    means the solver slowed down while running, e.g. from swapping, thermal
+    throttling or another job competing for the GPU.
+
+    Args:
+        samples: Rows in `THROUGHPUT_COLUMNS` order.
+
+    Returns:
+        Dict with sample count, median/min/max MCells/s, early and late
+        medians, their ratio and the peak solver RSS. Empty if no samples.
+    """
+    if not samples:
+        return {}
+    col = {name: i for i, name in enumerate(THROUGHPUT_COLUMNS)}
+    last_attempt = samples[-1][col["attempt"]]
+    rows = [r for r in samples if r[col["attempt"]] == last_attempt]
+    speeds = [r[col["mcells_per_s"]] for r in rows]
+    steady = [r for r in rows if r[col["percent"]] >= _WARMUP_PERCENT] or rows
+    early = [r[col["mcells_per_s"]] for r in steady if r[col["percent"]] <= 25]
+    late = [r[col["mcells_per_s"]] for r in steady if r[col["percent"]] >= 75]
+    rss = [r[col["rss_mb"]] for r in samples if r[col["rss_mb"]] is not None]
+
+    summary = {
+        "samples": len(rows),
+        "attempts": int(last_attempt),
+        "median_mcells_per_s": statistics.median(speeds),
+        "min_mcells_per_s": min(speeds),
+        "max_mcells_per_s": max(speeds),
+        "early_median_mcells_per_s": statistics.median(early) if early else None,
+        "late_median_mcells_per_s": statistics.median(late) if late else None,
+        "degradation_ratio": None,
+        "peak_rss_mb": max(rss) if rss else None,
+    }
+    if early and late and summary["early_median_mcells_per_s"] > 0:
+        summary["degradation_ratio"] = summary["late_median_mcells_per_s"] / summary["early_median_mcells_per_s"]
+    return summary
+
+
+def load_throughput_file(path: str) -> dict:
+    """Loads a throughput file written by `SolverThroughputRecorder.save`.
+
+    Args:
+        path: Path to a `solver_throughput.json` file.
+
+    Returns:
+        Dict with 'metadata', 'columns', 'samples' and 'summary' keys.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SolverThroughputRecorder:
+    """Collects every iSolve progress sample of one simulation.
+
+    Each sample stores wall time, elapsed solver time, retry attempt, percent
+    done, MCells/s, iSolve's own remaining-time estimate and the resident
+    memory of the iSolve process. The series is written next to the
+    simulation results so throughput can be compared across a sweep.
+    """
+
+    def __init__(self, metadata: Optional[dict] = None):
+        """Initializes an empty recorder.
+
+        Args:
+            metadata: Free-form fields saved with the series (simulation name, kernel, ...).
+        """
+        self.metadata = dict(metadata or {})
+        self.samples: List[List[Optional[float]]] = []
+        self.attempt = 0
+        self._process = None
+        self._attempt_start = time.monotonic()
+
+    def start_attempt(self, pid: Optional[int] = None) -> None:
+        """Marks the start of a solver attempt and attaches to its process for RSS sampling.
+
+        Args:
+            pid: Process id of the iSolve process, if known.
+        """
+        self.attempt += 1
+        self._attempt_start = time.monotonic()
+        self._process = None
+        if psutil is not None and pid is not None:
+            try:
+                self._process = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._process = None
+
+    def _sample_rss_mb(self) -> Optional[float]:
+        """Returns the resident memory of the attached solver process in MB."""
+        if self._process is None:
+            return None
+        try:
+            return self._process.memory_info().rss / (1024 * 1024)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._process = None
+            return None
+
+    def record(self, progress_info: "ProgressInfo") -> List[Optional[float]]:
+        """Appends one progress sample.
+
+        Args:
+            progress_info: Parsed iSolve progress line.
+
+        Returns:
+            The recorded row in `THROUGHPUT_COLUMNS` order.
+        """
+        row = [
+            time.time(),
+            time.monotonic() - self._attempt_start,
+            self.attempt,
+            progress_info.percentage,
+            float(progress_info.mcells_per_sec),
+            progress_info.remaining_seconds,
+            self._sample_rss_mb(),
+        ]
+        self.samples.append(row)
+        return row
+
+    def summary(self) -> dict:
+        """Returns `summarize_throughput` of the recorded samples."""
+        return summarize_throughput(self.samples)
+
+    def save(self, results_dir: str) -> Optional[str]:
+        """Writes the series and its summary to `SOLVER_THROUGHPUT_FILENAME` in `results_dir`.
+
+        Args:
+            results_dir: Directory holding the simulation results.
+
+        Returns:
+            Path of the written file, or None if there was nothing to write.
+        """
+        if not self.samples:
+            return None
+        path = os.path.join(results_dir, SOLVER_THROUGHPUT_FILENAME)
+        payload = {
+            "metadata": self.metadata,
+            "columns": list(THROUGHPUT_COLUMNS),
+            "samples": self.samples,
+            "summary": self.summary(),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        return path
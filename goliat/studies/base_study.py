@@ -17,11 +17,15 @@ except ImportError:
     requests = None  # type: ignore
 
 from goliat.config import Config
+from goliat.constants import CLEANUP_WAIT_S, RESULT_UPLOAD_WAIT_S
+from goliat.eta_model import simulation_features
+from goliat.extraction.cleanup_service import CleanupService
 from goliat.logging_manager import LoggingMixin
 from goliat.profiler import Profiler
 from goliat.project_manager import ProjectManager
 from goliat.simulation_runner import SimulationRunner
 from goliat.utils import StudyCancelledError, ensure_s4l_running
+from goliat.utils.result_uploader import ResultUploader
 
 if TYPE_CHECKING:
     from ..gui_manager import QueueGUI
@@ -71,8 +75,12 @@ class BaseStudy(LoggingMixin):
             profiling_config,
             self.study_type,
             self.config.profiling_config_path,
+            eta_history_path=self.config.eta_history_path,
+            sample_stacks=bool(self.config["execution_control.sample_stacks"]),
         )
         self.line_profiler = None
+        self._result_uploader: Optional[ResultUploader] = None
+        self._cleanup_service: Optional[CleanupService] = None
 
         self.project_manager = ProjectManager(
             self.config,
@@ -109,7 +117,9 @@ class BaseStudy(LoggingMixin):
                     yield
         finally:
             elapsed = self.profiler.subtask_times[task_name][-1]
-            self._log(f"    - Subtask '{task_name}' done in {elapsed:.2f}s", log_type="verbose")
+            usages = self.profiler.subtask_resources.get(task_name)
+            usage = f" ({usages[-1].summary()})" if usages else ""
+            self._log(f"    - Subtask '{task_name}' done in {elapsed:.2f}s{usage}", log_type="verbose")
 
             if is_top_level_subtask:
                 self._log(f"    - Done in {elapsed:.2f}s", level="progress", log_type="success")
@@ -139,6 +149,8 @@ class BaseStudy(LoggingMixin):
         """
         ensure_s4l_running()
         try:
+            if self.config["execution_control.resume_verification"] == "deep" and not self.no_cache:
+                self.project_manager.deep_verify_resume_manifest()
             self._run_study()
         except StudyCancelledError:
             self._log(
@@ -156,6 +168,8 @@ class BaseStudy(LoggingMixin):
                 log_type="success",
             )
             self.profiler.save_estimates()
+            self._wait_for_result_uploads()
+            self._finish_cleanup()
             self.project_manager.cleanup()
             if self.gui:
                 self.gui.update_profiler()  # Send final profiler state
@@ -174,6 +188,21 @@ class BaseStudy(LoggingMixin):
         do_extract = True if do_extract is None else bool(do_extract)
         return do_setup, do_run, do_extract
 
+    def _simulation_features(self, phantom_name: str, freq) -> dict:
+        """Describes one simulation for the profiler's learned ETA model.
+
+        Args:
+            phantom_name: Name of the phantom.
+            freq: Frequency in MHz, or a list of frequencies for multi-sine runs.
+
+        Returns:
+            Feature dict from `goliat.eta_model.simulation_features`.
+        """
+        frequency = max(freq) if isinstance(freq, list) else freq
+        # Point sensors plus the overall field sensor
+        sensors = (self.config["simulation_parameters.number_of_point_sensors"] or 0) + 1
+        return simulation_features(frequency, phantom_name, kernel=(self.config["solver_settings"] or {}).get("kernel"), sensors=sensors)
+
     def _set_initial_profiler_phase(self, do_setup: bool, do_run: bool, do_extract: bool):
         """Sets the initial profiler phase based on execution control flags.
 
@@ -310,6 +339,9 @@ class BaseStudy(LoggingMixin):
         Args:
             simulation: The simulation object to run.
         """
+        project_path = self.project_manager.project_path
+        if self._cleanup_service is not None and project_path is not None:
+            self._cleanup_service.ensure_free_space(project_path)
         with self.subtask("run_simulation_total"):
             runner = SimulationRunner(
                 self.config,
@@ -408,8 +440,13 @@ class BaseStudy(LoggingMixin):
             self.project_manager.update_simulation_metadata(os.path.join(project_dir, "config.json"), extract_done=True)
             # Upload results if running as part of an assignment
             self._upload_results_if_assignment(project_dir)
+            if self._cleanup_service is not None:
+                self._cleanup_service.release(project_dir)
         else:
             self._log(f"Deliverables for '{stage}' phase not found. Metadata not updated.", log_type="warning")
+            if stage == "extract" and self._cleanup_service is not None:
+                # Keep the files of an unconfirmed extraction so it can be retried
+                self._cleanup_service.discard(project_dir)
 
     def _collect_result_files(self, project_dir: str) -> dict:
         """Collects result files to upload.
@@ -418,7 +455,8 @@ class BaseStudy(LoggingMixin):
             project_dir: Path to the simulation results directory.
 
         Returns:
-            Dictionary mapping filename to file content (bytes).
+            Dictionary mapping filename to file path. Files are streamed from
+            disk by the uploader, not read here.
         """
         files_to_upload = [
             "config.json",
@@ -434,11 +472,7 @@ class BaseStudy(LoggingMixin):
         for filename in files_to_upload:
             file_path = os.path.join(project_dir, filename)
             if os.path.exists(file_path):
-                try:
-                    with open(file_path, "rb") as f:
-                        files[filename] = f.read()
-                except Exception as e:
-                    self._log(f"WARNING: Could not read {filename}: {e}", log_type="warning")
+                files[filename] = file_path
         return files
 
     def _normalize_relative_path(self, project_dir: str) -> str:
@@ -477,35 +511,74 @@ class BaseStudy(LoggingMixin):
         # Normalize path separators to forward slashes for cross-platform compatibility
         return relative_path.replace(os.sep, "/").replace(os.altsep, "/")
 
-    def _upload_files_to_server(self, files: dict, relative_path: str, assignment_id: str, server_url: str):
-        """Uploads files to the monitoring server.
+    def _upload_files_to_server(self, files: dict, relative_path: str, assignment_id: str, server_url: str, project_dir: str):
+        """Queues files for background upload to the monitoring server.
+
+        The upload runs on the uploader's thread so the next simulation can
+        start right away; `run()` waits for queued uploads before returning.
 
         Args:
-            files: Dictionary mapping filename to file content.
+            files: Dictionary mapping filename to file path.
             relative_path: Relative path from results/ root.
             assignment_id: Assignment ID from environment.
             server_url: Server URL for uploads.
+            project_dir: Simulation results directory.
         """
         try:
-            # Prepare multipart form data
-            upload_files = []
-            for filename, content in files.items():
-                upload_files.append(("files", (filename, content)))
-
-            response = requests.post(  # type: ignore[attr-defined]
-                f"{server_url}/api/assignments/{assignment_id}/results",
-                files=upload_files,
-                data={"relativePath": relative_path},
-                timeout=30,
-            )
-
-            if response.status_code == 200:
-                self._log(f"Results uploaded successfully ({len(files)} files)", log_type="success")
-            else:
-                self._log(f"WARNING: Results upload failed (status {response.status_code}): {response.text[:100]}", log_type="warning")
+            if self._result_uploader is None:
+                self._result_uploader = ResultUploader(server_url, assignment_id, logger=self.verbose_logger)
+            self._result_uploader.submit(project_dir, relative_path, files, force=self._should_reupload_results())
+            self._log(f"Queued {len(files)} result files for upload", log_type="info")
         except Exception as e:
             self._log(f"WARNING: Error uploading results: {e}", log_type="warning")
 
+    def _wait_for_result_uploads(self):
+        """Waits for queued result uploads so they are not lost when the process exits."""
+        if self._result_uploader is None:
+            return
+        self._log("Waiting for result uploads to finish...", log_type="info")
+        if not self._result_uploader.wait(timeout=RESULT_UPLOAD_WAIT_S):
+            self._log("WARNING: Result uploads still running; they will resume on the next upload.", log_type="warning")
+        self._result_uploader.close()
+        self._result_uploader = None
+
+    @property
+    def cleanup_service(self) -> CleanupService:
+        """Background service removing simulation files after confirmed extraction.
+
+        Configured from `execution_control.cleanup_archive_dir` (move files there
+        instead of deleting them) and `execution_control.cleanup_min_free_gb`
+        (disk budget below which cleanup is flushed before the next run).
+        """
+        if self._cleanup_service is None:
+            archive_dir = self.config["execution_control.cleanup_archive_dir"]
+            if archive_dir:
+                archive_dir = os.path.join(self.base_dir, archive_dir)
+            min_free_gb = self.config["execution_control.cleanup_min_free_gb"] or 0
+            self._cleanup_service = CleanupService(
+                archive_dir=archive_dir,
+                archive_root=os.path.join(self.base_dir, "results"),
+                min_free_bytes=int(float(min_free_gb) * 1024**3),
+                logger=self.verbose_logger,
+            )
+        return self._cleanup_service
+
+    def _finish_cleanup(self):
+        """Waits for background cleanup and reports the space it freed in this study."""
+        if self._cleanup_service is None:
+            return
+        if not self._cleanup_service.close(timeout=CLEANUP_WAIT_S):
+            self._log("WARNING: Simulation file cleanup still running at exit.", log_type="warning")
+        stats = self._cleanup_service.stats
+        if stats.files or stats.failures:
+            self._log(
+                f"Cleanup removed {stats.files} simulation file(s), freeing {stats.bytes_freed / 1024**3:.2f} GB"
+                + (f" ({stats.failures} could not be removed)" if stats.failures else ""),
+                level="progress",
+                log_type="info",
+            )
+        self._cleanup_service = None
+
     def _upload_results_if_assignment(self, project_dir: str):
         """Upload results to web dashboard if running as part of an assignment.
 
@@ -532,7 +605,7 @@ class BaseStudy(LoggingMixin):
             return
 
         relative_path = self._normalize_relative_path(project_dir)
-        self._upload_files_to_server(files, relative_path, assignment_id, server_url)
+        self._upload_files_to_server(files, relative_path, assignment_id, server_url, project_dir)
 
     def _setup_line_profiler_if_needed(self, subtask_name: str, instance) -> tuple:
         """Sets up line profiler if configured for this subtask.
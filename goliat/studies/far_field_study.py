@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..logging_manager import add_simulation_log_handlers, remove_simulation_log_handlers
+from ..results import get_catalog
 from ..results_extractor import ResultsExtractor
 from ..setups.far_field_setup import FarFieldSetup
 from ..utils import apply_run_tag, profile
@@ -88,6 +89,14 @@ class FarFieldStudy(BaseStudy):
 
         total_simulations = len(phantoms) * len(frequencies) * len(incident_directions) * len(polarizations)
         self.profiler.set_total_simulations(total_simulations)
+        self.profiler.set_simulation_plan(
+            [
+                self._simulation_features(phantom_name, freq)
+                for phantom_name in phantoms
+                for freq in frequencies
+                for _ in range(len(incident_directions) * len(polarizations))
+            ]
+        )
         self._set_initial_profiler_phase(do_setup, do_run, do_extract)
 
         self._iterate_far_field_simulations(
@@ -643,26 +652,7 @@ class FarFieldStudy(BaseStudy):
         Returns:
             List of Path objects to _Output.h5 files.
         """
-        freq_str = f"{'+'.join(str(f) for f in freq)}" if isinstance(freq, list) else str(freq)
-        base_path = Path(self.config.base_dir) / "results" / "far_field" / phantom_name.lower() / f"{freq_str}MHz"
-
-        h5_paths = []
-        for direction in incident_directions:
-            for polarization in polarizations:
-                placement_name = apply_run_tag(f"environmental_{direction}_{polarization}", self.config["run_tag"])
-                project_filename = f"far_field_{phantom_name.lower()}_{freq_str}MHz_{placement_name}"
-                results_dir = base_path / placement_name / f"{project_filename}.smash_Results"
-
-                if results_dir.exists():
-                    candidates = sorted(
-                        (f for f in results_dir.iterdir() if f.name.endswith("_Output.h5")),
-                        key=lambda f: f.stat().st_mtime,
-                        reverse=True,
-                    )
-                    if candidates:
-                        h5_paths.append(candidates[0])
-
-        return h5_paths
+        return list(self._newest_result_files(phantom_name, freq, incident_directions, polarizations, "_Output.h5"))
 
     def _find_input_h5(
         self,
@@ -684,25 +674,42 @@ class FarFieldStudy(BaseStudy):
         Returns:
             Path to an _Input.h5 file, or None if not found.
         """
+        return next(self._newest_result_files(phantom_name, freq, incident_directions, polarizations, "_Input.h5"), None)
+
+    def _newest_result_files(
+        self,
+        phantom_name: str,
+        freq: int | list[int],
+        incident_directions: list[str],
+        polarizations: list[str],
+        suffix: str,
+    ):
+        """Yields the newest file ending in `suffix` from each placement's .smash_Results folder.
+
+        The (phantom, freq) subtree is refreshed in the results catalog once and the
+        folders are then looked up in the index rather than listed one by one.
+
+        Args:
+            phantom_name: Phantom name.
+            freq: Frequency in MHz.
+            incident_directions: List of direction names.
+            polarizations: List of polarization names.
+            suffix: File name suffix, e.g. '_Output.h5'.
+        """
         freq_str = f"{'+'.join(str(f) for f in freq)}" if isinstance(freq, list) else str(freq)
-        base_path = Path(self.config.base_dir) / "results" / "far_field" / phantom_name.lower() / f"{freq_str}MHz"
+        catalog = get_catalog(os.path.join(self.config.base_dir, "results"))
+        catalog.refresh(under=f"far_field/{phantom_name.lower()}/{freq_str}MHz")
 
         for direction in incident_directions:
             for polarization in polarizations:
                 placement_name = apply_run_tag(f"environmental_{direction}_{polarization}", self.config["run_tag"])
+                entry = catalog.simulation(f"far_field/{phantom_name.lower()}/{freq_str}MHz/{placement_name}")
+                if entry is None:
+                    continue
                 project_filename = f"far_field_{phantom_name.lower()}_{freq_str}MHz_{placement_name}"
-                results_dir = base_path / placement_name / f"{project_filename}.smash_Results"
-
-                if results_dir.exists():
-                    candidates = sorted(
-                        (f for f in results_dir.iterdir() if f.name.endswith("_Input.h5")),
-                        key=lambda f: f.stat().st_mtime,
-                        reverse=True,
-                    )
-                    if candidates:
-                        return candidates[0]
-
-        return None
+                newest = entry.newest(suffix, subdir=f"{project_filename}.smash_Results")
+                if newest is not None:
+                    yield Path(newest.path)
 
     def _save_auto_induced_summary(self, summary_path: Path, results: dict) -> None:
         """Save auto-induced results to a summary JSON file.
@@ -52,6 +52,7 @@ class NearFieldStudy(BaseStudy):
 
         total_simulations = self._calculate_total_simulations(phantoms, frequencies, all_scenarios)
         self.profiler.set_total_simulations(total_simulations)
+        self.profiler.set_simulation_plan(self._build_simulation_plan(phantoms, frequencies, all_scenarios))
         self._set_initial_profiler_phase(do_setup, do_run, do_extract)
 
         self._iterate_near_field_simulations(phantoms, frequencies, all_scenarios, total_simulations, do_setup, do_run, do_extract)
@@ -86,6 +87,31 @@ class NearFieldStudy(BaseStudy):
                     total_simulations += len(list(frequencies)) * len(positions) * len(orientations)  # type: ignore
         return total_simulations
 
+    def _build_simulation_plan(self, phantoms: list, frequencies, all_scenarios: dict) -> list[dict]:
+        """Lists the ETA features of every simulation, in the order they will run.
+
+        Args:
+            phantoms: List of phantom names.
+            frequencies: Iterable of frequency strings.
+            all_scenarios: Dictionary of placement scenarios.
+
+        Returns:
+            One feature dict per simulation.
+        """
+        plan = []
+        for phantom_name in phantoms:
+            phantom_definition = (self.config["phantom_definitions"] or {}).get(phantom_name, {})  # type: ignore
+            placements_config = phantom_definition.get("placements", {})
+            if not placements_config:
+                continue
+            for freq_str in frequencies:
+                features = self._simulation_features(phantom_name, int(freq_str))
+                for scenario_name, scenario_details in all_scenarios.items():  # type: ignore
+                    if placements_config.get(f"do_{scenario_name}"):
+                        placements = len(scenario_details.get("positions", {})) * len(scenario_details.get("orientations", {}))
+                        plan.extend([features] * placements)
+        return plan
+
     def _set_initial_profiler_phase(self, do_setup: bool, do_run: bool, do_extract: bool):
         """Sets the initial profiler phase based on execution control flags.
 
@@ -1,10 +1,12 @@
 from .load_far_field import DIRECTIONS, FREQS_MHZ, METRICS, PHANTOMS, POLARIZATIONS, load_far_field
-from .reml_anova import decompose_balanced, decompose_reml
+from .reml_anova import bootstrap_balanced, decompose_balanced, decompose_balanced_all, decompose_reml
 from .report import build_report
 
 __all__ = [
     "load_far_field",
     "decompose_balanced",
+    "decompose_balanced_all",
+    "bootstrap_balanced",
     "decompose_reml",
     "build_report",
     "METRICS",
@@ -1,6 +1,6 @@
 """Tidy long-format loader for env-FF protocol replicates (sT1.5.4).
 
-Walks ``goliat/results/far_field/{phantom}/{freq}MHz/environmental_{axis}_{sign}_{pol}/sar_results.json``
+Reads ``goliat/results/far_field/{phantom}/{freq}MHz/environmental_{axis}_{sign}_{pol}/sar_results.json``
 and returns one row per (phantom, freq, direction, polarisation, metric).
 """
 
@@ -9,11 +9,14 @@ from __future__ import annotations
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from goliat.results import get_catalog
+
 log = logging.getLogger(__name__)
 
 PHANTOMS = ("duke", "eartha", "ella", "thelonious")
@@ -51,48 +54,56 @@ def load_far_field(
     results_root: Path | str,
     phantoms: tuple[str, ...] = PHANTOMS,
     freqs_mhz: tuple[int, ...] = FREQS_MHZ,
+    max_workers: int = 16,
 ) -> pd.DataFrame:
     """Build a tidy long DataFrame from the env-FF result tree.
 
     Returns columns: ``phantom, freq_mhz, direction, polarization, metric, Y, logY``.
-    One row per (phantom, freq, direction, polarisation, metric).
+    One row per (phantom, freq, direction, polarisation, metric). The
+    ``sar_results.json`` files are read by ``max_workers`` threads.
     """
     root = Path(results_root)
-    rows: list[dict] = []
+    catalog = get_catalog(str(root))
+    catalog.refresh()
 
+    # (phantom, freq, direction, pol, path) for every simulation, read in parallel below.
+    sims: list[tuple[str, int, str, str, Path]] = []
     for phantom in phantoms:
         for freq in freqs_mhz:
-            freq_dir = root / phantom / f"{freq}MHz"
-            if not freq_dir.is_dir():
-                log.warning("Missing freq dir: %s", freq_dir)
+            if not catalog.is_dir(f"{phantom}/{freq}MHz"):
+                log.warning("Missing freq dir: %s", root / phantom / f"{freq}MHz")
                 continue
-            for sim_dir in sorted(freq_dir.iterdir()):
-                m = _DIR_RE.match(sim_dir.name)
-                if not m:
+            for sim in catalog.simulations(phantom=phantom, frequency=freq):
+                m = _DIR_RE.match(sim.placement)
+                if not m or "sar_results.json" not in sim.files:
                     continue
                 axis, sign, pol = m.groups()
-                direction = f"{axis}_{sign}"
+                sims.append((phantom, int(freq), f"{axis}_{sign}", pol, Path(sim.files["sar_results.json"].path)))
 
-                payload = _read_one(sim_dir / "sar_results.json")
-                if payload is None:
-                    continue
+    # JSON parsing is cheap; the reads are latency-bound on a results share, so overlap them.
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        payloads = list(pool.map(_read_one, [s[-1] for s in sims]))
 
-                for json_key, metric in METRICS.items():
-                    val = payload.get(json_key)
-                    if val is None or (isinstance(val, float) and not np.isfinite(val)) or val <= 0:
-                        # Non-positive metrics cannot be log-transformed; skip them.
-                        continue
-                    rows.append(
-                        dict(
-                            phantom=phantom,
-                            freq_mhz=int(freq),
-                            direction=direction,
-                            polarization=pol,
-                            metric=metric,
-                            Y=float(val),
-                            logY=float(np.log(val)),
-                        )
-                    )
+    rows: list[dict] = []
+    for (phantom, freq, direction, pol, _), payload in zip(sims, payloads):
+        if payload is None:
+            continue
+        for json_key, metric in METRICS.items():
+            val = payload.get(json_key)
+            if val is None or (isinstance(val, float) and not np.isfinite(val)) or val <= 0:
+                # Non-positive metrics cannot be log-transformed; skip them.
+                continue
+            rows.append(
+                dict(
+                    phantom=phantom,
+                    freq_mhz=freq,
+                    direction=direction,
+                    polarization=pol,
+                    metric=metric,
+                    Y=float(val),
+                    logY=float(np.log(val)),
+                )
+            )
 
     df = pd.DataFrame(rows)
     if df.empty:
@@ -70,57 +70,43 @@ class VarianceComponents:
         return out
 
 
-def decompose_balanced(df: pd.DataFrame, metric: str) -> VarianceComponents:
-    """Closed-form variance components for the balanced env-FF design.
+COMPONENTS = ("phantom", "freq", "pf", "dir", "pol", "resid")
 
-    Uses the standard EMS for a 4-way random-effects ANOVA with main
-    effects on phantom (p), freq (f), direction (d), polarisation (pi) and
-    the p x f interaction. Higher-order interactions and pure numerical
-    noise are pooled into the residual.
-    """
-    sub = df[df["metric"] == metric].copy()
-    if sub.empty:
-        raise ValueError(f"No data for metric {metric}")
+# Tidy column behind each tensor axis, in axis order (phantom, freq, dir, pol).
+_FACTOR_COLUMNS = {"phantom": "phantom", "freq": "freq_mhz", "dir": "direction", "pol": "polarization"}
 
-    levels = {
-        "phantom": sorted(sub["phantom"].unique()),
-        "freq": sorted(sub["freq_mhz"].unique()),
-        "dir": sorted(sub["direction"].unique()),
-        "pol": sorted(sub["polarization"].unique()),
-    }
-    n_p, n_f, n_d, n_pi = (len(levels[k]) for k in ("phantom", "freq", "dir", "pol"))
-    n_expected = n_p * n_f * n_d * n_pi
-    n_obs = len(sub)
-    if n_obs != n_expected:
-        raise ValueError(
-            f"Design is unbalanced for metric={metric}: got {n_obs} obs, "
-            f"expected {n_expected} ({n_p}x{n_f}x{n_d}x{n_pi}). "
-            "Use decompose_reml() for unbalanced data."
-        )
 
-    y = sub["logY"].to_numpy()
-    grand = float(y.mean())
+def _mean_squares(y: np.ndarray) -> tuple[dict[str, np.ndarray], dict[str, int], np.ndarray]:
+    """Mean squares of the additive + p x f model, batched over leading axes.
 
-    # Group means for each marginal.
-    mean_p = sub.groupby("phantom")["logY"].mean()
-    mean_f = sub.groupby("freq_mhz")["logY"].mean()
-    mean_pf = sub.groupby(["phantom", "freq_mhz"])["logY"].mean()
-    mean_d = sub.groupby("direction")["logY"].mean()
-    mean_pi = sub.groupby("polarization")["logY"].mean()
+    Args:
+        y: logY tensor of shape ``(..., n_p, n_f, n_d, n_pi)``, one observation per cell.
 
-    ss_p = n_f * n_d * n_pi * ((mean_p - grand) ** 2).sum()
-    ss_f = n_p * n_d * n_pi * ((mean_f - grand) ** 2).sum()
-    ss_d = n_p * n_f * n_pi * ((mean_d - grand) ** 2).sum()
-    ss_pi = n_p * n_f * n_d * ((mean_pi - grand) ** 2).sum()
+    Returns:
+        ``(ms, df, grand)``: mean squares per component (each of shape ``y.shape[:-4]``),
+        degrees of freedom per component and the grand mean.
+    """
+    n_p, n_f, n_d, n_pi = y.shape[-4:]
+    grand = y.mean(axis=(-4, -3, -2, -1))
+    g = grand[..., None]
+
+    # Marginal means, each reduced over the other three factors.
+    mean_p = y.mean(axis=(-3, -2, -1))
+    mean_f = y.mean(axis=(-4, -2, -1))
+    mean_d = y.mean(axis=(-4, -3, -1))
+    mean_pi = y.mean(axis=(-4, -3, -2))
+    mean_pf = y.mean(axis=(-2, -1))
+
+    ss_p = n_f * n_d * n_pi * ((mean_p - g) ** 2).sum(axis=-1)
+    ss_f = n_p * n_d * n_pi * ((mean_f - g) ** 2).sum(axis=-1)
+    ss_d = n_p * n_f * n_pi * ((mean_d - g) ** 2).sum(axis=-1)
+    ss_pi = n_p * n_f * n_d * ((mean_pi - g) ** 2).sum(axis=-1)
 
     # p x f interaction (after removing main effects):
-    pf_devs = mean_pf.reset_index()
-    pf_devs["mean_p"] = pf_devs["phantom"].map(mean_p)
-    pf_devs["mean_f"] = pf_devs["freq_mhz"].map(mean_f)
-    pf_devs["interaction"] = pf_devs["logY"] - pf_devs["mean_p"] - pf_devs["mean_f"] + grand
-    ss_pf = n_d * n_pi * (pf_devs["interaction"] ** 2).sum()
+    interaction = mean_pf - mean_p[..., :, None] - mean_f[..., None, :] + grand[..., None, None]
+    ss_pf = n_d * n_pi * (interaction**2).sum(axis=(-2, -1))
 
-    ss_total = ((y - grand) ** 2).sum()
+    ss_total = ((y - grand[..., None, None, None, None]) ** 2).sum(axis=(-4, -3, -2, -1))
     ss_resid = ss_total - (ss_p + ss_f + ss_pf + ss_d + ss_pi)
 
     df_p = n_p - 1
@@ -128,46 +114,221 @@ def decompose_balanced(df: pd.DataFrame, metric: str) -> VarianceComponents:
     df_pf = df_p * df_f
     df_d = n_d - 1
     df_pi = n_pi - 1
-    df_total = n_obs - 1
+    df_total = n_p * n_f * n_d * n_pi - 1
     df_resid = df_total - (df_p + df_f + df_pf + df_d + df_pi)
+    df = {"phantom": df_p, "freq": df_f, "pf": df_pf, "dir": df_d, "pol": df_pi, "resid": df_resid}
+
+    ss = {"phantom": ss_p, "freq": ss_f, "pf": ss_pf, "dir": ss_d, "pol": ss_pi, "resid": ss_resid}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ms = {k: ss[k] / df[k] for k in COMPONENTS}
+    return ms, df, grand
 
-    ms = {
-        "phantom": ss_p / df_p,
-        "freq": ss_f / df_f,
-        "pf": ss_pf / df_pf,
-        "dir": ss_d / df_d,
-        "pol": ss_pi / df_pi,
-        "resid": ss_resid / df_resid,
-    }
 
-    # EMS-based variance components (random-effects 4-way ANOVA with
-    # additive main effects + p x f interaction).
+def _ems_components(ms: dict[str, np.ndarray], shape: tuple[int, int, int, int]) -> dict[str, np.ndarray]:
+    """EMS-based variance components (random-effects 4-way ANOVA with
+    additive main effects + p x f interaction)."""
+    n_p, n_f, n_d, n_pi = shape
     v_resid = ms["resid"]
-    v_d = (ms["dir"] - v_resid) / (n_p * n_f * n_pi)
-    v_pi = (ms["pol"] - v_resid) / (n_p * n_f * n_d)
-    v_pf = (ms["pf"] - v_resid) / (n_d * n_pi)
-    v_p = (ms["phantom"] - ms["pf"]) / (n_f * n_d * n_pi)
-    v_f = (ms["freq"] - ms["pf"]) / (n_p * n_d * n_pi)
-
-    sigma2 = {
-        "phantom": float(v_p),
-        "freq": float(v_f),
-        "pf": float(v_pf),
-        "dir": float(v_d),
-        "pol": float(v_pi),
-        "resid": float(v_resid),
+    return {
+        "phantom": (ms["phantom"] - ms["pf"]) / (n_f * n_d * n_pi),
+        "freq": (ms["freq"] - ms["pf"]) / (n_p * n_d * n_pi),
+        "pf": (ms["pf"] - v_resid) / (n_d * n_pi),
+        "dir": (ms["dir"] - v_resid) / (n_p * n_f * n_pi),
+        "pol": (ms["pol"] - v_resid) / (n_p * n_f * n_d),
+        "resid": v_resid,
     }
+
+
+def balanced_tensor(df: pd.DataFrame, metrics: list[str] | None = None) -> tuple[np.ndarray, list[str], dict[str, list]]:
+    """Reshape the tidy frame into a dense ``(metric, phantom, freq, dir, pol)`` logY tensor.
+
+    Levels are the sorted union over all requested metrics, so a metric that
+    is missing any cell shows up as NaN in its slice.
+
+    Returns:
+        ``(tensor, metrics, levels)`` where ``levels`` maps ``phantom``, ``freq``,
+        ``dir`` and ``pol`` to their sorted levels (the tensor's axes 1-4).
+    """
+    if metrics is None:
+        metrics = sorted(df["metric"].unique())
+    sub = df[df["metric"].isin(metrics)]
+    levels = {k: sorted(sub[col].unique()) for k, col in _FACTOR_COLUMNS.items()}
+
+    codes = [pd.Categorical(sub["metric"], categories=metrics).codes]
+    codes += [pd.Categorical(sub[col], categories=levels[k]).codes for k, col in _FACTOR_COLUMNS.items()]
+    tensor = np.full((len(metrics),) + tuple(len(v) for v in levels.values()), np.nan)
+    tensor[tuple(codes)] = sub["logY"].to_numpy()
+    return tensor, list(metrics), levels
+
+
+def decompose_balanced(df: pd.DataFrame, metric: str) -> VarianceComponents:
+    """Closed-form variance components for the balanced env-FF design.
+
+    Uses the standard EMS for a 4-way random-effects ANOVA with main
+    effects on phantom (p), freq (f), direction (d), polarisation (pi) and
+    the p x f interaction. Higher-order interactions and pure numerical
+    noise are pooled into the residual.
+    """
+    sub = df[df["metric"] == metric]
+    if sub.empty:
+        raise ValueError(f"No data for metric {metric}")
+
+    tensor, _, _ = balanced_tensor(sub, [metric])
+    y = tensor[0]
+    n_p, n_f, n_d, n_pi = y.shape
+    n_expected = n_p * n_f * n_d * n_pi
+    n_obs = len(sub)
+    if n_obs != n_expected or np.isnan(y).any():
+        raise ValueError(
+            f"Design is unbalanced for metric={metric}: got {n_obs} obs, "
+            f"expected {n_expected} ({n_p}x{n_f}x{n_d}x{n_pi}). "
+            "Use decompose_reml() for unbalanced data."
+        )
+    return _components_from_tensor(metric, y)
+
+
+def _components_from_tensor(metric: str, y: np.ndarray) -> VarianceComponents:
+    ms, df, grand = _mean_squares(y)
+    sigma2 = _ems_components(ms, y.shape)
     return VarianceComponents(
         metric=metric,
-        n_obs=n_obs,
-        grand_mean_logY=grand,
-        sigma2=sigma2,
-        df={"phantom": df_p, "freq": df_f, "pf": df_pf, "dir": df_d, "pol": df_pi, "resid": df_resid},
-        ms=ms,
+        n_obs=y.size,
+        grand_mean_logY=float(grand),
+        sigma2={k: float(sigma2[k]) for k in COMPONENTS},
+        df=df,
+        ms={k: float(ms[k]) for k in COMPONENTS},
         method="balanced-MoM",
     )
 
 
+def decompose_balanced_all(df: pd.DataFrame, metrics: list[str] | None = None) -> tuple[list[VarianceComponents], dict[str, str]]:
+    """:func:`decompose_balanced` for many metrics in one vectorized pass.
+
+    Metrics that fill the shared design are decomposed together from one
+    tensor. The others fall back to :func:`decompose_balanced`, which uses the
+    metric's own levels.
+
+    Returns:
+        ``(components, skipped)``: components in metric order, and the reason
+        for every metric that could not be decomposed.
+    """
+    tensor, metrics, _ = balanced_tensor(df, metrics)
+    complete = ~np.isnan(tensor).any(axis=(1, 2, 3, 4))
+    counts = df["metric"].value_counts()
+
+    batch = {}
+    if complete.any():
+        y = tensor[complete]
+        ms, dof, grand = _mean_squares(y)
+        sigma2 = _ems_components(ms, y.shape[1:])
+        for i, metric in enumerate(np.asarray(metrics)[complete]):
+            batch[metric] = (i, ms, dof, grand, sigma2)
+
+    components, skipped = [], {}
+    for metric, is_complete in zip(metrics, complete):
+        if is_complete and counts.get(metric, 0) == tensor[0].size:
+            i, ms, dof, grand, sigma2 = batch[metric]
+            components.append(
+                VarianceComponents(
+                    metric=metric,
+                    n_obs=tensor[0].size,
+                    grand_mean_logY=float(grand[i]),
+                    sigma2={k: float(sigma2[k][i]) for k in COMPONENTS},
+                    df=dof,
+                    ms={k: float(ms[k][i]) for k in COMPONENTS},
+                    method="balanced-MoM",
+                )
+            )
+            continue
+        try:
+            components.append(decompose_balanced(df, metric))
+        except ValueError as e:
+            skipped[metric] = str(e)
+    return components, skipped
+
+
+def bootstrap_balanced(
+    df: pd.DataFrame,
+    metrics: list[str] | None = None,
+    n_boot: int = 2000,
+    level: float = 0.95,
+    factors: tuple[str, ...] = ("phantom", "freq", "dir"),
+    seed: int | None = 0,
+    chunk_size: int = 250,
+) -> pd.DataFrame:
+    """Percentile bootstrap confidence intervals for the balanced variance components.
+
+    Each replicate resamples the levels of ``factors`` with replacement
+    (phantoms, frequencies and directions by default; polarisation has only
+    two levels) and recomputes the mean squares and EMS components. All
+    replicates and metrics are evaluated as one ``(metric, replicate, p, f,
+    d, pi)`` tensor, in chunks of ``chunk_size`` replicates to bound memory,
+    instead of refitting per replicate.
+
+    Only metrics that fill the shared balanced design are bootstrapped.
+
+    Args:
+        df: Tidy frame from :func:`~goliat.uncertainty.load_far_field.load_far_field`.
+        metrics: Metrics to bootstrap; defaults to all.
+        n_boot: Number of bootstrap replicates.
+        level: Two-sided confidence level.
+        factors: Factors whose levels are resampled (``phantom``, ``freq``, ``dir``, ``pol``).
+        seed: Seed for :func:`numpy.random.default_rng`.
+        chunk_size: Replicates evaluated per vectorized batch.
+
+    Returns:
+        One row per (metric, component) with columns ``metric, component, sigma,
+        sigma_lo, sigma_hi, n_boot``. Sigmas are square roots of the variance
+        components truncated at zero, as in :attr:`VarianceComponents.sigma`.
+    """
+    unknown = set(factors) - set(_FACTOR_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown bootstrap factors: {sorted(unknown)}")
+    tensor, metrics, _ = balanced_tensor(df, metrics)
+    complete = ~np.isnan(tensor).any(axis=(1, 2, 3, 4))
+    y = tensor[complete]
+    metrics = [m for m, ok in zip(metrics, complete) if ok]
+    if not metrics:
+        return pd.DataFrame(columns=["metric", "component", "sigma", "sigma_lo", "sigma_hi", "n_boot"])
+
+    shape = y.shape[1:]
+    rng = np.random.default_rng(seed)
+    point = _ems_components(_mean_squares(y)[0], shape)
+
+    boot = {k: np.empty((len(metrics), n_boot)) for k in COMPONENTS}
+    for start in range(0, n_boot, chunk_size):
+        n = min(chunk_size, n_boot - start)
+        index = []
+        for axis, factor in enumerate(_FACTOR_COLUMNS):
+            if factor in factors:
+                idx = rng.integers(0, shape[axis], size=(n, shape[axis]))
+            else:
+                idx = np.broadcast_to(np.arange(shape[axis]), (n, shape[axis]))
+            # Broadcast each axis' (replicate, level) draws against the other axes
+            index.append(idx.reshape((n,) + tuple(shape[axis] if a == axis else 1 for a in range(4))))
+        # Adjacent advanced indices keep their place: (metric, replicate, p, f, d, pi)
+        y_boot = y[(slice(None), *index)]
+        sigma2 = _ems_components(_mean_squares(y_boot)[0], shape)
+        for k in COMPONENTS:
+            boot[k][:, start : start + n] = sigma2[k]
+
+    alpha = (1.0 - level) / 2.0
+    bounds = {k: np.nanquantile(np.sqrt(np.clip(boot[k], 0.0, None)), [alpha, 1.0 - alpha], axis=1) for k in COMPONENTS}
+    rows = [
+        {
+            "metric": metric,
+            "component": k,
+            "sigma": float(np.sqrt(max(point[k][i], 0.0))),
+            "sigma_lo": float(bounds[k][0][i]),
+            "sigma_hi": float(bounds[k][1][i]),
+            "n_boot": n_boot,
+        }
+        for i, metric in enumerate(metrics)
+        for k in COMPONENTS
+    ]
+    return pd.DataFrame(rows)
+
+
 def decompose_reml(df: pd.DataFrame, metric: str) -> VarianceComponents:
     """REML fit via statsmodels MixedLM (variance components).
 
@@ -78,10 +78,20 @@ def format_console_table(report: pd.DataFrame) -> str:
     return fmt.to_string(index=False)
 
 
+def format_interval_table(intervals: pd.DataFrame) -> str:
+    """One line per metric with ``sigma [lo, hi]`` for every component."""
+    cells = intervals.assign(
+        cell=[f"{s:.3f} [{lo:.3f}, {hi:.3f}]" for s, lo, hi in intervals[["sigma", "sigma_lo", "sigma_hi"]].to_numpy()]
+    )
+    table = cells.pivot(index="metric", columns="component", values="cell")
+    return table[[c for c in ALL_COMPONENTS if c in table.columns]].to_string()
+
+
 def write_outputs(
     report: pd.DataFrame,
     components: list[VarianceComponents],
     out_dir: Path | str,
+    intervals: pd.DataFrame | None = None,
 ) -> None:
     out = Path(out_dir)
     out.mkdir(parents=True, exist_ok=True)
@@ -104,3 +114,6 @@ def write_outputs(
                 }
             )
     pd.DataFrame(long_rows).to_csv(out / "variance_components_long.csv", index=False)
+
+    if intervals is not None:
+        intervals.to_csv(out / "variance_components_ci.csv", index=False)
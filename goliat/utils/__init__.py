@@ -1,42 +1,79 @@
 """Utility functions for GOLIAT.
 
 This module re-exports commonly used utilities from submodules for backward compatibility.
-All existing imports from `goliat.utils` will continue to work.
+All existing imports from `goliat.utils` will continue to work. Submodules are imported
+on first attribute access, so importing a light helper (e.g. `format_time`) does not
+pull in h5py and numpy through the skin voxel utilities.
 """
 
-# Re-export all commonly used utilities from core module
-from .core import (
-    Profiler,
-    StudyCancelledError,
-    delete_project_file,
-    ensure_s4l_running,
-    format_time,
-    non_blocking_sleep,
-    open_project,
-    profile,
-    suppress_stdout_stderr,
-)
-
-# Run-tag helper for simulation output isolation
-from .run_tag import apply_run_tag
-
-# Also expose setup utilities for convenience
-from .setup import initial_setup
-
-# Skin voxel utilities for auto-induced exposure
-from .skin_voxel_utils import (
-    extract_skin_voxels,
-    get_skin_voxel_coordinates,
-)
-
-# Version detection utilities
-from .version import (
-    get_sim4life_major_minor,
-    get_sim4life_version,
-    get_version_display_string,
-    is_sim4life_92_or_later,
-    is_version_supported,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_EXPORTS = {
+    # Core utilities
+    "Profiler": ".core",
+    "StudyCancelledError": ".core",
+    "delete_project_file": ".core",
+    "ensure_s4l_running": ".core",
+    "format_time": ".core",
+    "non_blocking_sleep": ".core",
+    "open_project": ".core",
+    "profile": ".core",
+    "suppress_stdout_stderr": ".core",
+    # Run-tag helper for simulation output isolation
+    "apply_run_tag": ".run_tag",
+    # Setup utilities
+    "initial_setup": ".setup",
+    # Skin voxel utilities for auto-induced exposure
+    "extract_skin_voxels": ".skin_voxel_utils",
+    "get_skin_voxel_coordinates": ".skin_voxel_utils",
+    # Version detection utilities
+    "get_sim4life_major_minor": ".version",
+    "get_sim4life_version": ".version",
+    "get_version_display_string": ".version",
+    "is_sim4life_92_or_later": ".version",
+    "is_version_supported": ".version",
+}
+"""Public name -> submodule that defines it."""
+
+if TYPE_CHECKING:
+    from .core import (
+        Profiler,
+        StudyCancelledError,
+        delete_project_file,
+        ensure_s4l_running,
+        format_time,
+        non_blocking_sleep,
+        open_project,
+        profile,
+        suppress_stdout_stderr,
+    )
+    from .run_tag import apply_run_tag
+    from .setup import initial_setup
+    from .skin_voxel_utils import extract_skin_voxels, get_skin_voxel_coordinates
+    from .version import (
+        get_sim4life_major_minor,
+        get_sim4life_version,
+        get_version_display_string,
+        is_sim4life_92_or_later,
+        is_version_supported,
+    )
+
+
+def __getattr__(name: str):
+    """Imports the submodule defining `name` on first access and caches the attribute."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Lists lazily exported names alongside the already loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "StudyCancelledError",
@@ -0,0 +1,427 @@
+"""Background, streaming upload of simulation results to the monitoring dashboard."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+try:
+    import requests
+
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+    requests = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+from goliat.constants import (
+    RESULT_UPLOAD_CHUNK_BYTES,
+    RESULT_UPLOAD_MANIFEST_FILENAME,
+    RESULT_UPLOAD_MAX_ATTEMPTS,
+    RESULT_UPLOAD_TIMEOUT_S,
+)
+
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class ResultFile:
+    """A result file frozen at the size and hash it had when the upload was queued."""
+
+    name: str
+    path: str
+    size: int
+    sha256: str
+
+
+def snapshot_file(name: str, path: str, chunk_bytes: int = RESULT_UPLOAD_CHUNK_BYTES) -> ResultFile:
+    """Hashes a file by streaming it; only the bytes present now are uploaded later.
+
+    Logs can still grow while the upload waits in the background, so the
+    size is fixed here and the upload sends exactly the hashed bytes.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_bytes):
+            hasher.update(chunk)
+            size += len(chunk)
+    return ResultFile(name, path, size, hasher.hexdigest())
+
+
+def available_encodings() -> list[str]:
+    """Content encodings this client can produce, preferred first."""
+    return (["zstd"] if zstandard is not None else []) + ["gzip"]
+
+
+def _compressor(encoding: Optional[str]):
+    """Returns a streaming compressor with compress()/flush(), or None for identity."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    if encoding == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    return None
+
+
+def iter_file_content(
+    result_file: ResultFile, encoding: Optional[str] = None, chunk_bytes: int = RESULT_UPLOAD_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """Yields the snapshotted bytes of a file, compressed on the fly if requested."""
+    compressor = _compressor(encoding)
+    remaining = result_file.size
+    with open(result_file.path, "rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(chunk_bytes, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if compressor is None:
+                yield chunk
+            else:
+                compressed = compressor.compress(chunk)
+                if compressed:
+                    yield compressed
+    if compressor is not None:
+        tail = compressor.flush()
+        if tail:
+            yield tail
+
+
+def _read_region(path: str, size: int, chunk_bytes: int) -> Iterator[bytes]:
+    """Yields exactly the first `size` bytes of a file."""
+    remaining = size
+    with open(path, "rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(chunk_bytes, remaining))
+            if not chunk:
+                raise OSError(f"{path} shrank below its snapshotted size of {size} bytes")
+            remaining -= len(chunk)
+            yield chunk
+
+
+class _MultipartBody:
+    """multipart/form-data body streamed from disk, with its length known up front.
+
+    requests sends an iterable that has a length with a Content-Length header
+    rather than chunked transfer encoding, which some proxies and servers
+    reject. Iterating again (on a retry) restarts the body.
+
+    Args:
+        boundary: Multipart boundary.
+        fields: Form fields sent before the files.
+        files: (filename, content type, path, size) of each 'files' part.
+        chunk_bytes: Read size when streaming files.
+    """
+
+    def __init__(self, boundary: str, fields: dict, files: list[tuple[str, str, str, int]], chunk_bytes: int):
+        self._segments: list = []
+        for key, value in fields.items():
+            self._segments.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'.encode())
+        for filename, content_type, path, size in files:
+            self._segments.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n".encode()
+            )
+            self._segments.append((path, size))
+            self._segments.append(b"\r\n")
+        self._segments.append(f"--{boundary}--\r\n".encode())
+        self._chunk_bytes = chunk_bytes
+        self.sent = 0
+
+    def __len__(self) -> int:
+        return sum(len(segment) if isinstance(segment, bytes) else segment[1] for segment in self._segments)
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.sent = 0
+        for segment in self._segments:
+            for chunk in (segment,) if isinstance(segment, bytes) else _read_region(*segment, self._chunk_bytes):
+                self.sent += len(chunk)
+                yield chunk
+
+
+class ResultUploader:
+    """Uploads result files of finished simulations on a background thread.
+
+    Request bodies are streamed from disk with a Content-Length header, so
+    memory use does not grow with log size. Before uploading, the content
+    hashes are offered to the server's manifest endpoint and only files it
+    reports missing are sent, one request per file, compressed if the server
+    accepts an encoding; servers without that endpoint get every file in one
+    uncompressed request, as before. Files acknowledged
+    by the server are recorded in a manifest in the results directory, so a
+    retried or restarted upload resumes with the files that did not make it.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        assignment_id: str,
+        session=None,
+        logger: Optional[logging.Logger] = None,
+        max_attempts: int = RESULT_UPLOAD_MAX_ATTEMPTS,
+        chunk_bytes: int = RESULT_UPLOAD_CHUNK_BYTES,
+        timeout: float = RESULT_UPLOAD_TIMEOUT_S,
+    ):
+        """Initializes the uploader.
+
+        Args:
+            server_url: Base URL of the monitoring dashboard.
+            assignment_id: Assignment the results belong to.
+            session: HTTP session; a keep-alive session is created if None.
+            logger: Logger for upload messages.
+            max_attempts: Attempts per file before giving up.
+            chunk_bytes: Read size when streaming files.
+            timeout: Socket timeout per request in seconds.
+        """
+        self.server_url = server_url.rstrip("/")
+        self.assignment_id = assignment_id
+        self.session = session or requests.Session()  # type: ignore[union-attr]
+        self.logger = logger or logging.getLogger("verbose")
+        self.max_attempts = max_attempts
+        self.chunk_bytes = chunk_bytes
+        self.timeout = timeout
+        self._manifest_supported: Optional[bool] = None
+        self._manifest_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-upload")
+        self._pending: list[Future] = []
+
+    @property
+    def results_url(self) -> str:
+        """Endpoint receiving result files."""
+        return f"{self.server_url}/api/assignments/{self.assignment_id}/results"
+
+    def submit(self, project_dir: str, relative_path: str, filenames: dict, force: bool = False) -> Future:
+        """Snapshots the files and queues their upload.
+
+        Args:
+            project_dir: Simulation results directory (holds the upload manifest).
+            relative_path: Path of the results relative to the results root.
+            filenames: Mapping of upload name to file path.
+            force: Ignore the local manifest and offer every file again.
+
+        Returns:
+            Future resolving to the summary returned by `upload`.
+        """
+        files = []
+        for name, path in filenames.items():
+            try:
+                files.append(snapshot_file(name, path, self.chunk_bytes))
+            except OSError as e:
+                self.logger.warning(f"Could not read {name} for upload: {e}", extra={"log_type": "warning"})
+        future = self._executor.submit(self.upload, project_dir, relative_path, files, force)
+        self._pending = [f for f in self._pending if not f.done()] + [future]
+        return future
+
+    def upload(self, project_dir: str, relative_path: str, files: list[ResultFile], force: bool = False) -> dict:
+        """Uploads files that neither the local manifest nor the server already has.
+
+        Args:
+            project_dir: Simulation results directory.
+            relative_path: Path of the results relative to the results root.
+            files: Snapshotted files.
+            force: Ignore the local manifest.
+
+        Returns:
+            Dict with 'uploaded', 'skipped' and 'failed' file names and 'bytes_sent'.
+        """
+        summary = {"uploaded": [], "skipped": [], "failed": [], "bytes_sent": 0}
+        manifest = {} if force else self._load_manifest(project_dir)
+        candidates = []
+        for f in files:
+            if manifest.get(f.name) == f.sha256:
+                summary["skipped"].append(f.name)
+            else:
+                candidates.append(f)
+
+        missing, encoding = self._query_server(relative_path, candidates)
+        if missing is None and candidates:
+            sent = self._post_batch(relative_path, candidates)
+            for f in candidates:
+                summary["failed" if sent is None else "uploaded"].append(f.name)
+                if sent is not None:
+                    self._record_uploaded(project_dir, f)
+            summary["bytes_sent"] += sent or 0
+            candidates = []
+        for f in candidates:
+            if missing is not None and f.name not in missing:
+                summary["skipped"].append(f.name)
+                self._record_uploaded(project_dir, f)
+                continue
+            sent = self._post_file(relative_path, f, encoding)
+            if sent is None:
+                summary["failed"].append(f.name)
+            else:
+                summary["uploaded"].append(f.name)
+                summary["bytes_sent"] += sent
+                self._record_uploaded(project_dir, f)
+
+        if summary["failed"]:
+            self.logger.warning(
+                f"Results upload for {relative_path}: {len(summary['failed'])} file(s) failed: {', '.join(summary['failed'])}",
+                extra={"log_type": "warning"},
+            )
+        else:
+            self.logger.info(
+                f"Results uploaded for {relative_path}: {len(summary['uploaded'])} sent "
+                f"({summary['bytes_sent'] / 1024:.0f} KB), {len(summary['skipped'])} already on server",
+                extra={"log_type": "success"},
+            )
+        return summary
+
+    def _query_server(self, relative_path: str, files: list[ResultFile]) -> tuple[Optional[set], Optional[str]]:
+        """Asks the server which files it lacks and which encodings it accepts.
+
+        Returns:
+            (names of missing files, negotiated encoding); (None, None) when
+            the server has no manifest endpoint.
+        """
+        if not files or self._manifest_supported is False:
+            return None, None
+        payload = {
+            "relativePath": relative_path,
+            "files": [{"name": f.name, "sha256": f.sha256, "size": f.size} for f in files],
+            "encodings": available_encodings(),
+        }
+        try:
+            response = self.session.post(f"{self.results_url}/manifest", json=payload, timeout=self.timeout)
+        except requests.RequestException as e:  # type: ignore[union-attr]
+            self.logger.debug(f"Result manifest request failed: {e}")
+            return None, None
+        if response.status_code != 200:
+            if response.status_code in (404, 405, 501):
+                self._manifest_supported = False
+            return None, None
+        self._manifest_supported = True
+        body = response.json()
+        accepted = body.get("encodings") or []
+        encoding = next((e for e in available_encodings() if e in accepted), None)
+        return set(body.get("missing", [f.name for f in files])), encoding
+
+    def _post_file(self, relative_path: str, result_file: ResultFile, encoding: Optional[str]) -> Optional[int]:
+        """Uploads one file, compressed with `encoding` if given.
+
+        Returns:
+            Bytes sent in the successful request, or None if the upload failed.
+        """
+        fields = {"relativePath": relative_path, "sha256": result_file.sha256, "size": result_file.size}
+        if not encoding:
+            return self._post(
+                result_file.name, fields, [(result_file.name, "application/octet-stream", result_file.path, result_file.size)]
+            )
+
+        fields["contentEncoding"] = encoding
+        content_type = {"zstd": "application/zstd", "gzip": "application/gzip"}[encoding]
+        # The compressed size must be known for Content-Length, so compress to a temporary file once for all attempts
+        fd, compressed_path = tempfile.mkstemp(prefix="goliat-upload-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in iter_file_content(result_file, encoding, self.chunk_bytes):
+                    f.write(chunk)
+            size = os.path.getsize(compressed_path)
+            return self._post(result_file.name, fields, [(result_file.name, content_type, compressed_path, size)])
+        except OSError as e:
+            self.logger.warning(f"Could not compress {result_file.name} for upload: {e}", extra={"log_type": "warning"})
+            return None
+        finally:
+            os.remove(compressed_path)
+
+    def _post_batch(self, relative_path: str, files: list[ResultFile]) -> Optional[int]:
+        """Uploads all files uncompressed in one request, for servers without the manifest endpoint.
+
+        Returns:
+            Bytes sent in the successful request, or None if the upload failed.
+        """
+        parts = [(f.name, "application/octet-stream", f.path, f.size) for f in files]
+        return self._post(f"{len(files)} result files", {"relativePath": relative_path}, parts)
+
+    def _post(self, label: str, fields: dict, parts: list[tuple[str, str, str, int]]) -> Optional[int]:
+        """Posts a multipart body to the results endpoint, retrying with backoff.
+
+        Args:
+            label: What is being uploaded, for log messages.
+            fields: Form fields.
+            parts: (filename, content type, path, size) of each file part.
+
+        Returns:
+            Bytes sent in the successful request, or None if the upload failed.
+        """
+        boundary = uuid.uuid4().hex
+        body = _MultipartBody(boundary, fields, parts, self.chunk_bytes)
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = self.session.post(
+                    self.results_url,
+                    data=body,
+                    headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+                    timeout=self.timeout,
+                )
+                if response.status_code == 200:
+                    return body.sent
+                if response.status_code not in _RETRYABLE_STATUS:
+                    self.logger.warning(
+                        f"Upload of {label} rejected (status {response.status_code}): {response.text[:100]}",
+                        extra={"log_type": "warning"},
+                    )
+                    return None
+                reason = f"status {response.status_code}"
+            except (requests.RequestException, OSError) as e:  # type: ignore[union-attr]
+                reason = str(e)
+            if attempt < self.max_attempts:
+                delay = min(2**attempt, 30)
+                self.logger.debug(f"Upload of {label} failed ({reason}); retrying in {delay}s")
+                time.sleep(delay)
+        return None
+
+    def _load_manifest(self, project_dir: str) -> dict:
+        """Files of this assignment already acknowledged by the server, by name -> sha256."""
+        try:
+            with open(os.path.join(project_dir, RESULT_UPLOAD_MANIFEST_FILENAME), "r") as f:
+                return json.load(f).get(self.assignment_id, {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return {}
+
+    def _record_uploaded(self, project_dir: str, result_file: ResultFile) -> None:
+        """Adds an acknowledged file to the local manifest (atomic write)."""
+        path = os.path.join(project_dir, RESULT_UPLOAD_MANIFEST_FILENAME)
+        with self._manifest_lock:
+            try:
+                with open(path, "r") as f:
+                    manifest = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                manifest = {}
+            manifest.setdefault(self.assignment_id, {})[result_file.name] = result_file.sha256
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, path)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for queued uploads; returns False if some are still running after `timeout`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in list(self._pending):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except FutureTimeoutError:
+                return False
+            except Exception as e:
+                self.logger.warning(f"Results upload failed: {e}", extra={"log_type": "warning"})
+        return True
+
+    def close(self) -> None:
+        """Stops accepting uploads and closes the HTTP session."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
@@ -19,7 +19,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import trimesh
 from matplotlib import cm
-from scipy.spatial import ConvexHull
+
+from goliat.extraction.cross_section import CrossSectionEngine, mesh_hash
 
 # ============================================================================
 # Constants
@@ -33,78 +34,20 @@ MAX_STL_SIZE_MB = 10  # Only process reduced meshes < 10 MB
 
 
 # ============================================================================
-# Core computation functions (from compute_cross_section.py)
+# Core computation (goliat.extraction.cross_section)
 # ============================================================================
 
 
-def create_perpendicular_basis(view_direction: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    """Create two orthonormal basis vectors perpendicular to the view direction."""
-    n = view_direction / np.linalg.norm(view_direction)
-
-    if abs(n[0]) < 0.9:
-        ref = np.array([1.0, 0.0, 0.0])
-    else:
-        ref = np.array([0.0, 1.0, 0.0])
-
-    u = np.cross(n, ref)
-    u = u / np.linalg.norm(u)
-    v = np.cross(n, u)
-    v = v / np.linalg.norm(v)
-
-    return u, v
-
-
-def compute_projected_area(vertices: np.ndarray, view_direction: np.ndarray) -> float:
-    """Compute the projected convex hull area for a given viewing direction."""
-    u, v = create_perpendicular_basis(view_direction)
-
-    projected_2d = np.column_stack([np.dot(vertices, u), np.dot(vertices, v)])
-
-    try:
-        hull = ConvexHull(projected_2d)
-        return hull.volume  # In 2D, volume = area
-    except Exception:
-        return 0.0
-
-
-def sample_sphere_directions(n_theta: int = 36, n_phi: int = 72) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Generate direction vectors uniformly sampling a sphere."""
-    theta = np.linspace(0, np.pi, n_theta)
-    phi = np.linspace(0, 2 * np.pi, n_phi)
-
-    THETA, PHI = np.meshgrid(theta, phi, indexing="ij")
-
-    X = np.sin(THETA) * np.cos(PHI)
-    Y = np.sin(THETA) * np.sin(PHI)
-    Z = np.cos(THETA)
-
-    directions = np.stack([X, Y, Z], axis=-1)
-
-    return THETA, PHI, directions
-
-
 def compute_area_pattern(mesh: trimesh.Trimesh, n_theta: int = 36, n_phi: int = 72) -> dict:
     """
     Compute cross-sectional area pattern for all sampled directions.
 
     Returns a dictionary with all pattern data for serialization.
     """
-    THETA, PHI, directions = sample_sphere_directions(n_theta, n_phi)
-
-    vertices = mesh.vertices
-    areas = np.zeros((n_theta, n_phi))
-
-    total = n_theta * n_phi
-    print(f"    Computing areas for {total} directions...")
-
-    for i in range(n_theta):
-        for j in range(n_phi):
-            direction = directions[i, j]
-            if np.linalg.norm(direction) > 0.01:
-                areas[i, j] = compute_projected_area(vertices, direction)
-
-        if (i + 1) % 12 == 0:
-            print(f"      Progress: {(i + 1) * n_phi}/{total} ({100 * (i + 1) / n_theta:.0f}%)")
+    engine = CrossSectionEngine(mesh.vertices)
+    print(f"    Computing areas for {n_theta * n_phi} directions...")
+    pattern = engine.pattern(n_theta, n_phi)
+    areas = pattern.areas.copy()
 
     # Determine unit conversion
     bbox = mesh.bounding_box.extents
@@ -117,8 +60,8 @@ def compute_area_pattern(mesh: trimesh.Trimesh, n_theta: int = 36, n_phi: int =
         input_units = "m"
 
     return {
-        "theta": THETA.tolist(),
-        "phi": PHI.tolist(),
+        "theta": pattern.theta.tolist(),
+        "phi": pattern.phi.tolist(),
         "areas": areas.tolist(),
         "units": units,
         "input_units": input_units,
@@ -127,6 +70,7 @@ def compute_area_pattern(mesh: trimesh.Trimesh, n_theta: int = 36, n_phi: int =
         "bounding_box": bbox.tolist(),
         "n_vertices": len(mesh.vertices),
         "n_faces": len(mesh.faces),
+        "mesh_hash": engine.mesh_hash,
         "stats": {
             "min": float(areas.min()),
             "max": float(areas.max()),
@@ -311,29 +255,31 @@ def process_phantom(phantom: dict, resolution: int, force: bool = False) -> dict
     pattern_png = phantom_dir / "cross_section_pattern.png"
     heatmap_png = phantom_dir / "cross_section_heatmap.png"
 
-    # Check if already processed
-    if npz_path.exists() and not force:
-        print("  Already processed (use --force to recompute)")
-
-        # Load existing data
-        data = np.load(npz_path, allow_pickle=False)
-        return {
-            "theta": data["theta"],
-            "phi": data["phi"],
-            "areas": data["areas"],
-            "stats": {
-                "min": float(data["stats_min"]),
-                "max": float(data["stats_max"]),
-                "mean": float(data["stats_mean"]),
-                "ratio": float(data["stats_ratio"]),
-            },
-        }
-
     # Load mesh
     print(f"  Loading mesh: {stl_path.name} ({phantom['size_mb']:.1f} MB)")
     mesh = trimesh.load(stl_path)
     print(f"  Mesh: {len(mesh.vertices)} vertices, {len(mesh.faces)} faces")
 
+    # Check if already processed for this mesh and resolution (patterns saved before
+    # mesh hashes were recorded are trusted if the resolution matches)
+    if npz_path.exists() and not force:
+        data = np.load(npz_path, allow_pickle=False)
+        stored_hash = str(data["mesh_hash"]) if "mesh_hash" in data.files else None
+        if int(data["n_theta"]) == resolution and stored_hash in (None, mesh_hash(mesh.vertices)):
+            print("  Already processed (use --force to recompute)")
+            return {
+                "theta": data["theta"],
+                "phi": data["phi"],
+                "areas": data["areas"],
+                "stats": {
+                    "min": float(data["stats_min"]),
+                    "max": float(data["stats_max"]),
+                    "mean": float(data["stats_mean"]),
+                    "ratio": float(data["stats_ratio"]),
+                },
+            }
+        print("  Mesh or resolution changed since the last run, recomputing")
+
     # Compute pattern
     n_theta = resolution
     n_phi = resolution * 2
@@ -361,6 +307,7 @@ def process_phantom(phantom: dict, resolution: int, force: bool = False) -> dict
         n_faces=np.array(pattern_data["n_faces"]),
         phantom_name=np.array(pattern_data["phantom_name"]),
         stl_path=np.array(pattern_data["stl_path"]),
+        mesh_hash=np.array(pattern_data["mesh_hash"]),
         stats_min=np.array(stats["min"]),
         stats_max=np.array(stats["max"]),
         stats_mean=np.array(stats["mean"]),
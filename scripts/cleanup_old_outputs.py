@@ -19,6 +19,11 @@ import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from goliat.extraction.cleanup_service import CleanupService  # noqa: E402
+
 # ============== CONFIGURATION ==============
 TESTING = False  # Set to False to actually delete files
 INITIAL_DELAY_HOURS = 2.5
@@ -150,18 +155,13 @@ def cleanup_files(results_dir: Path, testing: bool = True) -> int:
         logger.warning("TESTING MODE: Files were NOT deleted.")
     else:
         logger.info("Deleting files...")
-        for file_path, _ in old_files:
-            try:
-                file_path.unlink()
-                logger.info(f"  Deleted: {file_path}")
-                deleted_count += 1
-            except PermissionError:
-                logger.error(f"  Permission denied deleting: {file_path}")
-            except FileNotFoundError:
-                logger.warning(f"  File already gone: {file_path}")
-            except OSError as e:
-                logger.error(f"  Error deleting {file_path}: {e}")
-        logger.info(f"Deleted {deleted_count}/{len(old_files)} files.")
+        # Same batched, parallel removal the studies use after extraction
+        service = CleanupService(logger=logger, batch_window_s=0)
+        service.submit([str(file_path) for file_path, _ in old_files], hold_key="old_outputs")
+        service.release("old_outputs")
+        service.close()
+        deleted_count = service.stats.files
+        logger.info(f"Deleted {deleted_count}/{len(old_files)} files, {service.stats.bytes_freed / (1024 * 1024):.1f} MB freed.")
 
         # Show disk space after cleanup
         try:
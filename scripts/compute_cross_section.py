@@ -22,7 +22,8 @@ from typing import Union
 
 import numpy as np
 import trimesh
-from scipy.spatial import ConvexHull
+
+from goliat.extraction.cross_section import CrossSectionEngine
 
 
 def direction_to_vector(direction: str) -> np.ndarray:
@@ -76,72 +77,6 @@ def direction_to_vector(direction: str) -> np.ndarray:
     )
 
 
-def create_perpendicular_basis(view_direction: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    """
-    Create two orthonormal basis vectors perpendicular to the view direction.
-
-    Args:
-        view_direction: Unit vector defining the viewing direction
-
-    Returns:
-        Tuple of two orthonormal vectors (u, v) perpendicular to view_direction
-    """
-    # Normalize the view direction (should already be normalized, but ensure)
-    n = view_direction / np.linalg.norm(view_direction)
-
-    # Choose a reference vector not parallel to n
-    if abs(n[0]) < 0.9:
-        ref = np.array([1.0, 0.0, 0.0])
-    else:
-        ref = np.array([0.0, 1.0, 0.0])
-
-    # Create first perpendicular vector using cross product
-    u = np.cross(n, ref)
-    u = u / np.linalg.norm(u)
-
-    # Create second perpendicular vector
-    v = np.cross(n, u)
-    v = v / np.linalg.norm(v)
-
-    return u, v
-
-
-def compute_projected_area(mesh: trimesh.Trimesh, view_direction: np.ndarray) -> float:
-    """
-    Compute the projected cross-sectional area of a mesh for a given viewing direction.
-
-    The method projects all mesh vertices onto a plane perpendicular to the view
-    direction, then computes the convex hull area of the projected points.
-
-    Args:
-        mesh: A trimesh Trimesh object
-        view_direction: Unit vector defining the viewing direction
-
-    Returns:
-        Projected area in the same units as the mesh (squared)
-    """
-    # Get the perpendicular plane basis vectors
-    u, v = create_perpendicular_basis(view_direction)
-
-    # Get all vertices from the mesh
-    vertices = mesh.vertices
-
-    # Project vertices onto the 2D plane
-    # For each vertex, compute its 2D coordinates in the (u, v) basis
-    projected_2d = np.column_stack([np.dot(vertices, u), np.dot(vertices, v)])
-
-    # Compute the convex hull of the projected points
-    try:
-        hull = ConvexHull(projected_2d)
-        area = hull.volume  # In 2D, ConvexHull.volume gives the area
-    except Exception as e:
-        # Handle degenerate cases (e.g., all points collinear)
-        print(f"Warning: Could not compute convex hull: {e}")
-        area = 0.0
-
-    return area
-
-
 def compute_cross_sections(stl_path: Union[str, Path], directions: list[str] | None = None) -> dict[str, float]:
     """
     Compute projected cross-sectional areas for multiple viewing directions.
@@ -188,28 +123,26 @@ def compute_cross_sections(stl_path: Union[str, Path], directions: list[str] | N
     print(f"Bounding box extents: {bbox}")
     print(f"Assuming mesh units: {unit_assumption} (converting areas to m²)")
 
-    # Compute areas for each direction
+    # Parse all directions first, then project the mesh hull for all of them in one batch
     results = {}
-
+    vectors = {}
     for direction in directions:
-        print(f"\nProcessing direction: {direction}")
-
         try:
-            view_vector = direction_to_vector(direction)
-            print(f"  View vector: {view_vector}")
-
-            area_raw = compute_projected_area(mesh, view_vector)
-            area_m2 = area_raw * scale_factor
-
-            print(f"  Projected area: {area_raw:.4f} {unit_assumption}² = {area_m2:.6f} m²")
-
-            results[direction] = area_m2
-
+            vectors[direction] = direction_to_vector(direction)
         except ValueError as e:
             print(f"  Error: {e}")
             results[direction] = None
 
-    return results
+    if vectors:
+        areas_raw = CrossSectionEngine(mesh.vertices).areas(np.array(list(vectors.values())))
+        for (direction, view_vector), area_raw in zip(vectors.items(), areas_raw):
+            area_m2 = float(area_raw) * scale_factor
+            print(f"\nDirection {direction}: view vector {view_vector}")
+            print(f"  Projected area: {area_raw:.4f} {unit_assumption}² = {area_m2:.6f} m²")
+            results[direction] = area_m2
+
+    # Keep the requested order
+    return {direction: results[direction] for direction in directions}
 
 
 def main():
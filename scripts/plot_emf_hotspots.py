@@ -12,13 +12,16 @@ auto-induced exposure simulations. It focuses on:
 Author: Generated for GOLIAT project
 """
 
+import hashlib
 import json
+import os
 import re
 import warnings
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import h5py
 import matplotlib.pyplot as plt
@@ -52,12 +55,62 @@ plt.rcParams.update(
 # Minimum domain size filter (mm) - hotspots with any dimension smaller are excluded
 MIN_DOMAIN_SIZE_MM = 48.0
 
+# Field components stored in the H5 files, in comp0/comp1/comp2 order
+FIELD_COMPONENTS = ("Ex", "Ey", "Ez")
+
+# Upper bound on the raw field data held in memory while streaming statistics over a volume
+STATS_SLAB_BYTES = 256 * 1024**2
+
+# Cache key of the whole-volume statistics reduction (see `FieldReducer`)
+STATS_KEY = "stats"
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
 
+def _passes_size_filter(domain_size_mm: Sequence[float], min_size_mm: float = MIN_DOMAIN_SIZE_MM) -> bool:
+    """X dimension can be smaller than min_size_mm; Y and Z dimensions must be >= min_size_mm."""
+    return domain_size_mm[1] >= min_size_mm and domain_size_mm[2] >= min_size_mm
+
+
+@dataclass
+class EMFGrid:
+    """Grid axes and E-field component shapes of an H5 file, read without loading any field data."""
+
+    axis_x: np.ndarray  # Grid axes in meters
+    axis_y: np.ndarray
+    axis_z: np.ndarray
+    shapes: Tuple[Tuple[int, int, int], ...]  # Ex, Ey, Ez array shapes
+
+    @property
+    def cell_shape(self) -> Tuple[int, int, int]:
+        """Shape of the cell-centered components combined by `EMFData.E_magnitude`."""
+        staggered = [[n - (axis == c) for axis, n in enumerate(shape)] for c, shape in enumerate(self.shapes)]
+        return tuple(int(n) for n in np.minimum.reduce(staggered))
+
+    @property
+    def domain_center(self) -> Tuple[float, float, float]:
+        """Return domain center in mm."""
+        cx = (self.axis_x[0] + self.axis_x[-1]) / 2 * 1000
+        cy = (self.axis_y[0] + self.axis_y[-1]) / 2 * 1000
+        cz = (self.axis_z[0] + self.axis_z[-1]) / 2 * 1000
+        return (cx, cy, cz)
+
+    @property
+    def domain_size_mm(self) -> Tuple[float, float, float]:
+        """Return domain size in mm."""
+        dx = (self.axis_x[-1] - self.axis_x[0]) * 1000
+        dy = (self.axis_y[-1] - self.axis_y[0]) * 1000
+        dz = (self.axis_z[-1] - self.axis_z[0]) * 1000
+        return (dx, dy, dz)
+
+    def passes_size_filter(self, min_size_mm: float = MIN_DOMAIN_SIZE_MM) -> bool:
+        """Check if domain size passes minimum size filter (see `_passes_size_filter`)."""
+        return _passes_size_filter(self.domain_size_mm, min_size_mm)
+
+
 @dataclass
 class EMFData:
     """Container for electromagnetic field data from H5 file."""
@@ -95,21 +148,20 @@ class EMFData:
     def grid_center_z(self) -> np.ndarray:
         return 0.5 * (self.axis_z[:-1] + self.axis_z[1:])
 
+    @property
+    def grid(self) -> EMFGrid:
+        """Axes and component shapes of this field."""
+        return EMFGrid(self.axis_x, self.axis_y, self.axis_z, (self.Ex.shape, self.Ey.shape, self.Ez.shape))
+
     @property
     def domain_center(self) -> Tuple[float, float, float]:
         """Return domain center in mm."""
-        cx = (self.axis_x[0] + self.axis_x[-1]) / 2 * 1000
-        cy = (self.axis_y[0] + self.axis_y[-1]) / 2 * 1000
-        cz = (self.axis_z[0] + self.axis_z[-1]) / 2 * 1000
-        return (cx, cy, cz)
+        return self.grid.domain_center
 
     @property
     def domain_size_mm(self) -> Tuple[float, float, float]:
         """Return domain size in mm."""
-        dx = (self.axis_x[-1] - self.axis_x[0]) * 1000
-        dy = (self.axis_y[-1] - self.axis_y[0]) * 1000
-        dz = (self.axis_z[-1] - self.axis_z[0]) * 1000
-        return (dx, dy, dz)
+        return self.grid.domain_size_mm
 
     def passes_size_filter(self, min_size_mm: float = MIN_DOMAIN_SIZE_MM) -> bool:
         """Check if domain size passes minimum size filter.
@@ -117,9 +169,7 @@ class EMFData:
         X dimension can be smaller than min_size_mm (it starts at lowest x and extends).
         Y and Z dimensions must be >= min_size_mm.
         """
-        dx, dy, dz = self.domain_size_mm
-        # X can be smaller, but Y and Z must meet minimum
-        return dy >= min_size_mm and dz >= min_size_mm
+        return self.grid.passes_size_filter(min_size_mm)
 
 
 @dataclass
@@ -172,23 +222,34 @@ def load_complex_field(dataset: h5py.Dataset) -> np.ndarray:
     return data[..., 0] + 1j * data[..., 1]
 
 
-def load_emf_data(h5_path: Path) -> EMFData:
-    """Load EMF data from an H5 file (E-field only for efficiency)."""
+def open_e_field(h5file: h5py.File) -> Tuple[List[h5py.Dataset], EMFGrid]:
+    """Return the (unread) Ex, Ey, Ez datasets of an open H5 file and its grid."""
+    e_base = h5file["FieldGroups"][find_field_group(h5file)]["AllFields"]["EM E(x,y,z,f0)"]["_Object"]["Snapshots"]["0"]
+    datasets = [e_base[f"comp{c}"] for c in range(len(FIELD_COMPONENTS))]
+
+    mesh = h5file["Meshes"][find_mesh_group(h5file)]
+    grid = EMFGrid(
+        axis_x=mesh["axis_x"][:],
+        axis_y=mesh["axis_y"][:],
+        axis_z=mesh["axis_z"][:],
+        shapes=tuple(tuple(ds.shape[:3]) for ds in datasets),
+    )
+    return datasets, grid
+
+
+def load_emf_grid(h5_path: Path) -> EMFGrid:
+    """Load only the grid axes and component shapes from an H5 file."""
     with h5py.File(h5_path, "r") as f:
-        field_key = find_field_group(f)
-        mesh_key = find_mesh_group(f)
+        return open_e_field(f)[1]
 
-        e_base = f["FieldGroups"][field_key]["AllFields"]["EM E(x,y,z,f0)"]["_Object"]["Snapshots"]["0"]
-        Ex = load_complex_field(e_base["comp0"])
-        Ey = load_complex_field(e_base["comp1"])
-        Ez = load_complex_field(e_base["comp2"])
 
-        mesh = f["Meshes"][mesh_key]
-        axis_x = mesh["axis_x"][:]
-        axis_y = mesh["axis_y"][:]
-        axis_z = mesh["axis_z"][:]
+def load_emf_data(h5_path: Path) -> EMFData:
+    """Load EMF data from an H5 file (E-field only for efficiency)."""
+    with h5py.File(h5_path, "r") as f:
+        datasets, grid = open_e_field(f)
+        Ex, Ey, Ez = (load_complex_field(ds) for ds in datasets)
 
-    return EMFData(Ex=Ex, Ey=Ey, Ez=Ez, axis_x=axis_x, axis_y=axis_y, axis_z=axis_z)
+    return EMFData(Ex=Ex, Ey=Ey, Ez=Ez, axis_x=grid.axis_x, axis_y=grid.axis_y, axis_z=grid.axis_z)
 
 
 def extract_candidate_number(filename: str) -> int:
@@ -230,8 +291,7 @@ def filter_files_by_domain_size(h5_files: List[Path], min_size_mm: float = MIN_D
     valid_files = []
     for h5_file in h5_files:
         try:
-            data = load_emf_data(h5_file)
-            if data.passes_size_filter(min_size_mm):
+            if load_emf_grid(h5_file).passes_size_filter(min_size_mm):
                 valid_files.append(h5_file)
         except Exception:
             pass
@@ -239,75 +299,336 @@ def filter_files_by_domain_size(h5_files: List[Path], min_size_mm: float = MIN_D
 
 
 # =============================================================================
-# Analysis Functions
+# Per-file Reductions
 # =============================================================================
+#
+# The aggregate analysis only needs one plane per component/plane combination and
+# a handful of whole-volume statistics per file. Planes are read through hyperslab
+# selections (the neighbouring plane is included where |E| needs cell-centering),
+# statistics are streamed over x-slabs of at most STATS_SLAB_BYTES, and every
+# reduction is cached by file fingerprint so repeated runs and plots reuse it.
 
 
-def compute_hotspot_stats(h5_path: Path, phantom: str, frequency: str) -> Optional[HotspotStats]:
-    """Compute statistics for a single hotspot file. Returns None if domain too small."""
-    data = load_emf_data(h5_path)
+def slice_key(component: str, plane: str, x_center_offset_mm: float = 25.0) -> str:
+    """Cache key of a center-slice reduction (see `read_field_plane`)."""
+    return f"slice:{component}:{plane}:{x_center_offset_mm:g}"
 
-    # Check domain size filter
-    if not data.passes_size_filter():
-        return None
 
-    Ex_mag = np.abs(data.Ex)
-    Ey_mag = np.abs(data.Ey)
-    Ez_mag = np.abs(data.Ez)
-    E_mag = data.E_magnitude
+def _abs2(block: np.ndarray) -> np.ndarray:
+    """|E|^2 of a raw block whose last axis holds the real and imaginary parts."""
+    return block[..., 0] ** 2 + block[..., 1] ** 2
 
-    # Find hotspot location (max |E|)
-    hotspot_idx = np.unravel_index(np.argmax(E_mag), E_mag.shape)
 
-    x_mm = data.grid_center_x[min(hotspot_idx[0], len(data.grid_center_x) - 1)] * 1000
-    y_mm = data.grid_center_y[min(hotspot_idx[1], len(data.grid_center_y) - 1)] * 1000
-    z_mm = data.grid_center_z[min(hotspot_idx[2], len(data.grid_center_z) - 1)] * 1000
+def _center(block: np.ndarray, axis: int) -> np.ndarray:
+    """Average neighbouring samples along `axis` (staggered edge -> cell center)."""
+    lo = [slice(None)] * block.ndim
+    hi = list(lo)
+    lo[axis] = slice(None, -1)
+    hi[axis] = slice(1, None)
+    return 0.5 * (block[tuple(lo)] + block[tuple(hi)])
+
+
+def read_field_plane(
+    datasets: List[h5py.Dataset], grid: EMFGrid, component: str, plane: str, x_center_offset_mm: float = 25.0
+) -> np.ndarray:
+    """Read the |component| center slice that `compute_averaged_field_slice` averages.
+
+    Plane positions match slicing the full field: the middle index for the axis
+    perpendicular to 'xy' and 'xz', and `x_center_offset_mm` from the lowest X for 'yz'.
+
+    Args:
+        datasets: Ex, Ey, Ez datasets from `open_e_field`.
+        grid: Grid from `open_e_field`.
+        component: 'Ex', 'Ey', 'Ez', or 'E_mag'
+        plane: 'xy', 'xz', or 'yz'
+        x_center_offset_mm: Distance from lowest X to the 'yz' plane.
+
+    Returns:
+        2-D array of field magnitudes.
+    """
+    if component == "E_mag":
+        shape = grid.cell_shape
+    elif component in FIELD_COMPONENTS:
+        shape = grid.shapes[FIELD_COMPONENTS.index(component)]
+    else:
+        raise ValueError(f"Unknown component: {component}")
+
+    if plane == "xy":
+        axis, index = 2, shape[2] // 2
+    elif plane == "xz":
+        axis, index = 1, shape[1] // 2
+    elif plane == "yz":
+        target_x_mm = grid.axis_x[0] * 1000 + x_center_offset_mm
+        axis, index = 0, min(int(np.argmin(np.abs(grid.axis_x * 1000 - target_x_mm))), shape[0] - 1)
+    else:
+        raise ValueError(f"Unknown plane: {plane}")
+
+    region = [slice(0, n) for n in shape]
+    region[axis] = slice(index, index + 1)
+
+    if component == "E_mag":
+        abs2 = 0.0
+        for c, dataset in enumerate(datasets):
+            extended = list(region)
+            extended[c] = slice(region[c].start, region[c].stop + 1)
+            abs2 = abs2 + _abs2(_center(dataset[tuple(extended)], c))
+        field = np.sqrt(abs2)
+    else:
+        block = datasets[FIELD_COMPONENTS.index(component)][tuple(region)]
+        field = np.hypot(block[..., 0], block[..., 1])
+    return np.take(field, 0, axis=axis)
+
+
+def reduce_field_stats(datasets: List[h5py.Dataset], grid: EMFGrid) -> Dict[str, np.ndarray]:
+    """Stream the whole-volume statistics of `HotspotStats` over x-slabs.
+
+    Each component is read exactly once. The last row of every slab is carried
+    over so |E| can be cell-centered across slab boundaries.
+
+    Returns:
+        Dict with 'max' and 'mean' (Ex, Ey, Ez, E_mag magnitudes) and
+        'hotspot_location' (cell center of max |E| in mm).
+    """
+    cells = grid.cell_shape
+    n_rows = max(shape[0] for shape in grid.shapes)
+    row_bytes = sum(int(np.prod(ds.shape[1:])) * ds.dtype.itemsize for ds in datasets)
+    slab_rows = max(1, STATS_SLAB_BYTES // max(1, row_bytes))
+
+    maxima = np.zeros(4)
+    sums = np.zeros(4)
+    counts = np.zeros(4)
+    peak, peak_index = -1.0, (0, 0, 0)
+    carry: Optional[List[np.ndarray]] = None
+    start = 0  # first cell row not yet reduced; the buffers below begin at this row
+
+    for a in range(0, n_rows, slab_rows):
+        b = min(a + slab_rows, n_rows)
+        blocks = [ds[a : min(b, ds.shape[0])] if a < ds.shape[0] else np.empty((0,) + ds.shape[1:], ds.dtype) for ds in datasets]
+
+        for c, block in enumerate(blocks):
+            if block.size:
+                magnitude = np.hypot(block[..., 0], block[..., 1])
+                maxima[c] = max(maxima[c], magnitude.max())
+                sums[c] += magnitude.sum(dtype=np.float64)
+                counts[c] += magnitude.size
+
+        if carry is not None:
+            blocks = [np.concatenate([previous, block]) for previous, block in zip(carry, blocks)]
+        end = min(b - 1, cells[0])
+        if end > start:
+            n, ny, nz = end - start, cells[1], cells[2]
+            e_mag = np.sqrt(
+                _abs2(_center(blocks[0][: n + 1, :ny, :nz], 0))
+                + _abs2(_center(blocks[1][:n, : ny + 1, :nz], 1))
+                + _abs2(_center(blocks[2][:n, :ny, : nz + 1], 2))
+            )
+            index = np.unravel_index(np.argmax(e_mag), e_mag.shape)
+            if e_mag[index] > peak:
+                peak, peak_index = float(e_mag[index]), (start + int(index[0]), int(index[1]), int(index[2]))
+            maxima[3] = max(maxima[3], e_mag[index])
+            sums[3] += e_mag.sum(dtype=np.float64)
+            counts[3] += e_mag.size
+        carry = [block[max(0, end - start) :] for block in blocks] if end < cells[0] else None
+        start = max(start, end)
+
+    centers = [0.5 * (axis[:-1] + axis[1:]) for axis in (grid.axis_x, grid.axis_y, grid.axis_z)]
+    location = [center[min(i, len(center) - 1)] * 1000 for center, i in zip(centers, peak_index)]
+    return {"max": maxima, "mean": sums / np.maximum(counts, 1), "hotspot_location": np.array(location)}
+
+
+def _reduce_file(h5_path: Path, keys: Sequence[str]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Compute the requested reductions of one file with a single open (runs in pool workers)."""
+    results = {}
+    with h5py.File(h5_path, "r") as f:
+        datasets, grid = open_e_field(f)
+        domain = {"domain_size": np.array(grid.domain_size_mm), "domain_center": np.array(grid.domain_center)}
+        for key in keys:
+            if key == STATS_KEY:
+                entry = reduce_field_stats(datasets, grid)
+            else:
+                _, component, plane, offset = key.split(":")
+                entry = {"slice": read_field_plane(datasets, grid, component, plane, float(offset))}
+            results[key] = {**entry, **domain}
+    return results
 
+
+def file_fingerprint(h5_path: Path) -> str:
+    """Identify a file version by resolved path, size and modification time."""
+    stat = os.stat(h5_path)
+    return f"{Path(h5_path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+FileReduction = Dict[str, Dict[str, np.ndarray]]
+
+
+class FieldReducer:
+    """Computes per-file reductions in a process pool and caches them by file fingerprint.
+
+    Results are kept in memory for the lifetime of the reducer and, with
+    `cache_dir`, stored as one .npz per file version and key so later runs
+    skip the H5 reads entirely. A rewritten file gets a new fingerprint and is
+    reduced again.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, workers: Optional[int] = None):
+        """
+        Args:
+            cache_dir: Directory for cached reductions, or None for the in-memory cache only.
+            workers: Worker processes; defaults to the CPU count (at most 8). 1 reduces in-process.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self._memory: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def reduce(self, h5_files: Sequence[Path], keys: Sequence[str]) -> List[Union[FileReduction, Exception]]:
+        """Return the requested reductions for each file, computing only the missing ones.
+
+        Returns:
+            One entry per file, in order: {key: reduction arrays}, or the exception
+            that prevented the file from being reduced.
+        """
+        results: List[Union[FileReduction, Exception]] = [{} for _ in h5_files]
+        pending: Dict[int, Dict[str, str]] = {}
+        for i, h5_file in enumerate(h5_files):
+            try:
+                fingerprint = file_fingerprint(h5_file)
+            except OSError as e:
+                results[i] = e
+                continue
+            for key in keys:
+                cache_id = hashlib.sha1(f"{fingerprint}|{key}".encode("utf-8")).hexdigest()
+                entry = self._load(cache_id)
+                if entry is None:
+                    pending.setdefault(i, {})[key] = cache_id
+                else:
+                    results[i][key] = entry
+
+        for i, computed in self._compute(h5_files, pending):
+            if isinstance(computed, Exception):
+                results[i] = computed
+                continue
+            for key, entry in computed.items():
+                self._store(pending[i][key], entry)
+                results[i][key] = entry
+        return results
+
+    def _compute(
+        self, h5_files: Sequence[Path], pending: Dict[int, Dict[str, str]]
+    ) -> Iterator[Tuple[int, Union[FileReduction, Exception]]]:
+        if self.workers <= 1 or len(pending) <= 1:
+            for i, missing in pending.items():
+                try:
+                    yield i, _reduce_file(h5_files[i], list(missing))
+                except Exception as e:
+                    yield i, e
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+            futures = {pool.submit(_reduce_file, h5_files[i], list(missing)): i for i, missing in pending.items()}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    yield futures[future], e
+
+    def _load(self, cache_id: str) -> Optional[Dict[str, np.ndarray]]:
+        entry = self._memory.get(cache_id)
+        if entry is None and self.cache_dir is not None:
+            path = self.cache_dir / f"{cache_id}.npz"
+            if path.exists():
+                with np.load(path, allow_pickle=False) as data:
+                    entry = {name: data[name] for name in data.files}
+                self._memory[cache_id] = entry
+        return entry
+
+    def _store(self, cache_id: str, entry: Dict[str, np.ndarray]) -> None:
+        self._memory[cache_id] = entry
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{cache_id}.tmp.npz"
+            np.savez(tmp_path, **entry)
+            os.replace(tmp_path, self.cache_dir / f"{cache_id}.npz")
+
+
+# Reducer used when callers don't pass one (in-memory cache only)
+DEFAULT_FIELD_REDUCER = FieldReducer()
+
+
+# =============================================================================
+# Analysis Functions
+# =============================================================================
+
+
+def _hotspot_stats_from_reduction(h5_path: Path, phantom: str, frequency: str, entry: Dict[str, np.ndarray]) -> Optional[HotspotStats]:
+    """Build `HotspotStats` from a cached stats reduction. Returns None if domain too small."""
+    if not _passes_size_filter(entry["domain_size"]):
+        return None
+
+    maxima, means = entry["max"], entry["mean"]
     return HotspotStats(
         file_path=h5_path,
         phantom=phantom,
         frequency=frequency,
         candidate_num=extract_candidate_number(h5_path.name),
-        max_Ex=float(np.max(Ex_mag)),
-        max_Ey=float(np.max(Ey_mag)),
-        max_Ez=float(np.max(Ez_mag)),
-        max_E_mag=float(np.max(E_mag)),
-        mean_Ex=float(np.mean(Ex_mag)),
-        mean_Ey=float(np.mean(Ey_mag)),
-        mean_Ez=float(np.mean(Ez_mag)),
-        mean_E_mag=float(np.mean(E_mag)),
-        hotspot_location=(x_mm, y_mm, z_mm),
-        domain_center=data.domain_center,
-        domain_size=data.domain_size_mm,
+        max_Ex=float(maxima[0]),
+        max_Ey=float(maxima[1]),
+        max_Ez=float(maxima[2]),
+        max_E_mag=float(maxima[3]),
+        mean_Ex=float(means[0]),
+        mean_Ey=float(means[1]),
+        mean_Ez=float(means[2]),
+        mean_E_mag=float(means[3]),
+        hotspot_location=tuple(float(v) for v in entry["hotspot_location"]),
+        domain_center=tuple(float(v) for v in entry["domain_center"]),
+        domain_size=tuple(float(v) for v in entry["domain_size"]),
     )
 
 
-def analyze_all_hotspots(discovered: Dict[str, Dict[str, List[Path]]], max_per_combo: int = 20, verbose: bool = True) -> List[HotspotStats]:
-    """Analyze all discovered hotspots and return statistics."""
+def compute_hotspot_stats(h5_path: Path, phantom: str, frequency: str, reducer: Optional[FieldReducer] = None) -> Optional[HotspotStats]:
+    """Compute statistics for a single hotspot file. Returns None if domain too small."""
+    result = (reducer or DEFAULT_FIELD_REDUCER).reduce([h5_path], [STATS_KEY])[0]
+    if isinstance(result, Exception):
+        raise result
+    return _hotspot_stats_from_reduction(h5_path, phantom, frequency, result[STATS_KEY])
+
+
+def analyze_all_hotspots(
+    discovered: Dict[str, Dict[str, List[Path]]], max_per_combo: int = 20, verbose: bool = True, reducer: Optional[FieldReducer] = None
+) -> List[HotspotStats]:
+    """Analyze all discovered hotspots and return statistics.
+
+    All files are reduced up front in one parallel batch; the per-combination
+    summaries below only read the (cached) reductions.
+    """
     all_stats = []
     skipped_count = 0
 
-    for freq in sorted(discovered.keys(), key=lambda x: int(x.replace("GHz", ""))):
-        for phantom in sorted(discovered[freq].keys()):
-            files = discovered[freq][phantom][:max_per_combo]
+    combos = [
+        (freq, phantom, discovered[freq][phantom][:max_per_combo])
+        for freq in sorted(discovered.keys(), key=lambda x: int(x.replace("GHz", "")))
+        for phantom in sorted(discovered[freq].keys())
+    ]
+    results = iter((reducer or DEFAULT_FIELD_REDUCER).reduce([f for _, _, files in combos for f in files], [STATS_KEY]))
 
-            if verbose:
-                print(f"Analyzing {freq}/{phantom}: {len(files)} files...")
+    for freq, phantom, files in combos:
+        if verbose:
+            print(f"Analyzing {freq}/{phantom}: {len(files)} files...")
 
-            valid_count = 0
-            for h5_file in files:
-                try:
-                    stats = compute_hotspot_stats(h5_file, phantom, freq)
-                    if stats is not None:
-                        all_stats.append(stats)
-                        valid_count += 1
-                    else:
-                        skipped_count += 1
-                except Exception as e:
-                    print(f"  Error processing {h5_file.name}: {e}")
+        valid_count = 0
+        for h5_file in files:
+            result = next(results)
+            if isinstance(result, Exception):
+                print(f"  Error processing {h5_file.name}: {result}")
+                continue
+            stats = _hotspot_stats_from_reduction(h5_file, phantom, freq, result[STATS_KEY])
+            if stats is not None:
+                all_stats.append(stats)
+                valid_count += 1
+            else:
+                skipped_count += 1
 
-            if verbose and valid_count < len(files):
-                print(f"    ({valid_count} passed size filter, {len(files) - valid_count} skipped)")
+        if verbose and valid_count < len(files):
+            print(f"    ({valid_count} passed size filter, {len(files) - valid_count} skipped)")
 
     if verbose and skipped_count > 0:
         print(f"\nTotal skipped due to domain size < {MIN_DOMAIN_SIZE_MM}mm: {skipped_count}")
@@ -321,12 +642,18 @@ def analyze_all_hotspots(discovered: Dict[str, Dict[str, List[Path]]], max_per_c
 
 
 def compute_averaged_field_slice(
-    h5_files: List[Path], component: str, plane: str, target_size: int = 80, x_center_offset_mm: float = 25.0
+    h5_files: List[Path],
+    component: str,
+    plane: str,
+    target_size: int = 80,
+    x_center_offset_mm: float = 25.0,
+    reducer: Optional[FieldReducer] = None,
 ) -> Tuple[np.ndarray, int]:
     """
     Compute averaged field slice across multiple H5 files.
 
     All fields are normalized to [0,1] before averaging, then resampled to a common grid.
+    Only the slice itself is read from each file (see `read_field_plane`).
 
     For X dimension: data starts at lowest X and extends as far as it goes.
     When combining, the "center" of the output grid corresponds to x_center_offset_mm
@@ -340,81 +667,39 @@ def compute_averaged_field_slice(
         plane: 'xy', 'xz', or 'yz'
         target_size: Target grid size for resampling
         x_center_offset_mm: Distance from lowest X to the "center" point (default 25mm)
+        reducer: Reducer providing the (cached) slices; defaults to `DEFAULT_FIELD_REDUCER`.
 
     Returns:
         Tuple of (averaged_slice, count_of_valid_files)
     """
     from scipy.ndimage import zoom
 
+    key = slice_key(component, plane, x_center_offset_mm)
     all_slices = []
 
-    for h5_file in h5_files:
-        try:
-            data = load_emf_data(h5_file)
-
-            # Check domain size filter (Y and Z must be >= 48mm, X can be smaller)
-            if not data.passes_size_filter():
-                continue
-
-            # Get field
-            if component == "Ex":
-                field = np.abs(data.Ex)
-            elif component == "Ey":
-                field = np.abs(data.Ey)
-            elif component == "Ez":
-                field = np.abs(data.Ez)
-            elif component == "E_mag":
-                field = data.E_magnitude
-            else:
-                continue
-
-            # Get domain info
-            dx, dy, dz = data.domain_size_mm
-            x_min_mm = data.axis_x[0] * 1000
-
-            # Extract center slice based on plane
-            # For planes involving X: use x_center_offset_mm from lowest X as the "center"
-            # For Y and Z: use the actual center
-
-            if plane == "xy":
-                # Z is perpendicular - use center
-                z_idx = field.shape[2] // 2
-                slice_2d = field[:, :, z_idx]
-                # First axis is X (special handling), second is Y (centered)
-
-            elif plane == "xz":
-                # Y is perpendicular - use center
-                y_idx = field.shape[1] // 2
-                slice_2d = field[:, y_idx, :]
-                # First axis is X (special handling), second is Z (centered)
-
-            elif plane == "yz":
-                # X is perpendicular - use x_center_offset_mm from lowest X
-                # Find the index corresponding to x_center_offset_mm from lowest X
-                target_x_mm = x_min_mm + x_center_offset_mm
-                x_coords_mm = data.axis_x * 1000
-                x_idx = np.argmin(np.abs(x_coords_mm - target_x_mm))
-                x_idx = min(x_idx, field.shape[0] - 1)
-                slice_2d = field[x_idx, :, :]
-                # Both axes are Y and Z (centered normally)
-            else:
-                continue
+    for result in (reducer or DEFAULT_FIELD_REDUCER).reduce(h5_files, [key]):
+        # Unreadable files and unknown components/planes are skipped
+        if isinstance(result, Exception):
+            continue
+        entry = result[key]
 
-            # Normalize to [0, 1]
-            max_val = np.max(slice_2d)
-            if max_val > 0:
-                slice_norm = slice_2d / max_val
-            else:
-                continue
+        # Check domain size filter (Y and Z must be >= 48mm, X can be smaller)
+        if not _passes_size_filter(entry["domain_size"]):
+            continue
 
-            # Resample to target size
-            zoom_factors = (target_size / slice_norm.shape[0], target_size / slice_norm.shape[1])
-            slice_resampled = zoom(slice_norm, zoom_factors, order=1)
+        # Normalize to [0, 1]
+        slice_2d = entry["slice"]
+        max_val = np.max(slice_2d)
+        if max_val > 0:
+            slice_norm = slice_2d / max_val
+        else:
+            continue
 
-            all_slices.append(slice_resampled)
+        # Resample to target size
+        zoom_factors = (target_size / slice_norm.shape[0], target_size / slice_norm.shape[1])
+        slice_resampled = zoom(slice_norm, zoom_factors, order=1)
 
-        except Exception:
-            continue
+        all_slices.append(slice_resampled)
 
     if not all_slices:
         return np.zeros((target_size, target_size)), 0
@@ -430,7 +715,13 @@ def compute_averaged_field_slice(
 
 
 def plot_averaged_component_grid(
-    discovered: Dict[str, Dict[str, List[Path]]], component: str, plane: str, output_dir: Path, max_files: int = 20, verbose: bool = True
+    discovered: Dict[str, Dict[str, List[Path]]],
+    component: str,
+    plane: str,
+    output_dir: Path,
+    max_files: int = 20,
+    verbose: bool = True,
+    reducer: Optional[FieldReducer] = None,
 ):
     """
     Plot a grid of AVERAGED field slices for a component/plane combination.
@@ -457,7 +748,7 @@ def plot_averaged_component_grid(
         for freq in freq_order:
             if phantom in discovered[freq] and discovered[freq][phantom]:
                 files = discovered[freq][phantom][:max_files]
-                avg_slice, count = compute_averaged_field_slice(files, component, plane)
+                avg_slice, count = compute_averaged_field_slice(files, component, plane, reducer=reducer)
 
                 if count > 0:
                     averaged_data[(phantom, freq)] = (avg_slice, count)
@@ -709,9 +1000,16 @@ def plot_summary_statistics(stats: List[HotspotStats], output_dir: Path, verbose
         print(f"Summary plots saved to {output_dir}")
 
 
-def plot_all_averaged_grids(discovered: Dict[str, Dict[str, List[Path]]], output_dir: Path, max_files: int = 20, verbose: bool = True):
+def plot_all_averaged_grids(
+    discovered: Dict[str, Dict[str, List[Path]]],
+    output_dir: Path,
+    max_files: int = 20,
+    verbose: bool = True,
+    reducer: Optional[FieldReducer] = None,
+):
     """Generate all component/plane combination grids with averaging."""
     output_dir.mkdir(parents=True, exist_ok=True)
+    reducer = reducer or DEFAULT_FIELD_REDUCER
 
     if verbose:
         print("Generating averaged slice grids...")
@@ -719,16 +1017,24 @@ def plot_all_averaged_grids(discovered: Dict[str, Dict[str, List[Path]]], output
     components = ["Ex", "Ey", "Ez", "E_mag"]
     planes = ["xy", "xz", "yz"]
 
+    # Read every slice of a file in one pass (and in parallel) before the grids pick them up
+    files = [f for phantoms in discovered.values() for combo_files in phantoms.values() for f in combo_files[:max_files]]
+    reducer.reduce(files, [slice_key(component, plane) for component in components for plane in planes])
+
     for component in components:
         for plane in planes:
-            plot_averaged_component_grid(discovered, component, plane, output_dir, max_files=max_files, verbose=verbose)
+            plot_averaged_component_grid(discovered, component, plane, output_dir, max_files=max_files, verbose=verbose, reducer=reducer)
 
     if verbose:
         print(f"Averaged slice grids saved to {output_dir}")
 
 
 def plot_ez_by_frequency_all_phantoms(
-    discovered: Dict[str, Dict[str, List[Path]]], output_dir: Path, max_files: int = 20, verbose: bool = True
+    discovered: Dict[str, Dict[str, List[Path]]],
+    output_dir: Path,
+    max_files: int = 20,
+    verbose: bool = True,
+    reducer: Optional[FieldReducer] = None,
 ):
     """
     Plot Ez field averaged over ALL phantoms for each frequency.
@@ -756,7 +1062,7 @@ def plot_ez_by_frequency_all_phantoms(
                 all_files.extend(discovered[freq][phantom][:max_files])
 
             if all_files:
-                avg_slice, count = compute_averaged_field_slice(all_files, "Ez", plane, target_size)
+                avg_slice, count = compute_averaged_field_slice(all_files, "Ez", plane, target_size, reducer=reducer)
                 if count > 0:
                     freq_data[freq] = (avg_slice, count)
                     global_min = min(global_min, np.nanpercentile(avg_slice, 1))
@@ -838,6 +1144,13 @@ Examples:
     parser.add_argument("--freq", type=str, help="Filter by frequency (e.g., 7GHz)")
     parser.add_argument("--max-files", type=int, default=20, help="Maximum files to analyze per phantom/freq (default: 20 = all)")
     parser.add_argument("--min-domain-size", type=float, default=48.0, help="Minimum domain size in mm (default: 48.0)")
+    parser.add_argument("--workers", type=int, help="Worker processes reading H5 files (default: CPU count, at most 8)")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for cached per-file reductions (default: <output>/.field_cache)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write cached reductions on disk")
     parser.add_argument("--quiet", action="store_true", help="Suppress progress output")
 
     args = parser.parse_args()
@@ -884,7 +1197,9 @@ Examples:
     if verbose:
         print("Analyzing hotspot statistics...")
 
-    stats = analyze_all_hotspots(discovered, max_per_combo=args.max_files, verbose=verbose)
+    cache_dir = None if args.no_cache else (args.cache_dir or output_dir / ".field_cache")
+    reducer = FieldReducer(cache_dir=cache_dir, workers=args.workers)
+    stats = analyze_all_hotspots(discovered, max_per_combo=args.max_files, verbose=verbose, reducer=reducer)
 
     if not stats:
         print("No data to analyze (all filtered out by domain size)!")
@@ -894,7 +1209,7 @@ Examples:
         print(f"\nAnalyzed {len(stats)} hotspot files (passed size filter)")
 
     # Generate all averaged slice grids (Ex, Ey, Ez, E_mag for xy, xz, yz planes)
-    plot_all_averaged_grids(discovered, output_dir, max_files=args.max_files, verbose=verbose)
+    plot_all_averaged_grids(discovered, output_dir, max_files=args.max_files, verbose=verbose, reducer=reducer)
 
     # Generate summary statistics plots
     plot_summary_statistics(stats, output_dir, verbose)
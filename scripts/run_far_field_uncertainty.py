@@ -12,6 +12,8 @@ Produces:
   and CV_dir / CV_pol / CV_resid columns plus a robustness verdict.
 * ``variance_components_long.csv`` — tidy long form, one row per
   (metric, component).
+* ``variance_components_ci.csv`` — bootstrap percentile intervals of every
+  sigma, one row per (metric, component); skipped with ``--bootstrap 0``.
 * ``tidy_far_field.csv`` — the loaded long-format dataframe (handy for
   downstream plotting).
 """
@@ -24,13 +26,15 @@ import sys
 from pathlib import Path
 
 from goliat.uncertainty import (
-    decompose_balanced,
+    bootstrap_balanced,
+    decompose_balanced_all,
     decompose_reml,
     load_far_field,
 )
 from goliat.uncertainty.report import (
     build_report,
     format_console_table,
+    format_interval_table,
     write_outputs,
 )
 
@@ -60,6 +64,15 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Restrict to a subset of metric short names (e.g. WB_SAR psSAR10g). Defaults to all metrics found in the data.",
     )
+    p.add_argument(
+        "--bootstrap",
+        type=int,
+        default=2000,
+        metavar="N",
+        help="Bootstrap replicates for the sigma confidence intervals (default: 2000, 0 to skip).",
+    )
+    p.add_argument("--ci-level", type=float, default=0.95, help="Two-sided confidence level (default: 0.95).")
+    p.add_argument("--seed", type=int, default=0, help="Random seed for the bootstrap (default: 0).")
     return p.parse_args(argv)
 
 
@@ -84,14 +97,9 @@ def main(argv: list[str] | None = None) -> int:
         print(f"None of the requested metrics are present: {requested}", file=sys.stderr)
         return 2
 
-    components = []
-    for m in metrics:
-        try:
-            vc = decompose_balanced(df, m)
-        except ValueError as e:
-            print(f"  skipping {m}: {e}")
-            continue
-        components.append(vc)
+    components, skipped = decompose_balanced_all(df, metrics)
+    for m, reason in skipped.items():
+        print(f"  skipping {m}: {reason}")
 
     if args.reml:
         for m in metrics:
@@ -110,9 +118,18 @@ def main(argv: list[str] | None = None) -> int:
     print(format_console_table(report[report["method"] == "balanced-MoM"]))
     print()
 
-    write_outputs(report, components, args.out_dir)
+    intervals = None
+    if args.bootstrap > 0:
+        intervals = bootstrap_balanced(df, metrics, n_boot=args.bootstrap, level=args.ci_level, seed=args.seed)
+        print(f"Sigma with {args.ci_level:.0%} bootstrap intervals ({args.bootstrap} replicates):")
+        print(format_interval_table(intervals))
+        print()
+
+    write_outputs(report, components, args.out_dir, intervals)
     print(f"Wrote {args.out_dir / 'variance_components_summary.csv'}")
     print(f"Wrote {args.out_dir / 'variance_components_long.csv'}")
+    if intervals is not None:
+        print(f"Wrote {args.out_dir / 'variance_components_ci.csv'}")
     return 0
 
 
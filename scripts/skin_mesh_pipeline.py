@@ -6,6 +6,7 @@ This script performs the complete workflow:
 1. Extract tissue voxels from Sim4Life _Input.h5
 2. Apply morphological processing (dilate-erode)
 3. Generate mesh via marching cubes
+   (steps 1-3 run in overlapping z-slabs unless blockwise_processing is disabled)
 4. Apply Blender modifiers (Remesh, Decimate)
 5. Scale and export optimized STL
 
@@ -192,6 +193,62 @@ def get_nested(d: Dict, *keys, default=None):
 # ---------------------------------------------------------------------------
 
 
+def _build_uuid_material_map(f) -> Dict[str, str]:
+    """Build mapping from UUID string to material name."""
+    uuid_to_name = {}
+
+    def visitor(name: str, obj):
+        if hasattr(obj, "attrs") and "material_name" in obj.attrs:
+            mat_name = obj.attrs["material_name"]
+            if isinstance(mat_name, bytes):
+                mat_name = mat_name.decode("utf-8")
+            parts = name.split("/")
+            if len(parts) >= 3:
+                uuid_str = parts[2]
+                uuid_to_name[uuid_str] = mat_name
+
+    f.visititems(visitor)
+    return uuid_to_name
+
+
+def _build_voxel_id_map(id_map: np.ndarray, uuid_to_name: Dict[str, str]) -> Dict[int, str]:
+    """Map voxel IDs to tissue names via UUID lookup.
+
+    Each id_map row holds the 16 raw bytes of a UUID, so rows are matched
+    against the binary form of the known UUIDs instead of being formatted
+    back to strings one byte at a time.
+    """
+    name_by_bytes = {}
+    for uuid_str, name in uuid_to_name.items():
+        try:
+            name_by_bytes[bytes.fromhex(uuid_str.replace("-", ""))] = name
+        except ValueError:
+            continue
+
+    rows = np.ascontiguousarray(id_map, dtype=np.uint8).reshape(len(id_map), -1)
+    voxel_id_to_name = {}
+    for i, row in enumerate(rows):
+        name = name_by_bytes.get(row.tobytes())
+        if name is not None:
+            voxel_id_to_name[i] = name
+    return voxel_id_to_name
+
+
+def _tissue_ids(voxel_id_to_name: Dict[int, str], tissue_keywords: list[str]) -> list[int]:
+    """Voxel IDs whose tissue name contains any of the keywords (case-insensitive)."""
+    keywords = [kw.lower() for kw in tissue_keywords]
+    return [voxel_id for voxel_id, name in voxel_id_to_name.items() if any(kw in name.lower() for kw in keywords)]
+
+
+def _find_voxel_mesh(f, input_h5_path: str):
+    """Return the first mesh group holding voxel data."""
+    for mesh_key in f["Meshes"].keys():
+        mesh = f[f"Meshes/{mesh_key}"]
+        if "voxels" in mesh:
+            return mesh
+    raise ValueError(f"No mesh with voxel data found in {input_h5_path}")
+
+
 def extract_tissue_voxels(
     input_h5_path: str,
     tissue_keywords: list[str],
@@ -204,60 +261,11 @@ def extract_tissue_voxels(
     """
     import h5py
 
-    def build_uuid_material_map(f) -> Dict[str, str]:
-        """Build mapping from UUID string to material name."""
-        uuid_to_name = {}
-
-        def visitor(name: str, obj):
-            if hasattr(obj, "attrs") and "material_name" in obj.attrs:
-                mat_name = obj.attrs["material_name"]
-                if isinstance(mat_name, bytes):
-                    mat_name = mat_name.decode("utf-8")
-                parts = name.split("/")
-                if len(parts) >= 3:
-                    uuid_str = parts[2]
-                    uuid_to_name[uuid_str] = mat_name
-
-        f.visititems(visitor)
-        return uuid_to_name
-
-    def build_voxel_id_map(id_map: np.ndarray, uuid_to_name: Dict[str, str]) -> Dict[int, str]:
-        """Map voxel IDs to tissue names via UUID lookup."""
-        voxel_id_to_name = {}
-        for i in range(len(id_map)):
-            h = "".join(f"{b:02x}" for b in id_map[i])
-            uuid_str = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
-            if uuid_str in uuid_to_name:
-                voxel_id_to_name[i] = uuid_to_name[uuid_str]
-        return voxel_id_to_name
-
     with h5py.File(input_h5_path, "r") as f:
-        uuid_to_name = build_uuid_material_map(f)
-
-        for mesh_key in f["Meshes"].keys():
-            mesh = f[f"Meshes/{mesh_key}"]
-            if "voxels" not in mesh:
-                continue
-
-            voxels = mesh["voxels"][:]
-            id_map = mesh["id_map"][:]
-            axis_x = mesh["axis_x"][:]
-            axis_y = mesh["axis_y"][:]
-            axis_z = mesh["axis_z"][:]
-
-            voxel_id_to_name = build_voxel_id_map(id_map, uuid_to_name)
-
-            # Find matching tissue IDs
-            tissue_ids = []
-            for voxel_id, name in voxel_id_to_name.items():
-                name_lower = name.lower()
-                if any(kw.lower() in name_lower for kw in tissue_keywords):
-                    tissue_ids.append(voxel_id)
-
-            tissue_mask = np.isin(voxels, tissue_ids)
-            return tissue_mask, axis_x, axis_y, axis_z, voxel_id_to_name
-
-    raise ValueError(f"No mesh with voxel data found in {input_h5_path}")
+        mesh = _find_voxel_mesh(f, input_h5_path)
+        voxel_id_to_name = _build_voxel_id_map(mesh["id_map"][:], _build_uuid_material_map(f))
+        tissue_mask = np.isin(mesh["voxels"][:], _tissue_ids(voxel_id_to_name, tissue_keywords))
+        return tissue_mask, mesh["axis_x"][:], mesh["axis_y"][:], mesh["axis_z"][:], voxel_id_to_name
 
 
 # ---------------------------------------------------------------------------
@@ -326,6 +334,194 @@ def voxels_to_mesh(
     return verts_world, faces
 
 
+# ---------------------------------------------------------------------------
+# Steps 1-3 out of core: blockwise voxel extraction, processing and meshing
+# ---------------------------------------------------------------------------
+
+
+def blockwise_halo(dilate_iterations: int, erode_iterations: int, smooth_sigma: float) -> int:
+    """
+    Number of extra z-planes a slab needs on each side for exact results.
+
+    Each dilation or erosion iteration with the 18-connected structure reaches
+    one plane further, and scipy's gaussian_filter reaches int(4 * sigma + 0.5)
+    planes (its default truncate of 4). Beyond that distance from a slab cut,
+    the processed values are the same as for the whole volume.
+    """
+    halo = dilate_iterations + erode_iterations
+    if smooth_sigma > 0:
+        halo += int(4.0 * smooth_sigma + 0.5)
+    return halo
+
+
+def _slab_bounds(n_planes: int, slab_depth: int) -> list[Tuple[int, int]]:
+    """Split the cubes between n_planes z-planes into slabs of at most slab_depth cubes."""
+    n_cubes = n_planes - 1
+    return [(start, min(start + slab_depth, n_cubes)) for start in range(0, n_cubes, slab_depth)]
+
+
+def _mesh_slab(
+    voxels,
+    tissue_ids: list[int],
+    start: int,
+    stop: int,
+    halo: int,
+    dilate_iterations: int,
+    erode_iterations: int,
+    smooth_sigma: float,
+    keep_masks: bool,
+) -> Dict[str, Any]:
+    """
+    Extract, process and mesh the cubes between z-planes start and stop.
+
+    Reads planes [start - halo, stop + halo] (clipped to the grid) from the
+    voxels dataset and runs the same steps as the monolithic path on them.
+    Only planes start..stop, which are unaffected by the slab cuts, are passed
+    to marching cubes.
+
+    Returns:
+        Dict with 'verts' (grid index coordinates, z already offset),
+        'faces', voxel counts over the planes this slab owns and, with
+        keep_masks, those planes of the original and processed masks.
+    """
+    from skimage import measure
+
+    n_planes = voxels.shape[2]
+    lo = max(0, start - halo)
+    hi = min(n_planes, stop + 1 + halo)
+    tissue_mask = np.isin(voxels[:, :, lo:hi], tissue_ids)
+
+    if dilate_iterations or erode_iterations:
+        processed = dilate_erode_process(tissue_mask, dilate_iterations, erode_iterations)
+    else:
+        processed = tissue_mask
+    if smooth_sigma > 0:
+        volume = apply_gaussian_smoothing(processed, sigma=smooth_sigma)
+    else:
+        volume = processed.astype(np.float32)
+    volume = volume[:, :, start - lo : stop + 1 - lo]
+
+    # Planes [start, stop) belong to this slab; the last slab also owns the final plane
+    own = slice(start - lo, (stop + 1 if stop == n_planes - 1 else stop) - lo)
+    result = {
+        "verts": np.zeros((0, 3), dtype=np.float32),
+        "faces": np.zeros((0, 3), dtype=np.int64),
+        "tissue_voxels": int(np.count_nonzero(tissue_mask[:, :, own])),
+        "processed_voxels": int(np.count_nonzero(processed[:, :, own])),
+    }
+    if keep_masks:
+        result["mask_original"] = tissue_mask[:, :, own]
+        result["mask"] = processed[:, :, own]
+
+    if volume.min() <= 0.5 <= volume.max():
+        try:
+            verts, faces, _, _ = measure.marching_cubes(volume, level=0.5)
+        except RuntimeError:  # No surface crosses this slab
+            return result
+        # float32 like the monolithic output, so seam vertices compare exactly
+        verts[:, 2] += np.float32(start)
+        result["verts"] = verts
+        result["faces"] = faces.astype(np.int64)
+    return result
+
+
+def _stitch_slabs(slabs: list[Dict[str, Any]], seam_planes: list[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate slab meshes and merge the vertices duplicated on slab seams.
+
+    Neighbouring slabs both triangulate the cubes touching their shared plane
+    and compute the vertices on that plane from the same values, so the
+    duplicates are bitwise equal and are merged by exact coordinate match.
+    """
+    offsets = np.cumsum([0] + [len(slab["verts"]) for slab in slabs])
+    verts = np.concatenate([slab["verts"] for slab in slabs])
+    faces = np.concatenate([slab["faces"] + offset for slab, offset in zip(slabs, offsets)])
+
+    remap = np.arange(len(verts))
+    on_seam = np.flatnonzero(np.isin(verts[:, 2], np.asarray(seam_planes, dtype=verts.dtype)))
+    if len(on_seam):
+        _, first, inverse = np.unique(verts[on_seam], axis=0, return_index=True, return_inverse=True)
+        remap[on_seam] = on_seam[first][inverse.reshape(-1)]
+    keep = remap == np.arange(len(verts))
+    new_index = np.cumsum(keep) - 1
+    return verts[keep], new_index[remap[faces]]
+
+
+def extract_mesh_blockwise(
+    input_h5_path: str,
+    tissue_keywords: list[str],
+    dilate_iterations: int = 2,
+    erode_iterations: int = 1,
+    smooth_sigma: float = 0.8,
+    slab_depth: int = 64,
+    workers: int = 4,
+    keep_masks: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run steps 1-3 (voxel extraction, dilate-erode, smoothing, marching cubes) in z-slabs.
+
+    The voxel grid is read in overlapping slabs of slab_depth cubes plus a
+    halo from blockwise_halo on each side, which are processed on a thread
+    pool and stitched back together. Peak memory scales with workers times
+    the slab size instead of the whole grid (unless keep_masks is set), and
+    the mesh has the same vertices and triangles as voxels_to_mesh applied
+    to the output of extract_tissue_voxels and dilate_erode_process, up to
+    vertex and face order and float32 round-off of the vertex z coordinates
+    (marching cubes interpolates in slab-local plane indices). Pass
+    dilate_iterations = erode_iterations = 0 to skip the morphological
+    processing.
+
+    Returns:
+        Dict with 'verts' (world coordinates), 'faces', 'axis_x', 'axis_y',
+        'axis_z', 'tissue_map', 'grid_shape', 'tissue_voxels',
+        'processed_voxels' and, with keep_masks, the full 'mask_original' and
+        'mask' arrays.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import h5py
+
+    halo = blockwise_halo(dilate_iterations, erode_iterations, smooth_sigma)
+
+    with h5py.File(input_h5_path, "r") as f:
+        mesh = _find_voxel_mesh(f, input_h5_path)
+        voxel_id_to_name = _build_voxel_id_map(mesh["id_map"][:], _build_uuid_material_map(f))
+        tissue_ids = _tissue_ids(voxel_id_to_name, tissue_keywords)
+        axis_x, axis_y, axis_z = mesh["axis_x"][:], mesh["axis_y"][:], mesh["axis_z"][:]
+        voxels = mesh["voxels"]
+        bounds = _slab_bounds(voxels.shape[2], slab_depth)
+
+        # h5py serializes the slab reads; the processing and meshing run concurrently
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            slabs = list(
+                pool.map(
+                    lambda b: _mesh_slab(
+                        voxels, tissue_ids, b[0], b[1], halo, dilate_iterations, erode_iterations, smooth_sigma, keep_masks
+                    ),
+                    bounds,
+                )
+            )
+        grid_shape = voxels.shape
+
+    verts, faces = _stitch_slabs(slabs, [start for start, _ in bounds[1:]])
+    spacing = np.array([np.mean(np.diff(axis_x)), np.mean(np.diff(axis_y)), np.mean(np.diff(axis_z))])
+    result = {
+        "verts": verts * spacing + np.array([axis_x[0], axis_y[0], axis_z[0]]),
+        "faces": faces,
+        "axis_x": axis_x,
+        "axis_y": axis_y,
+        "axis_z": axis_z,
+        "tissue_map": voxel_id_to_name,
+        "grid_shape": grid_shape,
+        "tissue_voxels": sum(slab["tissue_voxels"] for slab in slabs),
+        "processed_voxels": sum(slab["processed_voxels"] for slab in slabs),
+    }
+    if keep_masks:
+        result["mask_original"] = np.concatenate([slab["mask_original"] for slab in slabs], axis=2)
+        result["mask"] = np.concatenate([slab["mask"] for slab in slabs], axis=2)
+    return result
+
+
 def process_mesh_trimesh(
     verts: np.ndarray,
     faces: np.ndarray,
@@ -531,43 +727,83 @@ def main():
     print(f"Output dir: {output_dir}")
     print(f"Tissue: {tissue_keyword}")
 
-    # Step 1: Extract voxels
-    print(f"\n{'=' * 60}")
-    print("Step 1: Extract Tissue Voxels")
-    print(f"{'=' * 60}")
+    morph_cfg = config.get("morphological_processing", {})
+    dilate_iter = morph_cfg.get("dilate_iterations", 2) if morph_cfg.get("enabled", True) else 0
+    erode_iter = morph_cfg.get("erode_iterations", 1) if morph_cfg.get("enabled", True) else 0
+    mc_cfg = config.get("marching_cubes", {})
+    smooth_sigma = mc_cfg.get("smooth_sigma", 0.8)
+    # Off by default: the blockwise path has to keep the full masks in memory to pickle them
+    save_pickle = output_cfg.get("save_voxel_pickle", False)
+
+    blockwise_cfg = config.get("blockwise_processing", {})
+    blockwise_enabled = blockwise_cfg.get("enabled", True)
+    if blockwise_enabled:
+        # Steps 1-3 in z-slabs: memory bounded by the slab size, not the grid
+        slab_depth = blockwise_cfg.get("slab_depth", 64)
+        workers = blockwise_cfg.get("workers", 4)
+        print(f"\n{'=' * 60}")
+        print("Steps 1-3: Blockwise Voxel Extraction, Processing and Marching Cubes")
+        print(f"{'=' * 60}")
+        print(f"Slab depth: {slab_depth} planes (+{blockwise_halo(dilate_iter, erode_iter, smooth_sigma)} halo), workers: {workers}")
+        print(f"Dilate: {dilate_iter}, Erode: {erode_iter}, Smooth sigma: {smooth_sigma}")
+        if save_pickle:
+            print("save_voxel_pickle is set: keeping the full voxel masks in memory for the pickle")
+
+        blockwise = extract_mesh_blockwise(
+            str(h5_path),
+            [tissue_keyword],
+            dilate_iterations=dilate_iter,
+            erode_iterations=erode_iter,
+            smooth_sigma=smooth_sigma,
+            slab_depth=slab_depth,
+            workers=workers,
+            keep_masks=save_pickle,
+        )
+        axis_x, axis_y, axis_z = blockwise["axis_x"], blockwise["axis_y"], blockwise["axis_z"]
+        tissue_map = blockwise["tissue_map"]
+        tissue_mask = blockwise.get("mask_original")
+        processed_mask = blockwise.get("mask")
+        verts, faces = blockwise["verts"], blockwise["faces"]
+
+        matching = [n for n in tissue_map.values() if tissue_keyword.lower() in n.lower()]
+        print(f"Matched tissues: {matching}")
+        print(f"Grid shape: {blockwise['grid_shape']}")
+        print(f"Tissue voxels: {blockwise['tissue_voxels']:,}")
+        print(f"Voxels after processing: {blockwise['processed_voxels']:,}")
+    else:
+        # Step 1: Extract voxels
+        print(f"\n{'=' * 60}")
+        print("Step 1: Extract Tissue Voxels")
+        print(f"{'=' * 60}")
+
+        tissue_mask, axis_x, axis_y, axis_z, tissue_map = extract_tissue_voxels(str(h5_path), [tissue_keyword])
+
+        matching = [n for n in tissue_map.values() if tissue_keyword.lower() in n.lower()]
+        print(f"Matched tissues: {matching}")
+        print(f"Grid shape: {tissue_mask.shape}")
+        print(f"Tissue voxels: {np.sum(tissue_mask):,}")
 
-    tissue_mask, axis_x, axis_y, axis_z, tissue_map = extract_tissue_voxels(str(h5_path), [tissue_keyword])
+        # Step 2: Morphological processing
+        print(f"\n{'=' * 60}")
+        print("Step 2: Morphological Processing")
+        print(f"{'=' * 60}")
 
-    matching = [n for n in tissue_map.values() if tissue_keyword.lower() in n.lower()]
-    print(f"Matched tissues: {matching}")
-    print(f"Grid shape: {tissue_mask.shape}")
-    print(f"Tissue voxels: {np.sum(tissue_mask):,}")
+        if morph_cfg.get("enabled", True):
+            print(f"Dilate: {dilate_iter}, Erode: {erode_iter}")
+
+            processed_mask = dilate_erode_process(tissue_mask, dilate_iter, erode_iter)
+            print(f"Voxels after processing: {np.sum(processed_mask):,}")
+        else:
+            print("Skipping (disabled in config)")
+            processed_mask = tissue_mask
 
     dx = np.mean(np.diff(axis_x)) * 1000
     dy = np.mean(np.diff(axis_y)) * 1000
     dz = np.mean(np.diff(axis_z)) * 1000
     print(f"Mean voxel size: {dx:.2f} x {dy:.2f} x {dz:.2f} mm")
 
-    # Step 2: Morphological processing
-    print(f"\n{'=' * 60}")
-    print("Step 2: Morphological Processing")
-    print(f"{'=' * 60}")
-
-    morph_cfg = config.get("morphological_processing", {})
-    if morph_cfg.get("enabled", True):
-        dilate_iter = morph_cfg.get("dilate_iterations", 2)
-        erode_iter = morph_cfg.get("erode_iterations", 1)
-        print(f"Dilate: {dilate_iter}, Erode: {erode_iter}")
-
-        processed_mask = dilate_erode_process(tissue_mask, dilate_iter, erode_iter)
-        print(f"Voxels after processing: {np.sum(processed_mask):,}")
-    else:
-        print("Skipping (disabled in config)")
-        processed_mask = tissue_mask
-
     # Save pickle (optional)
-    output_cfg = config.get("output", {})
-    if output_cfg.get("save_voxel_pickle", True):
+    if save_pickle:
         pickle_name = output_cfg.get("pickle_filename", f"{tissue_keyword}_voxels.pkl")
         pickle_path = output_dir / pickle_name
         pickle_data = {
@@ -584,16 +820,15 @@ def main():
             pickle.dump(pickle_data, f)
         print(f"Saved pickle: {pickle_path}")
 
-    # Step 3: Marching cubes
-    print(f"\n{'=' * 60}")
-    print("Step 3: Marching Cubes Mesh Generation")
-    print(f"{'=' * 60}")
+    if not blockwise_enabled:
+        # Step 3: Marching cubes
+        print(f"\n{'=' * 60}")
+        print("Step 3: Marching Cubes Mesh Generation")
+        print(f"{'=' * 60}")
 
-    mc_cfg = config.get("marching_cubes", {})
-    smooth_sigma = mc_cfg.get("smooth_sigma", 0.8)
-    print(f"Smooth sigma: {smooth_sigma}")
+        print(f"Smooth sigma: {smooth_sigma}")
 
-    verts, faces = voxels_to_mesh(processed_mask, axis_x, axis_y, axis_z, smooth_sigma)
+        verts, faces = voxels_to_mesh(processed_mask, axis_x, axis_y, axis_z, smooth_sigma)
     print(f"Raw mesh: {len(verts):,} vertices, {len(faces):,} faces")
 
     # Step 4: Trimesh processing
@@ -669,7 +904,7 @@ def main():
     print(f"{'=' * 60}")
     print(f"Output directory: {output_dir}")
     print(f"  - {stl_path.name}")
-    if output_cfg.get("save_voxel_pickle", True):
+    if save_pickle:
         print(f"  - {pickle_name}")
 
 
@@ -1,6 +1,10 @@
 import sys
 from unittest.mock import MagicMock
 
+import h5py
+import numpy as np
+import pytest
+
 
 def pytest_configure(config):
     """
@@ -29,3 +33,22 @@ def pytest_configure(config):
 
     # Mock XCoreModeling
     sys.modules["XCoreModeling"] = MagicMock()
+
+
+@pytest.fixture
+def write_solver_output():
+    """Returns a function that writes a minimal but complete Sim4Life _Output.h5."""
+
+    def write(path, nodes=(6, 5, 4), fields=("E", "H")):
+        with h5py.File(path, "w") as f:
+            mesh = f.create_group("Meshes/mesh0")
+            for axis, n in zip("xyz", nodes):
+                mesh[f"axis_{axis}"] = np.linspace(0.0, 0.1, n)
+            f.create_group("FieldGroups/0/_Object").attrs["name"] = "Overall Field"
+            for field_type in fields:
+                snapshot = f.create_group(f"FieldGroups/0/AllFields/EM {field_type}(x,y,z,f0)/_Object/Snapshots/0")
+                for comp in range(3):
+                    shape = tuple(n - 1 if axis == comp else n for axis, n in enumerate(nodes)) + (2,)
+                    snapshot.create_dataset(f"comp{comp}", data=np.ones(shape, dtype=np.float32), chunks=True)
+
+    return write
@@ -68,6 +68,26 @@ class TestAnalyzer:
         # Check skin group
         assert analyzer.tissue_group_composition["skin_group"] == {"skin"}
 
+    def test_analyzer_tissue_taxonomy_is_compiled_once_and_cached(self, mock_config, mock_strategy, tmp_path):
+        """Test that the compiled taxonomy follows the composition and is stored with the aggregated results."""
+        import pandas as pd
+
+        mock_strategy.get_results_base_dir.return_value = str(tmp_path)
+        analyzer = Analyzer(mock_config, "thelonious", mock_strategy)
+        analyzer.tissue_group_composition = {"eyes_group": {"lens", "cornea"}, "skin_group": {"skin"}}
+
+        taxonomy = analyzer.tissue_taxonomy
+        assert taxonomy.groups == ["eyes_group", "skin_group"] and taxonomy.tissues == ["cornea", "lens", "skin"]
+        assert analyzer.tissue_taxonomy is taxonomy
+
+        analyzer.tissue_group_composition["skin_group"].add("fat")
+        assert analyzer.tissue_taxonomy.tissues == ["cornea", "lens", "fat", "skin"]
+
+        analyzer._convert_units_and_cache(pd.DataFrame({"head_SAR": [1.0]}), pd.DataFrame())
+        reloaded = Analyzer(mock_config, "thelonious", mock_strategy)
+        reloaded._load_from_cache()
+        assert reloaded.tissue_taxonomy.to_dict() == analyzer.tissue_taxonomy.to_dict()
+
     def test_analyzer_process_single_result_near_field(self, mock_config, mock_strategy):
         """Test processing single result for near-field."""
         mock_strategy.__class__.__name__ = "NearFieldAnalysisStrategy"
@@ -0,0 +1,92 @@
+import os
+
+import h5py
+import numpy as np
+import pytest
+
+from goliat.bench import CASES, BenchContext, compare_to_baseline, generate_synthetic_phantom, load_baseline, run_benchmarks, save_baseline
+from goliat.bench.synthetic import BODY_ATTENUATION, build_voxels, fibonacci_directions
+from goliat.extraction.field_reader import find_overall_field_group, get_field_path, get_field_shape
+from goliat.utils.skin_voxel_utils import extract_air_voxels, extract_skin_voxels
+
+
+@pytest.fixture(scope="module")
+def phantom(tmp_path_factory):
+    return generate_synthetic_phantom(str(tmp_path_factory.mktemp("phantom")), grid=(24, 20, 32), n_directions=3)
+
+
+def test_synthetic_phantom_uses_sim4life_layout(phantom):
+    skin_mask, axis_x, axis_y, axis_z, tissues = extract_skin_voxels(phantom.input_h5)
+    air_mask = extract_air_voxels(phantom.input_h5)[0]
+    with h5py.File(phantom.input_h5, "r") as f:
+        voxels = next(iter(f["Meshes"].values()))["voxels"][:]
+    assert sorted(tissues.values()) == ["Bone", "Muscle", "Skin"] and skin_mask.shape == (23, 19, 31)
+    assert np.array_equal(skin_mask, voxels == 1) and np.array_equal(air_mask, voxels == 0) and skin_mask.any()
+    assert np.array_equal(voxels, build_voxels([axis_x, axis_y, axis_z]))
+
+    assert get_field_shape(phantom.output_h5s[0]) == (24, 20, 32)
+    with h5py.File(phantom.output_h5s[0], "r") as f:
+        field_path = get_field_path(find_overall_field_group(f), "E")
+        shapes = [f[f"{field_path}/comp{c}"].shape for c in range(3)]
+        ex = f[f"{field_path}/comp0"][:]
+    assert shapes == [(23, 20, 32, 2), (24, 19, 32, 2), (24, 20, 31, 2)]
+
+    # Ex is a plane wave: constant amplitude in air, attenuated in the body, phase advancing along x
+    k_hat = fibonacci_directions(3)[0]
+    theta, phi = np.arccos(k_hat[2]), np.arctan2(k_hat[1], k_hat[0])
+    ex = ex[..., 0] + 1j * ex[..., 1]
+    assert abs(ex[0, 0, 0]) == pytest.approx(abs(np.cos(theta) * np.cos(phi)), rel=1e-5)
+    assert abs(ex[11, 10, 16]) == pytest.approx(BODY_ATTENUATION * abs(ex[0, 0, 0]), rel=1e-5)
+    k_dx = 2 * np.pi * 3500e6 / 299792458.0 * k_hat[0] * 0.002
+    assert np.angle(ex[1, 0, 0] / ex[0, 0, 0]) == pytest.approx(-k_dx, abs=1e-5)
+
+    # An identical request reuses the files
+    mtime = os.stat(phantom.output_h5s[0]).st_mtime_ns
+    assert generate_synthetic_phantom(os.path.dirname(phantom.input_h5), grid=(24, 20, 32), n_directions=3) == phantom
+    assert os.stat(phantom.output_h5s[0]).st_mtime_ns == mtime
+
+
+def test_every_case_runs_and_is_compared_with_the_baseline(phantom, tmp_path):
+    ctx = BenchContext(phantom, work_dir=str(tmp_path / "scratch"), n_air_points=20)
+    results = run_benchmarks(ctx, repeats=1)
+    assert [r.name for r in results] == list(CASES) and all(r.wall_s > 0 and r.repeats == 1 for r in results)
+    with h5py.File(tmp_path / "scratch" / "combined_Output.h5", "r") as f:
+        assert f[f"{get_field_path(find_overall_field_group(f), 'H')}/comp2"].shape == (24, 20, 31, 2)
+
+    path = str(tmp_path / "baseline.json")
+    save_baseline(path, results, phantom)
+    baseline = load_baseline(path)
+    assert baseline["phantom"]["grid"] == [24, 20, 32] and set(baseline["results"]) == set(CASES)
+    assert not any(c.regressed for c in compare_to_baseline(results, baseline))
+
+    baseline["results"]["h5_slicer"]["wall_s"] /= 2
+    comparisons = {c.name: c for c in compare_to_baseline(results, baseline, min_slowdown_s=0.0)}
+    assert comparisons["h5_slicer"].regressed and comparisons["h5_slicer"].time_ratio == pytest.approx(2.0, rel=0.01)
+
+    with pytest.raises(ValueError, match="Unknown benchmark case"):
+        run_benchmarks(ctx, names=["h5_slicer", "nope"])
+
+
+def test_memory_is_measured_as_growth_during_the_run(phantom, tmp_path):
+    from goliat.bench.runner import BenchCase, run_case
+
+    def prepare(ctx):
+        held = np.ones(100 * 2**20 // 8)  # Prepared inputs stay resident but are not the case's own cost
+        return lambda: (held, np.ones(40 * 2**20 // 8).sum())
+
+    result = run_case(BenchCase("alloc", "Allocates 40 MB", prepare), BenchContext(phantom, work_dir=str(tmp_path)), repeats=2)
+    if result.rss_growth_mb is None:
+        pytest.skip("Resident memory is not measurable on this platform")
+    assert 30 < result.rss_growth_mb < 90
+
+
+def test_small_memory_changes_do_not_regress():
+    from goliat.bench.runner import BenchResult
+
+    baseline = {"results": {"case": {"wall_s": 1.0, "rss_growth_mb": 1.6}}}
+    noisy = BenchResult("case", 1, 1.0, 1.0, 1.0, rss_growth_mb=4.1)
+    (comparison,) = compare_to_baseline([noisy], baseline)
+    assert comparison.memory_ratio == pytest.approx(2.56, rel=0.01) and not comparison.regressed
+
+    grown = noisy._replace(rss_growth_mb=64.0)
+    assert compare_to_baseline([grown], baseline)[0].regressed
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+from cli.__main__ import COMMANDS, create_parser
+from cli.startup_profile import HEAVY_MODULES, STARTUP_IMPORT_BUDGET_S, format_report, parse_importtime
+
+
+def _import_profile(code):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return [r for r in map(parse_importtime, result.stderr.splitlines()) if r is not None]
+
+
+def test_every_subcommand_is_registered():
+    subparsers = next(a for a in create_parser()._actions if a.dest == "command")
+    assert set(subparsers.choices) == set(COMMANDS)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import sys; sys.argv = ['goliat', 'version']; from cli.__main__ import main; main()",
+        "from goliat.utils import format_time; import goliat.extraction, goliat.gui_manager, goliat.analysis",
+    ],
+    ids=["goliat-version", "package-imports"],
+)
+def test_light_paths_stay_within_startup_budget(code):
+    records = _import_profile(code)
+
+    loaded = {r.module.split(".")[0] for r in records}
+    assert not loaded & set(HEAVY_MODULES)
+    assert sum(r.self_us for r in records) / 1e6 < STARTUP_IMPORT_BUDGET_S
+
+
+def test_report_lists_slowest_imports_first():
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |   small",
+        "import time:      5000 |       9000 | big",
+    ]
+    report = format_report([r for r in map(parse_importtime, lines) if r], wall_seconds=0.5)
+
+    assert "2 modules imported in 0.005s" in report
+    assert report.index("big") < report.index("small")
+    assert "Heavy packages loaded: none" in report
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from goliat.analysis import compare
+from goliat.analysis.compare import (
+    load_comparison_data,
+    read_partner_workbook,
+    render_comparison_figures,
+    scenario_figures,
+    summary_figures,
+)
+
+pytest.importorskip("openpyxl")
+
+
+def _workbook(path, phantom, sar_head):
+    with pd.ExcelWriter(path) as writer:
+        for scenario in ("fronteyes", "cheek"):
+            pd.DataFrame(
+                {
+                    "frequency_mhz": [700, 700, 3500],
+                    "placement": ["center", "left", None],
+                    "Input Power (mW)": [100, 100, "N/A"],
+                    "SAR_head (mW/kg)": [sar_head, sar_head + 1, 2.5],
+                    "psSAR10g_eyes (mW/kg)": [None, None, None],
+                }
+            ).to_excel(writer, sheet_name=f"{phantom}_{scenario}", index=False)
+    return str(path)
+
+
+def test_workbooks_are_parsed_once_per_content(tmp_path, monkeypatch):
+    path = _workbook(tmp_path / "ugent.xlsx", "Thelonious", 1.0)
+    cache_dir = str(tmp_path / "cache")
+    parsed = read_partner_workbook(path, "UGent", cache_dir)
+    assert len(parsed) == 6 and set(parsed["scenario"]) == {"fronteyes", "cheek"}
+
+    def fail(_path):
+        raise AssertionError("workbook parsed again")
+
+    monkeypatch.setattr(compare, "_parse_workbook", fail)
+    cached = read_partner_workbook(path, "UGent", cache_dir)
+    pd.testing.assert_frame_equal(cached, parsed)
+    assert cached["placement"].isna().tolist() == [False, False, True] * 2
+
+    _workbook(path, "Thelonious", 4.0)
+    with pytest.raises(AssertionError, match="parsed again"):
+        read_partner_workbook(path, "UGent", cache_dir)
+
+
+def test_only_figures_with_changed_data_are_redrawn(tmp_path):
+    ugent = _workbook(tmp_path / "ugent.xlsx", "Thelonious", 1.0)
+    cnr = _workbook(tmp_path / "cnr.xlsx", "Duke", 3.0)
+    df = load_comparison_data(ugent, cnr, str(tmp_path / "cache"))
+    figures = scenario_figures(df, "png") + summary_figures(df, "png")
+    assert [f.filename for f in figures] == [
+        "compare_SAR_head_mW_kg_fronteyes.png",
+        "compare_SAR_head_mW_kg_cheek.png",
+        "compare_summary_SAR_head_mW_kg.png",
+    ]
+
+    output_dir = tmp_path / "plots"
+    assert sorted(render_comparison_figures(df, figures, output_dir, workers=2)) == sorted(figures)
+    assert all((output_dir / f.filename).stat().st_size > 0 for f in figures)
+    assert render_comparison_figures(df, figures, output_dir, workers=2) == []
+
+    df.loc[(df["phantom"] == "Duke") & (df["scenario"] == "cheek"), "SAR_head (mW/kg)"] += 1
+    redrawn = render_comparison_figures(df, figures, output_dir, workers=1)
+    assert [f.filename for f in redrawn] == ["compare_SAR_head_mW_kg_cheek.png", "compare_summary_SAR_head_mW_kg.png"]
+    assert len(render_comparison_figures(df, figures, output_dir, workers=1, force=True)) == 3
@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+
+from goliat.config import Config
+from goliat.config.compiled import ConfigSnapshot, derive_config, resolution_cache_path
+from goliat.constants import CONFIG_CACHE_DIRNAME
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "material_name_mapping.json").write_text("{}")
+    (tmp_path / "configs" / "base_config.json").write_text(json.dumps({"simulation_parameters": {"convergence_level_dB": -15}}))
+    (tmp_path / "configs" / "study.json").write_text(json.dumps({"extends": "base_config", "study_type": "far_field"}))
+    return tmp_path
+
+
+def _cache_file(project):
+    return resolution_cache_path(str(project / "data" / CONFIG_CACHE_DIRNAME), str(project / "configs" / "study.json"))
+
+
+def test_resolution_cache_reused_until_chain_changes(project, monkeypatch):
+    assert Config(str(project), "study")["simulation_parameters.convergence_level_dB"] == -15
+    assert os.path.exists(_cache_file(project))
+
+    # A touched but unchanged parent keeps the cache: no file of the chain is parsed again
+    base = project / "configs" / "base_config.json"
+    os.utime(base, ns=(0, 0))
+    loads = []
+    original_load_json = Config._load_json
+    monkeypatch.setattr(Config, "_load_json", lambda self, path: loads.append(path) or original_load_json(self, path))
+    assert Config(str(project), "study")["study_type"] == "far_field"
+    assert not any(path.endswith(".json") and "configs" in path for path in loads)
+
+    # Editing the parent invalidates the resolution
+    base.write_text(json.dumps({"simulation_parameters": {"convergence_level_dB": -30}}))
+    assert Config(str(project), "study")["simulation_parameters.convergence_level_dB"] == -30
+
+
+def test_resolution_cache_follows_new_shadowing_parent(project):
+    (project / "configs" / "study.json").write_text(json.dumps({"extends": "base", "study_type": "far_field"}))
+    defaults = project / "goliat" / "config" / "defaults"
+    defaults.mkdir(parents=True)
+    (defaults / "base.json").write_text(json.dumps({"phantoms": ["duke"]}))
+    assert Config(str(project), "study")["phantoms"] == ["duke"]
+
+    # A user config added later takes precedence over the packaged default
+    (project / "configs" / "base.json").write_text(json.dumps({"phantoms": ["ella"]}))
+    assert Config(str(project), "study")["phantoms"] == ["ella"]
+
+
+def test_lookup_reflects_in_place_changes(project):
+    config = Config(str(project), "study")
+    assert config["simulation_parameters.missing"] is None
+
+    config.config["simulation_parameters"]["excitation_type"] = "Gaussian"
+    assert config["simulation_parameters.excitation_type"] == "Gaussian"
+
+    config.config = {"study_type": "near_field"}
+    assert config["study_type"] == "near_field"
+    assert config["simulation_parameters"] is None
+    with pytest.raises(KeyError):
+        config[""]
+
+
+def test_derive_config_shares_untouched_subtrees():
+    base = {
+        "phantoms": ["duke", "ella"],
+        "far_field_setup": {
+            "type": "environmental",
+            "environmental": {"polarizations": ["theta", "phi"], "incident_directions": ["x_pos"]},
+        },
+        "gridding_parameters": {"global_gridding_per_frequency": {"700": 3.0, "900": 2.5}},
+        "antenna_config": {"700": {"model": "pifa"}},
+    }
+
+    derived = derive_config(
+        base,
+        {
+            "phantoms": ["duke"],
+            ("far_field_setup", "environmental", "polarizations"): ["theta"],
+            "gridding_parameters.global_gridding_per_frequency": {"700": 3.0},
+        },
+    )
+
+    assert base["phantoms"] == ["duke", "ella"]
+    assert base["far_field_setup"]["environmental"]["polarizations"] == ["theta", "phi"]
+    assert base["gridding_parameters"]["global_gridding_per_frequency"] == {"700": 3.0, "900": 2.5}
+    assert derived["far_field_setup"]["environmental"] == {"polarizations": ["theta"], "incident_directions": ["x_pos"]}
+    assert derived["antenna_config"] is base["antenna_config"]
+    assert (
+        derived["far_field_setup"]["environmental"]["incident_directions"]
+        is base["far_field_setup"]["environmental"]["incident_directions"]
+    )
+    assert list(derived) == list(base)
+
+    snapshot = ConfigSnapshot(base).derive({"antenna_config.700.model": "dipole"})
+    assert snapshot["antenna_config.700.model"] == "dipole"
+    assert base["antenna_config"]["700"]["model"] == "pifa"
+    with pytest.raises(TypeError):
+        derive_config(base, {"phantoms.duke": 1})
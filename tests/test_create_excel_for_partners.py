@@ -0,0 +1,78 @@
+import json
+
+import pandas as pd
+import pytest
+
+from goliat.analysis.create_excel_for_partners import create_cnr_excel, write_partner_workbook
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def _results_csv(path, placements, extra_columns=0):
+    df = pd.DataFrame(
+        {
+            "placement": placements,
+            "frequency_mhz": [3500, 700] * (len(placements) // 2),
+            "SAR_whole_body": [0.5, 1.25] * (len(placements) // 2),
+            "SAR_head": [2.0, None] * (len(placements) // 2),
+            "SAR_trunk": 0.125,
+            "peak_sapd_W_m2": 12.5,
+        }
+    )
+    for i in range(extra_columns):
+        df[f"unused_{i}"] = i
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+def test_workbook_streams_sorted_sheets_with_tables_and_widths(tmp_path, monkeypatch):
+    monkeypatch.setattr("goliat.analysis.create_excel_for_partners.PARTNER_EXCEL_CHUNK_ROWS", 3)
+    thelonious = _results_csv(
+        tmp_path / "thelonious.csv",
+        [
+            "by_cheek_tragus_tilt_up",
+            "by_cheek_tragus_cheek_base",
+            "front_of_eyes_center",
+            "on_desk",
+            "by_belly_up_vertical",
+            "by_belly_down",
+        ],
+        extra_columns=5,
+    )
+    eartha = _results_csv(tmp_path / "eartha.csv", ["on_desk", "on_desk"])
+    output = tmp_path / "partners.xlsx"
+
+    rows = write_partner_workbook(
+        output, [("thelonious_26ghz", thelonious), ("eartha", eartha)], {3500: 250}, sheet_prefix=lambda n: n.split("_")[0].capitalize()
+    )
+    assert list(rows) == [f"{p}_{s}" for p in ("Thelonious", "Eartha") for s in ("fronteyes", "belly", "cheek")]
+    assert list(rows.values()) == [1, 2, 2, 0, 0, 0]
+
+    workbook = openpyxl.load_workbook(output)
+    cheek = workbook["Thelonious_cheek"]
+    assert list(cheek.values) == [
+        (
+            "frequency_mhz",
+            "placement",
+            "Input Power (mW)",
+            "SAR_wholebody (mW/kg)",
+            "SAR_head (mW/kg)",
+            "SAR_trunk (mW/kg)",
+            "Peak SAPD (W/m²)",
+        ),
+        (700, "cheek_1", "N/A", 1.25, None, 0.125, 12.5),
+        (3500, "tilt_2", 250, 0.5, 2.0, 0.125, 12.5),
+    ]
+    assert cheek.tables["Thelonious_cheek"].ref == "A1:G3"
+    assert [cheek.column_dimensions[c].width for c in "ABC"] == [15, 11, 18]
+    assert workbook["Eartha_belly"].max_row == 1 and not workbook["Eartha_belly"].tables
+
+
+def test_create_cnr_excel_writes_the_three_phantom_sheets(tmp_path, capsys):
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"antenna_config": {"700": {"target_power_mW": 100}}}))
+    csv_path = _results_csv(tmp_path / "results.csv", ["front_of_eyes_left", "by_belly_down"])
+
+    create_cnr_excel("duke", csv_path, str(config), str(tmp_path / "duke.xlsx"))
+    assert openpyxl.load_workbook(tmp_path / "duke.xlsx").sheetnames == ["Duke_fronteyes", "Duke_belly", "Duke_cheek"]
+    assert "Sheet 2 (Duke_belly): 1 rows" in capsys.readouterr().out
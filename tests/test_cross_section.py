@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pytest
+from scipy.spatial import ConvexHull
+
+from goliat.extraction.cross_section import CrossSectionEngine, load_area_pattern, sample_sphere_directions
+
+
+def _projected_hull_area(vertices, direction):
+    """Reference: area of the 2-D hull of the vertices projected along `direction`."""
+    direction = direction / np.linalg.norm(direction)
+    u = np.cross(direction, [1.0, 0.0, 0.0] if abs(direction[0]) < 0.9 else [0.0, 1.0, 0.0])
+    u /= np.linalg.norm(u)
+    v = np.cross(direction, u)
+    return ConvexHull(np.column_stack([vertices @ u, vertices @ v])).volume
+
+
+def test_engine_matches_projected_hulls_and_caches_patterns(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    vertices = rng.normal(size=(400, 3)) * [0.2, 0.15, 0.9]
+    # Chunks of 7 directions so the batch below is split across the thread pool
+    monkeypatch.setattr("goliat.extraction.cross_section.CROSS_SECTION_CHUNK_DIRECTIONS", 7)
+    engine = CrossSectionEngine(vertices, cache_dir=str(tmp_path))
+
+    directions = rng.normal(size=(30, 3))
+    expected = [_projected_hull_area(vertices, d) for d in directions]
+    assert engine.areas(directions) == pytest.approx(expected, rel=1e-9)
+
+    pattern = engine.pattern(n_theta=5, n_phi=9)
+    _, _, grid = sample_sphere_directions(5, 9)
+    assert pattern.areas.shape == (5, 9)
+    assert pattern.areas[2, 3] == pytest.approx(_projected_hull_area(vertices, grid[2, 3]), rel=1e-9)
+    assert os.listdir(tmp_path) == [f"{engine.mesh_hash}_5x9.npz"]
+    assert CrossSectionEngine(vertices.copy()).pattern(n_theta=5, n_phi=9) is pattern
+
+
+def test_load_area_pattern_reuses_file_until_it_changes(tmp_path):
+    theta, phi, _ = sample_sphere_directions(3, 5)
+    path = str(tmp_path / "cross_section_pattern.npz")
+    np.savez_compressed(path, theta=theta, phi=phi, areas=np.arange(15.0).reshape(3, 5))
+
+    pattern = load_area_pattern(path)
+    assert pattern.mesh_hash is None
+    assert load_area_pattern(path) is pattern
+    # phi wraps around, so -90 deg is looked up as 270 deg
+    assert pattern.area_at(np.pi / 2, -np.pi / 2) == 8.0
+
+    np.savez_compressed(path, theta=theta, phi=phi, areas=np.ones((3, 5)), mesh_hash="abc")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = load_area_pattern(path)
+    assert reloaded.mesh_hash == "abc" and reloaded.area_at(0.0, 0.0) == 1.0
@@ -0,0 +1,138 @@
+import json
+
+import pytest
+
+from goliat.eta_model import EtaModel, import_log_history, load_eta_history, simulation_features, sum_predictions
+from goliat.profiler import Profiler
+
+
+def _run_time(frequency_mhz, phantom="duke"):
+    """Synthetic run time growing with frequency cubed, slower for the larger phantom."""
+    return 60.0 * (frequency_mhz / 700.0) ** 3 * (1.5 if phantom == "thelonious" else 1.0)
+
+
+@pytest.fixture
+def history():
+    samples = []
+    for phantom in ("duke", "thelonious"):
+        for freq in (450, 700, 900, 1450, 2450):
+            samples.append(
+                {"phase": "run", "seconds": _run_time(freq, phantom), "features": simulation_features(freq, phantom, "Acceleware")}
+            )
+    return samples
+
+
+def test_model_predicts_by_simulation_size(history):
+    model = EtaModel(history)
+
+    expected, low, high = model.predict("run", simulation_features(1800, "duke", "Acceleware"))
+    assert expected == pytest.approx(_run_time(1800), rel=0.25)
+    assert low < expected < high
+    assert (
+        model.predict("run", simulation_features(700, "thelonious", "Acceleware"))[0]
+        > model.predict("run", simulation_features(700, "duke", "Acceleware"))[0]
+    )
+    assert model.predict("extract", simulation_features(700, "duke")) is None
+
+
+def test_profiler_forecasts_each_remaining_simulation(history, tmp_path):
+    history_path = tmp_path / "eta_history.json"
+    history_path.write_text(json.dumps({"near_field": history}))
+    profiler = Profiler({"do_run": True}, {"avg_run_time": 60}, "near_field", str(tmp_path / "profiling.json"), str(history_path))
+    plan = [simulation_features(f, "duke", "Acceleware") for f in (700, 2450, 700)]
+    profiler.set_total_simulations(len(plan))
+    profiler.set_simulation_plan(plan)
+    profiler.start_stage("run")
+
+    forecast = profiler.get_eta_forecast()
+    current_run = forecast["current"]["run"][0]
+    assert forecast["future"][0] > 10 * current_run  # The 2450 MHz run dominates
+    assert profiler.get_time_remaining(0.0) == pytest.approx(current_run + forecast["future"][0])
+    low, high = profiler.get_time_remaining_band(0.0)
+    assert low < profiler.get_time_remaining(0.0) < high
+
+    restored = Profiler.from_snapshot(profiler.snapshot())
+    assert restored.get_time_remaining(0.5) == pytest.approx(profiler.get_time_remaining(0.5))
+    assert restored.get_time_remaining_band(0.5) == pytest.approx(profiler.get_time_remaining_band(0.5))
+
+    profiler.end_stage()
+    assert len(load_eta_history(str(history_path), "near_field")) == len(history)  # Throttled until the study ends
+    profiler.save_estimates()
+    assert len(load_eta_history(str(history_path), "near_field")) == len(history) + 1
+
+
+def test_parallel_studies_keep_each_others_samples(history, tmp_path):
+    history_path = tmp_path / "eta_history.json"
+    history_path.write_text(json.dumps({"near_field": history}))
+    profilers = [Profiler({"do_run": True}, {}, "near_field", str(tmp_path / f"profiling_{i}.json"), str(history_path)) for i in range(2)]
+    for frequency, profiler in zip((700, 900), profilers):
+        profiler.set_total_simulations(1)
+        profiler.set_simulation_plan([simulation_features(frequency, "duke", "Acceleware")])
+        profiler.start_stage("run")
+        profiler.end_stage()
+    for profiler in profilers:
+        profiler.save_estimates()
+
+    saved = load_eta_history(str(history_path), "near_field")
+    assert len(saved) == len(history) + 2
+    assert {s["features"]["frequency_mhz"] for s in saved[-2:]} == {700.0, 900.0}
+    assert sorted(p.name for p in tmp_path.iterdir() if p.name.startswith("eta_history")) == ["eta_history.json"]
+
+
+def test_profiler_reuses_forecast_until_state_changes(history, tmp_path, monkeypatch):
+    history_path = tmp_path / "eta_history.json"
+    history_path.write_text(json.dumps({"near_field": history}))
+    profiler = Profiler({"do_run": True}, {"avg_run_time": 60}, "near_field", str(tmp_path / "profiling.json"), str(history_path))
+    plan = [simulation_features(f, "duke", "Acceleware") for f in (700, 900, 700)]
+    profiler.set_total_simulations(len(plan))
+    profiler.set_simulation_plan(plan)
+    calls = []
+    predict = profiler.eta_model.predict
+    monkeypatch.setattr(profiler.eta_model, "predict", lambda *args: calls.append(args) or predict(*args))
+
+    first = profiler.get_eta_forecast()
+    assert len(calls) == 3  # Current simulation plus the two distinct future ones
+    assert profiler.get_eta_forecast() is first
+    assert len(calls) == 3
+
+    profiler.completed_simulations += 1
+    profiler.get_eta_forecast()
+    assert len(calls) > 3
+
+
+def test_sum_predictions_combines_bands_in_log_space():
+    band = (100.0, 60.0, 160.0)
+
+    expected, low, high = sum_predictions([(band, 10)])
+    assert expected == pytest.approx(1000.0)
+    # Independent errors partly cancel, so the total band is narrower than ten stacked worst cases
+    assert 600.0 < low < expected < high < 1600.0
+    assert sum_predictions([(band, 1)])[0] == pytest.approx(100.0)
+    assert sum_predictions([]) == [0.0, 0.0, 0.0]
+
+
+def test_profiler_without_plan_keeps_average_estimate():
+    profiler = Profiler({"do_run": True}, {"avg_run_time": 20}, "near_field", "dummy.json")
+    profiler.set_total_simulations(2)
+    profiler.start_stage("run")
+
+    assert profiler.get_time_remaining(0.5) == pytest.approx(30.0)
+    assert profiler.get_time_remaining_band(0.5) is None
+
+
+def test_import_log_history_skips_known_logs(tmp_path):
+    metrics = {
+        "metadata": {"log_file": "results/near_field/duke/700MHz/by_cheek/verbose.log"},
+        "grid": {"frequency_mhz": 700, "total_cells": 6_000_000},
+        "solver": {"kernel": "Acceleware (AXware)"},
+        "sensors": {"count": 2},
+        "timing": {"phases": {"run": 760.0, "extract": 55.0}},
+        "category": {"phantom": "duke"},
+    }
+    path = str(tmp_path / "eta_history.json")
+
+    assert import_log_history(path, "near_field", [metrics]) == 2
+    assert import_log_history(path, "near_field", [metrics]) == 0
+    saved = load_eta_history(path, "near_field")
+    assert saved[0]["features"]["kernel"] == "acceleware"
+    assert saved[0]["features"]["total_cells"] == 6_000_000
@@ -1,10 +1,12 @@
 """Tests for goliat.extraction.cleaner module."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from goliat.extraction.cleaner import Cleaner
+from goliat.extraction.cleanup_service import CleanupService
 
 
 @pytest.fixture
@@ -72,24 +74,27 @@ class TestCleaner:
         mock_parent._log.assert_called()
         assert "WARNING" in str(mock_parent._log.call_args)
 
+    @staticmethod
+    def _submitted(parent):
+        """Files held in the study's cleanup service, in submission order."""
+        return [path for call in parent.study.cleanup_service.submit.call_args_list for path in call.args[0]]
+
     @patch("goliat.extraction.cleaner.glob.glob")
-    @patch("goliat.extraction.cleaner.os.remove")
-    def test_cleanup_simulation_files_output(self, mock_remove, mock_glob, mock_parent_with_study):
+    def test_cleanup_simulation_files_output(self, mock_glob, mock_parent_with_study):
         """Test cleanup of output files."""
         mock_glob.return_value = ["/tmp/test_Results/file1_Output.h5", "/tmp/test_Results/file2_Output.h5"]
-        mock_remove.return_value = None
 
         cleaner = Cleaner(mock_parent_with_study)
         mock_parent_with_study.config.get_auto_cleanup_previous_results.return_value = ["output"]
         cleaner.cleanup_simulation_files()
 
-        # Should delete 2 files
-        assert mock_remove.call_count == 2
+        # Should hold 2 files until the study confirms the extraction
+        assert self._submitted(mock_parent_with_study) == mock_glob.return_value
+        assert mock_parent_with_study.study.cleanup_service.submit.call_args.kwargs == {"hold_key": "/tmp"}
         mock_parent_with_study._log.assert_called()
 
     @patch("goliat.extraction.cleaner.glob.glob")
-    @patch("goliat.extraction.cleaner.os.remove")
-    def test_cleanup_simulation_files_input(self, mock_remove, mock_glob, mock_parent_with_study):
+    def test_cleanup_simulation_files_input(self, mock_glob, mock_parent_with_study):
         """Test cleanup of input files."""
         mock_glob.return_value = ["/tmp/test_Results/file1_Input.h5"]
 
@@ -97,11 +102,10 @@ class TestCleaner:
         mock_parent_with_study.config.get_auto_cleanup_previous_results.return_value = ["input"]
         cleaner.cleanup_simulation_files()
 
-        assert mock_remove.call_count == 1
+        assert self._submitted(mock_parent_with_study) == ["/tmp/test_Results/file1_Input.h5"]
 
     @patch("goliat.extraction.cleaner.glob.glob")
-    @patch("goliat.extraction.cleaner.os.remove")
-    def test_cleanup_simulation_files_smash(self, mock_remove, mock_glob, mock_parent_with_study):
+    def test_cleanup_simulation_files_smash(self, mock_glob, mock_parent_with_study):
         """Test cleanup of project files."""
         mock_glob.return_value = ["/tmp/test.smash"]
 
@@ -109,11 +113,10 @@ class TestCleaner:
         mock_parent_with_study.config.get_auto_cleanup_previous_results.return_value = ["smash"]
         cleaner.cleanup_simulation_files()
 
-        assert mock_remove.call_count == 1
+        assert self._submitted(mock_parent_with_study) == ["/tmp/test.smash"]
 
     @patch("goliat.extraction.cleaner.glob.glob")
-    @patch("goliat.extraction.cleaner.os.remove")
-    def test_cleanup_simulation_files_multiple_types(self, mock_remove, mock_glob, mock_parent_with_study):
+    def test_cleanup_simulation_files_multiple_types(self, mock_glob, mock_parent_with_study):
         """Test cleanup of multiple file types."""
 
         def glob_side_effect(pattern):
@@ -131,30 +134,67 @@ class TestCleaner:
         mock_parent_with_study.config.get_auto_cleanup_previous_results.return_value = ["output", "input", "smash"]
         cleaner.cleanup_simulation_files()
 
-        assert mock_remove.call_count == 3
-
-    @patch("goliat.extraction.cleaner.glob.glob")
-    @patch("goliat.extraction.cleaner.os.remove")
-    def test_cleanup_simulation_files_delete_error(self, mock_remove, mock_glob, mock_parent_with_study):
-        """Test handling of delete errors."""
-        mock_glob.return_value = ["/tmp/test_Results/file1_Output.h5"]
-        mock_remove.side_effect = PermissionError("Access denied")
-
-        cleaner = Cleaner(mock_parent_with_study)
-        mock_parent_with_study.config.get_auto_cleanup_previous_results.return_value = ["output"]
-        cleaner.cleanup_simulation_files()
-
-        # Should log warning but continue
-        mock_parent_with_study._log.assert_called()
-        assert "Warning" in str(mock_parent_with_study._log.call_args)
+        assert len(self._submitted(mock_parent_with_study)) == 3
 
     @patch("goliat.extraction.cleaner.glob.glob")
-    @patch("goliat.extraction.cleaner.os.remove")
-    def test_cleanup_simulation_files_unknown_type(self, mock_remove, mock_glob, mock_parent_with_study):
+    def test_cleanup_simulation_files_unknown_type(self, mock_glob, mock_parent_with_study):
         """Test cleanup with unknown cleanup type."""
         cleaner = Cleaner(mock_parent_with_study)
         mock_parent_with_study.config.get_auto_cleanup_previous_results.return_value = ["unknown_type"]
         cleaner.cleanup_simulation_files()
 
-        # Should not delete anything
-        mock_remove.assert_not_called()
+        # Should not schedule anything
+        mock_parent_with_study.study.cleanup_service.submit.assert_not_called()
+
+
+class TestCleanupService:
+    """Tests for CleanupService."""
+
+    @staticmethod
+    def _files(tmp_path, *names, size=1000):
+        paths = []
+        for name in names:
+            path = tmp_path / "results" / "duke" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * size)
+            paths.append(str(path))
+        return paths
+
+    def test_files_are_removed_only_after_release(self, tmp_path):
+        service = CleanupService(batch_window_s=0.05)
+        kept, removed = self._files(tmp_path, "a_Output.h5"), self._files(tmp_path, "b_Output.h5", "b_Input.h5")
+        service.submit(kept, hold_key="a")
+        service.submit(removed, hold_key="b")
+        service.submit(removed[:1], hold_key="b")  # A second extraction of the same simulation
+        assert all(os.path.exists(p) for p in kept + removed)
+
+        assert service.release("b") == 2
+        service.discard("a")
+        assert service.drain(timeout=10)
+
+        assert not any(os.path.exists(p) for p in removed) and os.path.exists(kept[0])
+        assert (service.stats.files, service.stats.bytes_freed, service.stats.failures) == (2, 2000, 0)
+        assert service.close(timeout=10)
+
+    def test_archive_and_failures(self, tmp_path):
+        archive = tmp_path / "archive"
+        service = CleanupService(archive_dir=str(archive), archive_root=str(tmp_path / "results"))
+        files = self._files(tmp_path, "c_Output.h5")
+        service.submit(files + [str(tmp_path / "missing_Output.h5")], hold_key="c")
+        service.release("c")
+        assert service.close(timeout=10)
+
+        assert (archive / "duke" / "c_Output.h5").read_bytes() == b"x" * 1000
+        assert (service.stats.files, service.stats.failures) == (1, 1)
+
+    def test_low_free_space_drains_before_next_run(self, tmp_path):
+        # A budget larger than any disk: always below it
+        service = CleanupService(min_free_bytes=2**62, batch_window_s=3600)
+        files = self._files(tmp_path, "d_Output.h5")
+        service.submit(files, hold_key="d")
+        service.release("d")
+
+        # The batch window is skipped and the caller waits for the removal
+        assert service.ensure_free_space(files[0]) is False
+        assert not os.path.exists(files[0])
+        service.close(timeout=10)
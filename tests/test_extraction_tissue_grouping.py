@@ -0,0 +1,70 @@
+"""Tests for goliat.extraction.tissue_grouping module."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from goliat.extraction.tissue_grouping import TissueGrouper, TissueTaxonomy
+
+
+def test_group_tissues_matches_entity_and_material_names():
+    config = MagicMock()
+    config.get_material_mapping.return_value = {
+        "Cornea": "Eye (Cornea)",
+        "Lens": "Eye (Lens)",
+        "Skin": "Skin",
+        "_tissue_groups": {"eyes_group": ["Cornea", "Lens"], "skin_group": ["Skin"], "face_group": ["Skin", "Cornea"]},
+    }
+    tissues = ["Eye (Cornea)  (Thelonious_6y_V6)", "Skin  (Thelonious_6y_V6)", "Muscle  (Thelonious_6y_V6)"]
+
+    groups = TissueGrouper(config, "thelonious", MagicMock()).group_tissues(tissues)
+    assert groups == {
+        "eyes_group": ["Eye (Cornea)  (Thelonious_6y_V6)", "Lens (not present)"],
+        "skin_group": ["Skin  (Thelonious_6y_V6)"],
+        "face_group": ["Skin  (Thelonious_6y_V6)", "Eye (Cornea)  (Thelonious_6y_V6)"],
+    }
+
+    taxonomy = TissueTaxonomy.from_groups(groups, tissues)
+    assert taxonomy.tissues == [tissues[0], tissues[1], tissues[2]]
+    assert taxonomy.membership.toarray().tolist() == [[1, 0, 0], [0, 1, 0], [1, 1, 0]]
+    assert taxonomy.codes([tissues[2], "Lens (not present)", tissues[0]]).tolist() == [2, -1, 0]
+    assert TissueTaxonomy.from_dict(taxonomy.to_dict()).members == taxonomy.members
+
+
+def test_aggregate_matches_per_group_isin_and_groupby():
+    rng = np.random.default_rng(7)
+    n = 300
+    organ = pd.DataFrame(
+        {
+            "tissue": rng.choice(["eye", "lens", "brain", "skin", "fat", "unknown"], n),
+            "placement": rng.choice(["front", "cheek", None], n),
+            "frequency_mhz": rng.choice([700, 3500], n),
+            "sar": np.where(rng.random(n) < 0.2, np.nan, rng.random(n)),
+            "mass": rng.random(n),
+        }
+    )
+    groups = {"eyes_group": ["eye", "lens"], "head_group": ["eye", "lens", "brain", "skin"], "empty_group": ["bone"]}
+    taxonomy = TissueTaxonomy.from_groups(groups)
+
+    means = taxonomy.aggregate(organ, ["sar"], by=["placement", "frequency_mhz"])
+    peaks = taxonomy.aggregate(organ, ["sar"], by=["placement", "frequency_mhz"], how="max")
+    weighted = taxonomy.aggregate(organ, ["sar"], weights="mass")
+    for group_name, tissues in groups.items():
+        rows = organ[organ["tissue"].isin(tissues)]
+        expected = rows.groupby(["placement", "frequency_mhz"])["sar"].agg(["mean", "max"]).reset_index()
+        for result, stat in ((means, "mean"), (peaks, "max")):
+            got = result[result["group"] == group_name]
+            assert got[["placement", "frequency_mhz"]].values.tolist() == expected[["placement", "frequency_mhz"]].values.tolist()
+            np.testing.assert_allclose(got["sar"], expected[stat])
+
+        valid = rows.dropna(subset=["sar"])
+        got = weighted.loc[weighted["group"] == group_name, "sar"]
+        if rows.empty:
+            assert got.empty
+        else:
+            assert got.item() == pytest.approx((valid["sar"] * valid["mass"]).sum() / valid["mass"].sum())
+
+    with pytest.raises(ValueError, match="Unknown aggregation"):
+        taxonomy.aggregate(organ, ["sar"], how="median")
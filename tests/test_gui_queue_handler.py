@@ -0,0 +1,82 @@
+from queue import Queue
+from unittest.mock import MagicMock
+
+import pytest
+
+from goliat.gui.components.queue_handler import QueueHandler
+from goliat.profiler import Profiler
+
+
+@pytest.fixture
+def gui():
+    gui = MagicMock()
+    gui.queue = Queue()
+    gui.web_bridge_manager.web_bridge = None
+    gui.stage_progress_bar.value.return_value = 500
+    gui.stage_progress_bar.maximum.return_value = 1000
+    return gui
+
+
+def test_progress_messages_are_coalesced(gui):
+    for i in range(50):
+        gui.queue.put({"type": "overall_progress", "current": i, "total": 100})
+        gui.queue.put({"type": "stage_progress", "name": "Run", "current": i, "total": 100})
+
+    QueueHandler(gui).process_queue()
+
+    gui.update_overall_progress.assert_called_once_with(49, 100)
+    gui.update_stage_progress.assert_called_once_with("Run", 49, 100, "")
+
+
+def test_status_messages_are_appended_in_bulk(gui, capsys):
+    for i in range(3):
+        gui.queue.put({"type": "status", "message": f"line {i}", "log_type": "info"})
+    gui.queue.put({"type": "terminal_only", "message": "verbose", "log_type": "verbose"})
+
+    QueueHandler(gui).process_queue()
+
+    gui.update_status_batch.assert_called_once_with([("line 0", "info"), ("line 1", "info"), ("line 2", "info")])
+    assert "verbose" in capsys.readouterr().out
+
+
+def test_worker_output_reaches_the_terminal_only(gui, capsys):
+    gui.queue.put({"type": "print", "message": "from stdout"})
+    gui.queue.put({"type": "print", "message": "from stderr", "stream": "stderr"})
+
+    QueueHandler(gui).process_queue()
+
+    out = capsys.readouterr().out
+    assert "from stdout\n" in out and "from stderr" in out
+    gui.update_status_batch.assert_not_called()
+
+
+def test_barrier_messages_preserve_order(gui):
+    calls = []
+    gui.update_overall_progress.side_effect = lambda *a: calls.append("progress")
+    gui.study_finished.side_effect = lambda *a, **k: calls.append("finished")
+    gui.queue.put({"type": "overall_progress", "current": 100, "total": 100})
+    gui.queue.put({"type": "finished"})
+
+    QueueHandler(gui).process_queue()
+
+    assert calls == ["progress", "finished"]
+
+
+def test_profiler_snapshot_is_rebuilt_and_forwarded_with_eta(gui):
+    bridge = MagicMock()
+    gui.web_bridge_manager.web_bridge = bridge
+    profiler = Profiler({"do_setup": True, "do_run": True}, {"avg_setup_time": 10, "avg_run_time": 20}, "far_field", "unused.json")
+    profiler.set_total_simulations(2)
+    profiler.start_stage("run")
+    gui.queue.put({"type": "profiler_update", "profiler": profiler.snapshot()})
+
+    handler = QueueHandler(gui)
+    handler.process_queue()
+
+    assert isinstance(gui.profiler, Profiler)
+    assert gui.profiler.current_phase == "run"
+    forwarded = bridge.enqueue.call_args[0][0]
+    assert forwarded["type"] == "profiler_update"
+    assert forwarded["eta_seconds"] == pytest.approx(profiler.get_time_remaining(0.5))
+    assert handler.stats["ticks"] == 1
+    assert handler.stats["messages"] == 1
@@ -0,0 +1,69 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from goliat.gui.components.telemetry_store import TelemetryStore, read_telemetry_file
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TelemetryStore(
+        str(tmp_path),
+        "session",
+        logging.getLogger("verbose"),
+        recent_capacity=5,
+        archive_capacity=3,
+        downsample_factor=2,
+        flush_every=4,
+        clock_offset_s=0.0,
+    )
+    store.register_series("utilization", ["cpu", "gpu"])
+    return store
+
+
+def test_recent_window_is_bounded_and_old_samples_are_downsampled(store):
+    for i in range(9):
+        store.append("utilization", [float(i), None], timestamp=START + timedelta(seconds=i))
+
+    history = store.get_series("utilization")
+
+    # 4 evicted samples -> 2 averaged archive samples, then the 5 most recent
+    assert [v[0] for _, v in history] == [0.5, 2.5, 4.0, 5.0, 6.0, 7.0, 8.0]
+    assert all(v[1] is None for _, v in history)
+    assert history[0][0] == START + timedelta(seconds=0.5)
+
+
+def test_samples_are_flushed_in_batches(store, tmp_path):
+    for i in range(3):
+        store.append("utilization", [float(i), 50.0], timestamp=START + timedelta(seconds=i))
+    path = tmp_path / "utilization_session.bin"
+    assert not path.exists()
+
+    store.append("utilization", [3.0, None], timestamp=START + timedelta(seconds=3))
+    columns, rows = read_telemetry_file(str(path))
+
+    assert columns == ["timestamp", "cpu", "gpu"]
+    assert rows.shape == (4, 3)
+    assert rows[0, 0] == START.timestamp()
+    assert np.isnan(rows[3, 2])
+
+
+def test_close_flushes_pending_and_files_rotate(tmp_path):
+    store = TelemetryStore(str(tmp_path), "s", logging.getLogger("verbose"), flush_every=1, max_file_bytes=1, clock_offset_s=0.0)
+    store.register_series("progress", ["percent"])
+    store.append("progress", [10.0])
+    store.append("progress", [20.0])
+    store.close()
+
+    paths = store.get_file_paths("progress")
+    assert len(paths) == 2
+    assert [read_telemetry_file(p)[1][0, 1] for p in paths] == [10.0, 20.0]
+
+
+def test_wrong_number_of_values_raises(store):
+    with pytest.raises(ValueError):
+        store.append("utilization", [1.0])
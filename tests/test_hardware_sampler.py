@@ -0,0 +1,95 @@
+import os
+import sys
+import textwrap
+import time
+
+import pytest
+
+from goliat.gui.components.hardware_sampler import GpuReading, HardwareSampler, NvidiaSmiLoopBackend, create_gpu_backend
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="fake nvidia-smi is a POSIX script")
+
+
+@pytest.fixture
+def fake_nvidia_smi(tmp_path, monkeypatch):
+    """Puts an nvidia-smi on PATH that streams two GPUs and logs every start."""
+    starts = tmp_path / "starts.log"
+    script = tmp_path / "nvidia-smi"
+    script.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import sys, time
+            with open({str(starts)!r}, "a") as f:
+                f.write(" ".join(sys.argv[1:]) + "\\n")
+            loop_ms = int(next(a for a in sys.argv if a.startswith("--loop-ms=")).split("=")[1])
+            while True:
+                print("0, NVIDIA GeForce RTX 4090, 37, 2048, 24564", flush=True)
+                print("1, NVIDIA A100, 99, 1, 2", flush=True)
+                time.sleep(loop_ms / 1000)
+            """
+        )
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setattr("goliat.gui.components.hardware_sampler.NvmlBackend", lambda: 1 / 0)
+    return starts
+
+
+def test_one_nvidia_smi_process_feeds_every_sample(fake_nvidia_smi):
+    backend = create_gpu_backend(interval_s=0.1)
+    assert isinstance(backend, NvidiaSmiLoopBackend)
+    sampler = HardwareSampler(interval_s=0.1, gpu_backend=backend).start()
+    try:
+        assert sampler.wait_for_gpu(timeout=10)
+        time.sleep(0.3)
+        snapshot = sampler.sample()
+    finally:
+        sampler.stop()
+
+    assert snapshot.gpu_name == "GeForce RTX 4090" and snapshot.gpu_percent == 37.0
+    assert snapshot.vram_used_gb == 2.0 and snapshot.vram_total_gb == pytest.approx(23.988, abs=1e-3)
+    assert snapshot.ram_total_gb > 0 and sampler.snapshot() is snapshot
+    assert fake_nvidia_smi.read_text().splitlines() == [
+        "--query-gpu=index,name,utilization.gpu,memory.used,memory.total --format=csv,noheader,nounits --loop-ms=100"
+    ]
+    assert backend._process.poll() is not None
+
+
+class _StaticBackend:
+    available = True
+
+    def __init__(self, reading):
+        self.reading = reading
+
+    def latest(self):
+        return self.reading
+
+    def close(self):
+        pass
+
+
+def test_stale_or_missing_gpu_readings_are_reported_as_unavailable(tmp_path):
+    stale = GpuReading("RTX 4090", 50.0, 1024.0, 24564.0, time.monotonic() - 60)
+    snapshot = HardwareSampler(gpu_backend=_StaticBackend(stale)).sample()
+    assert snapshot.gpu_name == "RTX 4090" and snapshot.gpu_percent is None and snapshot.vram_total_gb is None
+
+    missing = NvidiaSmiLoopBackend(executable=str(tmp_path / "missing-nvidia-smi"))
+    sampler = HardwareSampler(gpu_backend=missing)
+    started = time.monotonic()
+    assert not sampler.wait_for_gpu(timeout=5)
+    assert time.monotonic() - started < 5 and not missing.available
+    assert HardwareSampler(gpu_backend=None).sample().gpu_percent is None
+
+
+def test_nvidia_smi_that_keeps_exiting_marks_backend_unavailable(tmp_path):
+    script = tmp_path / "nvidia-smi"
+    script.write_text("#!/bin/sh\necho 'NVIDIA-SMI has failed because it could not communicate with the NVIDIA driver.'\nexit 9\n")
+    script.chmod(0o755)
+
+    backend = NvidiaSmiLoopBackend(executable=str(script), max_failed_starts=2)
+    sampler = HardwareSampler(gpu_backend=backend)
+    started = time.monotonic()
+    # Gives up after two runs (one 1 s backoff in between) instead of restarting forever
+    assert not sampler.wait_for_gpu(timeout=10)
+    assert time.monotonic() - started < 5 and not backend.available and not sampler.gpu_available()
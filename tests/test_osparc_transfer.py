@@ -0,0 +1,209 @@
+import hashlib
+import re
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from goliat.osparc_batch import transfer
+from goliat.osparc_batch.job_monitor import JobMonitor, StatusBuffer
+from goliat.osparc_batch.osparc_client import download_and_process_results
+from goliat.osparc_batch.transfer import DownloadError, download_resumable, extract_results_archive, file_content_url
+
+
+class _FakeFilesServer:
+    """Local stand-in for the oSPARC file-content endpoint with Range support.
+
+    The first `drops` requests of each file send only half of the requested
+    bytes and then close the connection. Requests are answered with the
+    statuses in `errors` first, in order; None serves the request.
+    """
+
+    def __init__(self, files, drops=0, errors=()):
+        self.files = files
+        self.drops = drops
+        self.errors = list(errors)
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                file_id = re.match(r"/v0/files/([^/]+)/content", self.path).group(1)
+                data = server.files[file_id]
+                range_header = self.headers.get("Range")
+                server.requests.append((file_id, range_header))
+                error = server.errors.pop(0) if server.errors else None
+                if error:
+                    self.send_response(error)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                start = int(re.match(r"bytes=(\d+)-", range_header).group(1)) if range_header else 0
+                if start >= len(data):
+                    self.send_response(416)
+                    self.end_headers()
+                    return
+                body = data[start:]
+                self.send_response(206 if start else 200)
+                if start:
+                    self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if sum(1 for f, _ in server.requests if f == file_id) <= server.drops:
+                    self.wfile.write(body[: len(body) // 2])
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.host = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(transfer.time, "sleep", lambda _seconds: None)
+
+
+def _zip_bytes(members):
+    import io
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_download_resumes_after_dropped_connection(tmp_path, no_backoff):
+    data = bytes(range(256)) * 4096
+    server = _FakeFilesServer({"f1": data}, drops=1)
+    try:
+        session = transfer.requests.Session()
+        dest = download_resumable(
+            session,
+            file_content_url(server.host, "f1"),
+            tmp_path / "out.bin",
+            expected_sha256=hashlib.sha256(data).hexdigest(),
+            chunk_size=4096,
+        )
+    finally:
+        server.close()
+
+    assert dest.read_bytes() == data
+    assert not (tmp_path / "out.bin.part").exists()
+    # Second request continued from the bytes already on disk
+    assert server.requests[0] == ("f1", None)
+    assert server.requests[1][1] == f"bytes={len(data) // 2}-"
+
+
+def test_download_resumes_after_server_error(tmp_path, no_backoff):
+    data = bytes(range(256)) * 64
+    server = _FakeFilesServer({"f1": data}, drops=1, errors=[None, 503])
+    try:
+        dest = download_resumable(transfer.requests.Session(), file_content_url(server.host, "f1"), tmp_path / "out.bin", chunk_size=1024)
+        with pytest.raises(transfer.requests.HTTPError):
+            server.errors = [404]
+            download_resumable(transfer.requests.Session(), file_content_url(server.host, "f1"), tmp_path / "missing.bin")
+    finally:
+        server.close()
+
+    assert dest.read_bytes() == data
+    # The 503 was retried with the same range, which the server then answered with 206
+    assert [r for _, r in server.requests[:3]] == [None, f"bytes={len(data) // 2}-", f"bytes={len(data) // 2}-"]
+    assert len(server.requests) == 4  # The 404 was not retried
+
+
+def test_download_rejects_checksum_mismatch(tmp_path):
+    server = _FakeFilesServer({"f1": b"payload"})
+    try:
+        with pytest.raises(DownloadError, match="Checksum mismatch"):
+            download_resumable(
+                transfer.requests.Session(), file_content_url(server.host, "f1"), tmp_path / "out.bin", expected_sha256="0" * 64
+            )
+    finally:
+        server.close()
+    assert not (tmp_path / "out.bin").exists()
+    assert not (tmp_path / "out.bin.part").exists()
+
+
+def test_extract_renames_logs_and_skips_unsafe_members(tmp_path):
+    zip_path = tmp_path / "results.zip"
+    zip_path.write_bytes(_zip_bytes({"output.h5": b"h5", "input.log": b"solver log", "ax.log": b"ax", "../escape.txt": b"x"}))
+    out_dir = tmp_path / "sim"
+
+    extracted = extract_results_archive(zip_path, out_dir, "abc")
+
+    assert sorted(p.name for p in extracted) == ["abc_AxLog.log", "iSolve-output-abc.log", "output.h5"]
+    assert (out_dir / "iSolve-output-abc.log").read_bytes() == b"solver log"
+    assert not (tmp_path / "escape.txt").exists()
+    assert not zip_path.exists()
+
+
+def test_results_pipeline_against_fake_api(tmp_path, no_backoff):
+    h5 = b"\x89HDF" * 1000
+    archive = _zip_bytes({"input.log": b"log"})
+    server = _FakeFilesServer({"h5id": h5, "zipid": archive}, drops=1)
+    outputs = SimpleNamespace(
+        results={
+            "output_1": SimpleNamespace(id="h5id", filename="output.h5", checksum=hashlib.sha256(h5).hexdigest()),
+            "output_2": SimpleNamespace(id="zipid", filename="logs.zip", checksum=None),
+        }
+    )
+    solvers_api = SimpleNamespace(get_job_outputs=lambda *args: outputs)
+    client_cfg = SimpleNamespace(host=server.host, username="key", password="secret", temp_folder_path=str(tmp_path))
+    input_file = tmp_path / "sim" / "abc_Input.h5"
+    input_file.parent.mkdir()
+    buffer = StatusBuffer()
+    try:
+        download_and_process_results(
+            SimpleNamespace(id="job1"), SimpleNamespace(id="s", version="1"), client_cfg, input_file, None, buffer, solvers_api=solvers_api
+        )
+    finally:
+        server.close()
+
+    assert (input_file.parent / "abc_Output.h5").read_bytes() == h5
+    assert (input_file.parent / "iSolve-output-abc.log").read_bytes() == b"log"
+    # Statuses are coalesced: only the latest per job is applied
+    assert buffer.drain() == {"job1": "COMPLETED"}
+    assert buffer.drain() == {}
+
+
+def test_job_monitor_polls_concurrently_with_one_client():
+    barrier = threading.Barrier(3, timeout=5)
+    created = []
+
+    class FakeSolversApi:
+        def __init__(self, api_client):
+            created.append(api_client)
+
+        def inspect_job(self, solver_id, version, job_id):
+            barrier.wait()  # Only passes if all three polls are in flight at once
+            if job_id == "bad":
+                raise RuntimeError("boom")
+            return SimpleNamespace(state="STARTED", progress=10)
+
+    fake_osparc = SimpleNamespace(ApiClient=lambda cfg: object(), SolversApi=FakeSolversApi)
+    cfg = SimpleNamespace(username="key", password="secret", connection_pool_maxsize=4)
+    monitor = JobMonitor(cfg, fake_osparc, max_concurrent_polls=8)
+    solver = SimpleNamespace(id="s", version="1")
+    jobs = [(name, SimpleNamespace(id=name), solver) for name in ("a", "bad", "c")]
+
+    for _ in range(2):
+        results = monitor.poll(jobs)
+    monitor.close()
+
+    assert len(created) == 1
+    assert cfg.connection_pool_maxsize == 8
+    assert [key for key, *_ in results] == ["a", "bad", "c"]
+    assert isinstance(results[1][3], RuntimeError)
+    assert results[0][3].state == "STARTED"
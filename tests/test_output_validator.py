@@ -0,0 +1,66 @@
+import os
+import time
+from unittest.mock import MagicMock
+
+import h5py
+import numpy as np
+
+from goliat.extraction.output_validator import check_output_h5
+from goliat.project_manager import ProjectManager
+
+H_COMP1 = "FieldGroups/0/AllFields/EM H(x,y,z,f0)/_Object/Snapshots/0/comp1"
+
+
+def test_check_output_h5_rejects_damaged_files(tmp_path, write_solver_output):
+    valid = tmp_path / "valid_Output.h5"
+    write_solver_output(valid)
+    assert check_output_h5(str(valid)) == (True, "")
+
+    no_h = tmp_path / "no_h_Output.h5"
+    write_solver_output(no_h, fields=("E",))
+    assert check_output_h5(str(no_h)) == (False, "H comp0 missing")
+
+    truncated = tmp_path / "truncated_Output.h5"
+    write_solver_output(truncated)
+    os.truncate(truncated, os.path.getsize(truncated) // 2)
+    assert check_output_h5(str(truncated)).reason.startswith("unreadable")
+
+    partial = tmp_path / "partial_Output.h5"
+    write_solver_output(partial)
+    with h5py.File(partial, "r+") as f:
+        shape = f[H_COMP1].shape
+        del f[H_COMP1]
+        f.create_dataset(H_COMP1, shape=shape, dtype=np.float32, chunks=(1,) + shape[1:])[0] = 1.0
+    assert check_output_h5(str(partial)) == (False, f"H comp1: only 1 of {shape[0]} chunks written")
+
+    other_grid = tmp_path / "other_grid_Output.h5"
+    write_solver_output(other_grid)
+    with h5py.File(other_grid, "r+") as f:
+        del f["Meshes/mesh0/axis_z"]
+        f["Meshes/mesh0/axis_z"] = np.linspace(0.0, 0.1, 9)
+    assert "does not match any mesh" in check_output_h5(str(other_grid)).reason
+
+    assert check_output_h5(str(tmp_path / "missing_Output.h5")) == (False, "not an HDF5 file")
+
+
+def test_verdict_is_cached_until_the_file_changes(tmp_path, write_solver_output, monkeypatch):
+    config = MagicMock()
+    config.base_dir = str(tmp_path)
+    config.__getitem__.side_effect = lambda key: None
+    manager = ProjectManager(config, MagicMock(), MagicMock())
+    results_dir = tmp_path / "results" / "far_field" / "duke" / "700MHz" / "environmental_x_pos_theta" / "p.smash_Results"
+    results_dir.mkdir(parents=True)
+    output = results_dir / "abc_Output.h5"
+    write_solver_output(output)
+
+    checks = []
+    monkeypatch.setattr("goliat.project_manager.check_output_h5", lambda *args: checks.append(args) or check_output_h5(*args))
+    setup_timestamp = time.time() - 60
+    assert manager._validate_h5_file(str(output), str(results_dir), setup_timestamp)
+    assert manager._validate_h5_file(str(output), str(results_dir), setup_timestamp)
+    assert checks == [(str(output), str(results_dir / "abc_Input.h5"))]
+
+    os.truncate(output, 100)
+    assert not manager._validate_h5_file(str(output), str(results_dir), setup_timestamp)
+    assert len(checks) == 2
+    manager.cleanup()
@@ -0,0 +1,87 @@
+from goliat.analysis import analyze_simulation_stats
+from goliat.analysis.analyze_simulation_stats import VERBOSE_LOG_CACHE_NAME, parse_all_logs
+from goliat.analysis.parse_verbose_log import parse_verbose_log
+
+SAMPLE_LOG = """\
+Host CPU: AMD Ryzen 9 7950X
+iSolve X, Version 8.2.0 (16876)
+Importing from 'C:/data/phantoms/thelonious.sab'
+Phantom imported successfully.
+  Subtask 'setup_load_phantom' done in 12.50s
+Subtask 'setup_materials' done in 3.25s
+Subtask 'setup_materials' done in 0.75s
+Side X-: ABC (UPML, 8 layers)
+Side Z+: ABC (UPML, 12 layers)
+Number of cells: 100x200x300 = 6000000 cells = 6.000 MCells
+Number of cells including PML: 116x216x324 = 8118144 cells = 8.118 MCells
+Simulation Time Step:   4.16e-12 sec
+Simulation Iterations:   12345
+Simulation 'EM_FDTD_thelonious_700MHz' started on Mon Jan 5 10:00:00 2026
+[PROGRESS]: 10% [ 1234/12345] @ 1500.5 MCells/s
+[PROGRESS]: 50% [ 6000/12345] @ 1700.0 MCells/s
+[PROGRESS]: 90% [11000/12345] @ 1600.0 MCells/s
+Elapsed time for 'Simulation' was 00:12:34
+Simulation 'EM_FDTD_thelonious_700MHz' has ended successfully on Mon Jan 5 10:12:34 2026 and took 00:12:34 wall clock time
+"""
+
+
+def _write_log(path, content=SAMPLE_LOG):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_parse_verbose_log_extracts_metrics_in_one_pass(tmp_path):
+    metrics = parse_verbose_log(str(_write_log(tmp_path / "verbose.log")))
+
+    assert metrics["metadata"]["simulation_name"] == "EM_FDTD_thelonious_700MHz"
+    assert metrics["phantom"]["import_time_s"] == 12.5
+    assert metrics["timing"]["subtasks"] == {"setup_load_phantom": 12.5, "setup_materials": 0.75}
+    assert metrics["timing"]["total_wall_clock_s"] == 754
+    assert metrics["boundaries"]["pml_layers"] == {"X-": 8, "Z+": 12}
+    assert metrics["summary"]["peak_mcells_per_s"] == 1700.0
+    assert metrics["summary"]["min_mcells_per_s"] == 1500.5
+    assert metrics["summary"]["total_cell_iterations"] == 8118144 * 12345
+
+
+def test_parse_all_logs_reuses_cache_for_unchanged_logs(tmp_path, monkeypatch):
+    log_a = _write_log(tmp_path / "near_field" / "thelonious" / "700MHz" / "by_cheek" / "verbose.log")
+    log_b = _write_log(tmp_path / "near_field" / "eartha" / "900MHz" / "front_of_eyes" / "verbose.log")
+    _write_log(tmp_path / "far_field" / "thelonious" / "700MHz" / "verbose.log")
+    cache_path = tmp_path / VERBOSE_LOG_CACHE_NAME
+    log_files = analyze_simulation_stats.find_all_verbose_logs(tmp_path)
+
+    first = parse_all_logs(log_files, verbose=False, cache_path=cache_path, max_workers=1)
+    assert len(first) == 2
+    assert {m["category"]["phantom"] for m in first} == {"thelonious", "eartha"}
+    assert cache_path.exists()
+
+    parsed = []
+    original = analyze_simulation_stats._parse_log_safe
+    monkeypatch.setattr(analyze_simulation_stats, "_parse_log_safe", lambda p: parsed.append(p) or original(p))
+
+    second = parse_all_logs(log_files, verbose=False, cache_path=cache_path, max_workers=1)
+    assert parsed == []
+    assert [m["timing"] for m in second] == [m["timing"] for m in first]
+
+    _write_log(log_b, SAMPLE_LOG + "Subtask 'extract_sar' done in 5.00s\n")
+    third = parse_all_logs(log_files, verbose=False, cache_path=cache_path, max_workers=1)
+    assert parsed == [str(log_b.resolve())]
+    assert len(third) == 2
+    assert str(log_a.resolve()) not in parsed
+
+
+def test_failed_parses_are_not_cached_and_parser_changes_invalidate(tmp_path, monkeypatch):
+    log = _write_log(tmp_path / "near_field" / "thelonious" / "700MHz" / "by_cheek" / "verbose.log")
+    cache_path = tmp_path / VERBOSE_LOG_CACHE_NAME
+    original = analyze_simulation_stats._parse_log_safe
+    monkeypatch.setattr(analyze_simulation_stats, "_parse_log_safe", lambda p: None)
+
+    assert parse_all_logs([log], verbose=False, cache_path=cache_path, max_workers=1) == []
+    # The failure is retried on the next scan instead of being served from the cache
+    monkeypatch.setattr(analyze_simulation_stats, "_parse_log_safe", original)
+    assert len(parse_all_logs([log], verbose=False, cache_path=cache_path, max_workers=1)) == 1
+    assert analyze_simulation_stats.load_log_cache(cache_path)
+
+    monkeypatch.setattr(analyze_simulation_stats, "_log_cache_version", lambda: "changed-parser")
+    assert analyze_simulation_stats.load_log_cache(cache_path) == {}
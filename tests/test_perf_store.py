@@ -0,0 +1,123 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+from goliat.analysis.perf_report import detect_regressions, phase_breakdown, throughput_distribution
+from goliat.perf_store import metadata_row
+
+
+def _metadata(timestamp, mcells_per_s, gpu="RTX 4090", frequency=700):
+    return {
+        "simulation_name": f"EM_FDTD_duke_{frequency}MHz_x_pos_theta",
+        "study_type": "far_field",
+        "phantom_name": "duke",
+        "frequency_mhz": frequency,
+        "timestamp": timestamp,
+        "timing": {
+            "setup": {"total_time_s": 10.0, "subtasks": {"load_phantom": 4.0}},
+            "run": {"total_time_s": 80.0, "subtasks": {}},
+            "extract": {"total_time_s": 10.0, "subtasks": {}},
+        },
+        "total_study_time_s": 100.0,
+        "solver": {"iterations": 5000, "grid_resolution_mm": 2.0},
+        "hardware": {"gpu_model": gpu, "gpu_memory_mb": 24564.0},
+        "performance": {"avg_mcells_per_s": mcells_per_s},
+        "grid": {"total_mcells": 12.5, "dimensions": {"x": 100}},
+        "file_sizes": {"output_h5_mb": 512.0},
+        "project_path": f"/results/far_field/duke/{frequency}MHz/{timestamp}.smash",
+    }
+
+
+def test_report_tables_flag_a_slower_machine():
+    rows = []
+    for machine, recent_speed in (("fast-box", 1000.0), ("slow-box", 600.0)):
+        for i in range(25):
+            row = metadata_row(_metadata(f"2026-09-{1 + i:02d}T12:00:00", 1000.0 if i < 20 else recent_speed))
+            rows.append(dict(row, machine=machine))
+    df = pd.DataFrame(rows)
+
+    assert metadata_row(_metadata("2026-09-01T12:00:00", 1.0, frequency=[700, 900]))["frequency_mhz"] == "700+900"
+    assert rows[0]["gpu_memory_mb"] == 24564 and rows[0]["subtasks"] == '{"extract": {}, "run": {}, "setup": {"load_phantom": 4.0}}'
+
+    throughput = throughput_distribution(df)
+    assert list(throughput["machine"]) == ["fast-box", "slow-box"] and list(throughput["runs"]) == [25, 25]
+
+    regressions = detect_regressions(df)
+    assert regressions.set_index("machine")["regressed"].to_dict() == {"slow-box": True, "fast-box": False}
+    assert regressions.iloc[0]["ratio"] == pytest.approx(0.6)
+
+    phases = phase_breakdown(df).set_index("machine")
+    assert phases.loc["fast-box", "run_share"] == pytest.approx(0.8)
+
+
+def test_store_appends_filters_and_compacts(tmp_path):
+    pytest.importorskip("pyarrow")
+    from goliat.perf_store import append_metadata, compact_perf_store, load_perf_store
+
+    store = str(tmp_path / "perf_store")
+    for day in range(1, 4):
+        append_metadata(store, _metadata(f"2026-08-{day:02d}T09:00:00", 800.0), machine="node 1")
+        append_metadata(store, _metadata(f"2026-09-{day:02d}T09:00:00", 900.0 + day, gpu="A100"), machine="node-2")
+    # Appending the same export again replaces its row
+    append_metadata(store, _metadata("2026-09-01T09:00:00", 901.0, gpu="A100"), machine="node-2")
+
+    assert sorted(os.listdir(store)) == ["machine=node-2", "machine=node_1"]
+    assert len(load_perf_store(store)) == 6
+
+    recent = load_perf_store(store, columns=["machine", "avg_mcells_per_s"], since="2026-09-02", gpu_models=["A100"])
+    assert list(recent["avg_mcells_per_s"]) == [902.0, 903.0] and set(recent["machine"]) == {"node-2"}
+    assert list(load_perf_store(store, machines=["node 1"])["month"].unique()) == ["2026-08"]
+
+    assert compact_perf_store(store, min_files=2) == 6
+    assert len(glob.glob(os.path.join(store, "*", "*", "*.parquet"))) == 2
+    assert load_perf_store(store)["avg_mcells_per_s"].tolist() == [800.0, 800.0, 800.0, 901.0, 902.0, 903.0]
+
+
+def test_reexport_replaces_row_across_months(tmp_path):
+    pytest.importorskip("pyarrow")
+    from goliat.perf_store import append_metadata, load_perf_store
+
+    store = str(tmp_path / "perf_store")
+    # The metadata timestamp is the export time, so a re-export can land in another month
+    first = dict(_metadata("2026-08-31T23:00:00", 800.0), project_path="/results/far_field/duke/700MHz/sim.smash")
+    second = dict(first, timestamp="2026-09-01T08:00:00", performance={"avg_mcells_per_s": 820.0})
+    append_metadata(store, first, machine="node-1")
+    append_metadata(store, second, machine="node-1")
+
+    df = load_perf_store(store)
+    assert len(df) == 1
+    assert df.iloc[0]["avg_mcells_per_s"] == 820.0 and df.iloc[0]["month"] == "2026-09"
+    assert len(glob.glob(os.path.join(store, "*", "*", "*.parquet"))) == 1
+
+
+def test_reexport_after_compaction_is_counted_once(tmp_path):
+    pytest.importorskip("pyarrow")
+    from goliat.perf_store import append_metadata, compact_perf_store, load_perf_store
+
+    store = str(tmp_path / "perf_store")
+    first = dict(_metadata("2026-09-01T09:00:00", 800.0), project_path="/results/far_field/duke/700MHz/sim.smash")
+    append_metadata(store, first, machine="node-1")
+    append_metadata(store, _metadata("2026-09-02T09:00:00", 850.0), machine="node-1")
+    assert compact_perf_store(store, min_files=2) == 2
+
+    append_metadata(store, dict(first, timestamp="2026-09-03T09:00:00", performance={"avg_mcells_per_s": 820.0}), machine="node-1")
+    assert load_perf_store(store)["avg_mcells_per_s"].tolist() == [850.0, 820.0]
+    assert load_perf_store(store, columns=["avg_mcells_per_s"]).columns.tolist() == ["avg_mcells_per_s", "timestamp"]
+
+    assert compact_perf_store(store, min_files=2) == 2
+    assert load_perf_store(store)["avg_mcells_per_s"].tolist() == [850.0, 820.0]
+    assert len(glob.glob(os.path.join(store, "*", "*", "*.parquet"))) == 1
+
+
+def test_default_store_dir_follows_config(tmp_path):
+    from goliat.analysis.perf_report import default_store_dir
+
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "material_name_mapping.json").write_text("{}")
+    (tmp_path / "configs" / "study.json").write_text('{"execution_control": {"perf_store_dir": "shared/perf"}}')
+
+    assert default_store_dir(str(tmp_path)) == str(tmp_path / "data" / "perf_store")
+    assert default_store_dir(str(tmp_path), "study.json") == str(tmp_path / "shared" / "perf")
@@ -0,0 +1,95 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "plot_emf_hotspots.py"
+
+_PLANES = [(component, plane) for component in ("Ex", "Ey", "Ez", "E_mag") for plane in ("xy", "xz", "yz")]
+
+
+@pytest.fixture(scope="module")
+def hotspots():
+    spec = importlib.util.spec_from_file_location("plot_emf_hotspots", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Pool workers unpickle the reduction function by module name
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[spec.name]
+
+
+def _write_field(path, nodes, seed):
+    """Writes a random staggered E-field in the Sim4Life output layout: comp<c> has one sample less along axis c."""
+    rng = np.random.default_rng(seed)
+    with h5py.File(path, "w") as f:
+        mesh = f.create_group("Meshes/mesh0")
+        for name, n in zip(("axis_x", "axis_y", "axis_z"), nodes):
+            mesh[name] = 0.01 + 0.005 * np.arange(n)
+        snapshot = f.create_group("FieldGroups/group0/AllFields/EM E(x,y,z,f0)/_Object/Snapshots/0")
+        for c in range(3):
+            shape = tuple(n - (axis == c) for axis, n in enumerate(nodes)) + (2,)
+            snapshot[f"comp{c}"] = rng.standard_normal(shape).astype(np.float32)
+    return path
+
+
+def _reference_slice(data, component, plane, x_center_offset_mm=25.0):
+    """Center slice as the whole-volume path takes it from `load_emf_data`."""
+    field = data.E_magnitude if component == "E_mag" else np.abs(getattr(data, component))
+    if plane == "xy":
+        return field[:, :, field.shape[2] // 2]
+    if plane == "xz":
+        return field[:, field.shape[1] // 2, :]
+    x_idx = min(int(np.argmin(np.abs(data.axis_x * 1000 - (data.axis_x[0] * 1000 + x_center_offset_mm)))), field.shape[0] - 1)
+    return field[x_idx, :, :]
+
+
+@pytest.mark.parametrize("nodes", [(9, 13, 11), (14, 11, 12)])
+@pytest.mark.parametrize("slab_rows", [1, 3, None])
+def test_streamed_stats_match_whole_volume(hotspots, tmp_path, monkeypatch, nodes, slab_rows):
+    path = _write_field(tmp_path / "combined_candidate2_Output.h5", nodes, seed=sum(nodes))
+    _, ny, nz = nodes
+    row_bytes = 2 * 4 * (ny * nz + (ny - 1) * nz + ny * (nz - 1))
+    if slab_rows:
+        monkeypatch.setattr(hotspots, "STATS_SLAB_BYTES", slab_rows * row_bytes)
+
+    stats = hotspots.compute_hotspot_stats(path, "duke", "7GHz", reducer=hotspots.FieldReducer(workers=1))
+
+    data = hotspots.load_emf_data(path)
+    e_mag = data.E_magnitude
+    peak = np.unravel_index(np.argmax(e_mag), e_mag.shape)
+    centers = (data.grid_center_x, data.grid_center_y, data.grid_center_z)
+    for name, field in (("Ex", np.abs(data.Ex)), ("Ey", np.abs(data.Ey)), ("Ez", np.abs(data.Ez)), ("E_mag", e_mag)):
+        assert getattr(stats, f"max_{name}") == pytest.approx(float(field.max()), rel=1e-5)
+        assert getattr(stats, f"mean_{name}") == pytest.approx(float(field.mean()), rel=1e-5)
+    assert stats.hotspot_location == pytest.approx([c[i] * 1000 for c, i in zip(centers, peak)])
+    assert stats.candidate_num == 2 and stats.domain_size == pytest.approx(data.domain_size_mm)
+
+
+def test_slices_match_whole_volume_through_pool_and_cache(hotspots, tmp_path, monkeypatch):
+    from scipy.ndimage import zoom
+
+    files = [_write_field(tmp_path / f"candidate{i}_Output.h5", nodes, seed=i) for i, nodes in enumerate([(9, 13, 11), (14, 11, 12)])]
+    datasets = [hotspots.load_emf_data(path) for path in files]
+    cache_dir = tmp_path / "cache"
+
+    for workers in (2, 1):
+        if workers == 1:  # The second reducer must be served from the .npz cache
+            monkeypatch.setattr(hotspots, "_reduce_file", lambda *args: pytest.fail("H5 file read again"))
+        reducer = hotspots.FieldReducer(cache_dir=cache_dir, workers=workers)
+        for component, plane in _PLANES:
+            averaged, count = hotspots.compute_averaged_field_slice(files, component, plane, target_size=16, reducer=reducer)
+
+            expected = []
+            for data in datasets:
+                reference = _reference_slice(data, component, plane)
+                reference = reference / reference.max()
+                expected.append(zoom(reference, (16 / reference.shape[0], 16 / reference.shape[1]), order=1))
+            assert count == 2
+            np.testing.assert_allclose(averaged, np.mean(expected, axis=0), rtol=1e-5, atol=1e-6)
+    assert len(list(cache_dir.glob("*.npz"))) == len(files) * len(_PLANES)
@@ -33,3 +33,34 @@ def test_time_remaining(profiler_instance):
     profiler_instance.start_stage("run")
     remaining = profiler_instance.get_time_remaining(current_stage_progress=0.25)
     assert isinstance(remaining, float)
+
+
+def test_snapshot_roundtrip(profiler_instance):
+    profiler_instance.set_total_simulations(4)
+    profiler_instance.simulation_completed()
+    profiler_instance.subtask_times["setup"].append(12.0)
+    profiler_instance.start_stage("run")
+
+    snapshot = profiler_instance.snapshot()
+    restored = Profiler.from_snapshot(snapshot)
+
+    assert restored.current_phase == "run"
+    assert restored.subtask_times["setup"] == [12.0]
+    assert restored.get_time_remaining(0.5) == pytest.approx(profiler_instance.get_time_remaining(0.5))
+    assert restored.get_weighted_progress("run", 0.5) == pytest.approx(profiler_instance.get_weighted_progress("run", 0.5))
+
+
+def test_time_remaining_uses_measured_solver_progress(profiler_instance):
+    profiler_instance.set_total_simulations(1)
+    profiler_instance.start_stage("run")
+    profiler_instance.record_solver_progress(percent=50, remaining_s=100.0, mcells_per_s=1500.0, elapsed_s=90.0)
+
+    # Remaining solver time plus the extract phase estimate
+    assert profiler_instance.get_time_remaining(0.1) == pytest.approx(105.0)
+    assert Profiler.from_snapshot(profiler_instance.snapshot()).get_time_remaining(0.1) == pytest.approx(105.0)
+
+    profiler_instance.record_solver_progress(percent=25, remaining_s=None, mcells_per_s=1500.0, elapsed_s=30.0)
+    assert profiler_instance.get_time_remaining(0.1) == pytest.approx(95.0)
+
+    profiler_instance.end_stage()
+    assert profiler_instance.solver_progress is None
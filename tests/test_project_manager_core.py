@@ -142,7 +142,7 @@ class TestProjectManager:
         # Should not crash
         manager.update_simulation_metadata("/nonexistent/path.json", run_done=True)
 
-    def test_project_manager_get_deliverables_status(self, dummy_config, tmp_path):
+    def test_project_manager_get_deliverables_status(self, dummy_config, tmp_path, write_solver_output):
         """Test _get_deliverables_status method."""
         import time
 
@@ -158,16 +158,14 @@ class TestProjectManager:
 
         project_dir = str(tmp_path)
         project_filename = "test_project"
-        setup_timestamp = time.time()
+        setup_timestamp = time.time() - 1
 
         # Create results directory and H5 file
         results_dir = os.path.join(project_dir, f"{project_filename}_Results")
         os.makedirs(results_dir, exist_ok=True)
 
-        # Create a mock H5 file larger than 8MB
         h5_file_path = os.path.join(results_dir, "test_Output.h5")
-        with open(h5_file_path, "wb") as f:
-            f.write(b"0" * (9 * 1024 * 1024))  # 9MB file
+        write_solver_output(h5_file_path)
 
         status = manager._get_deliverables_status(project_dir, project_filename, setup_timestamp)
 
@@ -177,7 +175,7 @@ class TestProjectManager:
         assert status["run_done"] is True
 
     def test_project_manager_get_deliverables_status_small_file(self, dummy_config, tmp_path):
-        """Test _get_deliverables_status with small H5 file (should be ignored)."""
+        """Test _get_deliverables_status with a damaged H5 file (should be ignored)."""
         import time
 
         from goliat.project_manager import ProjectManager
@@ -198,12 +196,12 @@ class TestProjectManager:
         results_dir = os.path.join(project_dir, f"{project_filename}_Results")
         os.makedirs(results_dir, exist_ok=True)
 
-        # Create a small H5 file (less than 8MB)
+        # Not an HDF5 file, as left behind by an aborted solver run
         h5_file_path = os.path.join(results_dir, "test_Output.h5")
         with open(h5_file_path, "wb") as f:
             f.write(b"0" * 1024)  # 1KB file
 
         status = manager._get_deliverables_status(project_dir, project_filename, setup_timestamp)
 
-        # Small file should be ignored
+        # Damaged file should be ignored
         assert status["run_done"] is False
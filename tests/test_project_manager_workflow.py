@@ -98,7 +98,7 @@ class TestProjectManagerCoreWorkflow:
         # Should return status with setup_done=False due to hash mismatch
         assert status["setup_done"] is False
 
-    def test_project_manager_get_deliverables_status_with_extract(self, dummy_config, tmp_path):
+    def test_project_manager_get_deliverables_status_with_extract(self, dummy_config, tmp_path, write_solver_output):
         """Test _get_deliverables_status with extract deliverables."""
         from goliat.project_manager import ProjectManager
 
@@ -112,15 +112,14 @@ class TestProjectManagerCoreWorkflow:
 
         project_dir = str(tmp_path)
         project_filename = "test_project"
-        setup_timestamp = time.time()
+        setup_timestamp = time.time() - 1
 
         # Create results directory with H5 file
         results_dir = os.path.join(project_dir, f"{project_filename}_Results")
         os.makedirs(results_dir, exist_ok=True)
 
         h5_file = os.path.join(results_dir, "test_Output.h5")
-        with open(h5_file, "wb") as f:
-            f.write(b"0" * (9 * 1024 * 1024))  # 9MB file
+        write_solver_output(h5_file)
 
         # Create extract deliverables in project_dir (where _get_deliverables_status looks)
         # The method looks for files directly in project_dir
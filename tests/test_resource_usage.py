@@ -0,0 +1,61 @@
+import json
+import time
+
+import numpy as np
+import pytest
+
+from goliat.metadata_exporter import MetadataExporter
+from goliat.profiler import Profiler
+from goliat.resource_usage import ResourceTracker, _reset_peak
+
+
+def _hot_loop(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+@pytest.mark.skipif(not _reset_peak(), reason="peak RSS can only be reset per subtask on Linux")
+def test_nested_peaks_io_and_cpu_are_attributed_to_each_subtask(tmp_path):
+    tracker = ResourceTracker()
+    outer = tracker.start()
+
+    inner = tracker.start()
+    block = np.ones(200 * 1024 * 1024 // 8)
+    (tmp_path / "data.bin").write_bytes(block.tobytes()[: 8 * 1024 * 1024])
+    del block
+    allocating = tracker.stop(inner)
+
+    sibling = tracker.start()
+    _hot_loop(0.05)
+    (tmp_path / "data.bin").read_bytes()
+    computing = tracker.stop(sibling)
+    total = tracker.stop(outer)
+
+    assert allocating.peak_rss_mb - computing.peak_rss_mb > 150
+    assert total.peak_rss_mb >= allocating.peak_rss_mb
+    assert allocating.written_mb >= 8 and computing.read_mb >= 8 and total.written_mb >= 8
+    assert computing.cpu_s >= 0.05 and total.cpu_s >= computing.cpu_s + allocating.cpu_s - 1e-6
+    assert computing.stacks is None and "stacks" not in computing.as_dict()
+
+
+def test_sampled_stacks_and_exported_resources(tmp_path):
+    config_path = tmp_path / "profiling_config.json"
+    profiler = Profiler({"do_setup": True, "do_run": True, "do_extract": True}, {}, "near_field", str(config_path), sample_stacks=True)
+    profiler.resource_tracker.interval_s = 0.005
+
+    profiler.start_stage("extract")
+    with profiler.subtask("extract_sar_statistics"):
+        _hot_loop(0.2)
+    profiler.end_stage()
+
+    usage = profiler.subtask_resources["extract_sar_statistics"][-1]
+    assert usage.cpu_s >= 0.2 and any(stack.endswith("test_resource_usage:_hot_loop") for stack in usage.stacks)
+
+    saved = json.loads(config_path.read_text())["near_field"]["resources"]
+    assert saved["extract_sar_statistics"]["runs"] == 1 and saved["extract_sar_statistics"]["avg_cpu_s"] >= 0.2
+
+    exporter = MetadataExporter(profiler, str(tmp_path / "project.smash"), "sim", "near_field", "duke", 700)
+    extract = exporter._extract_timing_data()["extract"]
+    assert extract.resources["cpu_s"] >= usage.cpu_s
+    assert extract.subtask_resources["sar_statistics"] == usage.as_dict()
@@ -0,0 +1,163 @@
+import gzip
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from goliat.constants import RESULT_UPLOAD_MANIFEST_FILENAME
+from goliat.utils import result_uploader
+from goliat.utils.result_uploader import ResultUploader, iter_file_content, snapshot_file
+
+
+class _DashboardStub:
+    """Local stand-in for the dashboard's assignment results endpoints.
+
+    Args:
+        known_hashes: Content hashes the server already stores.
+        manifest: Whether the server implements the manifest endpoint.
+        failures: Per file name, how many upload attempts answer 503.
+    """
+
+    def __init__(self, known_hashes=(), manifest=True, failures=None):
+        self.known_hashes = set(known_hashes)
+        self.failures = dict(failures or {})
+        self.received = {}
+        self.upload_requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _read_body(self):
+                if self.headers.get("Transfer-Encoding") != "chunked":
+                    return self.rfile.read(int(self.headers["Content-Length"]))
+                body = b""
+                while size := int(self.rfile.readline().strip(), 16):
+                    body += self.rfile.read(size)
+                    self.rfile.readline()
+                self.rfile.readline()
+                return body
+
+            def _reply(self, status, payload=None):
+                data = json.dumps(payload or {}).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                body = self._read_body()
+                if self.path.endswith("/results/manifest"):
+                    if not manifest:
+                        return self._reply(404)
+                    files = json.loads(body)["files"]
+                    return self._reply(
+                        200, {"missing": [f["name"] for f in files if f["sha256"] not in stub.known_hashes], "encodings": ["gzip"]}
+                    )
+
+                message = BytesParser(policy=HTTP).parsebytes(
+                    b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body
+                )
+                parts = list(message.iter_parts())
+                fields = {part.get_param("name", header="content-disposition"): part for part in parts}
+                uploads = [part for part in parts if part.get_param("name", header="content-disposition") == "files"]
+                names = [part.get_filename() for part in uploads]
+                stub.upload_requests.append((names, self.headers.get("Transfer-Encoding")))
+                if any(stub.failures.get(name, 0) > 0 for name in names):
+                    for name in names:
+                        stub.failures[name] = max(stub.failures.get(name, 0) - 1, 0)
+                    return self._reply(503)
+                for name, part in zip(names, uploads):
+                    content = part.get_payload(decode=True)
+                    stub.received[name] = gzip.decompress(content) if "contentEncoding" in fields else content
+                if "sha256" in fields:
+                    stub.known_hashes.add(fields["sha256"].get_content().strip())
+                self._reply(200)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_uploader.time, "sleep", lambda _seconds: None)
+    (tmp_path / "config.json").write_text('{"a": 1}')
+    (tmp_path / "verbose.log").write_text("Subtask 'run' done in 1.00s\n" * 5000)
+    return tmp_path
+
+
+def _files(results_dir):
+    return {name: str(results_dir / name) for name in ("config.json", "verbose.log")}
+
+
+def test_snapshot_fixes_size_of_growing_file(results_dir):
+    snapshot = snapshot_file("verbose.log", str(results_dir / "verbose.log"))
+    with open(results_dir / "verbose.log", "a") as f:
+        f.write("appended after the snapshot\n")
+
+    assert len(b"".join(iter_file_content(snapshot))) == snapshot.size
+    assert gzip.decompress(b"".join(iter_file_content(snapshot, "gzip", chunk_bytes=1000))) == b"".join(iter_file_content(snapshot))
+
+
+def test_upload_skips_known_files_and_compresses(results_dir):
+    known = snapshot_file("config.json", str(results_dir / "config.json")).sha256
+    stub = _DashboardStub(known_hashes=[known])
+    uploader = ResultUploader(stub.url, "assignment-1")
+    try:
+        summary = uploader.submit(str(results_dir), "near_field/duke/700MHz", _files(results_dir)).result(timeout=30)
+        again = uploader.submit(str(results_dir), "near_field/duke/700MHz", _files(results_dir)).result(timeout=30)
+    finally:
+        uploader.close()
+        stub.close()
+
+    assert summary["uploaded"] == ["verbose.log"]
+    assert summary["skipped"] == ["config.json"]
+    assert stub.received["verbose.log"] == (results_dir / "verbose.log").read_bytes()
+    # The repetitive log compresses far below its size on disk
+    assert summary["bytes_sent"] < (results_dir / "verbose.log").stat().st_size / 10
+    assert sorted(again["skipped"]) == ["config.json", "verbose.log"]
+    assert stub.upload_requests == [(["verbose.log"], None)]  # Sized body, not chunked
+
+
+def test_upload_retries_and_resumes_with_failed_files(results_dir):
+    stub = _DashboardStub(failures={"config.json": 1, "verbose.log": 2})
+    uploader = ResultUploader(stub.url, "assignment-1", max_attempts=2)
+    try:
+        first = uploader.upload(str(results_dir), "rel", [snapshot_file(n, p) for n, p in _files(results_dir).items()])
+        second = uploader.upload(str(results_dir), "rel", [snapshot_file(n, p) for n, p in _files(results_dir).items()])
+    finally:
+        uploader.close()
+        stub.close()
+
+    # config.json succeeded on its retry; verbose.log exhausted its attempts and is the only file resent
+    assert first["uploaded"] == ["config.json"] and first["failed"] == ["verbose.log"]
+    assert second["uploaded"] == ["verbose.log"] and second["skipped"] == ["config.json"]
+    assert [names for names, _ in stub.upload_requests] == [["config.json"]] * 2 + [["verbose.log"]] * 3
+    assert stub.received["verbose.log"] == (results_dir / "verbose.log").read_bytes()
+    manifest = json.loads((results_dir / RESULT_UPLOAD_MANIFEST_FILENAME).read_text())
+    assert set(manifest["assignment-1"]) == {"config.json", "verbose.log"}
+
+
+def test_upload_batches_files_for_legacy_endpoint(results_dir):
+    stub = _DashboardStub(manifest=False, failures={"verbose.log": 1})
+    uploader = ResultUploader(stub.url, "assignment-1", max_attempts=2)
+    try:
+        summary = uploader.upload(str(results_dir), "rel", [snapshot_file(n, p) for n, p in _files(results_dir).items()])
+    finally:
+        uploader.close()
+        stub.close()
+
+    # Without a manifest endpoint all files go uncompressed in one request, retried as a whole
+    assert summary["uploaded"] == ["config.json", "verbose.log"]
+    assert stub.upload_requests == [(["config.json", "verbose.log"], None)] * 2
+    assert stub.received["verbose.log"] == (results_dir / "verbose.log").read_bytes()
+    assert summary["bytes_sent"] > (results_dir / "verbose.log").stat().st_size
@@ -0,0 +1,76 @@
+import os
+import shutil
+
+import pytest
+
+from goliat.results import ResultsCatalog, parse_simulation_dir
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x")
+
+
+def _age(root):
+    """Backdates every directory so the catalog trusts its mtime."""
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(10**18, 10**18))
+
+
+@pytest.fixture
+def results(tmp_path):
+    root = tmp_path / "results"
+    placement = root / "far_field" / "duke" / "700MHz" / "environmental_x_pos_theta__v2"
+    _touch(placement / "sar_results.json")
+    _touch(placement / "far_field_duke.smash_Results" / "abc_Output.h5")
+    _touch(root / "near_field" / "ella" / "900MHz" / "by_cheek_tragus_cheek_base" / "verbose.log")
+    _touch(root / "far_field" / "duke" / "700MHz" / "auto_induced" / "all_proxy_scores.csv")
+    _age(root)
+    return root
+
+
+def test_queries_parse_the_tree(results):
+    catalog = ResultsCatalog(str(results))
+
+    (sim,) = catalog.simulations(study_type="far_field", frequency=700)
+    assert (sim.phantom, sim.direction, sim.polarization, sim.run_tag) == ("duke", "x_pos", "theta", "v2")
+    assert sim.newest("_Output.h5", subdir="far_field_duke.smash_Results").path == os.path.join(
+        sim.path, "far_field_duke.smash_Results", "abc_Output.h5"
+    )
+    assert [f.relpath for f in catalog.find("verbose.log", under="near_field")] == [
+        "near_field/ella/900MHz/by_cheek_tragus_cheek_base/verbose.log"
+    ]
+    assert catalog.simulation(str(results / "near_field" / "ella" / "900MHz" / "by_cheek_tragus_cheek_base")).study_type == "near_field"
+    assert catalog.find("verbose.log", under="far_field") == []
+    assert os.path.exists(results / ".results_catalog.sqlite")
+    assert parse_simulation_dir("ella/700+900MHz/front_of_eyes")["frequency"] == "700+900"
+    assert parse_simulation_dir("far_field/duke/700MHz/auto_induced__v2") is None
+
+
+def test_refresh_only_lists_changed_directories(results, tmp_path):
+    db_path = str(tmp_path / "catalog.sqlite")
+    catalog = ResultsCatalog(str(results), db_path=db_path)
+    assert catalog.refresh()["listed"] == 11
+    assert catalog.refresh() == {"checked": 11, "listed": 0, "removed": 0}
+
+    new_placement = results / "far_field" / "duke" / "700MHz" / "environmental_y_neg_phi"
+    _touch(new_placement / "sar_results.json")
+    shutil.rmtree(results / "near_field" / "ella")
+    stats = catalog.refresh()
+
+    # The new placement and its changed parent, plus the parent of the removed subtree
+    assert stats["listed"] == 3 and stats["removed"] == 3
+    assert [s.direction for s in catalog.simulations(phantom="duke")] == ["x_pos", "y_neg"]
+    assert catalog.simulations(study_type="near_field") == []
+
+    # A second instance reuses the persisted index
+    reopened = ResultsCatalog(str(results), db_path=db_path)
+    assert reopened.refresh(under="far_field/duke")["checked"] == 6
+    assert reopened.is_dir("far_field/duke/700MHz/environmental_y_neg_phi")
+
+
+def test_subtree_refresh_does_not_skip_the_first_full_scan(results, tmp_path):
+    catalog = ResultsCatalog(str(results), db_path=str(tmp_path / "catalog.sqlite"))
+    catalog.refresh(under="far_field")
+
+    assert [s.study_type for s in catalog.simulations()] == ["far_field", "near_field"]
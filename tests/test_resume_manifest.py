@@ -0,0 +1,94 @@
+import os
+import time
+from unittest.mock import MagicMock
+
+import h5py
+import pytest
+
+from goliat.constants import RESUME_MANIFEST_FILENAME
+from goliat.project_manager import ProjectManager
+from goliat.results_extractor import ResultsExtractor
+from goliat.resume_manifest import ResumeManifest, ResumeRecord
+
+SURGICAL_CONFIG = {"study_type": "far_field", "phantom": "duke", "frequency": 700}
+
+
+@pytest.fixture
+def finished_simulation(tmp_path, write_solver_output):
+    """A simulation whose setup, run and extract phases completed, as the study records them."""
+    config = MagicMock()
+    config.base_dir = str(tmp_path)
+    config.__getitem__.side_effect = lambda key: None
+    config.get_auto_cleanup_previous_results.return_value = []
+    manager = ProjectManager(config, MagicMock(), MagicMock())
+
+    project_dir = tmp_path / "results" / "far_field" / "duke" / "700MHz" / "environmental_x_pos_theta"
+    project_dir.mkdir(parents=True)
+    manager.project_path = str(project_dir / "far_field_duke.smash")
+    with h5py.File(manager.project_path, "w"):
+        pass
+    meta_path = str(project_dir / "config.json")
+    manager.write_simulation_metadata(meta_path, SURGICAL_CONFIG, update_setup_timestamp=True)
+
+    later = time.time() + 60
+    results_dir = project_dir / "far_field_duke.smash_Results"
+    results_dir.mkdir()
+    write_solver_output(results_dir / "abc_Output.h5")
+    os.utime(results_dir / "abc_Output.h5", (later, later))
+    manager.update_simulation_metadata(meta_path, run_done=True)
+    for name in ResultsExtractor.get_required_deliverable_filenames().values():
+        (project_dir / name).write_text("{}")
+        os.utime(project_dir / name, (later, later))
+    manager.update_simulation_metadata(meta_path, extract_done=True)
+    return manager, project_dir, meta_path
+
+
+def test_resume_uses_manifest_without_probing(finished_simulation, monkeypatch):
+    manager, project_dir, meta_path = finished_simulation
+    record = manager.resume_manifest.get("far_field/duke/700MHz/environmental_x_pos_theta")
+    assert record.complete and record.project_file == "far_field_duke.smash"
+    assert "far_field_duke.smash_Results/abc_Output.h5" in record.deliverables
+
+    probes = []
+    monkeypatch.setattr(manager, "_probe_status", lambda *args: probes.append(args) or {})
+    assert manager.verify_simulation_metadata(meta_path, SURGICAL_CONFIG) == {"setup_done": True, "run_done": True, "extract_done": True}
+    assert probes == []
+
+    # A different config misses the record and goes through the hash check
+    assert manager.verify_simulation_metadata(meta_path, dict(SURGICAL_CONFIG, frequency=900))["setup_done"] is False
+    assert probes == []
+
+
+def test_deleted_deliverable_misses_the_manifest(finished_simulation):
+    manager, project_dir, meta_path = finished_simulation
+    os.remove(project_dir / "sar_results.json")
+
+    # The record still says done, but its fingerprints no longer match the disk
+    assert manager.verify_simulation_metadata(meta_path, SURGICAL_CONFIG) == {"setup_done": True, "run_done": True, "extract_done": False}
+    assert not manager.resume_manifest.get("far_field/duke/700MHz/environmental_x_pos_theta").extract_done
+
+
+def test_changed_metadata_falls_back_to_full_checks_and_backfills(finished_simulation):
+    manager, project_dir, meta_path = finished_simulation
+    manager.cleanup()
+    os.remove(project_dir / "sar_results.json")
+    # A study without the manifest, e.g. one resumed from an older version
+    os.remove(project_dir.parents[3] / RESUME_MANIFEST_FILENAME)
+
+    status = manager.verify_simulation_metadata(meta_path, SURGICAL_CONFIG)
+
+    assert status == {"setup_done": True, "run_done": True, "extract_done": False}
+    record = ResumeManifest(manager.resume_manifest.path).get("far_field/duke/700MHz/environmental_x_pos_theta")
+    assert (record.setup_done, record.run_done, record.extract_done) == (True, True, False)
+
+
+def test_deep_verify_catches_files_changed_behind_the_record(finished_simulation):
+    manager, project_dir, meta_path = finished_simulation
+    untouched = ResumeRecord(key="far_field/duke/900MHz/gone", config_hash="x", setup_done=True, run_done=True, extract_done=True)
+    manager.resume_manifest.put(untouched)
+    os.remove(project_dir / "sar_stats_all_tissues.pkl")
+
+    assert manager.deep_verify_resume_manifest(max_workers=4) == {"checked": 2, "changed": 2}
+
+    assert not manager.resume_manifest.get("far_field/duke/900MHz/gone").setup_done
+    assert manager.verify_simulation_metadata(meta_path, SURGICAL_CONFIG) == {"setup_done": True, "run_done": True, "extract_done": False}
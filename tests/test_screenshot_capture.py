@@ -0,0 +1,57 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from goliat.gui.components.screenshot_capture import ScreenshotCapture  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_only_changed_tabs_are_encoded_and_sent(qt_app):
+    tabs = QtWidgets.QTabWidget()
+    tabs.resize(640, 480)
+    labels = {}
+    for name in ("Progress", "Timings", "Plots"):
+        labels[name] = QtWidgets.QLabel(f"{name} " * 20)
+        tabs.addTab(labels[name], name)
+    tabs.show()
+    qt_app.processEvents()
+
+    uploads = []
+    capture = ScreenshotCapture(SimpleNamespace(tabs=tabs), on_screenshots=uploads.append, interval_s=5.0, bandwidth_budget=1_000_000)
+
+    def cycle():
+        assert capture.capture_cycle().result(timeout=10) is not None
+        return capture.last_stats
+
+    first = cycle()
+    assert set(uploads[-1]) == {"Timings", "Plots"} and all(data[:2] == b"\xff\xd8" for data in uploads[-1].values())
+    assert first.bytes_sent == sum(len(data) for data in uploads[-1].values()) and first.gui_thread_ms > 0
+
+    unchanged = cycle()
+    assert unchanged.tabs_rendered == 2 and unchanged.tabs_sent == 0 and unchanged.bytes_sent == 0 and len(uploads) == 1
+
+    labels["Plots"].setText("Plots changed")
+    changed = cycle()
+    assert set(uploads[-1]) == {"Plots"} and 0 < changed.changed_tiles < first.changed_tiles
+    capture.close()
+
+
+def test_quality_then_resolution_drop_when_over_budget(qt_app):
+    capture = ScreenshotCapture(SimpleNamespace(), interval_s=1.0, bandwidth_budget=1000)
+    qualities = []
+    for _ in range(8):
+        capture._adapt_to_budget(5000)
+        qualities.append((capture.quality, capture.scale))
+    assert qualities[:5] == [(75, 1.0), (65, 1.0), (55, 1.0), (45, 1.0), (40, 1.0)]
+    assert qualities[-1] == (40, 0.7)
+
+    capture._adapt_to_budget(100)
+    assert (capture.quality, capture.scale) == (40, 0.8)
@@ -0,0 +1,55 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from goliat.bench import generate_synthetic_phantom
+
+pytest.importorskip("skimage")
+pytest.importorskip("scipy")
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "skin_mesh_pipeline.py"
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    spec = importlib.util.spec_from_file_location("skin_mesh_pipeline", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def input_h5(tmp_path_factory):
+    return generate_synthetic_phantom(str(tmp_path_factory.mktemp("phantom")), grid=(24, 20, 32), n_directions=1).input_h5
+
+
+def _oriented_triangles(verts, faces, axes):
+    """Triangles as grid-index vertex triples, rotated to start at their smallest vertex so winding is kept."""
+    origin = np.array([axes[0][0], axes[1][0], axes[2][0]])
+    spacing = np.array([np.mean(np.diff(axis)) for axis in axes])
+    points = [tuple(p) for p in np.round((verts - origin) / spacing, 3)]
+    triangles = set()
+    for a, b, c in faces:
+        tri = (points[a], points[b], points[c])
+        i = tri.index(min(tri))
+        triangles.add(tri[i:] + tri[:i])
+    return triangles
+
+
+@pytest.mark.parametrize("slab_depth", [1, 5, 8, 64])
+@pytest.mark.parametrize("morphology", [(2, 1, 0.8), (0, 0, 0.0)])
+def test_blockwise_mesh_matches_whole_volume(pipeline, input_h5, slab_depth, morphology):
+    dilate, erode, sigma = morphology
+    mask, axis_x, axis_y, axis_z, _ = pipeline.extract_tissue_voxels(input_h5, ["skin"])
+    if dilate or erode:
+        mask = pipeline.dilate_erode_process(mask, dilate, erode)
+    verts, faces = pipeline.voxels_to_mesh(mask, axis_x, axis_y, axis_z, sigma)
+
+    blockwise = pipeline.extract_mesh_blockwise(input_h5, ["skin"], dilate, erode, sigma, slab_depth=slab_depth, workers=2, keep_masks=True)
+
+    axes = (axis_x, axis_y, axis_z)
+    assert len(blockwise["verts"]) == len(verts) and len(blockwise["faces"]) == len(faces)
+    assert _oriented_triangles(blockwise["verts"], blockwise["faces"], axes) == _oriented_triangles(verts, faces, axes)
+    assert np.array_equal(blockwise["mask"], mask) and blockwise["processed_voxels"] == int(mask.sum())
@@ -0,0 +1,60 @@
+import logging
+from pathlib import Path
+
+from goliat.analysis.solver_throughput_report import build_throughput_report, log_throughput_report
+from goliat.constants import SOLVER_THROUGHPUT_FILENAME
+from goliat.runners.isolve_output_parser import ISolveOutputParser
+from goliat.runners.solver_throughput import SolverThroughputRecorder, load_throughput_file, summarize_throughput
+
+
+def _progress_line(percent, speed):
+    return f"[PROGRESS]: {percent}% [ {percent}/100] Time Update, estimated remaining time 1 minutes 5 seconds @ {speed} MCells/s"
+
+
+def _record_run(recorder, speeds):
+    parser = ISolveOutputParser(None, None)
+    recorder.start_attempt()
+    for percent, speed in zip(range(2, 101, 98 // (len(speeds) - 1)), speeds):
+        recorder.record(parser.parse_line(_progress_line(percent, speed)).progress_info)
+
+
+def test_parser_reports_remaining_seconds():
+    info = ISolveOutputParser(None, None).parse_line(_progress_line(40, 1234.5)).progress_info
+    assert info.remaining_seconds == 65
+    assert info.time_remaining == "0:01:05"
+
+
+def test_summary_detects_slowdown_within_run():
+    recorder = SolverThroughputRecorder()
+    _record_run(recorder, [1000] * 5 + [500] * 5)
+    summary = recorder.summary()
+
+    assert summary["samples"] == 10
+    assert summary["early_median_mcells_per_s"] == 1000
+    assert summary["late_median_mcells_per_s"] == 500
+    assert summary["degradation_ratio"] == 0.5
+    assert summarize_throughput([]) == {}
+
+
+def test_report_flags_degraded_and_slow_simulations(tmp_path):
+    speeds = {"fast_a": [1000] * 10, "fast_b": [1000] * 10, "throttled": [1000] * 5 + [400] * 5, "slow": [500] * 10}
+    for name, run_speeds in speeds.items():
+        recorder = SolverThroughputRecorder({"kernel": "Acceleware"})
+        _record_run(recorder, run_speeds)
+        (tmp_path / name).mkdir()
+        recorder.save(str(tmp_path / name))
+
+    assert load_throughput_file(str(tmp_path / "slow" / SOLVER_THROUGHPUT_FILENAME))["columns"][3] == "percent"
+    flags = {Path(row["path"]).name: row["flags"] for row in build_throughput_report(tmp_path)}
+
+    assert flags["fast_a"] == []
+    assert flags["fast_b"] == []
+    assert "slowed_during_run" in flags["throttled"]
+    assert flags["slow"] == ["slow_vs_sweep"]
+
+
+def test_report_logs_a_zero_sweep_median(caplog):
+    row = {"path": "sim", "kernel": "cuda", "median_mcells_per_s": 0.0, "degradation_ratio": 0.0, "relative_to_sweep": None}
+    with caplog.at_level(logging.INFO, logger="progress"):
+        log_throughput_report([dict(row, flags=["slowed_during_run"])])
+    assert "(cuda sweep median is 0, late/early 0%) [slowed_during_run]" in caplog.text
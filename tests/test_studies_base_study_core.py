@@ -65,6 +65,19 @@ class TestBaseStudyCoreMethods:
             assert mock_runner_class.called
             assert mock_runner.run.called
 
+    def test_run_phase_checks_free_space_only_with_a_project(self, base_study):
+        """The pre-run disk space check needs a project path to measure."""
+        base_study.project_manager = MagicMock(project_path=None)
+        base_study._cleanup_service = MagicMock()
+
+        with patch("goliat.studies.base_study.SimulationRunner"):
+            base_study._execute_run_phase(MagicMock())
+            assert not base_study._cleanup_service.ensure_free_space.called
+
+            base_study.project_manager.project_path = "/tmp/test.smash"
+            base_study._execute_run_phase(MagicMock())
+            base_study._cleanup_service.ensure_free_space.assert_called_once_with("/tmp/test.smash")
+
     def test_base_study_subtask_context_manager(self, base_study):
         """Test subtask context manager."""
         mock_profiler = MagicMock()
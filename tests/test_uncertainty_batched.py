@@ -0,0 +1,52 @@
+import json
+
+import numpy as np
+import pytest
+
+from goliat.uncertainty import bootstrap_balanced, decompose_balanced, decompose_balanced_all, load_far_field
+
+PHANTOMS = ("duke", "ella", "eartha")
+FREQS = (700, 900, 2450)
+
+
+@pytest.fixture
+def far_field_df(tmp_path):
+    rng = np.random.default_rng(3)
+    for p_idx, phantom in enumerate(PHANTOMS):
+        for f_idx, freq in enumerate(FREQS):
+            for direction in ("x_pos", "y_neg", "z_pos"):
+                for pol in ("theta", "phi"):
+                    sim_dir = tmp_path / phantom / f"{freq}MHz" / f"environmental_{direction}_{pol}"
+                    sim_dir.mkdir(parents=True)
+                    wb = np.exp(0.3 * p_idx - 0.2 * f_idx + rng.normal(scale=0.05))
+                    payload = {"whole_body_sar": wb, "peak_sar_10g_W_kg": 20 * wb * np.exp(rng.normal(scale=0.1))}
+                    # Missing cell: psSAR10g becomes unbalanced
+                    if (phantom, freq, direction, pol) == ("ella", 900, "z_pos", "phi"):
+                        payload.pop("peak_sar_10g_W_kg")
+                    (sim_dir / "sar_results.json").write_text(json.dumps(payload))
+    return load_far_field(tmp_path, phantoms=PHANTOMS, freqs_mhz=FREQS)
+
+
+def test_batched_decomposition_matches_per_metric(far_field_df):
+    assert len(far_field_df) == 2 * 54 - 1
+
+    components, skipped = decompose_balanced_all(far_field_df)
+
+    assert [vc.metric for vc in components] == ["WB_SAR"]
+    assert "unbalanced" in skipped["psSAR10g"]
+    reference = decompose_balanced(far_field_df, "WB_SAR")
+    for key, value in reference.sigma2.items():
+        assert components[0].sigma2[key] == pytest.approx(value, abs=1e-12)
+    assert components[0].df == reference.df
+
+
+def test_bootstrap_intervals_are_reproducible(far_field_df):
+    intervals = bootstrap_balanced(far_field_df, n_boot=300, seed=7)
+
+    assert set(intervals["metric"]) == {"WB_SAR"}
+    assert list(intervals["component"]) == ["phantom", "freq", "pf", "dir", "pol", "resid"]
+    assert (intervals["sigma_lo"] <= intervals["sigma_hi"]).all()
+    phantom = intervals.set_index("component").loc["phantom"]
+    assert phantom["sigma"] == pytest.approx(decompose_balanced(far_field_df, "WB_SAR").sigma["phantom"])
+    assert phantom["sigma_hi"] > 0
+    assert intervals.equals(bootstrap_balanced(far_field_df, n_boot=300, seed=7))